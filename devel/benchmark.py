@@ -0,0 +1,385 @@
+#!/usr/bin/python3
+"""
+This script replays recorded messages through HotnessConsumer without network.
+
+External systems are replaced by local stand-ins with configurable latency,
+validators are using fake HTTP session, so their parsing code is measured too.
+It reports throughput, latency percentiles and memory used per message.
+
+Example:
+    python3 devel/benchmark.py --messages 1000 --latency koji=0.05 --memory
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import time
+import tracemalloc
+from unittest import mock
+
+from fedora_messaging.message import Message
+
+from hotness.builders import Builder
+from hotness.databases import Database
+from hotness.notifiers import Notifier
+from hotness.patchers import Patcher
+
+FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures"
+)
+
+# Systems with configurable latency
+SYSTEMS = ["pagure", "mdapi", "bugzilla", "koji", "redis", "fedora_messaging"]
+
+
+class Latency:
+    """
+    Simulated latency of external systems.
+    """
+
+    def __init__(self, latencies):
+        """
+        Params:
+            latencies (dict): Latency in seconds for every system
+        """
+        self.latencies = latencies
+
+    def wait(self, system):
+        """
+        Sleep for the latency of the system.
+
+        Params:
+            system (str): Name of the system
+        """
+        latency = self.latencies.get(system, 0)
+        if latency:
+            time.sleep(latency)
+
+
+class FakeResponse:
+    """
+    Response returned by `FakeSession`.
+    """
+
+    def __init__(self, status_code, data=None, text=""):
+        self.status_code = status_code
+        self.data = data
+        self.text = text
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """
+    Stand-in for `requests.Session` answering requests to dist-git and mdapi.
+    Every package is monitored with scratch builds and has older version in repo.
+    """
+
+    def __init__(self, latency, mdapi_url):
+        self.latency = latency
+        self.mdapi_url = mdapi_url
+
+    def get(self, url, timeout=None):
+        if url.startswith(self.mdapi_url):
+            self.latency.wait("mdapi")
+            return FakeResponse(200, {"version": "0.0.1", "release": "1.fc40"})
+
+        self.latency.wait("pagure")
+        if url.endswith("dead.package"):
+            return FakeResponse(404)
+        if url.endswith("monitoring.toml"):
+            return FakeResponse(
+                200, text="monitoring = true\nbugzilla = true\nscratch_build = true\n"
+            )
+        return FakeResponse(200, {"monitoring": "monitoring-with-scratch"})
+
+
+class FakeBugzilla(Notifier):
+    """
+    Stand-in for Bugzilla notifier.
+    """
+
+    def __init__(self, latency, **kwargs):
+        self.latency = latency
+
+    def notify(self, package, message, opts):
+        self.latency.wait("bugzilla")
+        return {"bz_id": opts.get("bz_id", 100)}
+
+    def flush(self):
+        pass
+
+    def stats(self):
+        return {
+            "queue_depth": 0,
+            "flushes": 0,
+            "flush_latency_last": 0.0,
+            "flush_latency_max": 0.0,
+            "update_failures": 0,
+        }
+
+
+class FakeFedoraMessaging(Notifier):
+    """
+    Stand-in for Fedora messaging notifier.
+    """
+
+    def __init__(self, latency, **kwargs):
+        self.latency = latency
+
+    def notify(self, package, message, opts):
+        self.latency.wait("fedora_messaging")
+        return {"msg_id": "benchmark"}
+
+
+class FakePatcher(Patcher):
+    """
+    Stand-in for Bugzilla patcher.
+    """
+
+    def __init__(self, latency, **kwargs):
+        self.latency = latency
+
+    def submit_patch(self, package, patch, opts):
+        self.latency.wait("bugzilla")
+        return {}
+
+
+class FakeKoji(Builder):
+    """
+    Stand-in for Koji builder.
+    """
+
+    def __init__(self, latency, **kwargs):
+        self.latency = latency
+
+    def build(self, package, opts):
+        self.latency.wait("koji")
+        return {
+            "build_id": 90100954,
+            "patch": "Benchmark patch",
+            "patch_filename": "benchmark.patch",
+            "message": "",
+        }
+
+
+class FakeRedis(Database):
+    """
+    Stand-in for Redis database keeping the values in dictionary.
+    """
+
+    def __init__(self, latency, data, **kwargs):
+        self.latency = latency
+        self.data = data
+        self.connection_pool = None
+
+    def insert(self, key, value):
+        self.latency.wait("redis")
+        old_value = self.data.get(key, "")
+        self.data[key] = value
+        return {"key": key, "value": value, "old_value": old_value}
+
+    def retrieve(self, key):
+        self.latency.wait("redis")
+        return {"key": key, "value": self.data.get(key, "")}
+
+    def scan_keys(self, pattern="*"):
+        self.latency.wait("redis")
+        return list(self.data)
+
+
+def parse_arguments():
+    """
+    Parse arguments.
+
+    Returns:
+        (argparse.Namespace) Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmarks HotnessConsumer with recorded messages"
+    )
+    parser.add_argument(
+        "--fixtures",
+        default=FIXTURES_DIR,
+        help="Directory with message bodies in <topic>/<name>.json files",
+    )
+    parser.add_argument(
+        "--messages",
+        type=int,
+        default=1000,
+        help="Number of messages to process, fixtures are repeated",
+    )
+    parser.add_argument(
+        "--latency",
+        action="append",
+        default=[],
+        metavar="SYSTEM=SECONDS",
+        help="Latency of external system, one of {}".format(", ".join(SYSTEMS)),
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Measure memory allocated per message, slows down the processing",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    args = parser.parse_args()
+
+    latencies = {}
+    for latency in args.latency:
+        system, _, seconds = latency.partition("=")
+        if system not in SYSTEMS:
+            parser.error("Unknown system '{}'".format(system))
+        latencies[system] = float(seconds)
+    args.latencies = latencies
+
+    return args
+
+
+def load_messages(fixtures_dir):
+    """
+    Load recorded messages from fixtures directory.
+
+    Params:
+        fixtures_dir (str): Directory with message bodies in <topic>/<name>.json files
+
+    Returns:
+        (list) List of `Message` objects
+    """
+    messages = []
+    for topic in sorted(os.listdir(fixtures_dir)):
+        topic_dir = os.path.join(fixtures_dir, topic)
+        if not os.path.isdir(topic_dir):
+            continue
+        for name in sorted(os.listdir(topic_dir)):
+            if not name.endswith(".json"):
+                continue
+            with open(os.path.join(topic_dir, name)) as f:
+                messages.append(Message(topic=topic, body=json.load(f)))
+    return messages
+
+
+def create_consumer(latency, messages):
+    """
+    Create HotnessConsumer with external systems replaced by stand-ins.
+
+    Params:
+        latency (Latency): Simulated latency of external systems
+        messages (list): Messages which will be processed
+
+    Returns:
+        (HotnessConsumer) Consumer ready to process messages
+    """
+    from hotness import hotness_consumer
+
+    # Builds from the recorded messages are known to the-new-hotness
+    data = {
+        str(message.body["info"]["id"]): "100"
+        for message in messages
+        if message.topic.endswith("buildsys.task.state.change")
+    }
+
+    with mock.patch.multiple(
+        hotness_consumer,
+        Koji=lambda **kwargs: FakeKoji(latency, **kwargs),
+        Redis=lambda **kwargs: FakeRedis(latency, data, **kwargs),
+        bz_notifier=lambda **kwargs: FakeBugzilla(latency, **kwargs),
+        bz_patcher=lambda **kwargs: FakePatcher(latency, **kwargs),
+        FedoraMessaging=lambda **kwargs: FakeFedoraMessaging(latency, **kwargs),
+    ):
+        consumer = hotness_consumer.HotnessConsumer()
+
+    session = FakeSession(latency, consumer.validator_mdapi.url)
+    consumer.validator_mdapi.requests_session = session
+    # Pagure validator could be wrapped by cache and snapshot
+    pagure = consumer.validator_pagure
+    while hasattr(pagure, "validator"):
+        pagure = pagure.validator
+    pagure.requests_session = session
+
+    return consumer
+
+
+def run(consumer, messages, count, measure_memory):
+    """
+    Process messages by consumer and measure it.
+
+    Params:
+        consumer (HotnessConsumer): Consumer to process messages
+        messages (list): Messages to process, repeated until count is reached
+        count (int): Number of messages to process
+        measure_memory (bool): Measure allocated memory
+
+    Returns:
+        (dict) Results of the benchmark
+    """
+    durations = []
+    if measure_memory:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    for i in range(count):
+        message = messages[i % len(messages)]
+        message_start = time.perf_counter()
+        consumer(message)
+        durations.append(time.perf_counter() - message_start)
+    total = time.perf_counter() - start
+
+    results = {
+        "messages": count,
+        "seconds": total,
+        "throughput": count / total if total else 0.0,
+        "p50": statistics.median(durations),
+        "p99": (
+            statistics.quantiles(durations, n=100)[98] if count > 1 else durations[0]
+        ),
+    }
+
+    if measure_memory:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results["retained_bytes_per_message"] = (current - baseline) / count
+        results["peak_bytes"] = peak - baseline
+
+    return results
+
+
+def print_results(results):
+    """
+    Print the results of the benchmark.
+
+    Params:
+        results (dict): Results of the benchmark
+    """
+    print("Messages:    {}".format(results["messages"]))
+    print("Total:       {:.3f} s".format(results["seconds"]))
+    print("Throughput:  {:.1f} msg/s".format(results["throughput"]))
+    print("Latency p50: {:.3f} ms".format(results["p50"] * 1000))
+    print("Latency p99: {:.3f} ms".format(results["p99"] * 1000))
+    if "peak_bytes" in results:
+        print(
+            "Memory:      {:.0f} B retained per message, {:.0f} KiB peak".format(
+                results["retained_bytes_per_message"], results["peak_bytes"] / 1024
+            )
+        )
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    logging.basicConfig(level=logging.WARNING)
+    # The consumer logs every message and failure, keep the output readable
+    logging.getLogger("hotness").setLevel(logging.CRITICAL)
+
+    latency = Latency(args.latencies)
+    messages = load_messages(args.fixtures)
+    consumer = create_consumer(latency, messages)
+    results = run(consumer, messages, args.messages, args.memory)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
@@ -0,0 +1,222 @@
+#!/usr/bin/python3
+"""
+This script generates the dist-git snapshot used by `dist_git_snapshot` option
+of the-new-hotness, see `hotness.validators.SnapshotValidator` for its format.
+
+Monitoring settings and retirement of every package are read from dist-git
+by `hotness.validators.Pagure` using pool of workers. The list of packages
+is retrieved from Pagure API or read from file with one package name per line.
+
+When previous snapshot is provided, packages read less than `--refresh-age`
+seconds ago are copied from it and packages which couldn't be read keep
+their previous entry, so their age is still judged by the time they were read.
+
+Example:
+    python3 devel/dist_git_snapshot.py --output /var/www/html/dist-git.json \\
+        --previous /var/www/html/dist-git.json --refresh-age 43200
+"""
+
+import argparse
+import concurrent.futures
+import json
+import logging
+import os
+import time
+
+import requests
+
+from hotness.domain import Package
+from hotness.validators import Pagure
+
+_logger = logging.getLogger(__name__)
+
+# Keys of `Pagure.validate` output stored in the snapshot
+OUTPUT_KEYS = (
+    "monitoring",
+    "bugzilla",
+    "all_versions",
+    "stable_only",
+    "scratch_build",
+    "retired",
+)
+
+
+def parse_arguments():
+    """
+    Parse arguments of the script.
+
+    Returns:
+        (argparse.Namespace) Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Generates snapshot of dist-git monitoring settings"
+    )
+    parser.add_argument("--output", required=True, help="Path to write snapshot to")
+    parser.add_argument(
+        "--dist-git-url",
+        default="https://src.fedoraproject.org",
+        help="URL of dist-git (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--branch", default="rawhide", help="Branch to check (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--packages", help="File with package names, default is all rpms in dist-git"
+    )
+    parser.add_argument("--previous", help="Path of previous snapshot to update")
+    parser.add_argument(
+        "--refresh-age",
+        type=float,
+        default=0,
+        help="Only read packages older than this in previous snapshot, "
+        "in seconds (default: read all)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="Number of packages read in parallel (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30,
+        help="Timeout of requests in seconds (default: %(default)s)",
+    )
+
+    return parser.parse_args()
+
+
+def list_packages(session, dist_git_url, timeout):
+    """
+    Retrieve names of all rpms in dist-git from Pagure API.
+
+    Params:
+        session (requests.Session): Session to use for requests
+        dist_git_url (str): URL of dist-git
+        timeout (float): Timeout of requests in seconds
+
+    Returns:
+        (list) Package names
+    """
+    names = []
+    url = "{}/api/0/projects?namespace=rpms&fork=false&short=true&per_page=100".format(
+        dist_git_url
+    )
+    while url:
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        data = response.json()
+        names.extend(project["name"] for project in data["projects"])
+        url = data["pagination"]["next"]
+
+    return names
+
+
+def read_package(validator, name):
+    """
+    Read monitoring settings and retirement of the package.
+
+    Params:
+        validator (Pagure): Validator to read the package with
+        name (str): Name of the package
+
+    Returns:
+        (dict) Snapshot entry of the package
+    """
+    output = validator.validate(Package(name=name, version="", distro=""))
+    entry = {key: output[key] for key in OUTPUT_KEYS}
+    entry["updated"] = int(time.time())
+
+    return entry
+
+
+def generate(args):
+    """
+    Generate the snapshot.
+
+    Params:
+        args (argparse.Namespace): Parsed arguments
+
+    Returns:
+        (dict) Snapshot
+    """
+    session = requests.Session()
+    session.mount(
+        "https://", requests.adapters.HTTPAdapter(pool_maxsize=args.workers * 3)
+    )
+    validator = Pagure(
+        url=args.dist_git_url,
+        requests_session=session,
+        timeout=args.timeout,
+        branch=args.branch,
+        package_type="rpm",
+    )
+
+    if args.packages:
+        with open(args.packages) as f:
+            names = [line.strip() for line in f if line.strip()]
+    else:
+        names = list_packages(session, args.dist_git_url, args.timeout)
+
+    previous = {}
+    if args.previous and os.path.exists(args.previous):
+        with open(args.previous) as f:
+            snapshot = json.load(f)
+        for name, entry in snapshot["packages"].items():
+            entry.setdefault("updated", snapshot["generated"])
+            previous[name] = entry
+
+    now = time.time()
+    packages = {}
+    to_read = []
+    for name in names:
+        entry = previous.get(name)
+        if entry and args.refresh_age and now - entry["updated"] < args.refresh_age:
+            packages[name] = entry
+        else:
+            to_read.append(name)
+
+    _logger.info(
+        "Reading %d packages, %d copied from previous snapshot",
+        len(to_read),
+        len(packages),
+    )
+    failed = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(read_package, validator, name): name for name in to_read
+        }
+        for future in concurrent.futures.as_completed(futures):
+            name = futures[future]
+            try:
+                packages[name] = future.result()
+            except Exception as e:
+                failed += 1
+                _logger.warning("Couldn't read %s: %s", name, e)
+                if name in previous:
+                    packages[name] = previous[name]
+
+    _logger.info("Read %d packages, %d failed", len(to_read) - failed, failed)
+
+    return {"generated": int(now), "packages": dict(sorted(packages.items()))}
+
+
+def write(snapshot, path):
+    """
+    Write the snapshot atomically, so it's never read half written.
+
+    Params:
+        snapshot (dict): Snapshot to write
+        path (str): Path to write snapshot to
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(snapshot, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    args = parse_arguments()
+    write(generate(args), args.output)
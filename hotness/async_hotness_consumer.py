@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions
+# of the GNU General Public License v.2, or (at your option) any later
+# version.  This program is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.  You
+# should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# Any Red Hat trademarks that are incorporated in the source
+# code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission
+# of Red Hat, Inc.
+import asyncio
+import atexit
+import logging
+import threading
+from typing import Any, List
+
+from anitya_schema.project_messages import ProjectVersionUpdatedV2  # type: ignore
+from fedora_messaging.message import Message  # type: ignore
+
+from hotness.config import config
+from hotness.common.tracing import span
+from hotness.domain import Package
+from hotness.hotness_consumer import HotnessConsumer
+from hotness.requests import PackageRequest
+from hotness.use_cases import AsyncPackageCheckUseCase
+from hotness.validators import AsyncMDApi, AsyncPagure
+from hotness.validators import async_http
+
+_logger = logging.getLogger(__name__)
+
+
+class AsyncHotnessConsumer(HotnessConsumer):
+    """
+    Asyncio variant of `HotnessConsumer`.
+
+    Messages are handled by coroutines on event loop running in background
+    thread. Validation of package mappings is done by asyncio validators
+    sharing one `aiohttp` connection pool, so waiting for slow dist-git or mdapi
+    doesn't block handling of other messages or mappings. Bugzilla, Koji
+    and Fedora messaging calls are still blocking and run in the default
+    executor of the event loop.
+
+    It could be used as fedora-messaging callback
+    `hotness.async_hotness_consumer:AsyncHotnessConsumer` or messages could be
+    passed directly to `handle` coroutine from other asyncio code running
+    in `loop`.
+
+    fedora-messaging calls the callback for one message at a time and
+    acknowledges the message when the callback returns, so when used
+    as callback, the messages are still handled one by one. Only the package
+    mappings of one message are validated concurrently. Messages are handled
+    concurrently only when `handle` is called concurrently by other asyncio code.
+
+    Attributes:
+        loop (`asyncio.AbstractEventLoop`): Event loop handling the messages
+        http_session (`aiohttp.ClientSession`): HTTP session shared
+                                    by the asyncio validators
+        validator_mdapi (`AsyncMDApi`): MDApi validator to retrieve the metadata
+                                    for package
+        validator_pagure (`AsyncPagure`): Pagure dist git for retrieval
+                                    of notification settings and to check
+                                    if a package is retired
+    """
+
+    TRANSIENT_ERRORS = HotnessConsumer.TRANSIENT_ERRORS + async_http.TRANSIENT_ERRORS
+
+    def __init__(self):
+        """
+        Consumer initialization.
+
+        Initializes the external systems the same way `HotnessConsumer` does,
+        except the validators, which are asyncio validators.
+
+        Raises:
+            ValueError: When validator cache or dist-git snapshot is enabled,
+              asyncio validators don't support them.
+        """
+        super(AsyncHotnessConsumer, self).__init__()
+        atexit.register(self.stop)
+
+    def _init_validators(self, requests_session, timeout):
+        """
+        Start the event loop and initialize the asyncio validators sharing
+        one HTTP session. The blocking session is only used by mdapi mirror.
+
+        Params:
+            requests_session: Session shared by the blocking validators
+            timeout: Connect and read timeout of requests
+
+        Raises:
+            ValueError: When validator cache or dist-git snapshot is enabled,
+              asyncio validators don't support them.
+        """
+        for section in ("validator_cache", "dist_git_snapshot"):
+            if config[section]["enabled"]:
+                raise ValueError(
+                    "{} is not supported by AsyncHotnessConsumer".format(section)
+                )
+
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self.loop.run_forever, name="hotness-asyncio", daemon=True
+        )
+        self._loop_thread.start()
+
+        # Session must be created in the event loop it's used by
+        self.http_session = self._run(self._create_session())
+        self.validator_mdapi = AsyncMDApi(
+            url=config["mdapi_url"],
+            session=self.http_session,
+            cache_expiration=config["mdapi_cache_expiration"],
+            mirror=self.mdapi_mirror,
+            retries=config["requests_retries"],
+        )
+        self.validator_pagure = AsyncPagure(
+            url=config["dist_git_url"],
+            session=self.http_session,
+            branch=config["repoid"],
+            package_type="rpm",
+            parallel_requests=config["dist_git_parallel_requests"],
+            retries=config["requests_retries"],
+        )
+
+    def _init_mapping_executor(self) -> None:
+        """
+        Package mappings are validated concurrently by the event loop,
+        the worker pool is never used and not created.
+        """
+        self.mapping_executor = None
+
+    def __call__(self, msg: Message) -> None:
+        """
+        Called when a message is received from RabbitMQ queue.
+        The message is handled by the event loop and this call blocks until
+        it's handled, so the message could be acknowledged or rejected
+        by fedora-messaging. Messages passed to the callback are therefore
+        handled one at a time.
+
+        Params:
+            msg: The message we received from the queue.
+
+        Raises:
+            Nack: For transient failures (network issues, timeouts, service unavailable)
+                  to retry the message later.
+        """
+        self._run(self.handle(msg))
+
+    async def handle(self, msg: Message) -> None:
+        """
+        Handle the message. Asyncio entry point of the consumer.
+
+        Params:
+            msg: The message to handle.
+
+        Raises:
+            Nack: For transient failures (network issues, timeouts, service unavailable)
+                  to retry the message later.
+        """
+        topic, body = msg.topic, msg.body
+        with self._handling_message(msg) as handling:
+            if self._filter_message(topic, body):
+                handling["result"] = "filtered"
+            elif topic.endswith("anitya.project.version.update.v2"):
+                message = ProjectVersionUpdatedV2(topic=topic, body=body)
+                # Deduplication could ask Redis, which is blocking
+                if self.deduplicator is not None and await asyncio.to_thread(
+                    self._is_duplicate, message
+                ):
+                    handling["result"] = "duplicate"
+                else:
+                    processed = False
+                    try:
+                        processed = await self._handle_anitya_version_update_async(
+                            message
+                        )
+                    finally:
+                        if not processed and self.deduplicator is not None:
+                            await asyncio.to_thread(self._release_processed, message)
+            elif topic.endswith("buildsys.task.state.change"):
+                await asyncio.to_thread(self._handle_buildsys_scratch, msg)
+
+    def stop(self) -> None:
+        """
+        Close the HTTP session and stop the event loop.
+        """
+        if not self.loop.is_running():
+            return
+        self._run(self.http_session.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join()
+
+    def _run(self, coroutine: Any) -> Any:
+        """
+        Run coroutine in the event loop and wait for its result.
+
+        Params:
+            coroutine: Coroutine to run
+
+        Returns:
+            Result of the coroutine.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    async def _create_session(self) -> Any:
+        """
+        Create HTTP session shared by the asyncio validators.
+
+        Returns:
+            `aiohttp.ClientSession` object.
+        """
+        return async_http.create_session(
+            connect_timeout=config["connect_timeout"],
+            read_timeout=config["read_timeout"],
+            pool_size=config["async_consumer"]["pool_size"],
+        )
+
+    async def _handle_anitya_version_update_async(
+        self, message: ProjectVersionUpdatedV2
+    ) -> bool:
+        """
+        Message handler for new versions found by Anitya,
+        see `HotnessConsumer._handle_anitya_version_update`.
+
+        All the package mappings are validated concurrently. The validated mappings
+        are processed one by one in the order of the message, so the published
+        messages and bugs are the same as with `HotnessConsumer`. Processing stops
+        on the first dropped mapping and the validations which are not needed
+        are cancelled.
+
+        Params:
+            message: Message to process.
+
+        Returns:
+            False if any mapping was dropped because of failure of external system,
+            True otherwise.
+
+        Raises:
+            Exception: First exception raised by any of the validations, nothing
+              else is processed after it.
+        """
+        mappings, retrieved_stable_versions = await asyncio.to_thread(
+            self._prepare_anitya_update, message
+        )
+
+        packages = [self._mapping_package(message, mapping) for mapping in mappings]
+        tasks = [
+            asyncio.ensure_future(
+                self._validate_package_async(package, retrieved_stable_versions)
+            )
+            for package in packages
+        ]
+
+        try:
+            for package, task in zip(packages, tasks):
+                validation_output = await task
+                with span("mapping", {"hotness.package": package.name}):
+                    reason = await asyncio.to_thread(
+                        self._process_validated_mapping,
+                        message,
+                        package,
+                        validation_output,
+                        retrieved_stable_versions,
+                    )
+                if reason:
+                    return reason not in self.ERROR_DROP_REASONS
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Retrieve the error, so it's not reported as never retrieved
+                    task.exception()
+
+        return True
+
+    async def _validate_package_async(
+        self, package: Package, stable_versions: List[str]
+    ) -> dict:
+        """
+        Validates the package with every asyncio validator,
+        see `HotnessConsumer._validate_package`.
+
+        Params:
+            package: Package to validate
+            stable_versions: Stable versions to check when monitoring
+                settings is set to stable only
+
+        Returns:
+            Dictionary containing output from the validators.
+        """
+        output = self._empty_validation_output()
+        # Check if we are monitoring the package
+        validate_request = PackageRequest(package)
+        validate_pagure_use_case = AsyncPackageCheckUseCase(self.validator_pagure)
+        pagure_response = await validate_pagure_use_case.validate(validate_request)
+        if not self._check_pagure_response(
+            package, pagure_response, stable_versions, output
+        ):
+            return output
+
+        # Check if the version is newer
+        validate_mdapi_use_case = AsyncPackageCheckUseCase(self.validator_mdapi)
+        mdapi_response = await validate_mdapi_use_case.validate(validate_request)
+        self._check_mdapi_response(
+            package, mdapi_response, pagure_response.value["all_versions"], output
+        )
+        return output
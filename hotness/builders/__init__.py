@@ -16,4 +16,7 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 from .builder import Builder  # noqa: F401
+from .git_mirror import GitMirror  # noqa: F401
 from .koji import Koji  # noqa: F401
+from .koji_session_pool import KojiSessionPool  # noqa: F401
+from .source_cache import SourceCache  # noqa: F401
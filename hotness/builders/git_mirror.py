@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import contextlib
+import fcntl
+import logging
+import os
+import shutil
+import subprocess as sp
+import typing
+
+_logger = logging.getLogger(__name__)
+
+
+class GitMirror:
+    """
+    Local cache of bare dist-git mirrors, one mirror per package.
+
+    Instead of cloning the package repository from dist-git for every build,
+    the mirror is updated by `git fetch` and the working copy is cloned from it
+    locally. Mirrors that weren't used for the longest time are removed when
+    the total size of the cache exceeds the limit.
+
+    Every mirror is guarded by a file lock, so concurrent builds of the same
+    package, even in different processes, don't update the same mirror
+    at once.
+
+    Attributes:
+        cache_dir: Directory where the mirrors are stored
+        max_size: Maximum total size of the mirrors in bytes, 0 means unlimited
+    """
+
+    def __init__(self, cache_dir: str, max_size: int = 0) -> None:
+        """
+        Class constructor.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def clone(self, name: str, url: str, target: str) -> None:
+        """
+        Clone the package repository to target directory using the local mirror.
+        The mirror is created or updated from url first.
+
+        The origin remote of the cloned repository points to url, so it looks
+        the same as a repository cloned directly from dist-git.
+
+        Params:
+            name: Name of the package
+            url: URL of the package repository
+            target: Directory to clone the repository to
+
+        Raises:
+            subprocess.CalledProcessError: If any git command fails.
+        """
+        mirror = self._mirror_path(name)
+        with self._lock(mirror):
+            if os.path.isdir(mirror):
+                _logger.info("Updating mirror %r from %r" % (mirror, url))
+                sp.check_output(
+                    ["git", "fetch", "--prune", url, "+refs/*:refs/*"],
+                    cwd=mirror,
+                    stderr=sp.STDOUT,
+                )
+            else:
+                _logger.info("Creating mirror %r of %r" % (mirror, url))
+                try:
+                    sp.check_output(
+                        ["git", "clone", "--mirror", url, mirror], stderr=sp.STDOUT
+                    )
+                except sp.CalledProcessError:
+                    # Don't leave partial mirror behind
+                    shutil.rmtree(mirror, ignore_errors=True)
+                    raise
+
+            _logger.info("Cloning %r to %r" % (mirror, target))
+            sp.check_output(["git", "clone", mirror, target], stderr=sp.STDOUT)
+            sp.check_output(
+                ["git", "remote", "set-url", "origin", url],
+                cwd=target,
+                stderr=sp.STDOUT,
+            )
+            # Modification time of the mirror is used for LRU eviction
+            os.utime(mirror)
+
+        self.evict(keep=mirror)
+
+    def evict(self, keep: str = "") -> typing.List[str]:
+        """
+        Remove least recently used mirrors until the total size of the cache
+        is below the limit. Mirrors that are currently locked are skipped.
+
+        Params:
+            keep: Path to mirror which shouldn't be removed
+
+        Returns:
+            List of removed mirrors.
+        """
+        removed: typing.List[str] = []
+        if not self.max_size:
+            return removed
+
+        mirrors = []
+        total_size = 0
+        for entry in os.scandir(self.cache_dir):
+            if not entry.is_dir() or not entry.name.endswith(".git"):
+                continue
+            size = self._size(entry.path)
+            total_size += size
+            mirrors.append((entry.stat().st_mtime, size, entry.path))
+
+        # Oldest first
+        for _, size, path in sorted(mirrors):
+            if total_size <= self.max_size:
+                break
+            if path == keep:
+                continue
+            with self._lock(path, blocking=False) as locked:
+                if not locked:
+                    continue
+                _logger.info("Evicting mirror %r" % path)
+                shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
+            removed.append(path)
+
+        return removed
+
+    def _mirror_path(self, name: str) -> str:
+        """
+        Return path to the mirror of the package.
+
+        Params:
+            name: Name of the package
+
+        Returns:
+            Path to the mirror.
+        """
+        return os.path.join(self.cache_dir, name.replace(os.sep, "_") + ".git")
+
+    @contextlib.contextmanager
+    def _lock(self, mirror: str, blocking: bool = True) -> typing.Iterator[bool]:
+        """
+        Hold exclusive file lock for the mirror.
+
+        Params:
+            mirror: Path to the mirror
+            blocking: Wait for the lock if it's held by somebody else
+
+        Returns:
+            True if the lock was acquired, False otherwise.
+        """
+        flags = fcntl.LOCK_EX
+        if not blocking:
+            flags |= fcntl.LOCK_NB
+        with open(mirror + ".lock", "w") as lock_file:
+            try:
+                fcntl.flock(lock_file, flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _size(self, path: str) -> int:
+        """
+        Return size of all files in directory.
+
+        Params:
+            path: Path to directory
+
+        Returns:
+            Size in bytes.
+        """
+        size = 0
+        for root, _, files in os.walk(path):
+            for file_name in files:
+                with contextlib.suppress(OSError):
+                    size += os.lstat(os.path.join(root, file_name)).st_size
+        return size
@@ -15,28 +15,41 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
-import hashlib
+import concurrent.futures
 import logging
 import os
 import random
+import re
 import string
 import subprocess as sp
 from tempfile import TemporaryDirectory
 import threading
 import time
 import typing
+import zlib
 
 import koji  # type: ignore
 
 from . import Builder
+from .git_mirror import GitMirror
+from .koji_session_pool import KojiSessionPool
+from .source_cache import SourceCache, sha512sum
+from hotness.common.metrics import EXTERNAL_CALL_DURATION, KOJI_UPLOAD_THROUGHPUT
 from hotness.domain.package import Package
 from hotness.exceptions import DownloadException, BuilderException
 
 _logger = logging.getLogger(__name__)
 
-# Thread lock for koji session
+# Thread lock for koji login
 _koji_session_lock = threading.RLock()
 
+# Maximum number of files hashed in parallel
+HASH_WORKERS = 4
+
+# Initial and maximum wait in seconds before retrying upload of a chunk
+UPLOAD_BACKOFF = 1
+UPLOAD_BACKOFF_MAX = 30
+
 
 class Koji(Builder):
     """
@@ -56,8 +69,19 @@ class Koji(Builder):
        opts: Any additional opts for koji
        priority: Priority of builds submitted by this wrapper
        target_tag: Tag under which builds will be submitted
+       git_mirror: Local cache of dist git mirrors, if None the package repository
+         is cloned directly from dist git
+       source_cache: Local cache of package sources, if None the sources are always
+         downloaded
+       session_pool: Pool of authenticated Koji sessions reused across builds
+       upload_chunk_size: Size of chunks in bytes for resumable SRPM upload,
+         0 uploads the whole SRPM at once
+       upload_retries: Number of retries of every chunk upload
+       __sources_line_regex: Regex for parsing line of dist git `sources` file
     """
 
+    __sources_line_regex = re.compile(r"^SHA512 \((.+)\) = ([0-9a-f]{128})$", re.I)
+
     def __init__(
         self,
         server_url: str,
@@ -68,6 +92,11 @@ class Koji(Builder):
         opts: dict,
         priority: int,
         target_tag: str,
+        git_mirror: typing.Optional[GitMirror] = None,
+        source_cache: typing.Optional[SourceCache] = None,
+        session_pool_size: int = 1,
+        upload_chunk_size: int = 0,
+        upload_retries: int = 3,
     ) -> None:
         """
         Class constructor.
@@ -85,6 +114,11 @@ class Koji(Builder):
         self.opts = opts
         self.priority = priority
         self.target_tag = target_tag
+        self.git_mirror = git_mirror
+        self.source_cache = source_cache
+        self.session_pool = KojiSessionPool(self._session_maker, size=session_pool_size)
+        self.upload_chunk_size = upload_chunk_size
+        self.upload_retries = upload_retries
 
     def build(self, package: Package, opts: dict) -> dict:
         """
@@ -117,9 +151,17 @@ class Koji(Builder):
         # because it's needed for OpenShift
         with TemporaryDirectory(prefix="thn-", dir="/var/tmp") as tmp:  # nosec
             dist_git_url = self.git_url.format(package=package.name)
-            _logger.info("Cloning %r to %r" % (dist_git_url, tmp))
             try:
-                sp.check_output(["git", "clone", dist_git_url, tmp], stderr=sp.STDOUT)
+                with EXTERNAL_CALL_DURATION.labels(
+                    system="koji", operation="clone"
+                ).time():
+                    if self.git_mirror:
+                        self.git_mirror.clone(package.name, dist_git_url, tmp)
+                    else:
+                        _logger.info("Cloning %r to %r" % (dist_git_url, tmp))
+                        sp.check_output(
+                            ["git", "clone", dist_git_url, tmp], stderr=sp.STDOUT
+                        )
             except sp.CalledProcessError as exc:
                 std_out = ""
                 std_err = ""
@@ -145,7 +187,10 @@ class Koji(Builder):
                 specfile,
             ]
             try:
-                sp.check_output(cmd, stderr=sp.STDOUT)
+                with EXTERNAL_CALL_DURATION.labels(
+                    system="koji", operation="bumpspec"
+                ).time():
+                    sp.check_output(cmd, stderr=sp.STDOUT)
             except sp.CalledProcessError as exc:
                 std_out = ""
                 std_err = ""
@@ -219,28 +264,40 @@ class Koji(Builder):
             # new sources from bumping the specfile version. Some packages don't
             # use macros in the source URL(s). We want to detect these and notify
             # the packager on the bug we filed about the new version.
-            old_sources = self._dist_git_sources(tmp)
-            try:
-                new_sources = self._spec_sources(specfile, tmp)
-            except DownloadException as exc:
-                # Attach the patch if DownloadException is thrown
-                raise BuilderException(str(exc), value=output)
-            output["message"] = self._compare_sources(old_sources, new_sources)
+            # Checksums of the sources are shared, so no file is hashed twice
+            checksums: typing.Dict[str, str] = {}
+            with EXTERNAL_CALL_DURATION.labels(
+                system="koji", operation="sources"
+            ).time():
+                old_sources = self._dist_git_sources(tmp, checksums)
+                try:
+                    new_sources = self._spec_sources(specfile, tmp, checksums)
+                except DownloadException as exc:
+                    # Attach the patch if DownloadException is thrown
+                    raise BuilderException(str(exc), value=output)
+                output["message"] = self._compare_sources(
+                    old_sources, new_sources, checksums
+                )
+            if self.source_cache:
+                _logger.info("Source cache stats: %r" % self.source_cache.stats())
 
             try:
-                cmd_output = sp.check_output(
-                    [
-                        "rpmbuild",
-                        "-D",
-                        "_sourcedir .",
-                        "-D",
-                        "_topdir .",
-                        "-bs",
-                        specfile,
-                    ],
-                    cwd=tmp,
-                    stderr=sp.STDOUT,
-                )
+                with EXTERNAL_CALL_DURATION.labels(
+                    system="koji", operation="rpmbuild"
+                ).time():
+                    cmd_output = sp.check_output(
+                        [
+                            "rpmbuild",
+                            "-D",
+                            "_sourcedir .",
+                            "-D",
+                            "_topdir .",
+                            "-bs",
+                            specfile,
+                        ],
+                        cwd=tmp,
+                        stderr=sp.STDOUT,
+                    )
             except sp.CalledProcessError as exc:
                 std_out = ""
                 std_err = ""
@@ -268,16 +325,21 @@ class Koji(Builder):
 
             _logger.debug("Got srpm %r" % srpm)
 
-            session = self._session_maker()
-            if not session:
-                raise BuilderException("Can't authenticate with Koji!")
-            output["build_id"] = self._scratch_build(session, package.name, srpm)
+            with self.session_pool.session() as session:
+                if not session:
+                    raise BuilderException("Can't authenticate with Koji!")
+                output["build_id"] = self._scratch_build(session, package.name, srpm)
 
             return output
 
-    def _dist_git_sources(self, dist_git_path: str) -> list:
+    def _dist_git_sources(
+        self,
+        dist_git_path: str,
+        checksums: typing.Optional[typing.Dict[str, str]] = None,
+    ) -> list:
         """
-        Retrieve sources from dist-git.
+        Retrieve sources from dist-git. Sources available in source cache
+        are not downloaded again.
 
         Example:
             >>> dist_git_sources('/path/to/repo')
@@ -285,11 +347,27 @@ class Koji(Builder):
 
         Params:
             dist_git_path: The filesystem path to the dist-git repository
+            checksums: Dictionary to store SHA512 checksums of the sources,
+              listed in `sources` file, in
 
         Returns:
             A list of absolute paths to source files downloaded
         """
         files = []
+        sources_checksums = self._read_sources_file(dist_git_path)
+        if checksums is not None:
+            for file_name, checksum in sources_checksums.items():
+                checksums[os.path.join(dist_git_path, file_name)] = checksum
+
+        if self.source_cache:
+            for file_name, checksum in sources_checksums.items():
+                file_path = os.path.join(dist_git_path, file_name)
+                if self.source_cache.get(file_path, checksum=checksum):
+                    files.append(file_path)
+            # Everything was retrieved from cache
+            if sources_checksums and len(files) == len(sources_checksums):
+                return files
+
         # The output format is:
         # Downloading requests-2.12.4.tar.gz from https://src.fedoraproject.org/repo/pkgs
         # ####################################################################### 100.0%
@@ -300,13 +378,104 @@ class Koji(Builder):
         )
         for line in output.decode("utf-8").splitlines():
             if line.startswith("Downloading"):
-                files.append(os.path.join(dist_git_path, line.split()[1]))
+                file_name = line.split()[1]
+                file_path = os.path.join(dist_git_path, file_name)
+                files.append(file_path)
+                if self.source_cache:
+                    self._cache_source(
+                        file_path, checksum=sources_checksums.get(file_name, "")
+                    )
 
         return files
 
-    def _spec_sources(self, specfile_path: str, target_dir: str) -> list:
+    def _read_sources_file(self, dist_git_path: str) -> typing.Dict[str, str]:
+        """
+        Read SHA512 checksums of sources from `sources` file in dist-git repository.
+        Lines in other format than `SHA512 (file) = checksum` are ignored.
+
+        Params:
+            dist_git_path: The filesystem path to the dist-git repository
+
+        Returns:
+            Dictionary with file names as keys and checksums as values.
+        """
+        checksums = {}
+        try:
+            with open(os.path.join(dist_git_path, "sources")) as f:
+                for line in f:
+                    match = self.__sources_line_regex.match(line.strip())
+                    if match:
+                        checksums[match.group(1)] = match.group(2)
+        except OSError:
+            _logger.debug("No sources file found in %r" % dist_git_path)
+
+        return checksums
+
+    def _spec_source_urls(
+        self, specfile_path: str, target_dir: str
+    ) -> typing.Dict[str, str]:
+        """
+        List remote sources of the specfile.
+
+        Params:
+            specfile_path: The filesystem path to the specfile
+            target_dir: The directory where the file(s) will be saved.
+
+        Returns:
+            Dictionary with paths where spectool saves the sources as keys
+            and source URLs as values.
+        """
+        sources: typing.Dict[str, str] = {}
+        try:
+            output = sp.check_output(
+                ["spectool", "-l", specfile_path], cwd=target_dir, stderr=sp.DEVNULL
+            )
+        except sp.CalledProcessError:
+            # The error is reported when downloading the sources
+            return sources
+
+        # The output format is:
+        # Source0: https://example.com/foo-1.0.tar.gz
+        # Patch0: foo.patch
+        for line in output.decode("utf-8").splitlines():
+            _, _, url = line.partition(": ")
+            url = url.strip()
+            if "://" not in url:
+                continue
+            # spectool takes the file name from the URL fragment when present
+            file_name = os.path.basename(url.split("#")[-1] if "#/" in url else url)
+            file_name = file_name.split("?")[0]
+            if file_name:
+                sources[os.path.realpath(os.path.join(target_dir, file_name))] = url
+
+        return sources
+
+    def _cache_source(self, file_path: str, checksum: str = "", url: str = "") -> None:
+        """
+        Store downloaded source in source cache. Any error is only logged,
+        because the build can continue without the cache.
+
+        Params:
+            file_path: Path to the source
+            checksum: SHA512 checksum of the source, computed if not provided
+            url: URL the source was downloaded from
+        """
+        if not self.source_cache:
+            return
+        try:
+            self.source_cache.put(file_path, checksum=checksum, url=url)
+        except OSError:
+            _logger.exception("Couldn't store %r in source cache" % file_path)
+
+    def _spec_sources(
+        self,
+        specfile_path: str,
+        target_dir: str,
+        checksums: typing.Optional[typing.Dict[str, str]] = None,
+    ) -> list:
         """
         Retrieve a specfile's sources and store them in the given target directory.
+        Sources available in source cache are not downloaded again.
 
         Example:
             >>> spec_sources('/path/to/specfile', '/tmp/dir')
@@ -315,6 +484,8 @@ class Koji(Builder):
         Params:
             specfile_path: The filesystem path to the specfile
             target_dir: The directory is where the file(s) will be saved.
+            checksums: Dictionary to store SHA512 checksums of the sources,
+              computed when storing them in source cache, in
 
         Returns:
             A list of absolute paths to source files downloaded
@@ -325,13 +496,25 @@ class Koji(Builder):
                 non-200 HTTP status codes, SSL errors, etc.
         """
         files = []
+        urls: typing.Dict[str, str] = {}
+        cached: typing.Set[str] = set()
+        if self.source_cache:
+            urls = self._spec_source_urls(specfile_path, target_dir)
+            for file_path, url in urls.items():
+                if self.source_cache.get(file_path, url=url):
+                    cached.add(file_path)
+                    files.append(file_path)
         try:
             output = sp.check_output(["spectool", "-g", specfile_path], cwd=target_dir)
             for line in output.decode("utf-8").splitlines():
                 if line.startswith("Downloaded"):
-                    files.append(
-                        os.path.realpath(os.path.join(target_dir, line.split()[-1]))
+                    file_path = os.path.realpath(
+                        os.path.join(target_dir, line.split()[-1])
                     )
+                    # Already retrieved from cache
+                    if file_path in cached:
+                        continue
+                    files.append(file_path)
         except sp.CalledProcessError as e:
             # spectool passes the cURL exit codes back so see its manpage for the full list
             if e.returncode == 1:
@@ -372,9 +555,22 @@ class Koji(Builder):
                 )
             raise DownloadException(msg)
 
+        downloaded = [path for path in files if path in urls and path not in cached]
+        if self.source_cache and downloaded:
+            checksums = self._checksum_files(downloaded, checksums)
+            for file_path in downloaded:
+                self._cache_source(
+                    file_path, checksum=checksums[file_path], url=urls[file_path]
+                )
+
         return files
 
-    def _compare_sources(self, old_sources: list, new_sources: list) -> str:
+    def _compare_sources(
+        self,
+        old_sources: list,
+        new_sources: list,
+        checksums: typing.Optional[typing.Dict[str, str]] = None,
+    ) -> str:
         """
         Compare two sets of files via checksum and raise an exception if both sets
         contain the same file.
@@ -382,45 +578,30 @@ class Koji(Builder):
         Params:
             old_sources: A list of filesystem paths to source tarballs.
             new_sources: A list of filesystem paths to source tarballs.
+            checksums: Already known SHA512 checksums of the files, only the missing
+              ones are computed
 
         Returns:
             String containing information message, it is returned when identical files
             are found, otherwise it's empty.
         """
+        checksums = self._checksum_files(old_sources + new_sources, checksums)
         old_checksums: typing.Set[str] = set()
         new_checksums: typing.Set[str] = set()
         source_checksum: typing.Dict = {}
-        for sources, checksums in ((old_sources, old_checksums),):
+        for sources, checksums_set, key in (
+            (old_sources, old_checksums, "old_sources"),
+            (new_sources, new_checksums, "new_sources"),
+        ):
             for file_path in sources:
-                with open(file_path, "rb") as fd:
-                    h = hashlib.sha512()
-                    h.update(fd.read())
-                    checksum = h.hexdigest()
-                    checksums.add(checksum)
-                    if checksum not in source_checksum:
-                        source_checksum[checksum] = {
-                            "old_sources": [],
-                            "new_sources": [],
-                        }
-                    source_checksum[checksum]["old_sources"].append(
-                        os.path.basename(file_path)
-                    )
-
-        for sources, checksums in ((new_sources, new_checksums),):
-            for file_path in sources:
-                with open(file_path, "rb") as fd:
-                    h = hashlib.sha512()
-                    h.update(fd.read())
-                    checksum = h.hexdigest()
-                    checksums.add(checksum)
-                    if checksum not in source_checksum:
-                        source_checksum[checksum] = {
-                            "old_sources": [],
-                            "new_sources": [],
-                        }
-                    source_checksum[checksum]["new_sources"].append(
-                        os.path.basename(file_path)
-                    )
+                checksum = checksums[file_path]
+                checksums_set.add(checksum)
+                if checksum not in source_checksum:
+                    source_checksum[checksum] = {
+                        "old_sources": [],
+                        "new_sources": [],
+                    }
+                source_checksum[checksum][key].append(os.path.basename(file_path))
 
         intersection_checksums = old_checksums.intersection(new_checksums)
         if intersection_checksums:
@@ -445,9 +626,39 @@ class Koji(Builder):
 
         return ""
 
+    def _checksum_files(
+        self, paths: list, checksums: typing.Optional[typing.Dict[str, str]] = None
+    ) -> typing.Dict[str, str]:
+        """
+        Compute SHA512 checksums of files. The files are read in chunks
+        and hashed in parallel, hashlib releases GIL when hashing.
+
+        Params:
+            paths: A list of filesystem paths to files
+            checksums: Already known checksums, these files are not hashed again
+
+        Returns:
+            Dictionary with paths as keys and checksums as values. It is the provided
+            checksums dictionary updated with new checksums.
+        """
+        if checksums is None:
+            checksums = {}
+        missing = [path for path in dict.fromkeys(paths) if path not in checksums]
+        if len(missing) == 1:
+            checksums[missing[0]] = sha512sum(missing[0])
+        elif missing:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(missing), HASH_WORKERS),
+                thread_name_prefix="hotness-hash",
+            ) as executor:
+                for path, checksum in zip(missing, executor.map(sha512sum, missing)):
+                    checksums[path] = checksum
+
+        return checksums
+
     def _session_maker(self) -> typing.Optional[koji.ClientSession]:
         """
-        Creates a new koji session for the build.
+        Creates a new authenticated koji session. It is used by the session pool.
 
         Returns:
             New koji session or None if authentication fails.
@@ -484,28 +695,45 @@ class Koji(Builder):
         _logger.info("Uploading {source} to koji".format(source=source))
         suffix = "".join([random.choice(string.ascii_letters) for i in range(8)])
         serverdir = "%s/%r.%s" % ("cli-build", time.time(), suffix)
-        retry_counter = 0
-        upload_successful = False
-        while retry_counter < 3 and not upload_successful:
-            try:
-                session.uploadWrapper(source, serverdir)
-                upload_successful = True
-            except koji.GenericError:
-                # Wait for 5 seconds and retry the upload
-                time.sleep(5)
-                retry_counter += 1
-
-        if not upload_successful:
-            raise BuilderException("Couldn't upload source {} to koji.".format(source))
+        with EXTERNAL_CALL_DURATION.labels(system="koji", operation="upload").time():
+            if self.upload_chunk_size:
+                self._chunked_upload(session, source, serverdir)
+            else:
+                retry_counter = 0
+                upload_successful = False
+                # Uploaded bytes and elapsed time reported by Koji after every chunk
+                progress = {"uploaded": 0, "elapsed": 0.0}
+
+                def callback(uploaded, size, chunk_size, chunk_time, elapsed):
+                    progress.update(uploaded=uploaded, elapsed=elapsed)
+
+                while retry_counter < 3 and not upload_successful:
+                    try:
+                        session.uploadWrapper(source, serverdir, callback=callback)
+                        upload_successful = True
+                    except koji.GenericError:
+                        # Wait for 5 seconds and retry the upload
+                        time.sleep(5)
+                        retry_counter += 1
+
+                if not upload_successful:
+                    raise BuilderException(
+                        "Couldn't upload source {} to koji.".format(source)
+                    )
+                if progress["elapsed"]:
+                    KOJI_UPLOAD_THROUGHPUT.observe(
+                        progress["uploaded"] / progress["elapsed"]
+                    )
 
         remote = "%s/%s" % (serverdir, os.path.basename(source))
         _logger.info(
             "Intiating koji build for %r"
             % dict(name=name, target=self.target_tag, source=remote, opts=self.opts)
         )
-        task_id = session.build(
-            remote, self.target_tag, self.opts, priority=self.priority
-        )
+        with EXTERNAL_CALL_DURATION.labels(system="koji", operation="build").time():
+            task_id = session.build(
+                remote, self.target_tag, self.opts, priority=self.priority
+            )
         _logger.info(
             "Scratch build created for {name}: {url}".format(
                 name=name, url=self.web_url + "/taskinfo?taskID={}".format(task_id)
@@ -513,3 +741,103 @@ class Koji(Builder):
         )
 
         return task_id
+
+    def _chunked_upload(
+        self, session: koji.ClientSession, source: str, serverdir: str
+    ) -> None:
+        """
+        Uploads file to Koji in chunks. Failed chunk is retried with exponential
+        backoff without uploading the chunks before it again. Every chunk and
+        the whole uploaded file are verified by adler32 checksum.
+
+        Chunks are uploaded one after another, because Koji hub locks the uploaded
+        file for every chunk and doesn't allow writing it in parallel.
+
+        Params:
+            session: Koji session to use for upload
+            source: Path to file
+            serverdir: Directory on Koji server to upload the file to
+
+        Raises:
+            BuilderException: If the upload fails or the uploaded file doesn't match.
+        """
+        name = os.path.basename(source)
+        start = time.monotonic()
+        offset = 0
+        checksum = zlib.adler32(b"")
+        with open(source, "rb") as fd:
+            while True:
+                chunk = fd.read(self.upload_chunk_size)
+                # Empty file still needs to be created on server
+                if not chunk and offset:
+                    break
+                self._upload_chunk(session, chunk, offset, serverdir, name, source)
+                checksum = zlib.adler32(chunk, checksum)
+                offset += len(chunk)
+                if not chunk:
+                    break
+
+        result = session.checkUpload(serverdir, name, verify="adler32")
+        if (
+            not result
+            or int(result["size"]) != offset
+            or result["hexdigest"] != "%08x" % checksum
+        ):
+            raise BuilderException(
+                "Uploaded source {} doesn't match the local file.".format(source)
+            )
+
+        elapsed = max(time.monotonic() - start, 0.001)
+        KOJI_UPLOAD_THROUGHPUT.observe(offset / elapsed)
+        _logger.info(
+            "Uploaded %s (%d bytes) to koji in %.2f seconds (%.1f KiB/s)"
+            % (source, offset, elapsed, offset / elapsed / 1024)
+        )
+
+    def _upload_chunk(
+        self,
+        session: koji.ClientSession,
+        chunk: bytes,
+        offset: int,
+        serverdir: str,
+        name: str,
+        source: str,
+    ) -> None:
+        """
+        Uploads one chunk of file to Koji and verifies it, retries on failure.
+
+        Params:
+            session: Koji session to use for upload
+            chunk: Data to upload
+            offset: Offset of the chunk in file
+            serverdir: Directory on Koji server to upload the file to
+            name: Name of the uploaded file
+            source: Path to local file, used in error message
+
+        Raises:
+            BuilderException: If the chunk upload fails after all retries.
+            koji.AuthError: If the session is no longer authenticated.
+        """
+        hexdigest = "%08x" % zlib.adler32(chunk)
+        for attempt in range(self.upload_retries + 1):
+            try:
+                result = session.rawUpload(
+                    chunk, offset, serverdir, name, overwrite=True
+                )
+                if result["size"] == len(chunk) and result["hexdigest"] == hexdigest:
+                    return
+                _logger.warning(
+                    "Checksum mismatch of chunk at offset %d of %s" % (offset, source)
+                )
+            except koji.AuthError:
+                raise
+            except koji.GenericError as exc:
+                _logger.warning(
+                    "Upload of chunk at offset %d of %s failed: %s"
+                    % (offset, source, exc)
+                )
+
+            if attempt < self.upload_retries:
+                time.sleep(min(UPLOAD_BACKOFF * 2**attempt, UPLOAD_BACKOFF_MAX))
+
+        raise BuilderException("Couldn't upload source {} to koji.".format(source))
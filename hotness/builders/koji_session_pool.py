@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import collections
+import contextlib
+import logging
+import threading
+import time
+import typing
+
+import koji  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+
+class KojiSessionPool:
+    """
+    Pool of authenticated Koji sessions reused across builds.
+
+    Every session is used by only one thread at a time, because Koji session
+    isn't thread safe. At most `size` sessions exist at once, callers wait
+    for a free session when all of them are used.
+
+    Session which wasn't used for `check_interval` seconds is checked before
+    reuse and replaced by a new one if it's no longer logged in. Session is also
+    dropped when Koji reports authentication error during its use.
+
+    Attributes:
+        factory: Function creating new authenticated session, returns None
+          if authentication fails
+        size: Maximum number of sessions
+        check_interval: Time in seconds after which idle session is checked
+          before reuse
+    """
+
+    def __init__(
+        self,
+        factory: typing.Callable[[], typing.Optional[koji.ClientSession]],
+        size: int = 1,
+        check_interval: float = 60,
+    ) -> None:
+        """
+        Class constructor.
+        """
+        self.factory = factory
+        self.size = size
+        self.check_interval = check_interval
+        self._idle: typing.Deque[typing.Tuple[koji.ClientSession, float]] = (
+            collections.deque()
+        )
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(size)
+
+    @contextlib.contextmanager
+    def session(self) -> typing.Iterator[typing.Optional[koji.ClientSession]]:
+        """
+        Borrow authenticated session from the pool.
+
+        Example:
+            >>> with pool.session() as session:
+            ...     session.build(...)
+
+        Returns:
+            Koji session or None if authentication fails.
+        """
+        with self._semaphore:
+            session = self._get()
+            if session is None:
+                yield None
+                return
+
+            reuse = True
+            try:
+                yield session
+            except koji.AuthError:
+                _logger.info("Dropping Koji session after authentication error")
+                reuse = False
+                raise
+            finally:
+                if reuse:
+                    with self._lock:
+                        self._idle.append((session, time.monotonic()))
+
+    def _get(self) -> typing.Optional[koji.ClientSession]:
+        """
+        Return idle session which is still valid or create a new one.
+
+        Returns:
+            Koji session or None if authentication fails.
+        """
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                # Most recently used session is the most likely to be valid
+                session, last_used = self._idle.pop()
+
+            if time.monotonic() - last_used < self.check_interval:
+                return session
+            if self._is_valid(session):
+                return session
+            _logger.info("Koji session expired, dropping it")
+
+        return self.factory()
+
+    def _is_valid(self, session: koji.ClientSession) -> bool:
+        """
+        Check if session is still logged in.
+
+        Params:
+            session: Koji session to check
+
+        Returns:
+            True if session is logged in, False otherwise.
+        """
+        try:
+            return bool(session.getLoggedInUser())
+        except Exception:
+            return False
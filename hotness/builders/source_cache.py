@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import contextlib
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import typing
+
+_logger = logging.getLogger(__name__)
+
+# Size of chunks used when computing checksum of file
+CHUNK_SIZE = 1024 * 1024
+
+# Regex for validating SHA512 checksum
+_sha512_regex = re.compile("^[0-9a-f]{128}$", re.I)
+
+
+class SourceCache:
+    """
+    Content-addressed on-disk cache of package sources.
+
+    Every file is stored once under its SHA512 checksum in `objects` directory.
+    Files downloaded from URL are also indexed by the URL in `urls` directory,
+    which contains the checksum of the file downloaded from the URL.
+
+    Cached files are hardlinked to the target directory when possible, otherwise
+    they are copied. Least recently used files are removed when the total size
+    of the cache exceeds the limit.
+
+    Attributes:
+        cache_dir: Directory where the sources are stored
+        max_size: Maximum total size of the cached files in bytes, 0 means unlimited
+        hits: Number of sources retrieved from cache
+        misses: Number of sources not found in cache
+    """
+
+    def __init__(self, cache_dir: str, max_size: int = 0) -> None:
+        """
+        Class constructor.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._objects_dir = os.path.join(cache_dir, "objects")
+        self._urls_dir = os.path.join(cache_dir, "urls")
+        self._lock = threading.Lock()
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._urls_dir, exist_ok=True)
+
+    def get(self, target: str, checksum: str = "", url: str = "") -> bool:
+        """
+        Retrieve file from cache by SHA512 checksum or URL and place it to target path.
+
+        Params:
+            target: Path where the cached file should be placed
+            checksum: SHA512 checksum of the file
+            url: URL the file was downloaded from, used when checksum is not provided
+
+        Returns:
+            True if the file was found in cache, False otherwise.
+        """
+        if not checksum and url:
+            checksum = self._read_url(url)
+
+        found = False
+        if _sha512_regex.match(checksum):
+            path = self._object_path(checksum)
+            try:
+                # Modification time of the file is used for LRU eviction
+                os.utime(path)
+                self._link(path, target)
+                found = True
+            except OSError:
+                found = False
+
+        with self._lock:
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if found:
+            _logger.debug("Using cached source %r for %r" % (checksum, target))
+        return found
+
+    def put(self, path: str, checksum: str = "", url: str = "") -> str:
+        """
+        Store file in cache.
+
+        Params:
+            path: Path to the file
+            checksum: SHA512 checksum of the file, computed if not provided
+            url: URL the file was downloaded from
+
+        Returns:
+            SHA512 checksum of the file.
+        """
+        if not _sha512_regex.match(checksum):
+            checksum = sha512sum(path)
+
+        object_path = self._object_path(checksum)
+        if not os.path.exists(object_path):
+            self._atomic_link(path, object_path)
+
+        if url:
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self._urls_dir, delete=False
+            ) as f:
+                f.write(checksum)
+            os.replace(f.name, self._url_path(url))
+
+        self.evict(keep=object_path)
+
+        return checksum
+
+    def evict(self, keep: str = "") -> typing.List[str]:
+        """
+        Remove least recently used files until the total size of the cache
+        is below the limit.
+
+        Params:
+            keep: Path to cached file which shouldn't be removed
+
+        Returns:
+            List of removed files.
+        """
+        removed: typing.List[str] = []
+        if not self.max_size:
+            return removed
+
+        objects = []
+        total_size = 0
+        for entry in os.scandir(self._objects_dir):
+            if not entry.is_file() or entry.name.startswith("."):
+                continue
+            stat = entry.stat()
+            total_size += stat.st_size
+            objects.append((stat.st_mtime, stat.st_size, entry.path))
+
+        # Oldest first
+        for _, size, path in sorted(objects):
+            if total_size <= self.max_size:
+                break
+            if path == keep:
+                continue
+            _logger.info("Evicting cached source %r" % path)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total_size -= size
+            removed.append(path)
+
+        return removed
+
+    def stats(self) -> dict:
+        """
+        Return the cache statistics.
+
+        Returns:
+            Dictionary containing number of cache hits, misses and hit rate.
+            Example:
+            {
+                "hits": 3,
+                "misses": 1,
+                "hit_rate": 0.75
+            }
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            hit_rate = self.hits / total if total else 0.0
+            return {"hits": self.hits, "misses": self.misses, "hit_rate": hit_rate}
+
+    def _object_path(self, checksum: str) -> str:
+        """
+        Return path to the cached file with checksum.
+
+        Params:
+            checksum: SHA512 checksum of the file
+
+        Returns:
+            Path to the cached file.
+        """
+        return os.path.join(self._objects_dir, checksum.lower())
+
+    def _url_path(self, url: str) -> str:
+        """
+        Return path to the index entry for URL.
+
+        Params:
+            url: URL of the file
+
+        Returns:
+            Path to the index entry.
+        """
+        return os.path.join(self._urls_dir, hashlib.sha256(url.encode()).hexdigest())
+
+    def _read_url(self, url: str) -> str:
+        """
+        Return checksum of the file downloaded from URL.
+
+        Params:
+            url: URL of the file
+
+        Returns:
+            SHA512 checksum or empty string if the URL is not in cache.
+        """
+        try:
+            with open(self._url_path(url)) as f:
+                return f.read().strip()
+        except OSError:
+            return ""
+
+    def _link(self, source: str, target: str) -> None:
+        """
+        Hardlink source file to target path, copy it if hardlink is not possible.
+
+        Params:
+            source: Path to the source file
+            target: Path to the target file
+        """
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(target)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+    def _atomic_link(self, source: str, target: str) -> None:
+        """
+        Place source file to target path in cache, so other processes never see
+        partially written file.
+
+        Params:
+            source: Path to the source file
+            target: Path to the target file in cache
+        """
+        tmp = os.path.join(
+            os.path.dirname(target),
+            ".{}.{}.{}".format(
+                os.path.basename(target), os.getpid(), threading.get_ident()
+            ),
+        )
+        self._link(source, tmp)
+        os.replace(tmp, target)
+
+
+def sha512sum(path: str) -> str:
+    """
+    Compute SHA512 checksum of file without reading it to memory at once.
+
+    Params:
+        path: Path to the file
+
+    Returns:
+        Hexadecimal SHA512 checksum.
+    """
+    h = hashlib.sha512()
+    with open(path, "rb") as fd:
+        for chunk in iter(lambda: fd.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
@@ -16,3 +16,5 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 from .rpm import RPM  # noqa: F401
+from .bloom_filter import BloomFilter  # noqa: F401
+from .deduplicator import Deduplicator  # noqa: F401
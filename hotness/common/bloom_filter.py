@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import hashlib
+import math
+import threading
+from typing import Iterator
+
+
+class BloomFilter:
+    """
+    Probabilistic set of strings with fixed memory usage.
+
+    Membership test never returns false negative, but it could return false
+    positive with probability `error_rate`, when no more than `capacity`
+    items were added. Items can't be removed from the filter.
+
+    Size of the filter in bits is computed from capacity and error rate:
+    `-capacity * ln(error_rate) / ln(2) ** 2`, which is roughly 1.2 bytes per
+    item for 1 % error rate.
+
+    Attributes:
+        capacity: Expected maximum number of items in filter
+        error_rate: Expected probability of false positive
+        num_bits: Size of the filter in bits
+        num_hashes: Number of bits set for every item
+        count: Number of items added to filter
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        """
+        Class constructor.
+
+        Params:
+            capacity: Expected maximum number of items in filter
+            error_rate: Expected probability of false positive, between 0 and 1
+
+        Raises:
+            ValueError: If capacity or error rate is out of range.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity of bloom filter must be positive.")
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate of bloom filter must be between 0 and 1.")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+
+    def add(self, item: str) -> None:
+        """
+        Add item to filter.
+
+        Params:
+            item: Item to add
+        """
+        with self._lock:
+            for position in self._positions(item):
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def __contains__(self, item: object) -> bool:
+        """
+        Check if item was added to filter.
+
+        Params:
+            item: Item to check
+
+        Returns:
+            False if the item was never added, True if it was probably added.
+        """
+        if not isinstance(item, str):
+            return False
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def __len__(self) -> int:
+        """
+        Return number of items added to filter.
+        """
+        return self.count
+
+    @property
+    def size(self) -> int:
+        """
+        Memory used by the bits of filter in bytes.
+        """
+        return len(self._bits)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        """
+        Return positions of bits for item, computed by double hashing
+        from one 128-bit digest.
+
+        Params:
+            item: Item to hash
+
+        Returns:
+            Iterator over `num_hashes` bit positions.
+        """
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        # Odd step makes sure the positions don't repeat too early
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (first + i * second) % self.num_bits
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import logging
+import threading
+from typing import Optional
+
+from hotness.databases import Cache, Database
+
+_logger = logging.getLogger(__name__)
+
+
+class Deduplicator:
+    """
+    Time window for recognizing messages which were already processed.
+
+    Keys are claimed before the message is processed and released when
+    the processing fails, so the message could be processed again.
+    Claimed keys are remembered in memory, least recently used keys are evicted
+    when there are more than `max_size` of them. The keys could also be shared
+    with other instances of the-new-hotness through database, which is asked
+    when the key isn't found in memory. Every key is forgotten `window` seconds
+    after it was claimed, the database must be created with the same expiration.
+
+    Any error of the database is logged and the key is treated as not claimed
+    by other instance, so the message is processed rather than lost.
+
+    Attributes:
+        window: Time in seconds the keys are remembered
+        max_size: Maximum number of keys remembered in memory
+        database: Database shared with other instances, None to use only memory
+        hits: Number of duplicates found in memory and in database
+        misses: Number of keys which weren't claimed yet
+    """
+
+    def __init__(
+        self, window: int, max_size: int = 10000, database: Optional[Database] = None
+    ) -> None:
+        """
+        Class constructor.
+        """
+        self.window = window
+        self.max_size = max_size
+        self.database = database
+        self.hits = {"memory": 0, "database": 0}
+        self.misses = 0
+        self._cache = Cache(expiration_time=window, max_size=max_size)
+        self._lock = threading.Lock()
+
+    def claim(self, key: str) -> Optional[str]:
+        """
+        Claim the key for the time window if it wasn't claimed yet.
+        The key is claimed atomically, so only one of the concurrent callers
+        claims it, even when the database is shared with other instances.
+
+        Params:
+            key: Key to claim
+
+        Returns:
+            Where the key was already claimed, "memory" or "database",
+            or None if it was claimed now.
+        """
+        source = None
+        if not self._cache.claim(key, "1"):
+            source = "memory"
+        elif self.database is not None:
+            try:
+                if not self.database.claim(key, "1"):
+                    source = "database"
+                    # The other instance could still release the key
+                    self._cache.delete(key)
+            except Exception:
+                _logger.exception("Couldn't claim duplicate %r in database" % key)
+
+        with self._lock:
+            if source is None:
+                self.misses += 1
+            else:
+                self.hits[source] += 1
+        return source
+
+    def release(self, key: str) -> None:
+        """
+        Release the claimed key, so it could be claimed again.
+
+        Params:
+            key: Key to release
+        """
+        self._cache.delete(key)
+        if self.database is not None:
+            try:
+                self.database.delete(key)
+            except Exception:
+                _logger.exception("Couldn't release duplicate %r in database" % key)
+
+    def stats(self) -> dict:
+        """
+        Return the deduplication statistics.
+
+        Returns:
+            Dictionary containing number of duplicates found in memory and database
+            and number of keys which weren't claimed yet.
+            Example:
+            {
+                "hits": {"memory": 3, "database": 1},
+                "misses": 10
+            }
+        """
+        with self._lock:
+            return {"hits": dict(self.hits), "misses": self.misses}
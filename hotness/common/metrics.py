@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+Optional Prometheus metrics of the-new-hotness.
+
+When the `prometheus-client` package is installed, the metrics are kept
+in its default registry and could be exposed over HTTP by `start_http_server`.
+Without it every metric is a no-op with the same interface.
+
+Statistics of components, returned by their `stats` method, are exported
+as gauges read when the metrics are scraped, see `register_stats`.
+"""
+
+import contextlib
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence
+
+try:
+    import prometheus_client  # type: ignore
+    from prometheus_client.core import GaugeMetricFamily  # type: ignore
+except ImportError:  # pragma: no cover
+    prometheus_client = None  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+# Buckets of duration histograms in seconds, covers both fast HTTP requests
+# and slow builds
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+)
+
+# Buckets of upload throughput histogram in bytes per second, 64 KiB/s to 64 MiB/s
+THROUGHPUT_BUCKETS = tuple(2**exponent for exponent in range(16, 27, 2))
+
+
+class _NoopTimer(contextlib.ContextDecorator):
+    """
+    Timer used when prometheus-client is not installed.
+    """
+
+    def __enter__(self) -> "_NoopTimer":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+class _NoopMetric:
+    """
+    Metric used when prometheus-client is not installed.
+    """
+
+    def labels(self, **labels: str) -> "_NoopMetric":
+        """
+        Ignore the labels.
+        """
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Ignore the increment.
+        """
+
+    def observe(self, value: float) -> None:
+        """
+        Ignore the observed value.
+        """
+
+    def time(self) -> _NoopTimer:
+        """
+        Return timer which doesn't observe anything.
+        """
+        return _NoopTimer()
+
+
+class StatsCollector:
+    """
+    Prometheus collector exporting numeric values returned by `stats` method
+    of registered components as gauges named `hotness_<name>_<key>`.
+    The statistics are read every time the metrics are scraped.
+    """
+
+    def __init__(self) -> None:
+        """
+        Class constructor.
+        """
+        self._sources: Dict[str, Callable[[], dict]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, stats: Callable[[], dict]) -> None:
+        """
+        Register statistics of component, replaces the previous one with
+        the same name.
+
+        Params:
+            name: Name of the component used in names of the gauges
+            stats: Function returning the statistics
+        """
+        with self._lock:
+            self._sources[name] = stats
+
+    def collect(self) -> Iterator[Any]:
+        """
+        Implementation of Prometheus collector, yields gauge for every numeric
+        value of statistics. Components whose statistics can't be read are skipped.
+        """
+        with self._lock:
+            sources = sorted(self._sources.items())
+        for name, stats in sources:
+            try:
+                values = sorted(stats().items())
+            except Exception:
+                _logger.exception("Couldn't read %s statistics" % name)
+                continue
+            for key, value in values:
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                gauge = GaugeMetricFamily(
+                    "hotness_{}_{}".format(name, key),
+                    "Value of {} in {} statistics.".format(key, name),
+                )
+                gauge.add_metric([], value)
+                yield gauge
+
+
+# Collector of component statistics, registered when prometheus-client is installed
+STATS = StatsCollector()
+if prometheus_client is not None:
+    prometheus_client.REGISTRY.register(STATS)
+
+
+def register_stats(name: str, stats: Callable[[], dict]) -> None:
+    """
+    Export statistics of component as gauges.
+
+    Params:
+        name: Name of the component used in names of the gauges
+        stats: Function returning the statistics, usually `stats` method
+    """
+    STATS.register(name, stats)
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Any:
+    """
+    Create counter in default registry, no-op if prometheus-client is missing.
+
+    Params:
+        name: Name of the metric without the `_total` suffix
+        documentation: Help text of the metric
+        labelnames: Names of the labels
+
+    Returns:
+        Counter.
+    """
+    if prometheus_client is None:  # pragma: no cover
+        return _NoopMetric()
+    return prometheus_client.Counter(name, documentation, labelnames)
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = DURATION_BUCKETS,
+) -> Any:
+    """
+    Create histogram in default registry, no-op if prometheus-client is missing.
+
+    Params:
+        name: Name of the metric
+        documentation: Help text of the metric
+        labelnames: Names of the labels
+        buckets: Upper bounds of the buckets
+
+    Returns:
+        Histogram.
+    """
+    if prometheus_client is None:  # pragma: no cover
+        return _NoopMetric()
+    return prometheus_client.Histogram(name, documentation, labelnames, buckets=buckets)
+
+
+def start_http_server(port: int, host: str = "") -> Optional[Any]:
+    """
+    Start HTTP server exposing the metrics in background thread.
+
+    Params:
+        port: Port to listen on, 0 to choose a free port
+        host: Address to listen on, empty string for all addresses
+
+    Returns:
+        Running server, call `shutdown` on it to stop it. None if prometheus-client
+        is not installed.
+    """
+    if prometheus_client is None:
+        _logger.warning(
+            "Metrics are enabled, but prometheus-client is not installed. "
+            "Metrics will not be exposed."
+        )
+        return None
+    server, _ = prometheus_client.start_http_server(port, addr=host)
+    _logger.info("Serving metrics on port %d" % server.server_address[1])
+    return server
+
+
+EXTERNAL_CALL_DURATION = histogram(
+    "hotness_external_call_duration_seconds",
+    "Duration of calls to external systems.",
+    ("system", "operation"),
+)
+MESSAGE_DURATION = histogram(
+    "hotness_message_duration_seconds",
+    "Duration of processing of received messages.",
+    ("topic",),
+)
+MESSAGES = counter(
+    "hotness_messages",
+    "Received messages by result: handled, filtered, duplicate, nack or error.",
+    ("topic", "result"),
+)
+DROPPED_MESSAGES = counter(
+    "hotness_dropped_messages",
+    "Messages dropped before handling by the filter which dropped them.",
+    ("filter",),
+)
+DUPLICATE_MESSAGES = counter(
+    "hotness_duplicate_messages",
+    "Dropped duplicate messages by where the duplicate was found: memory or database.",
+    ("source",),
+)
+UPDATE_DROPS = counter(
+    "hotness_update_drops",
+    "Dropped new versions by the reason of drop.",
+    ("reason",),
+)
+BUGZILLA_UPDATE_FAILURES = counter(
+    "hotness_bugzilla_update_failures",
+    "Bugs which couldn't be updated by queued update.",
+)
+KOJI_UPLOAD_THROUGHPUT = histogram(
+    "hotness_koji_upload_throughput_bytes_per_second",
+    "Throughput of SRPM uploads to Koji.",
+    buckets=THROUGHPUT_BUCKETS,
+)
@@ -15,9 +15,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import functools
 import re
 
-from itertools import zip_longest
+# Maximum number of parsed versions kept by `RPM.version_key`
+VERSION_KEY_CACHE_SIZE = 4096
 
 
 class RPM:
@@ -39,44 +41,71 @@ class RPM:
             0 if version1 is equal to version2
             -1 if version1 is older than version2
         """
-        v1, rc1, rcn1 = cls._split_rc(version1)
-        v2, rc2, rcn2 = cls._split_rc(version2)
-
-        diff = cls._compare_rpm_labels((None, v1, None), (None, v2, None))
-        if diff != 0:
-            # base versions are different, ignore rc-status
-            return diff
-
-        if rc1 and rc2:
-            # rc > pre > beta > alpha
-            if rc1.lower() > rc2.lower():
-                return 1
-            elif rc1.lower() < rc2.lower():
-                return -1
-
-            # both are same rc, higher rc is newer
-            if rcn1 and rcn2:
-                if int(rcn1) > int(rcn2):
-                    return 1
-                elif int(rcn1) < int(rcn2):
-                    return -1
-            elif rcn1:
-                return 1
-            elif rcn2:
-                return -1
-
-            # both rc numbers are missing or same
-            return 0
-
-        if rc1:
-            # only first is rc, then second is newer
-            return -1
-        if rc2:
-            # only second is rc, then first is newer
-            return 1
-
-        # neither is a rc
-        return 0
+        key1 = cls.version_key(version1)
+        key2 = cls.version_key(version2)
+        return (key1 > key2) - (key1 < key2)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=VERSION_KEY_CACHE_SIZE)
+    def version_key(version: str) -> tuple:
+        """
+        Parse version to key, which compares the same way as `compare` does.
+        Keys are cached, so every version is parsed only once.
+
+        Base versions are compared first, if these are same the version
+        without release candidate is newer than any release candidate.
+        Release candidates are compared by name (rc > pre > beta > alpha)
+        and then by number, release candidate with number is newer than
+        the one without it.
+
+        Params:
+            version: RPM version to parse
+
+        Returns:
+            Tuple which could be compared with keys of other versions.
+        """
+        base, rc, rc_num = RPM._split_rc(version)
+        base_key = tuple(RPM._iter_rpm_subfields(base))
+        if not rc:
+            return (base_key, 1, "", ())
+
+        rc_num_key = (1, int(rc_num)) if rc_num else (0,)
+        return (base_key, 0, rc.lower(), rc_num_key)
+
+    @staticmethod
+    def cache_stats() -> dict:
+        """
+        Return statistics of the cache of parsed versions shared
+        by all callers of `version_key` and `compare`.
+
+        Returns:
+            Dictionary containing number of cache hits, misses, hit rate
+            and number of cached versions.
+            Example:
+            {
+                "hits": 3,
+                "misses": 1,
+                "hit_rate": 0.75,
+                "size": 1,
+                "max_size": 4096
+            }
+        """
+        info = RPM.version_key.cache_info()
+        total = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": info.hits / total if total else 0.0,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+        }
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Remove all parsed versions from cache and reset its statistics.
+        """
+        RPM.version_key.cache_clear()
 
     __rc_upstream_regex = re.compile(
         r"(.*?)\.?(-?(rc|pre|beta|alpha|dev)([0-9]*))", re.I
@@ -114,6 +143,9 @@ class RPM:
     #   alphabetic, the numeric field is always considered greater (newer).
     # * In the case where one string runs out of fields, the other is always
     #   considered greater (newer).
+    #
+    # Tuples of subfields yielded by `_iter_rpm_subfields` are compared
+    # by Python exactly this way.
     _subfield_pattern = re.compile(
         r"(?P<junk>[^a-zA-Z0-9]*)((?P<text>[a-zA-Z]+)|(?P<num>[0-9]+))"
     )
@@ -131,38 +163,3 @@ class RPM:
                 yield (0, text)
             else:
                 yield (1, int(subfield.group("num")))
-
-    @classmethod
-    def _compare_rpm_field(cls, lhs, rhs):
-        # Short circuit for exact matches (including both being None)
-        if lhs == rhs:
-            return 0
-        # Otherwise assume both inputs are strings
-        lhs_subfields = cls._iter_rpm_subfields(lhs)
-        rhs_subfields = cls._iter_rpm_subfields(rhs)
-        for lhs_sf, rhs_sf in zip_longest(lhs_subfields, rhs_subfields):
-            if lhs_sf == rhs_sf:
-                # When both subfields are the same, move to next subfield
-                continue
-            if lhs_sf is None:
-                # Fewer subfields in LHS, so it's less than/older than RHS
-                return -1
-            if rhs_sf is None:
-                # More subfields in LHS, so it's greater than/newer than RHS
-                return 1
-            # Found a differing subfield, so it determines the relative order
-            return -1 if lhs_sf < rhs_sf else 1
-        # No relevant differences found between LHS and RHS
-        return 0
-
-    @classmethod
-    def _compare_rpm_labels(cls, lhs, rhs):
-        lhs_epoch, lhs_version, lhs_release = lhs
-        rhs_epoch, rhs_version, rhs_release = rhs
-        result = cls._compare_rpm_field(lhs_epoch, rhs_epoch)
-        if result:
-            return result
-        result = cls._compare_rpm_field(lhs_version, rhs_version)
-        if result:
-            return result
-        return cls._compare_rpm_field(lhs_release, rhs_release)
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+Optional tracing of the-new-hotness compatible with OpenTelemetry.
+
+Tracing is disabled by default and every span is a no-op. When it's enabled
+by `enable` and the `opentelemetry-api` package is installed, the spans are
+created by OpenTelemetry tracer. Exporting the spans is configured by
+OpenTelemetry SDK, for example by running the consumer with
+`opentelemetry-instrument` and `OTEL_*` environment variables.
+"""
+
+import contextlib
+import contextvars
+import functools
+import inspect
+import logging
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+try:
+    from opentelemetry import trace as otel_trace  # type: ignore
+except ImportError:  # pragma: no cover
+    otel_trace = None  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+# Name of the tracer used for the-new-hotness spans
+TRACER_NAME = "hotness"
+
+# Tracer used for spans, None when tracing is disabled
+_tracer: Optional[Any] = None
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class _NoopSpan:
+    """
+    Span used when tracing is disabled.
+    """
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Ignore the attribute.
+        """
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def enable() -> bool:
+    """
+    Enable tracing using OpenTelemetry tracer.
+
+    Returns:
+        True if tracing is enabled, False if OpenTelemetry is not installed.
+    """
+    global _tracer
+    if otel_trace is None:
+        _logger.warning(
+            "Tracing is enabled, but opentelemetry-api is not installed. "
+            "Spans will not be recorded."
+        )
+        return False
+    _tracer = otel_trace.get_tracer(TRACER_NAME)
+    return True
+
+
+def disable() -> None:
+    """
+    Disable tracing, every span is no-op again.
+    """
+    global _tracer
+    _tracer = None
+
+
+def is_enabled() -> bool:
+    """
+    Check if tracing is enabled.
+
+    Returns:
+        True if spans are recorded by tracer.
+    """
+    return _tracer is not None
+
+
+@contextlib.contextmanager
+def span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """
+    Open span as child of the current span.
+
+    Example:
+        >>> with span("message", {"messaging.message.id": msg.id}) as current:
+        ...     current.set_attribute("hotness.package", package.name)
+
+    Params:
+        name: Name of the span
+        attributes: Attributes of the span
+
+    Returns:
+        Span with `set_attribute` method, no-op span if tracing is disabled.
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield _NOOP_SPAN
+        return
+    with tracer.start_as_current_span(name, attributes=attributes) as current:
+        yield current
+
+
+def use_case_span(component: str) -> Callable[[_F], _F]:
+    """
+    Decorator opening span for use case method. The span is tagged with name
+    of the use case, class of the external system used by use case, name
+    of the package in request and type of the returned response.
+
+    Params:
+        component: Name of the use case attribute holding the external system,
+                   for example "validator"
+
+    Returns:
+        Decorator for the use case method.
+    """
+
+    def decorator(method: _F) -> _F:
+        def open_span(self: Any, request: Any) -> Any:
+            use_case = type(self).__name__
+            attributes = {
+                "hotness.use_case": use_case,
+                "hotness." + component: type(getattr(self, component)).__name__,
+            }
+            package = getattr(request, "package", None)
+            if package is not None:
+                attributes["hotness.package"] = package.name
+
+            return span(use_case + "." + method.__name__, attributes)
+
+        if inspect.iscoroutinefunction(method):
+            # The span must stay open until the coroutine is finished
+
+            @functools.wraps(method)
+            async def async_wrapper(self: Any, request: Any) -> Any:
+                if _tracer is None:
+                    return await method(self, request)
+
+                with open_span(self, request) as current:
+                    response = await method(self, request)
+                    current.set_attribute("hotness.response.type", response.type)
+                    return response
+
+            return async_wrapper  # type: ignore
+
+        @functools.wraps(method)
+        def wrapper(self: Any, request: Any) -> Any:
+            if _tracer is None:
+                return method(self, request)
+
+            with open_span(self, request) as current:
+                response = method(self, request)
+                current.set_attribute("hotness.response.type", response.type)
+                return response
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def propagate(function: _F) -> _F:
+    """
+    Wrap function so it runs in the context of the caller, when it's called
+    from other thread. The current span is kept in context variables, which
+    aren't copied to the threads of `concurrent.futures.ThreadPoolExecutor`.
+
+    Params:
+        function: Function to wrap
+
+    Returns:
+        Wrapped function.
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Every call needs its own copy, context can't be entered by two threads
+        return context.copy().run(function, *args, **kwargs)
+
+    return wrapper  # type: ignore
@@ -34,6 +34,30 @@ DEFAULTS = dict(
     dist_git_url="https://src.fedoraproject.org",
     # mdapi URL
     mdapi_url="https://apps.fedoraproject.org/mdapi",
+    # The time in seconds the-new-hotness should cache the package metadata
+    # retrieved from mdapi. Set to 0 to disable the cache.
+    mdapi_cache_expiration=0,
+    # Local mirror of the repository metadata mdapi is serving the data from,
+    # mdapi is only asked for packages missing in the mirror
+    # The metadata are downloaded in background after start, mdapi is asked
+    # until they are ready. Requires `zstandard` extra for current Fedora
+    # repositories, which compress the metadata by zstd
+    mdapi_mirror=dict(
+        # Read the package metadata from local mirror
+        enabled=False,
+        # URL of the source repository containing `repodata` directory, should
+        # be the source repository of the branch watched by the-new-hotness
+        repo_url="",
+        # Directory where the downloaded database is stored
+        cache_dir="/var/cache/hotness/mdapi",
+        # Time in seconds after which the repository metadata are checked again
+        # in background, the database is only downloaded when it changed
+        # Set to 0 to only check them on start
+        refresh_interval=3600,
+    ),
+    # Check the retirement and both monitoring settings sources in dist-git
+    # in parallel, instead of one after another
+    dist_git_parallel_requests=False,
     # hotness issue tracker URL
     hotness_issue_tracker="https://github.com/fedora-infra/the-new-hotness/issues",
     # Repository id
@@ -49,12 +73,124 @@ DEFAULTS = dict(
     # The number of times the-new-hotness should retry a network request
     # that failed for any reason (e.g. read timeout, DNS error, etc)
     requests_retries=3,
+    # The number of package mappings from a single Anitya message that
+    # the-new-hotness should validate in parallel. Validated mappings are always
+    # processed in order. Set to 1 to process mappings sequentially.
+    mapping_workers=1,
     # Redis configuration
     redis=dict(
         hostname="localhost",
         port=6379,
         password="",
         expiration=86400,
+        # Maximum number of connections to Redis, shared by all users of Redis
+        # in the-new-hotness. Threads wait for free connection when all are used.
+        pool_size=10,
+    ),
+    # Cache for the monitoring settings and retirement status retrieved from dist-git
+    validator_cache=dict(
+        # Cache the dist-git validation output
+        enabled=False,
+        # Backend of the cache, either "memory" or "redis"
+        # The "redis" backend uses the Redis configuration above
+        backend="memory",
+        # Expiration time in seconds for cached entries
+        expiration=300,
+        # Maximum number of cached entries, only used by "memory" backend
+        max_size=10000,
+    ),
+    # Bulk snapshot of the retirement status and monitoring settings of all
+    # packages in dist-git, packages missing in it are checked in dist-git
+    dist_git_snapshot=dict(
+        # Answer the dist-git validation from the snapshot
+        enabled=False,
+        # URL or local path of the JSON snapshot, see
+        # `hotness.validators.SnapshotValidator` for its format
+        # It could be generated by `devel/dist_git_snapshot.py`
+        source="",
+        # Time in seconds after which the snapshot is loaded again in background
+        # Set to 0 to only load it on start
+        refresh_interval=3600,
+        # Maximum age in seconds of the package settings in snapshot, older
+        # settings are read from dist-git. Set to 0 to always use them
+        max_age=86400,
+    ),
+    # Scratch build queue configuration
+    build_queue=dict(
+        # Queue the scratch builds and start them by build workers instead
+        # of starting them inside the message handler
+        enabled=False,
+        # Backend of the queue, either "memory" or "redis"
+        # The "redis" backend uses the Redis configuration above
+        # Builds left in "memory" queue are started before the consumer stops,
+        # builds left in "redis" queue are started after restart
+        # The "redis" backend requires Redis 6.2 or newer
+        backend="memory",
+        # Name of the Redis list holding the queue
+        name="hotness:build_queue",
+        # Number of build workers. Every build worker holds one connection
+        # from the Redis pool while it waits for builds in "redis" queue
+        workers=2,
+        # Time in seconds after which the builds taken by instance that stopped
+        # sending heartbeat are returned to "redis" queue. Running instances
+        # renew their lease every 5 seconds.
+        lease_time=30,
+    ),
+    # Local filter of scratch build tasks started by the-new-hotness
+    task_filter=dict(
+        # Drop messages about unknown build tasks without asking Redis
+        # Only enable it when this consumer is the only one starting builds,
+        # tasks started by other consumers are only known after refresh
+        enabled=False,
+        # Expected maximum number of tracked tasks, the memory used by the filter
+        # is roughly 1.2 bytes per task for 1 % false positive rate
+        capacity=100000,
+        # Probability that unknown task is not filtered out
+        error_rate=0.01,
+        # Time in seconds after which the filter is loaded again from Redis
+        # in background, the current filter is used until the new one is loaded.
+        # Messages aren't filtered until the filter is loaded on start.
+        # Set to 0 to only load it on start
+        refresh_interval=3600,
+    ),
+    # Deduplication of Anitya messages with the same project, latest version
+    # and package mappings, which were already processed
+    deduplication=dict(
+        # Drop the duplicate messages before checking the packages
+        # Messages which are retried or dropped because of failure of external
+        # system are not remembered as processed
+        enabled=False,
+        # Time in seconds the processed messages are remembered
+        window=3600,
+        # Maximum number of processed messages remembered in memory
+        max_size=10000,
+        # Where the processed messages are remembered, either "memory" or "redis"
+        # The "redis" backend uses the Redis configuration above and shares
+        # the processed messages with other instances of the-new-hotness
+        backend="memory",
+    ),
+    # Prometheus metrics of the-new-hotness, requires prometheus-client
+    # (`metrics` extra), they are always collected in memory when installed
+    metrics=dict(
+        # Expose the metrics in Prometheus text format over HTTP
+        enabled=False,
+        # Address to listen on, empty for all addresses
+        host="",
+        # Port to listen on
+        port=8000,
+    ),
+    # Tracing of messages and use cases, requires opentelemetry-api
+    # (the "tracing" extra)
+    # The spans are exported as configured for OpenTelemetry SDK
+    tracing=dict(
+        enabled=False,
+    ),
+    # Asyncio consumer `hotness.async_hotness_consumer:AsyncHotnessConsumer`,
+    # requires aiohttp (the "async" extra). It doesn't support validator_cache
+    # and dist_git_snapshot, the consumer refuses to start when they are enabled
+    async_consumer=dict(
+        # Maximum number of open connections shared by the asyncio validators
+        pool_size=100,
     ),
     # Bugzilla configuration
     bugzilla=dict(
@@ -68,6 +204,18 @@ DEFAULTS = dict(
         explanation_url="https://docs.fedoraproject.org/en-US/package-maintainers/Upstream_Release_Monitoring",  # noqa: E501
         reporter="Upstream Release Monitoring",
         reporter_email="upstream-release-monitoring@fedoraproject.org",
+        # The time in seconds the-new-hotness should cache the bugs found
+        # for a package. The cache is dropped when the bugs of the package
+        # are changed by the-new-hotness. Set to 0 to disable the cache.
+        query_cache_expiration=60,
+        # The time in seconds the-new-hotness should collect comments for bugs
+        # before sending them. Comments for the same bug are joined to one comment
+        # and bugs getting the same comment are updated by one request.
+        # New versions are published to `update.bug.file` only after the comment
+        # is sent. Comments which could not be sent are published to `update.drop`
+        # with reason "bugzilla".
+        # Set to 0 to send every comment immediately.
+        update_delay=0,
         short_desc_template="%(name)s-%(retrieved_version)s is available",
         short_desc_template_more_versions="New versions of %(name)s available.",
         description_template="""
@@ -115,6 +263,30 @@ To change the monitoring settings for the project, please visit:
         opts=dict(scratch=True),
         priority=30,
         target_tag="rawhide",
+        # Directory where the local mirrors of dist-git repositories are kept.
+        # Builds clone the package repository from the local mirror, which is
+        # updated from dist-git first. Empty string disables the mirrors.
+        mirror_dir="",
+        # Maximum total size of the mirrors in MB. Least recently used mirrors
+        # are removed when the size is exceeded. Set to 0 for unlimited size.
+        mirror_max_size=10240,
+        # Directory where the downloaded package sources are cached. Sources
+        # found in the cache by their SHA512 checksum or URL are not downloaded
+        # again. Empty string disables the cache.
+        source_cache_dir="",
+        # Maximum total size of the cached sources in MB. Least recently used
+        # sources are removed when the size is exceeded. Set to 0 for unlimited size.
+        source_cache_max_size=10240,
+        # Maximum number of authenticated Koji sessions reused across builds.
+        # Every build running at the same time needs its own session.
+        session_pool_size=2,
+        # Size of chunks in bytes used to upload the SRPM to Koji. Every chunk
+        # is verified and retried with exponential backoff on its own, so failed
+        # upload doesn't start from the beginning. Set to 0 to upload the SRPM
+        # at once with retries of the whole upload.
+        upload_chunk_size=0,
+        # Number of retries of every chunk upload
+        upload_retries=3,
     ),
 )
 
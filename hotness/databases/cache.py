@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import threading
+import time
 from typing import Dict
 
 from . import Database
@@ -25,16 +27,30 @@ class Cache(Database):
     Wrapper for the cache for the-new-hotness.
     It is represented by python dictionary.
 
+    Optionally the entries could expire after specified time and the number of entries
+    could be limited. When the limit is reached, the least recently used entry is evicted.
+
     Attributes:
-        cache (dict): Dictionary to hold key/value pairs
+        cache (dict): Dictionary to hold key/value pairs, ordered from least recently used
+        expiration_time (int): Expiration time to use on keys (in seconds), 0 for no expiration
+        max_size (int): Maximum number of keys in cache, 0 for no limit
+        expirations (dict): Dictionary holding the expiration timestamp for every key
     """
 
-    def __init__(self) -> None:
+    def __init__(self, expiration_time: int = 0, max_size: int = 0) -> None:
         """
         Class constructor.
+
+        Params:
+            expiration_time: Expiration time to set for keys (in seconds)
+            max_size: Maximum number of keys in cache
         """
         super(Cache, self).__init__()
         self.cache: Dict = {}
+        self.expiration_time = expiration_time
+        self.max_size = max_size
+        self.expirations: Dict[str, float] = {}
+        self._lock = threading.Lock()
 
     def insert(self, key: str, value: str) -> dict:
         """
@@ -54,9 +70,9 @@ class Cache(Database):
               "old_value": "old_value" # Old value for the key, empty if the key is new
             }
         """
-        output = {"key": key, "value": value, "old_value": self.cache.get(key, "")}
-
-        self.cache[key] = value
+        with self._lock:
+            output = {"key": key, "value": value, "old_value": self._get(key)}
+            self._set(key, value)
 
         return output
 
@@ -76,6 +92,84 @@ class Cache(Database):
               "value": "value" # Retrieved value for the key
             }
         """
-        output = {"key": key, "value": self.cache.get(key, "")}
+        with self._lock:
+            value = self._get(key)
+            if value and self.max_size:
+                # Move the key to the end, it is the most recently used now
+                self.cache[key] = self.cache.pop(key)
+
+        output = {"key": key, "value": value}
 
         return output
+
+    def claim(self, key: str, value: str) -> bool:
+        """
+        Insert key/value pair to cache only if the key is not there yet.
+
+        Params:
+            key: Key to insert to database
+            value: Value for the key to add
+
+        Returns:
+            True if the key was inserted, False if it was already in cache.
+        """
+        with self._lock:
+            if self._get(key):
+                return False
+            self._set(key, value)
+
+        return True
+
+    def delete(self, key: str) -> None:
+        """
+        Remove the key from cache.
+
+        Params:
+            key: Key to remove
+        """
+        with self._lock:
+            self._delete(key)
+
+    def _get(self, key: str) -> str:
+        """
+        Get value for a key and remove the key if it's expired.
+
+        Params:
+            key: Key to get
+
+        Returns:
+            Value for the key or "" if the key is not available.
+        """
+        expiration = self.expirations.get(key)
+        if expiration is not None and expiration <= time.monotonic():
+            self._delete(key)
+
+        return self.cache.get(key, "")
+
+    def _set(self, key: str, value: str) -> None:
+        """
+        Set value for a key and evict the least recently used keys over the limit.
+
+        Params:
+            key: Key to set
+            value: Value for the key
+        """
+        # Move the key to the end, it is the most recently used now
+        self.cache.pop(key, None)
+        self.cache[key] = value
+        if self.expiration_time:
+            self.expirations[key] = time.monotonic() + self.expiration_time
+
+        if self.max_size:
+            while len(self.cache) > self.max_size:
+                self._delete(next(iter(self.cache)))
+
+    def _delete(self, key: str) -> None:
+        """
+        Remove the key from cache.
+
+        Params:
+            key: Key to remove
+        """
+        self.cache.pop(key, None)
+        self.expirations.pop(key, None)
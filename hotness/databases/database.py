@@ -44,3 +44,34 @@ class Database:
         raise an exception.
         """
         raise NotImplementedError
+
+    def claim(self, key: str, value: str) -> bool:
+        """
+        Insert key/value pair to database only if the key is not there yet.
+
+        Child classes should override this method to make the check and insert
+        atomic, the default implementation calls `retrieve` and `insert`.
+
+        Params:
+            key: Key to insert to database
+            value: Value for the key to add
+
+        Returns:
+            True if the key was inserted, False if it was already in database.
+        """
+        if self.retrieve(key)["value"]:
+            return False
+        self.insert(key, value)
+        return True
+
+    def delete(self, key: str) -> None:
+        """
+        Delete method that should be implemented by every child class.
+
+        It should remove the key from database using the external system.
+        Removing key which is not in database isn't an error.
+
+        In case of any issue that would prevent removing the key, method should
+        raise an exception.
+        """
+        raise NotImplementedError
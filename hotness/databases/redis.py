@@ -15,9 +15,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+from typing import Iterator, Optional
+
 import redis
 
 from . import Database
+from hotness.common.metrics import EXTERNAL_CALL_DURATION
 
 
 class Redis(Database):
@@ -26,14 +29,25 @@ class Redis(Database):
     It establishes connection with Redis database and allows user to
     save and retrieves values from it.
 
+    Connections are taken from blocking connection pool, so multiple threads
+    could share the object and wait for free connection when all of them are used.
+
     Attributes:
         redis (`redis.Redis`): Redis object to use for communication with Redis
             database
+        connection_pool (`redis.BlockingConnectionPool`): Pool of connections
+            to Redis database
         expiration_time (int): Expiration time to use on keys (in seconds)
     """
 
     def __init__(
-        self, hostname: str, port: int, password: str, expiration_time: int
+        self,
+        hostname: str,
+        port: int,
+        password: str,
+        expiration_time: int,
+        pool_size: int = 10,
+        connection_pool: Optional[redis.ConnectionPool] = None,
     ) -> None:
         """
         Class constructor.
@@ -43,11 +57,20 @@ class Redis(Database):
             port: Port of the Redis database
             password: Password to use for connecting to Redis database
             expiration_time: Expiration time to set for keys (in seconds)
+            pool_size: Maximum number of connections to Redis database
+            connection_pool: Existing pool of connections to share, connection
+                             parameters are ignored when provided
         """
-        self.redis = redis.Redis(host=hostname, port=port, password=password)
+        if connection_pool is None:
+            connection_pool = redis.BlockingConnectionPool(
+                host=hostname, port=port, password=password, max_connections=pool_size
+            )
+        self.connection_pool = connection_pool
+        self.redis = redis.Redis(connection_pool=connection_pool)
 
         self.expiration_time = expiration_time
 
+    @EXTERNAL_CALL_DURATION.labels(system="redis", operation="set").time()
     def insert(self, key: str, value: str) -> dict:
         """
         It inserts key/value pair to redis. If key is already in redis
@@ -79,6 +102,7 @@ class Redis(Database):
 
         return output
 
+    @EXTERNAL_CALL_DURATION.labels(system="redis", operation="get").time()
     def retrieve(self, key: str) -> dict:
         """
         Retrieve value for a key in database. If the key is not available
@@ -105,3 +129,42 @@ class Redis(Database):
             output["value"] = value.decode()
 
         return output
+
+    @EXTERNAL_CALL_DURATION.labels(system="redis", operation="set_nx").time()
+    def claim(self, key: str, value: str) -> bool:
+        """
+        Insert key/value pair to redis only if the key is not there yet.
+        It uses SET NX, so only one of the concurrent callers inserts the key.
+
+        Params:
+            key: Key to insert to database
+            value: Value for the key to add
+
+        Returns:
+            True if the key was inserted, False if it was already in redis.
+        """
+        return bool(self.redis.set(key, value, ex=self.expiration_time, nx=True))
+
+    @EXTERNAL_CALL_DURATION.labels(system="redis", operation="delete").time()
+    def delete(self, key: str) -> None:
+        """
+        Remove the key from redis.
+
+        Params:
+            key: Key to remove
+        """
+        self.redis.delete(key)
+
+    def scan_keys(self, pattern: str = "*") -> Iterator[str]:
+        """
+        Iterate over keys in redis matching the pattern. It uses SCAN command,
+        so it doesn't block redis even when there are many keys.
+
+        Params:
+            pattern: Glob-style pattern the keys must match
+
+        Returns:
+            Iterator over matching keys.
+        """
+        for key in self.redis.scan_iter(match=pattern, count=1000):
+            yield key.decode()
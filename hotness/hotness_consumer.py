@@ -17,8 +17,24 @@
 # code or documentation are not subject to the GNU General Public
 # License and may only be used or replicated with the express permission
 # of Red Hat, Inc.
+import atexit
+import collections
+import concurrent.futures
+import contextlib
 import logging
-from typing import cast, List
+import threading
+import time
+from typing import (
+    Callable,
+    cast,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
 
 import requests
 from requests.packages.urllib3.util import retry  # type: ignore
@@ -28,12 +44,30 @@ from fedora_messaging import exceptions as fm_exceptions  # type: ignore
 
 from hotness.config import config
 from hotness.domain import Package
-from hotness.builders import Koji
-from hotness.databases import Redis
+from hotness.builders import GitMirror, Koji, SourceCache
+from hotness.common import BloomFilter, Deduplicator
+from hotness.common import tracing
+from hotness.common.metrics import (
+    DROPPED_MESSAGES,
+    DUPLICATE_MESSAGES,
+    MESSAGE_DURATION,
+    MESSAGES,
+    register_stats,
+    start_http_server,
+)
+from hotness.common.tracing import propagate, span
+from hotness.databases import Cache, Redis
 from hotness.notifiers import Bugzilla as bz_notifier, FedoraMessaging
 from hotness.patchers import Bugzilla as bz_patcher
-from hotness.validators import MDApi, Pagure
-from hotness.responses import ResponseFailure
+from hotness.queues import Memory as memory_queue, Redis as redis_queue, WorkerPool
+from hotness.validators import (
+    CachedValidator,
+    MDApi,
+    MDApiMirror,
+    Pagure,
+    SnapshotValidator,
+)
+from hotness.responses import Response, ResponseFailure
 from hotness.requests import (
     BuildRequest,
     InsertDataRequest,
@@ -47,6 +81,7 @@ from hotness.use_cases import (
     NotifyUserUseCase,
     PackageScratchBuildUseCase,
     PackageCheckUseCase,
+    QueueBuildUseCase,
     RetrieveDataUseCase,
     SubmitPatchUseCase,
 )
@@ -56,6 +91,49 @@ _logger = logging.getLogger(__name__)
 # Prefix used for the topic of published messages
 PREFIX = "hotness"
 
+# Final states of build task, see koji.TASK_STATES for all values
+BUILD_DONE_STATES = {"CLOSED", "FAILED", "CANCELED"}
+
+
+class MessageFilter(NamedTuple):
+    """
+    Cheap check of message done before any external system is called.
+
+    Attributes:
+        name: Name of the filter used in drop counters
+        topic: Suffix of the topic the filter applies to
+        accept: Function returning True if the message body should be handled
+        reason: Reason logged when the message is dropped
+    """
+
+    name: str
+    topic: str
+    accept: Callable[[Mapping], bool]
+    reason: str
+
+
+# Filters evaluated in order, the first failing one drops the message
+MESSAGE_FILTERS = [
+    MessageFilter(
+        name="secondary_instance",
+        topic="buildsys.task.state.change",
+        accept=lambda body: body["instance"] == "primary",
+        reason="Ignoring secondary arch task...",
+    ),
+    MessageFilter(
+        name="non_build_method",
+        topic="buildsys.task.state.change",
+        accept=lambda body: body["method"] == "build",
+        reason="Ignoring non-build task...",
+    ),
+    MessageFilter(
+        name="build_not_done",
+        topic="buildsys.task.state.change",
+        accept=lambda body: body["new"] in BUILD_DONE_STATES,
+        reason="The build is not in done state. Dropping message.",
+    ),
+]
+
 
 class HotnessConsumer(object):
     """
@@ -88,11 +166,40 @@ class HotnessConsumer(object):
                                                        fedora messages to broker
         patcher_bugzilla (`bz_patcher`): Bugzilla patcher for attaching patcher to tickets
                                          in Bugzilla
+        mdapi_mirror (`MDApiMirror`): Local mirror of the metadata used by MDApi
+                                    validator, None if disabled
         validator_mdapi (`MDApi`): MDApi validator to retrieve the metadata for package
-        validator_pagure (`Pagure`): Pagure dist git for retrieval of notification
-                                    settings and to check if a package is retired
+        validator_pagure (`Pagure`, `CachedValidator` or `SnapshotValidator`): Pagure
+                                    dist git for retrieval of notification settings
+                                    and to check if a package is retired, wrapped
+                                    by cache and snapshot if enabled
+        mapping_workers (int): Number of package mappings processed in parallel
+        mapping_executor (`concurrent.futures.ThreadPoolExecutor`): Bounded worker pool
+                                    for processing package mappings, None if mappings
+                                    are processed sequentially
+        build_queue (`memory_queue` or `redis_queue`): Queue for scratch builds,
+                                    None if scratch builds are started directly
+        build_workers (`WorkerPool`): Build workers starting the queued scratch builds
+        task_filter (`BloomFilter`): Filter of build tasks started by the-new-hotness,
+                                    None if disabled or not loaded
+        deduplicator (`Deduplicator`): Processed Anitya messages, None if duplicate
+                                    messages aren't dropped
+        dropped_messages (`collections.Counter`): Number of messages dropped
+                                    by every filter in `MESSAGE_FILTERS`
+        metrics_server (`http.server.ThreadingHTTPServer`): Server exposing metrics
+                                    in Prometheus text format, None if disabled
     """
 
+    # Errors which are transient and the message should be retried later
+    TRANSIENT_ERRORS: Tuple[Type[BaseException], ...] = (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+    )
+
+    # Reasons of `update.drop` caused by failure of external system,
+    # the message isn't treated as processed when dropped for them
+    ERROR_DROP_REASONS = frozenset(["dist-git", "mdapi", "bugzilla"])
+
     def __init__(self):
         """
         Consumer initialization.
@@ -111,11 +218,24 @@ class HotnessConsumer(object):
             total=retries, connect=retries, read=retries, backoff_factor=1
         )
         retry_conf.BACKOFF_MAX = 5
+        # Every worker doing the requests needs its own connection
+        pool_maxsize = max(
+            requests.adapters.DEFAULT_POOLSIZE,
+            config["mapping_workers"],
+        )
+        if config["dist_git_parallel_requests"]:
+            pool_maxsize = max(pool_maxsize, 3 * config["mapping_workers"])
         requests_session.mount(
-            "http://", requests.adapters.HTTPAdapter(max_retries=retry_conf)
+            "http://",
+            requests.adapters.HTTPAdapter(
+                max_retries=retry_conf, pool_maxsize=pool_maxsize
+            ),
         )
         requests_session.mount(
-            "https://", requests.adapters.HTTPAdapter(max_retries=retry_conf)
+            "https://",
+            requests.adapters.HTTPAdapter(
+                max_retries=retry_conf, pool_maxsize=pool_maxsize
+            ),
         )
 
         # Initialize attributes
@@ -129,6 +249,19 @@ class HotnessConsumer(object):
         self.distro = config["distro"]
         self.repoid = config["repoid"]
         self.hotness_issue_tracker = config["hotness_issue_tracker"]
+        git_mirror = None
+        if config["koji"]["mirror_dir"]:
+            git_mirror = GitMirror(
+                cache_dir=config["koji"]["mirror_dir"],
+                max_size=config["koji"]["mirror_max_size"] * 1024 * 1024,
+            )
+        source_cache = None
+        if config["koji"]["source_cache_dir"]:
+            source_cache = SourceCache(
+                cache_dir=config["koji"]["source_cache_dir"],
+                max_size=config["koji"]["source_cache_max_size"] * 1024 * 1024,
+            )
+            register_stats("source_cache", source_cache.stats)
         self.builder_koji = Koji(
             server_url=config["koji"]["server"],
             web_url=config["koji"]["weburl"],
@@ -144,12 +277,18 @@ class HotnessConsumer(object):
             opts=config["koji"]["opts"],
             priority=config["koji"]["priority"],
             target_tag=config["koji"]["target_tag"],
+            git_mirror=git_mirror,
+            source_cache=source_cache,
+            session_pool_size=config["koji"]["session_pool_size"],
+            upload_chunk_size=config["koji"]["upload_chunk_size"],
+            upload_retries=config["koji"]["upload_retries"],
         )
         self.database_redis = Redis(
             hostname=config["redis"]["hostname"],
             port=config["redis"]["port"],
             password=config["redis"]["password"],
             expiration_time=config["redis"]["expiration"],
+            pool_size=config["redis"]["pool_size"],
         )
         self.notifier_bugzilla = bz_notifier(
             server_url=config["bugzilla"]["url"],
@@ -160,14 +299,121 @@ class HotnessConsumer(object):
             keywords=config["bugzilla"]["keywords"],
             version=config["bugzilla"]["version"],
             status=config["bugzilla"]["bug_status"],
+            cache_expiration=config["bugzilla"]["query_cache_expiration"],
+            update_delay=config["bugzilla"]["update_delay"],
+            update_failure_callback=self._handle_bugzilla_update_failure,
+            update_sent_callback=self._handle_bugzilla_update_sent,
         )
+        register_stats("bugzilla", self.notifier_bugzilla.stats)
+        if config["bugzilla"]["update_delay"]:
+            # Send the queued bug updates when the consumer is stopped
+            atexit.register(self.notifier_bugzilla.flush)
         self.notifier_fedora_messaging = FedoraMessaging(prefix=PREFIX)
         self.patcher_bugzilla = bz_patcher(
             server_url=config["bugzilla"]["url"],
             api_key=config["bugzilla"]["api_key"],
         )
+        self.mdapi_mirror = None
+        if config["mdapi_mirror"]["enabled"]:
+            self.mdapi_mirror = MDApiMirror(
+                repo_url=config["mdapi_mirror"]["repo_url"],
+                cache_dir=config["mdapi_mirror"]["cache_dir"],
+                requests_session=requests_session,
+                timeout=timeout,
+                refresh_interval=config["mdapi_mirror"]["refresh_interval"],
+            )
+            # Don't delay the start, mdapi is asked until the mirror is ready
+            self.mdapi_mirror.start()
+            register_stats("mdapi_mirror", self.mdapi_mirror.stats)
+            atexit.register(self.mdapi_mirror.close)
+        self._init_validators(requests_session, timeout)
+        self.mapping_workers = config["mapping_workers"]
+        self._init_mapping_executor()
+        self.build_queue = None
+        self.build_workers = None
+        if config["build_queue"]["enabled"]:
+            if config["build_queue"]["backend"] == "redis":
+                self.build_queue = redis_queue(
+                    hostname=config["redis"]["hostname"],
+                    port=config["redis"]["port"],
+                    password=config["redis"]["password"],
+                    name=config["build_queue"]["name"],
+                    lease_time=config["build_queue"]["lease_time"],
+                    connection_pool=self.database_redis.connection_pool,
+                )
+            else:
+                self.build_queue = memory_queue()
+            self.build_workers = WorkerPool(
+                queue=self.build_queue,
+                handler=self._handle_queued_scratch_build,
+                workers=config["build_queue"]["workers"],
+            )
+            self.build_workers.start()
+            # Let the running builds finish when the consumer is stopped
+            atexit.register(self.build_workers.stop)
+        self.task_filter = None
+        self._task_filter_lock = threading.Lock()
+        self._task_filter_pending = None
+        self._task_filter_refreshed = 0.0
+        self._task_filter_refreshing = False
+        if config["task_filter"]["enabled"]:
+            # Don't delay the start, messages aren't filtered until it's loaded
+            self._task_filter_refreshing = True
+            self._start_task_filter_refresh_thread()
+        self.deduplicator = None
+        if config["deduplication"]["enabled"]:
+            deduplication_database = None
+            if config["deduplication"]["backend"] == "redis":
+                deduplication_database = Redis(
+                    hostname=config["redis"]["hostname"],
+                    port=config["redis"]["port"],
+                    password=config["redis"]["password"],
+                    expiration_time=config["deduplication"]["window"],
+                    connection_pool=self.database_redis.connection_pool,
+                )
+            self.deduplicator = Deduplicator(
+                window=config["deduplication"]["window"],
+                max_size=config["deduplication"]["max_size"],
+                database=deduplication_database,
+            )
+            register_stats("deduplication", self.deduplicator.stats)
+        self.dropped_messages = collections.Counter()
+        if config["tracing"]["enabled"]:
+            tracing.enable()
+        self.metrics_server = None
+        if config["metrics"]["enabled"]:
+            self.metrics_server = start_http_server(
+                port=config["metrics"]["port"], host=config["metrics"]["host"]
+            )
+            if self.metrics_server is not None:
+                atexit.register(self.metrics_server.shutdown)
+
+    def _init_mapping_executor(self) -> None:
+        """
+        Initialize the worker pool processing package mappings in parallel,
+        if more than one mapping worker is configured.
+        """
+        self.mapping_executor = None
+        if self.mapping_workers > 1:
+            self.mapping_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.mapping_workers,
+                thread_name_prefix="hotness-mapping",
+            )
+
+    def _init_validators(self, requests_session, timeout):
+        """
+        Initialize the validators, wrapped by cache and snapshot if enabled.
+
+        Params:
+            requests_session: Session shared by the validators
+            timeout: Connect and read timeout of requests
+        """
         self.validator_mdapi = MDApi(
-            url=config["mdapi_url"], requests_session=requests_session, timeout=timeout
+            url=config["mdapi_url"],
+            requests_session=requests_session,
+            timeout=timeout,
+            cache_expiration=config["mdapi_cache_expiration"],
+            mirror=self.mdapi_mirror,
         )
         self.validator_pagure = Pagure(
             url=config["dist_git_url"],
@@ -175,7 +421,41 @@ class HotnessConsumer(object):
             timeout=timeout,
             branch=config["repoid"],
             package_type="rpm",
+            parallel_requests=config["dist_git_parallel_requests"],
+            # Every mapping validated in parallel needs three requests
+            max_workers=3 * config["mapping_workers"],
         )
+        if config["validator_cache"]["enabled"]:
+            if config["validator_cache"]["backend"] == "redis":
+                validator_cache = Redis(
+                    hostname=config["redis"]["hostname"],
+                    port=config["redis"]["port"],
+                    password=config["redis"]["password"],
+                    expiration_time=config["validator_cache"]["expiration"],
+                    connection_pool=self.database_redis.connection_pool,
+                )
+            else:
+                validator_cache = Cache(
+                    expiration_time=config["validator_cache"]["expiration"],
+                    max_size=config["validator_cache"]["max_size"],
+                )
+            self.validator_pagure = CachedValidator(
+                validator=self.validator_pagure,
+                database=validator_cache,
+                key_prefix="pagure:{}".format(config["repoid"]),
+            )
+            register_stats("validator_cache", self.validator_pagure.stats)
+        if config["dist_git_snapshot"]["enabled"]:
+            self.validator_pagure = SnapshotValidator(
+                validator=self.validator_pagure,
+                source=config["dist_git_snapshot"]["source"],
+                requests_session=requests_session,
+                timeout=timeout,
+                refresh_interval=config["dist_git_snapshot"]["refresh_interval"],
+                max_age=config["dist_git_snapshot"]["max_age"],
+            )
+            self.validator_pagure.load()
+            register_stats("dist_git_snapshot", self.validator_pagure.stats)
 
     def __call__(self, msg: Message) -> None:
         """
@@ -188,38 +468,164 @@ class HotnessConsumer(object):
             Nack: For transient failures (network issues, timeouts, service unavailable)
                   to retry the message later.
         """
-        topic, body, msg_id = msg.topic, msg.body, msg.id
-        _logger.debug("Received %r" % msg_id)
-
-        try:
-            if topic.endswith("anitya.project.version.update.v2"):
+        topic, body = msg.topic, msg.body
+        with self._handling_message(msg) as handling:
+            if self._filter_message(topic, body):
+                handling["result"] = "filtered"
+            elif topic.endswith("anitya.project.version.update.v2"):
                 message = ProjectVersionUpdatedV2(topic=topic, body=body)
-                self._handle_anitya_version_update(message)
+                if self._is_duplicate(message):
+                    handling["result"] = "duplicate"
+                else:
+                    processed = False
+                    try:
+                        processed = self._handle_anitya_version_update(message)
+                    finally:
+                        if not processed:
+                            self._release_processed(message)
             elif topic.endswith("buildsys.task.state.change"):
                 self._handle_buildsys_scratch(msg)
-        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-            # This catches Timeout and ConnectionError (transient network issues)
-            _logger.warning(
-                "Transient network error processing message %s: %s. "
-                "Message will be retried.",
-                msg_id,
-                str(e),
-            )
-            raise fm_exceptions.Nack() from e
-        except Exception:
-            # For permanent errors (bugs in code, invalid data), log and drop
-            _logger.exception(
-                "Permanent error processing message %s. Message will be dropped.",
-                msg_id,
-            )
-            # By not raising anything, fedora-messaging acknowledges and drops the message
+
+    @contextlib.contextmanager
+    def _handling_message(self, msg: Message) -> Iterator[dict]:
+        """
+        Measure and trace handling of the message and handle the errors raised
+        during it.
+
+        Example:
+            >>> with self._handling_message(msg) as handling:
+            ...     handling["result"] = "filtered"
+
+        Params:
+            msg: The message we received from the queue.
+
+        Returns:
+            Dictionary with result of handling, which is "handled" by default.
+
+        Raises:
+            Nack: For transient failures (network issues, timeouts, service unavailable)
+                  to retry the message later.
+        """
+        topic, msg_id = msg.topic, msg.id
+        _logger.debug("Received %r" % msg_id)
+
+        handling = {"result": "handled"}
+        with MESSAGE_DURATION.labels(topic=topic).time(), span(
+            "message",
+            {"messaging.message.id": msg_id, "messaging.destination.name": topic},
+        ):
+            try:
+                yield handling
+            except self.TRANSIENT_ERRORS as e:
+                # This catches Timeout and ConnectionError (transient network issues)
+                handling["result"] = "nack"
+                _logger.warning(
+                    "Transient network error processing message %s: %s. "
+                    "Message will be retried.",
+                    msg_id,
+                    str(e),
+                )
+                raise fm_exceptions.Nack() from e
+            except Exception:
+                # For permanent errors (bugs in code, invalid data), log and drop
+                handling["result"] = "error"
+                _logger.exception(
+                    "Permanent error processing message %s. Message will be dropped.",
+                    msg_id,
+                )
+                # By not raising anything, fedora-messaging acknowledges
+                # and drops the message
+            finally:
+                MESSAGES.labels(topic=topic, result=handling["result"]).inc()
+
+    def _filter_message(self, topic: str, body: Mapping) -> Optional[str]:
+        """
+        Evaluate the message filters for the message and count the dropped messages.
+
+        Params:
+            topic: Topic of the message
+            body: Body of the message
+
+        Returns:
+            Name of the filter which dropped the message or None if the message
+            should be handled.
+        """
+        for message_filter in MESSAGE_FILTERS:
+            if topic.endswith(message_filter.topic) and not message_filter.accept(body):
+                _logger.debug(message_filter.reason)
+                self.dropped_messages[message_filter.name] += 1
+                DROPPED_MESSAGES.labels(filter=message_filter.name).inc()
+                return message_filter.name
+        return None
+
+    def _deduplication_key(self, message: ProjectVersionUpdatedV2) -> str:
+        """
+        Create key identifying the Anitya message for deduplication.
+
+        Params:
+            message: Anitya message
+
+        Returns:
+            Key created from project id, latest version and package mappings
+            for the watched distribution.
+        """
+        packages = sorted(
+            mapping["package_name"]
+            for mapping in message.mappings
+            if mapping["distro"] == self.distro
+        )
+        return "hotness:dedup:{}:{}:{}".format(
+            message.project_id, message.versions[0], ",".join(packages)
+        )
+
+    def _is_duplicate(self, message: ProjectVersionUpdatedV2) -> bool:
+        """
+        Claim the Anitya message for processing and count the dropped messages
+        if the same message was already claimed during the deduplication window.
+        The claim needs to be released by `_release_processed` when the message
+        isn't processed.
+
+        Params:
+            message: Anitya message
+
+        Returns:
+            True if the message should be dropped, False otherwise.
+        """
+        if self.deduplicator is None:
+            return False
+
+        source = self.deduplicator.claim(self._deduplication_key(message))
+        if source is None:
+            return False
+
+        _logger.info(
+            "Dropping duplicate message %r for %r %s"
+            % (message.id, message.project_name, message.versions[0])
+        )
+        self.dropped_messages["duplicate"] += 1
+        DROPPED_MESSAGES.labels(filter="duplicate").inc()
+        DUPLICATE_MESSAGES.labels(source=source).inc()
+        return True
+
+    def _release_processed(self, message: ProjectVersionUpdatedV2) -> None:
+        """
+        Release the Anitya message claimed by `_is_duplicate`, so it's processed
+        again when it's received. Called when the message should be retried
+        or it was dropped because of failure of external system.
+
+        Params:
+            message: Anitya message
+        """
+        if self.deduplicator is not None:
+            self.deduplicator.release(self._deduplication_key(message))
 
     def _handle_buildsys_scratch(self, message: Message) -> None:
         """
         Message handler for build messages.
 
-        This handler checks if we have build in the database, checks if the build
-        is in completed state and follow up comment is added to bugzilla issues.
+        This handler checks if we have build in the database and follow up comment
+        is added to bugzilla issues. Messages for secondary arch, non-build tasks
+        and builds not in done state are dropped by `MESSAGE_FILTERS` before.
 
         Topic: `org.fedoraproject.prod.buildsys.task.state.change`
 
@@ -227,19 +633,16 @@ class HotnessConsumer(object):
           message: Message to process
         """
         msg_id, body = message.id, message.body
-        instance = body["instance"]
-
-        if instance != "primary":
-            _logger.debug("Ignoring secondary arch task...")
-            return
-
-        method = body["method"]
-
-        if method != "build":
-            _logger.debug("Ignoring non-build task...")
-            return
-
         task_id = body["info"]["id"]
+        if config["task_filter"]["enabled"]:
+            self._refresh_task_filter_if_needed()
+            if self.task_filter is not None and str(task_id) not in self.task_filter:
+                _logger.debug(
+                    "ignoring [%s] as it's not one of our outstanding "
+                    "builds" % str(task_id)
+                )
+                return
+
         # Retrieve the build_id with bz_id from redis
         retrieve_data_request = RetrieveDataRequest(key=str(task_id))
         retrieve_data_redis_use_case = RetrieveDataUseCase(self.database_redis)
@@ -261,18 +664,7 @@ class HotnessConsumer(object):
 
         _logger.info("Handling koji scratch msg %r" % msg_id)
 
-        # see koji.TASK_STATES for all values
-        done_states = {
-            "CLOSED": "completed",
-            "FAILED": "failed",
-            "CANCELED": "canceled",
-        }
-
         state = body["new"]
-        if state not in done_states:
-            _logger.info("The build is not in done state. Dropping message.")
-            return
-
         link = f"http://koji.fedoraproject.org/koji/taskinfo?taskID={task_id}"
 
         # One last little switch-a-roo for stg
@@ -313,6 +705,103 @@ class HotnessConsumer(object):
         notifier_bugzilla_use_case = NotifyUserUseCase(self.notifier_bugzilla)
         notifier_bugzilla_use_case.notify(notify_request)
 
+    def _refresh_task_filter(self) -> None:
+        """
+        Load the filter of tracked build tasks from the task ids stored in Redis.
+
+        Tasks tracked while the filter is loaded are added to the new filter
+        as well. If Redis isn't available, the filter is disabled until
+        the next refresh, so no message is dropped by mistake.
+        """
+        self._task_filter_refreshed = time.monotonic()
+        task_filter = BloomFilter(
+            capacity=config["task_filter"]["capacity"],
+            error_rate=config["task_filter"]["error_rate"],
+        )
+        with self._task_filter_lock:
+            if self._task_filter_pending is None:
+                self._task_filter_pending = []
+
+        loaded = True
+        try:
+            # Only the task ids are stored as numeric keys
+            for key in self.database_redis.scan_keys("[0-9]*"):
+                task_filter.add(key)
+        except Exception:
+            _logger.exception("Couldn't load tracked build tasks from redis.")
+            loaded = False
+
+        with self._task_filter_lock:
+            for task_id in self._task_filter_pending:
+                task_filter.add(task_id)
+            self._task_filter_pending = None
+            self.task_filter = task_filter if loaded else None
+
+        if not loaded:
+            return
+
+        if len(task_filter) > task_filter.capacity:
+            _logger.warning(
+                "Tracking %d build tasks, more than the task filter capacity %d."
+                % (len(task_filter), task_filter.capacity)
+            )
+        _logger.info(
+            "Loaded %d build tasks to task filter using %d bytes."
+            % (len(task_filter), task_filter.size)
+        )
+
+    def _refresh_task_filter_if_needed(self) -> None:
+        """
+        Start loading the filter of tracked build tasks in background thread
+        when the refresh interval passed, unless it's already loading.
+        The current filter is used until the new one is loaded.
+        """
+        refresh_interval = config["task_filter"]["refresh_interval"]
+        if not refresh_interval:
+            return
+
+        with self._task_filter_lock:
+            if self._task_filter_refreshing or (
+                time.monotonic() - self._task_filter_refreshed < refresh_interval
+            ):
+                return
+            self._task_filter_refreshing = True
+
+        self._start_task_filter_refresh_thread()
+
+    def _start_task_filter_refresh_thread(self) -> None:
+        """
+        Load the filter of tracked build tasks in background thread,
+        `_task_filter_refreshing` must be already set.
+        """
+        # Collect the tasks tracked from now on, they may be missed by the load
+        with self._task_filter_lock:
+            self._task_filter_pending = []
+
+        def refresh() -> None:
+            try:
+                self._refresh_task_filter()
+            finally:
+                with self._task_filter_lock:
+                    self._task_filter_refreshing = False
+
+        threading.Thread(
+            target=refresh, name="hotness-task-filter", daemon=True
+        ).start()
+
+    def _track_task(self, task_id: str) -> None:
+        """
+        Add build task to the filter of tracked build tasks.
+
+        Params:
+            task_id: Id of the build task
+        """
+        with self._task_filter_lock:
+            if self._task_filter_pending is not None:
+                self._task_filter_pending.append(task_id)
+            if self.task_filter is not None:
+                self.task_filter.add(task_id)
+
     def _list_to_series(
         self, items: List, N: int = 3, oxford_comma: bool = True
     ) -> str:
@@ -347,7 +836,7 @@ class HotnessConsumer(object):
 
         return first + conjunction + items[-1]
 
-    def _handle_anitya_version_update(self, message: ProjectVersionUpdatedV2) -> None:
+    def _handle_anitya_version_update(self, message: ProjectVersionUpdatedV2) -> bool:
         """
         Message handler for new versions found by Anitya.
 
@@ -369,16 +858,52 @@ class HotnessConsumer(object):
 
         Params:
             message: Message to process.
+
+        Returns:
+            False if any mapping was dropped because of failure of external system,
+            True otherwise.
+        """
+        mappings, retrieved_stable_versions = self._prepare_anitya_update(message)
+
+        if self.mapping_executor and len(mappings) > 1:
+            reason = self._handle_mappings_concurrently(
+                message, mappings, retrieved_stable_versions
+            )
+            return reason not in self.ERROR_DROP_REASONS
+
+        for mapping in mappings:
+            with span("mapping", {"hotness.package": mapping["package_name"]}):
+                reason = self._handle_mapping(
+                    message, mapping, retrieved_stable_versions
+                )
+            if reason:
+                return reason not in self.ERROR_DROP_REASONS
+
+        return True
+
+    def _prepare_anitya_update(
+        self, message: ProjectVersionUpdatedV2
+    ) -> Tuple[List[dict], List[str]]:
+        """
+        Prepare Anitya message for processing of its package mappings.
+        Publishes to `update.drop` if there is no mapping to watched distribution.
+
+        Params:
+            message: Message to process.
+
+        Returns:
+            Mappings for the watched distribution and stable versions
+            retrieved by Anitya.
         """
         _logger.info("Handling anitya msg %r" % message.id)
-        package = None
         fedora_messaging_use_case = NotifyUserUseCase(self.notifier_fedora_messaging)
         latest_version = message.versions[0]
         # Filter the stable versions only
+        stable_versions = set(message.stable_versions)
         retrieved_stable_versions = [
             version
             for version in message.upstream_versions
-            if version in message.stable_versions
+            if version in stable_versions
         ]
 
         # No mapping for the distribution we want to watch, just sent the message and
@@ -403,91 +928,208 @@ class HotnessConsumer(object):
             )
             fedora_messaging_use_case.notify(notify_request)
 
-        for mapping in message.mappings:
-            if mapping["distro"] == self.distro:
-                package = Package(
-                    name=mapping["package_name"],
-                    version=latest_version,
-                    distro=self.distro,
-                )
+        mappings = [
+            mapping for mapping in message.mappings if mapping["distro"] == self.distro
+        ]
 
-                validation_output = self._validate_package(
-                    package, retrieved_stable_versions
-                )
+        return mappings, retrieved_stable_versions
 
-                # Check if validation failed
-                if validation_output["reason"]:
-                    opts = {
-                        "body": {
-                            "trigger": {"msg": message.body, "topic": message.topic},
-                            "reason": validation_output["reason"],
-                        }
-                    }
+    def _handle_mappings_concurrently(
+        self,
+        message: ProjectVersionUpdatedV2,
+        mappings: List[dict],
+        stable_versions: List[str],
+    ) -> Optional[str]:
+        """
+        Process package mappings from Anitya message using the bounded worker pool.
 
-                    notify_request = NotifyRequest(
-                        package=package, message="update.drop", opts=opts
-                    )
-                    fedora_messaging_use_case.notify(notify_request)
-                    return
-
-                scratch_build = validation_output["scratch_build"]
-                bugzilla = validation_output["bugzilla"]
-
-                current_version = validation_output["version"]
-                current_release = validation_output["release"]
-
-                retrieved_versions = message.upstream_versions
-                if validation_output["stable_only"]:
-                    retrieved_versions = retrieved_stable_versions
-
-                bz_id = -1
-                if bugzilla:
-                    # Comment on bugzilla
-                    bz_id = self._comment_on_bugzilla_with_template(
-                        package=package,
-                        current_version=current_version,
-                        current_release=current_release,
-                        project_homepage=message.project_homepage,
-                        project_id=message.project_id,
-                        retrieved_versions=retrieved_versions,
+        Only the validation, which doesn't change anything, is done in parallel
+        by the workers. The validated mappings are processed one by one in the order
+        of the message, so the published messages and bugs are the same as when
+        the mappings are processed sequentially. Processing stops on the first
+        dropped mapping and the validations which are not needed are cancelled.
+
+        Params:
+            message: Message to process.
+            mappings: Mappings for the watched distribution.
+            stable_versions: Stable versions retrieved by Anitya.
+
+        Returns:
+            Reason of the first dropped mapping or None if every mapping
+            was processed.
+
+        Raises:
+            Exception: First exception raised by any of the validations, nothing
+                else is processed after it.
+        """
+        executor = cast(concurrent.futures.ThreadPoolExecutor, self.mapping_executor)
+        packages = [self._mapping_package(message, mapping) for mapping in mappings]
+        futures = [
+            executor.submit(propagate(self._validate_package), package, stable_versions)
+            for package in packages
+        ]
+
+        try:
+            for package, future in zip(packages, futures):
+                validation_output = future.result()
+                with span("mapping", {"hotness.package": package.name}):
+                    reason = self._process_validated_mapping(
+                        message, package, validation_output, stable_versions
                     )
+                if reason:
+                    return reason
+        finally:
+            for future in futures:
+                future.cancel()
+
+        return None
+
+    def _handle_mapping(
+        self,
+        message: ProjectVersionUpdatedV2,
+        mapping: dict,
+        retrieved_stable_versions: List[str],
+    ) -> Optional[str]:
+        """
+        Validate and process one package mapping from Anitya message.
+
+        Publishes to `update.drop` if validation fails or communication with bugzilla
+        fails. Publishes to `update.bug.file` otherwise.
+
+        Params:
+            message: Message to process.
+            mapping: Mapping to process.
+            retrieved_stable_versions: Stable versions retrieved by Anitya.
+
+        Returns:
+            Reason of the drop published to `update.drop` or None if the mapping
+            was processed.
+        """
+        package = self._mapping_package(message, mapping)
+        validation_output = self._validate_package(package, retrieved_stable_versions)
 
-                    # Failure happened when communicating with bugzilla
-                    if bz_id == -1:
-                        opts = {
-                            "body": {
-                                "trigger": {
-                                    "msg": message.body,
-                                    "topic": message.topic,
-                                },
-                                "reason": "bugzilla",
-                            }
-                        }
-
-                        notify_request = NotifyRequest(
-                            package=package, message="update.drop", opts=opts
-                        )
-                        fedora_messaging_use_case.notify(notify_request)
-                        return
-
-                # Send Fedora messaging notification
-                # This will have bz_id = -1 if there isn't any bugzilla ticket filled
+        return self._process_validated_mapping(
+            message, package, validation_output, retrieved_stable_versions
+        )
+
+    def _mapping_package(
+        self, message: ProjectVersionUpdatedV2, mapping: dict
+    ) -> Package:
+        """
+        Create package for the package mapping from Anitya message.
+
+        Params:
+            message: Message to process.
+            mapping: Mapping to process.
+
+        Returns:
+            Package with the latest version from the message.
+        """
+        return Package(
+            name=mapping["package_name"],
+            version=message.versions[0],
+            distro=self.distro,
+        )
+
+    def _process_validated_mapping(
+        self,
+        message: ProjectVersionUpdatedV2,
+        package: Package,
+        validation_output: dict,
+        retrieved_stable_versions: List[str],
+    ) -> Optional[str]:
+        """
+        Process one validated package mapping from Anitya message.
+
+        Publishes to `update.drop` if validation failed or communication with bugzilla
+        fails. Publishes to `update.bug.file` otherwise, when the comment on bug
+        is queued, it's published after the comment is sent.
+
+        Params:
+            message: Message to process.
+            package: Package created from the mapping.
+            validation_output: Output of `_validate_package`.
+            retrieved_stable_versions: Stable versions retrieved by Anitya.
+
+        Returns:
+            Reason of the drop published to `update.drop` or None if the mapping
+            was processed.
+        """
+        fedora_messaging_use_case = NotifyUserUseCase(self.notifier_fedora_messaging)
+
+        # Check if validation failed
+        if validation_output["reason"]:
+            opts = {
+                "body": {
+                    "trigger": {"msg": message.body, "topic": message.topic},
+                    "reason": validation_output["reason"],
+                }
+            }
+
+            notify_request = NotifyRequest(
+                package=package, message="update.drop", opts=opts
+            )
+            fedora_messaging_use_case.notify(notify_request)
+            return validation_output["reason"]
+
+        scratch_build = validation_output["scratch_build"]
+        bugzilla = validation_output["bugzilla"]
+
+        current_version = validation_output["version"]
+        current_release = validation_output["release"]
+
+        retrieved_versions = message.upstream_versions
+        if validation_output["stable_only"]:
+            retrieved_versions = retrieved_stable_versions
+
+        bz_id = -1
+        queued = False
+        if bugzilla:
+            # Comment on bugzilla
+            bz_id, queued = self._comment_on_bugzilla_with_template(
+                package=package,
+                current_version=current_version,
+                current_release=current_release,
+                project_homepage=message.project_homepage,
+                project_id=message.project_id,
+                retrieved_versions=retrieved_versions,
+                trigger={"msg": message.body, "topic": message.topic},
+            )
+
+            # Failure happened when communicating with bugzilla
+            if bz_id == -1:
                 opts = {
                     "body": {
-                        "trigger": {"msg": message.body, "topic": message.topic},
-                        "bug": {"bug_id": bz_id},
-                        "package": package.name,
+                        "trigger": {
+                            "msg": message.body,
+                            "topic": message.topic,
+                        },
+                        "reason": "bugzilla",
                     }
                 }
 
                 notify_request = NotifyRequest(
-                    package=package, message="update.bug.file", opts=opts
+                    package=package, message="update.drop", opts=opts
                 )
                 fedora_messaging_use_case.notify(notify_request)
+                return "bugzilla"
+
+        # Send Fedora messaging notification
+        # This will have bz_id = -1 if there isn't any bugzilla ticket filled
+        # Queued comment is published when it's sent, see `_handle_bugzilla_update_sent`
+        if not queued:
+            self._publish_bug_file(
+                package, {"msg": message.body, "topic": message.topic}, bz_id
+            )
 
-                # Do a scratch build
-                if scratch_build and bugzilla:
-                    self._handle_scratch_build(package, bz_id)
+        # Do a scratch build
+        if scratch_build and bugzilla:
+            if self.build_queue:
+                self._queue_scratch_build(package, bz_id)
+            else:
+                self._handle_scratch_build(package, bz_id)
+
+        return None
 
     def _validate_package(self, package: Package, stable_versions: List[str]) -> dict:
         """
@@ -520,7 +1162,33 @@ class HotnessConsumer(object):
                 "reason": ""
             }
         """
-        output = {
+        output = self._empty_validation_output()
+        # Check if we are monitoring the package
+        validate_request = PackageRequest(package)
+        validate_pagure_use_case = PackageCheckUseCase(self.validator_pagure)
+        pagure_response = validate_pagure_use_case.validate(validate_request)
+        if not self._check_pagure_response(
+            package, pagure_response, stable_versions, output
+        ):
+            return output
+
+        # Check if the version is newer
+        validate_mdapi_use_case = PackageCheckUseCase(self.validator_mdapi)
+        mdapi_response = validate_mdapi_use_case.validate(validate_request)
+        self._check_mdapi_response(
+            package, mdapi_response, pagure_response.value["all_versions"], output
+        )
+        return output
+
+    @staticmethod
+    def _empty_validation_output() -> dict:
+        """
+        Create output of `_validate_package` before any validation.
+
+        Returns:
+            Dictionary with default values of validation output.
+        """
+        return {
             "bugzilla": True,
             "scratch_build": False,
             "stable_only": False,
@@ -528,11 +1196,29 @@ class HotnessConsumer(object):
             "release": 0,
             "reason": "",
         }
-        # Check if we are monitoring the package
-        validate_request = PackageRequest(package)
-        validate_pagure_use_case = PackageCheckUseCase(self.validator_pagure)
-        response = validate_pagure_use_case.validate(validate_request)
 
+    def _check_pagure_response(
+        self,
+        package: Package,
+        response: Response,
+        stable_versions: List[str],
+        output: dict,
+    ) -> bool:
+        """
+        Check the response of Pagure validator and fill the validation output.
+        The package version is replaced by the latest stable version when
+        monitoring is set to stable only and the version isn't stable.
+
+        Params:
+            package: Package being validated
+            response: Response of Pagure validator
+            stable_versions: Stable versions to check when monitoring
+                settings is set to stable only
+            output: Validation output to fill, reason is set when validation fails
+
+        Returns:
+            True if the validation should continue, False if it failed.
+        """
         # We encountered an issue during retrieving of monitoring settings
         if not response:
             _logger.error(
@@ -540,18 +1226,17 @@ class HotnessConsumer(object):
                 % package.name
             )
             output["reason"] = "dist-git"
-            return output
+            return False
 
         # Maintainer doesn't want to monitor the package
         if not response.value["monitoring"]:
             _logger.info("Repo says not to monitor %r. Dropping." % package.name)
             output["reason"] = "monitoring settings"
-            return output
+            return False
 
         output["bugzilla"] = response.value["bugzilla"]
         output["scratch_build"] = response.value["scratch_build"]
         output["stable_only"] = response.value["stable_only"]
-        all_versions = response.value["all_versions"]
 
         # If monitoring is set to stable only check if the package version
         # is stable, if not replace it with latest stable
@@ -563,7 +1248,7 @@ class HotnessConsumer(object):
                     % package.name
                 )
                 output["reason"] = "monitoring settings"
-                return output
+                return False
             if package.version not in stable_versions:
                 package.version = stable_versions[0]
 
@@ -571,17 +1256,27 @@ class HotnessConsumer(object):
         if response.value["retired"]:
             _logger.info("Package %r is retired. Dropping." % package.name)
             output["reason"] = "retired"
-            return output
+            return False
 
-        # Check if the version is newer
-        validate_mdapi_use_case = PackageCheckUseCase(self.validator_mdapi)
-        response = validate_mdapi_use_case.validate(validate_request)
+        return True
 
+    def _check_mdapi_response(
+        self, package: Package, response: Response, all_versions: bool, output: dict
+    ) -> None:
+        """
+        Check the response of MDApi validator and fill the validation output.
+
+        Params:
+            package: Package being validated
+            response: Response of MDApi validator
+            all_versions: Monitoring setting for notifying about every version
+            output: Validation output to fill, reason is set when validation fails
+        """
         # We encountered an issue with MDAPI
         if not response:
             _logger.error("Couldn't retrieve metadata for %r. Dropping." % package.name)
             output["reason"] = "mdapi"
-            return output
+            return
 
         # Version in upstream is not newer
         if not response.value["newer"]:
@@ -593,11 +1288,10 @@ class HotnessConsumer(object):
                     % package.name
                 )
                 output["reason"] = "not newer"
-                return output
+                return
 
         output["version"] = response.value["version"]
         output["release"] = response.value["release"]
-        return output
 
     def _comment_on_bugzilla_with_template(
         self,
@@ -607,7 +1301,8 @@ class HotnessConsumer(object):
         project_homepage: str,
         project_id: int,
         retrieved_versions: List[str] = [],
-    ) -> int:
+        trigger: Optional[dict] = None,
+    ) -> Tuple[int, bool]:
         """
         Comment on bugzilla bug using the configured template.
 
@@ -618,9 +1313,14 @@ class HotnessConsumer(object):
             project_homepage: Upstream homepage
             project_id: Project id in Anitya
             retrieved_versions: All versions retrieved by Anitya in last check
+            trigger: Message which triggered the comment, used to publish
+                `update.bug.file` or `update.drop` when the queued comment
+                is sent or can't be sent. Only passed to the notifier
+                when the comments are queued.
 
         Returns:
-            Bugzilla ticket id. -1 if failure was encountered.
+            Tuple containing Bugzilla ticket id, -1 if failure was encountered,
+            and True if the comment was queued to be sent later.
         """
         bz_id = -1
         latest_upstream = package.version
@@ -648,20 +1348,111 @@ class HotnessConsumer(object):
         short_desc = self.short_desc_template % dict(
             name=package.name, retrieved_version=latest_upstream
         )
+        opts: dict = {"bz_short_desc": short_desc}
+        if trigger and config["bugzilla"]["update_delay"]:
+            opts["trigger"] = trigger
         notify_request = NotifyRequest(
             package=package,
             message=description,
-            opts={"bz_short_desc": short_desc},
+            opts=opts,
         )
         notifier_bugzilla_use_case = NotifyUserUseCase(self.notifier_bugzilla)
         response = notifier_bugzilla_use_case.notify(notify_request)
 
         if not response:
-            return bz_id
+            return bz_id, False
 
         bz_id = response.value["bz_id"]
 
-        return bz_id
+        return bz_id, response.value.get("queued", False)
+
+    def _publish_bug_file(self, package: Package, trigger: dict, bz_id: int) -> None:
+        """
+        Publish to `update.bug.file`.
+
+        Params:
+            package: Package the bug belongs to
+            trigger: Message which triggered the update of bug
+            bz_id: Id of the bug, -1 if there isn't any bug
+        """
+        opts = {
+            "body": {
+                "trigger": trigger,
+                "bug": {"bug_id": bz_id},
+                "package": package.name,
+            }
+        }
+        notify_request = NotifyRequest(
+            package=package, message="update.bug.file", opts=opts
+        )
+        fedora_messaging_use_case = NotifyUserUseCase(self.notifier_fedora_messaging)
+        fedora_messaging_use_case.notify(notify_request)
+
+    def _handle_bugzilla_update_sent(self, package: Package, opts: dict) -> None:
+        """
+        Publish to `update.bug.file` when queued update of bug for new version
+        was sent to bugzilla. Called by Bugzilla notifier when `update_delay` is set.
+
+        Params:
+            package: Package the bug belongs to
+            opts: Options of the notify request, containing the id of the bug
+                  and the message which triggered the update
+        """
+        if "trigger" not in opts:
+            return
+
+        self._publish_bug_file(package, opts["trigger"], opts["bz_id"])
+
+    def _handle_bugzilla_update_failure(self, package: Package, opts: dict) -> None:
+        """
+        Publish to `update.drop` when queued update of bug for new version couldn't
+        be sent to bugzilla. Called by Bugzilla notifier when `update_delay` is set.
+
+        Params:
+            package: Package the bug belongs to
+            opts: Options of the notify request, containing the message which
+                  triggered the update
+        """
+        if "trigger" not in opts:
+            return
+
+        opts = {"body": {"trigger": opts["trigger"], "reason": "bugzilla"}}
+        notify_request = NotifyRequest(
+            package=package, message="update.drop", opts=opts
+        )
+        fedora_messaging_use_case = NotifyUserUseCase(self.notifier_fedora_messaging)
+        fedora_messaging_use_case.notify(notify_request)
+
+    def _queue_scratch_build(self, package: Package, bz_id: int) -> None:
+        """
+        Queue the scratch build, so it is started later by build workers.
+        If the build can't be queued, it is started directly.
+
+        Params:
+            package: Package to start scratch build for
+            bz_id: Bugzilla bug id to reference in build
+        """
+        build_request = BuildRequest(package=package, opts={"bz_id": bz_id})
+        queue_build_use_case = QueueBuildUseCase(self.build_queue)
+        response = queue_build_use_case.queue_build(build_request)
+        if not response:
+            _logger.error(
+                "Couldn't queue scratch build for %r. Starting it directly."
+                % package.name
+            )
+            self._handle_scratch_build(package, bz_id)
+
+    def _handle_queued_scratch_build(self, value: dict) -> None:
+        """
+        Start scratch build retrieved from the build queue.
+        Called by build workers.
+
+        Params:
+            value: Queued build as created by `QueueBuildUseCase`
+        """
+        package = cast(Package, Package.from_dict(value["package"]))
+        _logger.info("Starting queued scratch build for %r" % package.name)
+        self._handle_scratch_build(package, value["opts"]["bz_id"])
 
     def _handle_scratch_build(self, package: Package, bz_id: int) -> None:
         """
@@ -707,6 +1498,7 @@ class HotnessConsumer(object):
 
             # Insert the build_id to redis if available
             if build_id:
+                self._track_task(str(build_id))
                 insert_data_request = InsertDataRequest(
                     key=str(build_id), value=str(bz_id)
                 )
@@ -742,6 +1534,7 @@ class HotnessConsumer(object):
             notifier_bugzilla_use_case.notify(notify_request)
 
         # Save the build_id with bz_id to redis
+        self._track_task(str(build_id))
         insert_data_request = InsertDataRequest(key=str(build_id), value=str(bz_id))
         insert_data_redis_use_case = InsertDataUseCase(self.database_redis)
         response = insert_data_redis_use_case.insert(insert_data_request)
@@ -16,9 +16,13 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 
 import bugzilla  # type: ignore
 
+from hotness.common.metrics import BUGZILLA_UPDATE_FAILURES, EXTERNAL_CALL_DURATION
 from hotness.exceptions import NotifierException
 from hotness.domain.package import Package
 from .notifier import Notifier
@@ -41,6 +45,17 @@ class Bugzilla(Notifier):
                                 open
         bug_status_closed (list): List of statuses in which the ticket is considered closed
         new_bug (dict): Parameters for creating a new_bug in Bugzilla
+        cache_expiration (int): Time in seconds to cache bugs found for component,
+                                0 to disable the cache
+        update_delay (float): Time in seconds to collect updates of bugs before sending
+                              them, 0 to send every update immediately
+        update_failure_callback (callable): Called with package and options passed
+                                            to `notify` for every queued update
+                                            which couldn't be sent, None to only
+                                            log the failure
+        update_sent_callback (callable): Called with package and options passed
+                                         to `notify` for every queued update
+                                         which was sent, None to ignore it
     """
 
     base_query = {
@@ -78,6 +93,10 @@ class Bugzilla(Notifier):
         keywords: str,
         version: str,
         status: str,
+        cache_expiration: int = 0,
+        update_delay: float = 0,
+        update_failure_callback: Optional[Callable[[Package, dict], None]] = None,
+        update_sent_callback: Optional[Callable[[Package, dict], None]] = None,
     ) -> None:
         """
         Class constructor.
@@ -94,6 +113,14 @@ class Bugzilla(Notifier):
             keywords: Keywords for the new ticket
             version: Version of product to assign to new ticket
             status: Status of the new bug
+            cache_expiration: Time in seconds to cache bugs found for component
+            update_delay: Time in seconds to collect updates of bugs before sending them.
+                          Comments for the same bug are joined to one comment and bugs
+                          getting the same update are updated by one call.
+            update_failure_callback: Called with package and options passed to `notify`
+                                     for every queued update which couldn't be sent
+            update_sent_callback: Called with package and options passed to `notify`
+                                  for every queued update which was sent
 
         Raises:
             NotifierException: When the bugzilla session can't be established
@@ -120,6 +147,25 @@ class Bugzilla(Notifier):
         self.new_bug["version"] = version
         self.new_bug["status"] = status
 
+        self.cache_expiration = cache_expiration
+        self._bugs_cache: Dict[str, Tuple[float, List["bugzilla.Bug"]]] = {}
+        self._bugs_cache_lock = threading.Lock()
+
+        self.update_delay = update_delay
+        self.update_failure_callback = update_failure_callback
+        self.update_sent_callback = update_sent_callback
+        self._pending_updates: Dict[int, dict] = {}
+        # Updates taken from pending updates by `flush`, which are not sent yet
+        self._sending_updates: Dict[int, dict] = {}
+        self._pending_condition = threading.Condition()
+        self._flush_deadline: Optional[float] = None
+        self._flush_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._flushes = 0
+        self._flush_latency_last = 0.0
+        self._flush_latency_max = 0.0
+        self._update_failures = 0
+
     def notify(self, package: Package, message: str, opts: dict) -> dict:
         """
         This method is inherited from `hotness.notifiers.Notifier`.
@@ -142,10 +188,12 @@ class Bugzilla(Notifier):
                 }
 
         Returns:
-            Dictionary containing ticket bugzilla id
+            Dictionary containing ticket bugzilla id and whether the update
+            of the bug was queued to be sent later by `flush`
             Example:
             {
-                "bz_id": 100
+                "bz_id": 100,
+                "queued": True
             }
 
         Raises:
@@ -157,8 +205,9 @@ class Bugzilla(Notifier):
         # If bugzilla ticket id is provided, just follow up on the bug
         if not bug_id == 0:
             _logger.info("Bug id provided. Updating %s" % bug_id)
-            self._update_bug(bug_id, message)
             output["bz_id"] = bug_id
+            if self._update_bug(bug_id, message, package=package, opts=opts):
+                output["queued"] = True
             return output
 
         if not short_desc:
@@ -167,9 +216,13 @@ class Bugzilla(Notifier):
                 "Please provide either `bz_id` or `bz_short_desc`."
             )
 
+        # Both exact and inexact bug are looked up in all bugs of the package,
+        # so only one query is needed
+        bugs = self._component_bugs(package)
+
         # If bugzilla ticket id is not provided, try to find the bug using
         # the short description
-        bug = self._exact_bug(package, short_desc)
+        bug = self._exact_bug(bugs, short_desc)
         if bug:
             _logger.info("Found exact bug '%r'. Skipping notify action." % bug.weburl)
             output["bz_id"] = bug.bug_id
@@ -177,96 +230,352 @@ class Bugzilla(Notifier):
 
         # If none is found, try to look for any bug previously reported by the-new-hotness
         # that is still open and update that one
-        bug = self._inexact_bug(package)
+        bug = self._inexact_bug(bugs)
         if bug:
             _logger.info(
                 "There is already bug opened for previous version '%r'. "
                 "Let's update this one." % bug.weburl
             )
-            self._update_bug(bug.bug_id, message, short_desc)
             output["bz_id"] = bug.bug_id
+            if self._update_bug(
+                bug.bug_id, message, short_desc, package=package, opts=opts
+            ):
+                output["queued"] = True
             return output
 
         # If no bug exists create one
         bug = self._create_bug(package, message, short_desc)
+        self._invalidate_bugs(package)
         _logger.info("Filled a new bug %r" % bug.weburl)
         output["bz_id"] = bug.bug_id
         return output
 
-    def _update_bug(self, bug_id: int, message: str, summary: str = "") -> None:
+    def flush(self) -> None:
+        """
+        Send all pending updates of bugs. It is called periodically by background
+        thread when `update_delay` is set and should be called on shutdown.
+
+        Comments for the same bug are joined to one comment and bugs getting
+        the same comment and summary are updated by one call. Errors are logged,
+        counted and reported to `update_failure_callback`, the failed updates
+        are not retried. Updates which were sent are reported
+        to `update_sent_callback`.
+        """
+        with self._flush_lock:
+            with self._pending_condition:
+                pending = self._pending_updates
+                self._pending_updates = {}
+                self._sending_updates = pending
+                self._flush_deadline = None
+
+            if not pending:
+                return
+
+            start = time.monotonic()
+            updates: Dict[Tuple[str, str], List[int]] = {}
+            for bug_id, update in pending.items():
+                message = "\n\n".join(update["comments"])
+                updates.setdefault((message, update["summary"]), []).append(bug_id)
+
+            for (message, summary), bug_ids in updates.items():
+                try:
+                    self._send_update(bug_ids, message, summary)
+                except Exception:
+                    _logger.exception("Couldn't update bugs %r" % bug_ids)
+                    self._report_update_failure([pending[bug_id] for bug_id in bug_ids])
+                else:
+                    self._report_update_sent([pending[bug_id] for bug_id in bug_ids])
+
+            for update in pending.values():
+                for package, _ in update["requests"]:
+                    self._invalidate_bugs(package)
+
+            latency = time.monotonic() - start
+            with self._pending_condition:
+                self._sending_updates = {}
+                self._flushes += 1
+                self._flush_latency_last = latency
+                self._flush_latency_max = max(self._flush_latency_max, latency)
+
+    def stats(self) -> dict:
         """
-        Updates bug in bugzilla specified by bug id.
+        Return the statistics of pending bug updates.
+
+        Returns:
+            Dictionary containing number of bugs waiting for update, number of flushes,
+            latency of flushes in seconds and number of bugs which couldn't be updated
+            by flush.
+            Example:
+            {
+                "queue_depth": 2,
+                "flushes": 10,
+                "flush_latency_last": 0.8,
+                "flush_latency_max": 1.5,
+                "update_failures": 1
+            }
+        """
+        with self._pending_condition:
+            return {
+                "queue_depth": len(self._pending_updates),
+                "flushes": self._flushes,
+                "flush_latency_last": self._flush_latency_last,
+                "flush_latency_max": self._flush_latency_max,
+                "update_failures": self._update_failures,
+            }
+
+    def _update_bug(
+        self,
+        bug_id: int,
+        message: str,
+        summary: str = "",
+        package: Optional[Package] = None,
+        opts: Optional[dict] = None,
+    ) -> bool:
+        """
+        Updates bug in bugzilla specified by bug id. If `update_delay` is set,
+        the update is queued and sent later by `flush`.
+        Cached bugs of the package are dropped when the update is sent.
 
         Params:
             bug_id: Id of the bug in bugzilla
             message: Message to add as comment
             summary: Summary of the bug, only needs to be provided if we want
                      to update it.
+            package: Package the bug belongs to
+            opts: Options passed to `notify`, reported with id of the bug
+                  as `bz_id` to `update_failure_callback` when queued update
+                  can't be sent and to `update_sent_callback` when it was sent
+
+        Returns:
+            True if the update was queued, False if it was sent.
+        """
+        if not self.update_delay:
+            self._send_update([bug_id], message, summary)
+            if package:
+                self._invalidate_bugs(package)
+            return False
+
+        with self._pending_condition:
+            update = self._pending_updates.setdefault(
+                bug_id, {"comments": [], "summary": "", "requests": []}
+            )
+            update["comments"].append(message)
+            if summary:
+                update["summary"] = summary
+            if package:
+                update["requests"].append((package, dict(opts or {}, bz_id=bug_id)))
+            if self._flush_deadline is None:
+                self._flush_deadline = time.monotonic() + self.update_delay
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically,
+                    name="hotness-bugzilla-flusher",
+                    daemon=True,
+                )
+                self._flusher.start()
+            self._pending_condition.notify()
+        _logger.info("Queued update of bug: %s" % bug_id)
+        return True
+
+    def _flush_periodically(self) -> None:
+        """
+        Flush the pending updates when the oldest of them waits for `update_delay`.
+        It runs in background thread.
+        """
+        while True:
+            with self._pending_condition:
+                while self._flush_deadline is None:
+                    self._pending_condition.wait()
+                timeout = self._flush_deadline - time.monotonic()
+                if timeout > 0:
+                    self._pending_condition.wait(timeout)
+                    continue
+            self.flush()
+
+    def _report_update_failure(self, updates: List[dict]) -> None:
+        """
+        Count the queued updates which couldn't be sent and report them
+        to `update_failure_callback`.
+
+        Params:
+            updates: Pending updates of bugs which couldn't be updated
+        """
+        BUGZILLA_UPDATE_FAILURES.inc(len(updates))
+        with self._pending_condition:
+            self._update_failures += len(updates)
+
+        if self.update_failure_callback is None:
+            return
+
+        for update in updates:
+            for package, opts in update["requests"]:
+                try:
+                    self.update_failure_callback(package, opts)
+                except Exception:
+                    _logger.exception(
+                        "Couldn't report failed update of bug for %r" % package.name
+                    )
+
+    def _report_update_sent(self, updates: List[dict]) -> None:
+        """
+        Report the queued updates which were sent to `update_sent_callback`.
+
+        Params:
+            updates: Pending updates of bugs which were updated
+        """
+        if self.update_sent_callback is None:
+            return
+
+        for update in updates:
+            for package, opts in update["requests"]:
+                try:
+                    self.update_sent_callback(package, opts)
+                except Exception:
+                    _logger.exception(
+                        "Couldn't report sent update of bug for %r" % package.name
+                    )
+
+    def _pending_summaries(self) -> Dict[int, str]:
+        """
+        Return summaries of bugs that will be changed by queued updates.
+
+        Returns:
+            Dictionary of bug ids and new summaries.
+        """
+        with self._pending_condition:
+            return {
+                bug_id: update["summary"]
+                for updates in (self._sending_updates, self._pending_updates)
+                for bug_id, update in updates.items()
+                if update["summary"]
+            }
+
+    def _send_update(self, bug_ids: List[int], message: str, summary: str) -> None:
+        """
+        Updates bugs in bugzilla specified by bug ids with the same comment.
+
+        Params:
+            bug_ids: Ids of the bugs in bugzilla
+            message: Message to add as comment
+            summary: Summary of the bugs, only needs to be provided if we want
+                     to update it.
         """
         update = {
             "comment": {
                 "body": message,
                 "is_private": False,
             },
-            "ids": [bug_id],
+            "ids": bug_ids,
         }
         if summary:
             update["summary"] = summary
-        _logger.debug("Updating bug %r with %r" % (bug_id, update))
-        res = self.bugzilla._proxy.Bug.update(update)
+        _logger.debug("Updating bugs %r with %r" % (bug_ids, update))
+        with EXTERNAL_CALL_DURATION.labels(
+            system="bugzilla", operation="update"
+        ).time():
+            res = self.bugzilla._proxy.Bug.update(update)
         _logger.debug("Result from bug update: %r" % res)
-        _logger.info("Updated bug: %s" % bug_id)
+        _logger.info("Updated bugs: %s" % ", ".join(str(bug_id) for bug_id in bug_ids))
 
-    def _exact_bug(self, package: Package, short_desc: str) -> "bugzilla.Bug":
+    def _exact_bug(self, bugs: List["bugzilla.Bug"], short_desc: str) -> "bugzilla.Bug":
         """
-        Look for exact bug for the specified package.
+        Look for exact bug in bugs of the package. Summaries of the bugs
+        changed by queued updates are used instead of the ones from bugzilla.
 
         Params:
-            package: Search for bug for this package
+            bugs: Bugs of the package returned by `_component_bugs`
             short_desc: Short description to search for
 
         Returns:
             `bugzilla.Bug` if the bug is found or None if not.
         """
-        query = {
-            "component": package.name,
-            "bug_status": self.bug_status_open + self.bug_status_closed,
-            "short_desc": short_desc,
-            "short_desc_type": "substring",
-        }
-
-        query.update(self.base_query)
-        bugs = self.bugzilla.query(query)
-        if bugs:
-            return bugs[0]
+        statuses = self.bug_status_open + self.bug_status_closed
+        pending_summaries = self._pending_summaries() if self.update_delay else {}
+        # Bugzilla substring search is case insensitive
+        short_desc = short_desc.lower()
+        for bug in bugs:
+            summary = pending_summaries.get(bug.bug_id, bug.summary)
+            if bug.status in statuses and short_desc in summary.lower():
+                return bug
         return None
 
-    def _inexact_bug(self, package: Package) -> "bugzilla.Bug":
+    def _inexact_bug(self, bugs: List["bugzilla.Bug"]) -> "bugzilla.Bug":
         """
         Search for tickets in bugzilla filled by `self.reporter` and still
         in early states.
 
         Params:
-            package: Search for bug for this package
+            bugs: Bugs of the package returned by `_component_bugs`
 
         Returns:
             `bugzilla.Bug` if the bug is found or None if not.
         """
         # We'll match bugs in the NEW or ASSIGNED state
         # https://github.com/fedora-infra/the-new-hotness/issues/58
-        possible_statuses = list(set(self.bug_status_early + [self.new_bug["status"]]))
-        possible_statuses.sort()
+        possible_statuses = set(self.bug_status_early + [self.new_bug["status"]])
+        # All bugs of the package are already filtered by reporter in base query
+        for bug in bugs:
+            if bug.status in possible_statuses:
+                return bug
+        return None
+
+    def _component_bugs(self, package: Package) -> List["bugzilla.Bug"]:
+        """
+        Retrieve all bugs for the package reported by `self.reporter`
+        in any status used by `_exact_bug` and `_inexact_bug`. This way only
+        one query is needed to find both exact and inexact bug.
+
+        The result is cached for `cache_expiration` seconds.
+
+        Params:
+            package: Search for bugs for this package
+
+        Returns:
+            List of `bugzilla.Bug` in the order returned by bugzilla.
+        """
+        with self._bugs_cache_lock:
+            entry = self._bugs_cache.get(package.name)
+            if entry and entry[0] > time.monotonic():
+                _logger.debug("Using cached bugs for %r" % package.name)
+                return entry[1]
+
+        statuses = set(
+            self.bug_status_open + self.bug_status_closed + [self.new_bug["status"]]
+        )
         query = {
             "component": package.name,
-            "bug_status": possible_statuses,
-            "creator": self.reporter,
+            "bug_status": sorted(statuses),
+            "include_fields": ["id", "summary", "status"],
         }
 
         query.update(self.base_query)
-        bugs = self.bugzilla.query(query)
-        if bugs:
-            return bugs[0]
-        return None
+        with EXTERNAL_CALL_DURATION.labels(system="bugzilla", operation="query").time():
+            bugs = self.bugzilla.query(query)
+
+        if self.cache_expiration:
+            now = time.monotonic()
+            with self._bugs_cache_lock:
+                # Drop expired entries, so the cache doesn't grow indefinitely
+                for name in [
+                    name
+                    for name, (expiration, _) in self._bugs_cache.items()
+                    if expiration <= now
+                ]:
+                    del self._bugs_cache[name]
+                self._bugs_cache[package.name] = (now + self.cache_expiration, bugs)
+
+        return bugs
+
+    def _invalidate_bugs(self, package: Package) -> None:
+        """
+        Remove cached bugs for the package. Needs to be called after any change
+        to bugs of the package is sent.
+
+        Params:
+            package: Package to remove cached bugs for
+        """
+        with self._bugs_cache_lock:
+            self._bugs_cache.pop(package.name, None)
 
     def _create_bug(
         self, package: Package, message: str, short_desc: str
@@ -288,7 +597,10 @@ class Bugzilla(Notifier):
             "description": message,
         }
         bug_dict.update(self.new_bug)
-        new_bug = self.bugzilla.createbug(**bug_dict)
+        with EXTERNAL_CALL_DURATION.labels(
+            system="bugzilla", operation="create"
+        ).time():
+            new_bug = self.bugzilla.createbug(**bug_dict)
         _logger.info("Created bug: %s" % new_bug)
 
         return new_bug
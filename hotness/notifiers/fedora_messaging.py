@@ -20,6 +20,7 @@ import logging
 from fedora_messaging import api, message as fm_message  # type: ignore
 from fedora_messaging.exceptions import PublishException, ConnectionException  # type: ignore
 
+from hotness.common.metrics import EXTERNAL_CALL_DURATION, UPDATE_DROPS
 from hotness.exceptions import NotifierException
 from hotness.domain.package import Package
 from .notifier import Notifier
@@ -87,10 +88,16 @@ class FedoraMessaging(Notifier):
         if not message_class:
             raise NotifierException("Unknown topic provided '{}'".format(topic))
 
+        if message == "update.drop":
+            UPDATE_DROPS.labels(reason=body.get("reason", "")).inc()
+
         _logger.info("publishing topic %r" % topic)
         try:
             msg = message_class(topic=topic, body=body)
-            api.publish(msg)
+            with EXTERNAL_CALL_DURATION.labels(
+                system="fedora_messaging", operation="publish"
+            ).time():
+                api.publish(msg)
         except PublishException as e:
             raise NotifierException(
                 "Fedora messaging broker rejected message {}:{}".format(msg.id, e)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import queue
+from typing import Optional
+
+from . import Queue
+
+
+class Memory(Queue):
+    """
+    In-process queue for the-new-hotness.
+    It is represented by python `queue.Queue`, so the values are lost when
+    the process ends.
+
+    Attributes:
+        queue (`queue.Queue`): Queue holding the values
+    """
+
+    def __init__(self) -> None:
+        """
+        Class constructor.
+        """
+        super(Memory, self).__init__()
+        self.queue: queue.Queue = queue.Queue()
+
+    def put(self, value: dict) -> None:
+        """
+        Add value to the end of the queue.
+
+        Params:
+            value: Value to add
+        """
+        self.queue.put(value)
+
+    def get(self, timeout: float) -> Optional[dict]:
+        """
+        Remove and return value from the start of the queue.
+
+        Params:
+            timeout: Time in seconds to wait for value if the queue is empty
+
+        Returns:
+            Value from the queue or None if the queue is empty.
+        """
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def size(self) -> int:
+        """
+        Return the approximate number of values in the queue.
+
+        Returns:
+            Number of values in the queue.
+        """
+        return self.queue.qsize()
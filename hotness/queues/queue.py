@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+from typing import Optional
+
+
+class Queue:
+    """
+    Abstract class for queues used by the-new-hotness to pass jobs between
+    the consumer and workers.
+    This class must be inherited by every external queue.
+
+    Attributes:
+        persistent: True if the values in the queue survive the end of the process
+    """
+
+    persistent = False
+
+    def put(self, value: dict) -> None:
+        """
+        Put method that should be implemented by every child class.
+
+        It should add the value to the end of the queue.
+
+        In case of any issue that would prevent adding the value, method should
+        raise an exception.
+        """
+        raise NotImplementedError
+
+    def get(self, timeout: float) -> Optional[dict]:
+        """
+        Get method that should be implemented by every child class.
+
+        It should remove and return the value from the start of the queue.
+        If the queue is empty, it should wait at most `timeout` seconds
+        for new value and return None when nothing is available.
+
+        In case of any issue that would prevent retrieving the value, method should
+        raise an exception.
+        """
+        raise NotImplementedError
+
+    def size(self) -> int:
+        """
+        Size method that should be implemented by every child class.
+
+        It should return the number of values waiting in the queue.
+        """
+        raise NotImplementedError
+
+    def ack(self, value: dict) -> None:
+        """
+        Acknowledge that the value returned by `get` was processed.
+
+        Queues that keep the values being processed until they are acknowledged
+        should override this method. Default implementation does nothing.
+
+        Params:
+            value: Value returned by `get`
+        """
+
+    def heartbeat(self) -> None:
+        """
+        Signal that the values retrieved by this process are still being processed.
+        Called periodically while the workers are running.
+
+        Queues shared by multiple processes that return the values of processes
+        that stopped to the queue should override this method. Default
+        implementation does nothing.
+        """
+
+    def requeue(self) -> int:
+        """
+        Return values that were retrieved, but never acknowledged, back
+        to the queue. Called when the workers are started.
+
+        Queues shared by multiple processes must only return values
+        of processes that are no longer running.
+
+        Queues that keep the values being processed until they are acknowledged
+        should override this method. Default implementation does nothing.
+
+        Returns:
+            Number of values returned to the queue.
+        """
+        return 0
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import json
+import uuid
+from typing import Optional
+
+import redis
+
+from . import Queue
+
+
+class Redis(Queue):
+    """
+    Wrapper around redis-py library.
+    It stores the queue as Redis list, so the values could be shared between
+    multiple instances of the-new-hotness and survive restart.
+
+    Values retrieved by `get` are atomically moved to the processing list
+    of this instance and removed from it by `ack`. Every instance holds a lease,
+    which is renewed by `heartbeat`. Values left in the processing lists
+    of instances whose lease expired are returned to the queue by `requeue`,
+    values processed by running instances are left alone.
+    Requires Redis 6.2 or newer.
+
+    Connections are taken from blocking connection pool, which could be shared
+    with other users of Redis. Every call of `get` holds a connection while
+    it waits for a value.
+
+    Attributes:
+        redis (`redis.Redis`): Redis object to use for communication with Redis
+            database
+        connection_pool (`redis.BlockingConnectionPool`): Pool of connections
+            to Redis database
+        name (str): Name of the Redis list holding the queue
+        lease_time (int): Time in seconds after which the values processed
+            by instance without heartbeat are returned to the queue
+        instance_id (str): Unique identifier of this instance
+        instances (str): Name of the Redis set holding identifiers of instances
+            using the queue
+        processing (str): Name of the Redis list holding values that are being
+            processed by this instance
+        lease (str): Name of the Redis key holding the lease of this instance
+    """
+
+    persistent = True
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        password: str,
+        name: str,
+        lease_time: int = 30,
+        connection_pool: Optional[redis.ConnectionPool] = None,
+    ) -> None:
+        """
+        Class constructor.
+
+        Params:
+            hostname: Hostname of the Redis database
+            port: Port of the Redis database
+            password: Password to use for connecting to Redis database
+            name: Name of the Redis list holding the queue
+            lease_time: Time in seconds after which the values processed by instance
+                        without heartbeat are returned to the queue
+            connection_pool: Existing pool of connections to share, connection
+                             parameters are ignored when provided
+        """
+        super(Redis, self).__init__()
+        if connection_pool is None:
+            connection_pool = redis.BlockingConnectionPool(
+                host=hostname, port=port, password=password
+            )
+        self.connection_pool = connection_pool
+        self.redis = redis.Redis(connection_pool=connection_pool)
+        self.name = name
+        self.lease_time = lease_time
+        self.instance_id = uuid.uuid4().hex
+        self.instances = "{}:instances".format(name)
+        self.processing = self._processing(self.instance_id)
+        self.lease = self._lease(self.instance_id)
+
+    def put(self, value: dict) -> None:
+        """
+        Add value to the end of the queue.
+
+        Params:
+            value: Value to add, it needs to be JSON serializable
+        """
+        self.redis.lpush(self.name, json.dumps(value))
+
+    def get(self, timeout: float) -> Optional[dict]:
+        """
+        Move value from the start of the queue to the processing list
+        of this instance and return it. The value needs to be acknowledged
+        by `ack` when processed.
+
+        Params:
+            timeout: Time in seconds to wait for value if the queue is empty
+
+        Returns:
+            Value from the queue or None if the queue is empty.
+        """
+        result = self.redis.blmove(
+            self.name, self.processing, timeout, src="RIGHT", dest="LEFT"  # type: ignore
+        )
+
+        if not result:
+            return None
+
+        return json.loads(result)  # type: ignore
+
+    def ack(self, value: dict) -> None:
+        """
+        Remove processed value from the processing list of this instance.
+
+        Params:
+            value: Value returned by `get`
+        """
+        self.redis.lrem(self.processing, 1, json.dumps(value))
+
+    def heartbeat(self) -> None:
+        """
+        Renew the lease of this instance and register it between the instances
+        using the queue.
+        """
+        pipeline = self.redis.pipeline()
+        pipeline.set(self.lease, 1, ex=self.lease_time)
+        pipeline.sadd(self.instances, self.instance_id)
+        pipeline.execute()
+
+    def requeue(self) -> int:
+        """
+        Move every value from the processing lists of instances whose lease
+        expired back to the queue, so it is the next to be retrieved,
+        oldest value first. The lease of this instance is renewed first.
+
+        Returns:
+            Number of values returned to the queue.
+        """
+        self.heartbeat()
+
+        count = 0
+        for member in self.redis.smembers(self.instances):  # type: ignore
+            instance_id = member.decode() if isinstance(member, bytes) else member
+            if instance_id == self.instance_id or self.redis.exists(
+                self._lease(instance_id)
+            ):
+                continue
+
+            processing = self._processing(instance_id)
+            # Every value is moved atomically, instances requeueing the same
+            # list at the same time don't duplicate the values
+            while self.redis.lmove(processing, self.name, src="LEFT", dest="RIGHT"):
+                count += 1
+            self.redis.srem(self.instances, instance_id)
+        return count
+
+    def size(self) -> int:
+        """
+        Return the number of values in the queue.
+
+        Returns:
+            Number of values in the queue.
+        """
+        return self.redis.llen(self.name)  # type: ignore
+
+    def _processing(self, instance_id: str) -> str:
+        """
+        Return name of the processing list of instance.
+
+        Params:
+            instance_id: Identifier of the instance
+
+        Returns:
+            Name of the Redis list.
+        """
+        return "{}:processing:{}".format(self.name, instance_id)
+
+    def _lease(self, instance_id: str) -> str:
+        """
+        Return name of the lease key of instance.
+
+        Params:
+            instance_id: Identifier of the instance
+
+        Returns:
+            Name of the Redis key.
+        """
+        return "{}:lease:{}".format(self.name, instance_id)
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import logging
+import threading
+from typing import Callable, List, Optional
+
+from . import Queue
+
+_logger = logging.getLogger(__name__)
+
+
+class WorkerPool:
+    """
+    Pool of worker threads processing values from queue.
+
+    Every worker takes a value from the queue and calls the handler with it.
+    Exception raised by handler is logged and the worker continues with next value.
+    Every retrieved value is acknowledged when the handler finishes.
+    Values that were retrieved but not acknowledged by previous run are returned
+    to the queue on start. While the workers are running, heartbeat of the queue
+    is sent periodically, so the values being processed are not returned
+    to the queue by other processes. Values left in queue that is not persistent
+    are processed before the workers stop, so they are not lost.
+
+    Attributes:
+        queue: Queue to take the values from
+        handler: Callable that processes one value
+        workers: Number of worker threads
+        poll_interval: Time in seconds worker waits for new value before checking
+                       if it should stop
+        heartbeat_interval: Time in seconds between heartbeats of the queue
+        threads: Running worker threads
+    """
+
+    def __init__(
+        self,
+        queue: Queue,
+        handler: Callable[[dict], None],
+        workers: int,
+        poll_interval: float = 1.0,
+        heartbeat_interval: float = 5.0,
+    ) -> None:
+        """
+        Class constructor.
+        """
+        self.queue = queue
+        self.handler = handler
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.threads: List[threading.Thread] = []
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._heartbeat_stop_event = threading.Event()
+
+    def start(self) -> None:
+        """
+        Start the worker threads.
+        """
+        try:
+            requeued = self.queue.requeue()
+            if requeued:
+                _logger.info("Returned %s unfinished values to queue", requeued)
+        except Exception:
+            _logger.exception("Couldn't return unfinished values to queue")
+
+        self._stop_event.clear()
+        self._heartbeat_stop_event.clear()
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat, name="hotness-worker-heartbeat", daemon=True
+        )
+        self._heartbeat_thread.start()
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name="hotness-worker-{}".format(index), daemon=True
+            )
+            thread.start()
+            self.threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the worker threads. Values that are currently processed
+        are finished first. If the queue is not persistent, values still
+        waiting in it are processed as well.
+
+        Params:
+            timeout: Time in seconds to wait for every worker thread
+        """
+        self._stop_event.set()
+        for thread in self.threads:
+            thread.join(timeout)
+        self.threads = []
+
+        # Keep the heartbeat until the values being processed are finished
+        self._heartbeat_stop_event.set()
+        if self._heartbeat_thread:
+            self._heartbeat_thread.join(timeout)
+            self._heartbeat_thread = None
+
+    def _heartbeat(self) -> None:
+        """
+        Heartbeat loop. Sends heartbeat of the queue until stopped.
+        """
+        while not self._heartbeat_stop_event.wait(self.heartbeat_interval):
+            try:
+                self.queue.heartbeat()
+            except Exception:
+                _logger.exception("Couldn't send heartbeat of queue")
+
+    def _work(self) -> None:
+        """
+        Worker loop. Processes the values from queue until stopped.
+        """
+        while not self._stop_event.is_set():
+            try:
+                value = self.queue.get(timeout=self.poll_interval)
+            except Exception:
+                _logger.exception("Couldn't retrieve value from queue")
+                # Don't spin when the queue is not available
+                self._stop_event.wait(self.poll_interval)
+                continue
+
+            if value is not None:
+                self._process(value)
+
+        # Values in queue that is not persistent would be lost with the process
+        while not self.queue.persistent:
+            try:
+                value = self.queue.get(timeout=0)
+            except Exception:
+                _logger.exception("Couldn't retrieve value from queue")
+                break
+
+            if value is None:
+                break
+
+            self._process(value)
+
+    def _process(self, value: dict) -> None:
+        """
+        Call the handler with value and acknowledge it.
+
+        Params:
+            value: Value retrieved from queue
+        """
+        try:
+            self.handler(value)
+        except Exception:
+            _logger.exception("Worker failed to process %r", value)
+
+        try:
+            self.queue.ack(value)
+        except Exception:
+            _logger.exception("Couldn't acknowledge %r", value)
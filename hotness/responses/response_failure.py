@@ -41,6 +41,7 @@ class ResponseFailure(Response):
     DATABASE_ERROR = "DatabaseError"
     NOTIFIER_ERROR = "NotifierError"
     PATCHER_ERROR = "PatcherError"
+    QUEUE_ERROR = "QueueError"
     INVALID_REQUEST_ERROR = "InvalidRequestError"
 
     def __init__(self, type: str, message: Any) -> None:
@@ -198,6 +199,21 @@ class ResponseFailure(Response):
 
         return response
 
+    @classmethod
+    def queue_error(cls, message: Any) -> "ResponseFailure":
+        """
+        Creates response for queue failure.
+
+        Params:
+            message: Message to add to this error
+
+        Returns:
+            ResponseFailure object
+        """
+        response = ResponseFailure(type=ResponseFailure.QUEUE_ERROR, message=message)
+
+        return response
+
     @classmethod
     def invalid_request_error(cls, request: Request) -> "ResponseFailure":
         """
@@ -18,6 +18,8 @@
 from .insert_data_use_case import InsertDataUseCase  # noqa: F401
 from .retrieve_data_use_case import RetrieveDataUseCase  # noqa: F401
 from .package_check_use_case import PackageCheckUseCase  # noqa: F401
+from .async_package_check_use_case import AsyncPackageCheckUseCase  # noqa: F401
 from .package_scratch_build_use_case import PackageScratchBuildUseCase  # noqa: F401
 from .notify_user_use_case import NotifyUserUseCase  # noqa: F401
 from .submit_patch_use_case import SubmitPatchUseCase  # noqa: F401
+from .queue_build_use_case import QueueBuildUseCase  # noqa: F401
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import logging
+
+from hotness.validators import AsyncValidator
+from hotness.validators.async_http import TRANSIENT_ERRORS
+from hotness.requests.package_request import PackageRequest
+from hotness import responses
+from hotness.common.tracing import use_case_span
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPackageCheckUseCase:
+    """
+    This class represents use case for validating the package with provided
+    asyncio validator.
+
+    Attributes:
+        validator: Asyncio validator to use.
+    """
+
+    def __init__(self, validator: AsyncValidator):
+        """
+        Class constructor.
+        """
+        self.validator = validator
+
+    @use_case_span("validator")
+    async def validate(self, request: PackageRequest) -> responses.Response:
+        """
+        Await the validate method on the validator.
+        This method will handle any error that happens during validation.
+
+        Params:
+            request: Request to handle.
+
+        Return:
+           Output of the validation.
+
+        Raises:
+            aiohttp.ClientConnectionError: For transient network errors
+                that should be retried.
+            asyncio.TimeoutError: For timeouts that should be retried.
+        """
+        if not request:
+            return responses.ResponseFailure.invalid_request_error(request)
+        try:
+            result = await self.validator.validate(request.package)
+            return responses.ResponseSuccess(result)
+        except TRANSIENT_ERRORS:
+            # Re-raise only connectivity/timeouts so they can be retried
+            raise
+        except Exception as exc:
+            logger.exception("Package check use case failure", exc_info=True)
+            return responses.ResponseFailure.validator_error(exc)
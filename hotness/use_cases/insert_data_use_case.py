@@ -20,6 +20,7 @@ import logging
 from hotness.databases import Database
 from hotness.requests import InsertDataRequest
 from hotness import responses
+from hotness.common.tracing import use_case_span
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,7 @@ class InsertDataUseCase:
         """
         self.database = database
 
+    @use_case_span("database")
     def insert(self, request: InsertDataRequest) -> responses.Response:
         """
         Call the insert method on the database.
@@ -20,6 +20,7 @@ import logging
 from hotness.notifiers import Notifier
 from hotness.requests import NotifyRequest
 from hotness import responses
+from hotness.common.tracing import use_case_span
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,7 @@ class NotifyUserUseCase:
         """
         self.notifier = notifier
 
+    @use_case_span("notifier")
     def notify(self, request: NotifyRequest) -> responses.Response:
         """
         Call the notify method on the notifier.
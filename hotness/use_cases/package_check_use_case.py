@@ -22,6 +22,7 @@ import requests
 from hotness.validators import Validator
 from hotness.requests.package_request import PackageRequest
 from hotness import responses
+from hotness.common.tracing import use_case_span
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,7 @@ class PackageCheckUseCase:
         """
         self.validator = validator
 
+    @use_case_span("validator")
     def validate(self, request: PackageRequest) -> responses.Response:
         """
         Call the validate method on the validator.
@@ -20,6 +20,7 @@ import logging
 from hotness.builders import Builder
 from hotness.requests import BuildRequest
 from hotness import responses
+from hotness.common.tracing import use_case_span
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,7 @@ class PackageScratchBuildUseCase:
         """
         self.builder = builder
 
+    @use_case_span("builder")
     def build(self, request: BuildRequest) -> responses.Response:
         """
         Call the build method on the builder.
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import logging
+
+from hotness.queues import Queue
+from hotness.requests import BuildRequest
+from hotness import responses
+from hotness.common.tracing import use_case_span
+
+logger = logging.getLogger(__name__)
+
+
+class QueueBuildUseCase:
+    """
+    This class represents use case for queueing the package build, so it could be
+    started later by the build workers.
+
+    Attributes:
+        queue: Queue to use.
+    """
+
+    def __init__(self, queue: Queue):
+        """
+        Class constructor.
+        """
+        self.queue = queue
+
+    @use_case_span("queue")
+    def queue_build(self, request: BuildRequest) -> responses.Response:
+        """
+        Call the put method on the queue.
+        This method will handle any error that happens when queueing the build.
+
+        Params:
+            request: Request to handle.
+
+        Return:
+           Output of the queueing.
+        """
+        if not request:
+            return responses.ResponseFailure.invalid_request_error(request)
+        try:
+            value = {"package": request.package.to_dict(), "opts": request.opts}
+            self.queue.put(value)
+            return responses.ResponseSuccess(value)
+        except Exception as exc:
+            logger.exception("Queue build use case failure", exc_info=True)
+            return responses.ResponseFailure.queue_error(exc)
@@ -20,6 +20,7 @@ import logging
 from hotness.databases import Database
 from hotness.requests import RetrieveDataRequest
 from hotness import responses
+from hotness.common.tracing import use_case_span
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,7 @@ class RetrieveDataUseCase:
         """
         self.database = database
 
+    @use_case_span("database")
     def retrieve(self, request: RetrieveDataRequest) -> responses.Response:
         """
         Call the retrieve method on the database.
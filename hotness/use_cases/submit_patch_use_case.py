@@ -20,6 +20,7 @@ import logging
 from hotness.patchers import Patcher
 from hotness.requests import SubmitPatchRequest
 from hotness import responses
+from hotness.common.tracing import use_case_span
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,7 @@ class SubmitPatchUseCase:
         """
         self.patcher = patcher
 
+    @use_case_span("patcher")
     def submit_patch(self, request: SubmitPatchRequest) -> responses.Response:
         """
         Call the submit_patch method on the patcher.
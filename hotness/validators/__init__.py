@@ -16,5 +16,11 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 from .validator import Validator  # noqa: F401
+from .mdapi_mirror import MDApiMirror  # noqa: F401
 from .mdapi import MDApi  # noqa: F401
 from .pagure import Pagure  # noqa: F401
+from .cached_validator import CachedValidator  # noqa: F401
+from .snapshot_validator import SnapshotValidator  # noqa: F401
+from .async_validator import AsyncValidator  # noqa: F401
+from .async_pagure import AsyncPagure  # noqa: F401
+from .async_mdapi import AsyncMDApi  # noqa: F401
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+HTTP session shared by asyncio validators.
+
+The asyncio validators are using `aiohttp`, which is an optional dependency.
+It's only needed when the asyncio consumer is used.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Tuple, Type, TypeVar
+
+try:
+    import aiohttp  # type: ignore
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Errors which are transient and the request should be retried later
+TRANSIENT_ERRORS: Tuple[Type[BaseException], ...] = (asyncio.TimeoutError,)
+if aiohttp is not None:  # pragma: no cover
+    TRANSIENT_ERRORS += (aiohttp.ClientConnectionError,)
+
+
+def create_session(
+    connect_timeout: float, read_timeout: float, pool_size: int = 100
+) -> Any:
+    """
+    Create HTTP session with connection pool shared by asyncio validators.
+    It must be called from running event loop.
+
+    Params:
+        connect_timeout: Time in seconds to wait for connection
+        read_timeout: Time in seconds to wait for read from socket
+        pool_size: Maximum number of open connections
+
+    Returns:
+        `aiohttp.ClientSession` object.
+
+    Raises:
+        RuntimeError: If aiohttp is not installed.
+    """
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is required by the asyncio validators")
+
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=pool_size),
+        timeout=aiohttp.ClientTimeout(
+            sock_connect=connect_timeout, sock_read=read_timeout
+        ),
+        raise_for_status=False,
+    )
+
+
+def backoff_time(
+    attempt: int, backoff_factor: float = 1, backoff_max: float = 5
+) -> float:
+    """
+    Return time to wait before retry, computed the same way as `urllib3.Retry`
+    used by the blocking validators. The first retry is done immediately.
+
+    Params:
+        attempt: Number of failed attempts
+        backoff_factor: Base of the exponential backoff in seconds
+        backoff_max: Maximum time to wait in seconds
+
+    Returns:
+        Time to wait in seconds.
+    """
+    if attempt <= 1:
+        return 0
+    return min(backoff_max, backoff_factor * 2 ** (attempt - 1))
+
+
+async def with_retries(request: Callable[[], Awaitable[T]], retries: int) -> T:
+    """
+    Await the request and retry it with exponential backoff when it fails
+    on transient error, the same way the requests of blocking validators
+    are retried.
+
+    Params:
+        request: Function returning new awaitable doing the request
+        retries: Maximum number of retries
+
+    Returns:
+        Result of the request.
+
+    Raises:
+        Exception: Transient error of the last attempt or any other error
+          raised by the request.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await request()
+        except TRANSIENT_ERRORS as error:
+            attempt += 1
+            if attempt > retries:
+                raise
+            delay = backoff_time(attempt)
+            _logger.debug(
+                "Request failed with %r, retrying in %s seconds" % (error, delay)
+            )
+            await asyncio.sleep(delay)
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from . import async_http
+from .async_validator import AsyncValidator
+from .mdapi import MDApi
+from .mdapi_mirror import MDApiMirror
+from hotness.common.metrics import EXTERNAL_CALL_DURATION
+from hotness.databases import Cache
+from hotness.domain import Package
+from hotness.exceptions import HTTPException
+
+_logger = logging.getLogger(__name__)
+
+
+class AsyncMDApi(AsyncValidator):
+    """
+    Asyncio variant of the `hotness.validators.MDApi` wrapper.
+
+    It returns the same output as `MDApi.validate`. Concurrent validations
+    of the same package share one request to mdapi and the retrieved metadata
+    could be cached for a short time. When local mirror of the metadata
+    is provided, mdapi is only asked for packages missing in it.
+
+    Attributes:
+        url: URL of the mdapi server
+        session: `aiohttp.ClientSession` used for HTTP requests, it could be shared
+          with other asyncio validators, see `hotness.validators.async_http`
+        cache_expiration: Time in seconds to cache the retrieved metadata, 0 to disable
+        mirror: Local mirror of the metadata, None to always ask mdapi
+        retries: Number of times the request failed on transient error is retried
+        cache: Cache holding the retrieved metadata
+    """
+
+    def __init__(
+        self,
+        url: str,
+        session: Any,
+        cache_expiration: int = 0,
+        mirror: Optional[MDApiMirror] = None,
+        retries: int = 0,
+    ) -> None:
+        """
+        Class constructor.
+        """
+        self.url = url
+        self.session = session
+        self.cache_expiration = cache_expiration
+        self.mirror = mirror
+        self.retries = retries
+        self.cache = Cache(expiration_time=cache_expiration, max_size=1024)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    async def validate(self, package: Package) -> dict:
+        """
+        Implementation of `AsyncValidator.validate` method. It calls the mdapi,
+        compares retrieved version with package version and returns the output.
+
+        Params:
+            package: Package to check against mdapi
+
+        Returns:
+            Dictionary containing output of response and validation,
+            see `MDApi.validate`.
+
+        Raises:
+            HTTPException: Is raised when HTTP status code of response isn't 200.
+        """
+        metadata = await self._get_metadata(package.name)
+        return MDApi.compare_metadata(package, metadata)
+
+    async def _get_metadata(self, name: str) -> dict:
+        """
+        Retrieve metadata for source package from mdapi.
+
+        Metadata are returned from local mirror or cache if available. If there
+        is already a request for the same package in progress, wait for it and
+        use its result instead of doing a new request.
+
+        Params:
+            name: Name of the source package
+
+        Returns:
+            Metadata returned by mdapi.
+
+        Raises:
+            HTTPException: Is raised when HTTP status code of response isn't 200.
+        """
+        if self.mirror is not None:
+            # Lookup in memory-mapped database is fast enough for the event loop
+            metadata = self.mirror.srcpkg(name)
+            if metadata is not None:
+                _logger.debug("Using mirrored pkg info for %r" % name)
+                return metadata
+
+        cached = self.cache.retrieve(name)["value"]
+        if cached:
+            _logger.debug("Using cached pkg info for %r" % name)
+            return json.loads(cached)
+
+        future = self._in_flight.get(name)
+        if future is not None:
+            _logger.debug("Waiting for pkg info request for %r in progress" % name)
+            # Shielded, so cancelling one waiter doesn't cancel the others
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(self._request_metadata(name))
+        self._in_flight[name] = future
+        try:
+            js = await asyncio.shield(future)
+        finally:
+            del self._in_flight[name]
+
+        if self.cache_expiration:
+            self.cache.insert(name, json.dumps(js))
+        return js
+
+    async def _request_metadata(self, name: str) -> dict:
+        """
+        Request metadata for source package from mdapi. Request failed
+        on transient error is retried.
+
+        Params:
+            name: Name of the source package
+
+        Returns:
+            Metadata returned by mdapi.
+
+        Raises:
+            HTTPException: Is raised when HTTP status code of response isn't 200.
+        """
+        mdapi_url = "{0}/koji/srcpkg/{1}".format(self.url, name)
+        _logger.debug("Getting pkg info from %r" % mdapi_url)
+
+        async def get() -> dict:
+            async with self.session.get(mdapi_url) as response:
+                # If error is encountered raise exception
+                if response.status != 200:
+                    raise HTTPException(
+                        response.status,
+                        "Error encountered on request {}".format(mdapi_url),
+                    )
+                return await response.json(content_type=None)
+
+        with EXTERNAL_CALL_DURATION.labels(system="mdapi", operation="srcpkg").time():
+            return await async_http.with_retries(get, self.retries)
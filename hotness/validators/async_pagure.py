@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Dict, Tuple
+
+from . import async_http
+from .async_validator import AsyncValidator
+from .pagure import Pagure
+from hotness.common.metrics import EXTERNAL_CALL_DURATION
+from hotness.domain import Package
+from hotness.exceptions import HTTPException
+
+_logger = logging.getLogger(__name__)
+
+
+class AsyncPagure(AsyncValidator):
+    """
+    Asyncio variant of the `hotness.validators.Pagure` wrapper.
+
+    It returns the same output as `Pagure.validate`, but the requests
+    to dist-git are done by `aiohttp` session, so waiting for slow dist-git
+    doesn't block other validations.
+
+    Attributes:
+        url: URL of the pagure dist-git server
+        session: `aiohttp.ClientSession` used for HTTP requests, it could be shared
+          with other asyncio validators, see `hotness.validators.async_http`
+        branch: Branch to check in dist-git
+        package_type: Type of the package in dist-git
+        parallel_requests: Do the retirement check and both monitoring settings
+          lookups concurrently instead of one after another
+        retries: Number of times the request failed on transient error is retried
+    """
+
+    def __init__(
+        self,
+        url: str,
+        session: Any,
+        branch: str,
+        package_type: str,
+        parallel_requests: bool = False,
+        retries: int = 0,
+    ) -> None:
+        """
+        Class constructor.
+        """
+        self.url = url
+        self.session = session
+        self.branch = branch
+        self.package_type = package_type
+        self.parallel_requests = parallel_requests
+        self.retries = retries
+
+    async def validate(self, package: Package) -> dict:
+        """
+        Implementation of `AsyncValidator.validate` method. It calls the Pagure
+        dist-git, checks if the package owner wants to be monitored and returns
+        the output.
+
+        Params:
+            package: Package to check in Pagure
+
+        Returns:
+            Dictionary containing output of response and validation,
+            see `Pagure.validate`.
+
+        Raises:
+            HTTPException: Is raised when HTTP status code of response isn't 200.
+        """
+        with EXTERNAL_CALL_DURATION.labels(
+            system="pagure", operation="validate"
+        ).time():
+            return await self._validate(package)
+
+    async def _validate(self, package: Package) -> dict:
+        """
+        Do the requests to dist-git and fill the output.
+
+        Params:
+            package: Package to check in Pagure
+
+        Returns:
+            Dictionary containing output of response and validation.
+        """
+        output = {
+            "monitoring": False,
+            "bugzilla": True,
+            "scratch_build": False,
+            "stable_only": False,
+            "all_versions": False,
+            "retired": False,
+        }
+        # Check if the package is retired
+        dead_package_url = "{0}/rpms/{1}/blob/{2}/f/dead.package".format(
+            self.url, package.name, self.branch
+        )
+        # Monitoring config file in repository is checked first
+        monitoring_config_url = "{0}/rpms/{1}/raw/{2}/f/monitoring.toml".format(
+            self.url, package.name, self.branch
+        )
+        # Old monitoring setting is used if the configuration file is not available
+        dist_git_url = "{0}/_dg/anitya/rpms/{1}".format(self.url, package.name)
+
+        tasks: Dict[str, asyncio.Future] = {}
+        if self.parallel_requests:
+            tasks = {
+                url: asyncio.ensure_future(self._get(url))
+                for url in (dead_package_url, monitoring_config_url, dist_git_url)
+            }
+
+        def get(url: str) -> Awaitable[Tuple[int, str]]:
+            return tasks[url] if url in tasks else self._get(url)
+
+        try:
+            _logger.debug(
+                "Checking {} to see if {} is retired".format(dead_package_url, package)
+            )
+            status, _ = await get(dead_package_url)
+
+            if status not in [200, 404]:
+                raise HTTPException(
+                    status, "Error encountered on request {}".format(dead_package_url)
+                )
+
+            # If there is dead.package found, package is retired
+            output["retired"] = status == 200
+            if output["retired"]:
+                return output
+
+            _logger.debug(
+                "Checking {} to see if {} is using monitoring config".format(
+                    monitoring_config_url, package
+                )
+            )
+            status, text = await get(monitoring_config_url)
+            if status == 200:
+                output.update(Pagure.parse_monitoring_config(text))
+                return output
+
+            _logger.debug(
+                "Checking {} to see if {} is monitored.".format(
+                    dist_git_url, package.name
+                )
+            )
+            status, text = await get(dist_git_url)
+            if status != 200:
+                raise HTTPException(
+                    status, "Error encountered on request {}".format(dist_git_url)
+                )
+            data = json.loads(text)
+        finally:
+            for task in tasks.values():
+                _discard(task)
+
+        monitoring_value = data.get("monitoring", "no-monitoring")
+        output.update(Pagure.parse_monitoring_value(monitoring_value))
+
+        return output
+
+    async def _get(self, url: str) -> Tuple[int, str]:
+        """
+        Do GET request and read the response. Request failed on transient error
+        is retried.
+
+        Params:
+            url: URL to request
+
+        Returns:
+            Tuple containing HTTP status code and text of the response.
+        """
+
+        async def get() -> Tuple[int, str]:
+            async with self.session.get(url) as response:
+                return response.status, await response.text()
+
+        return await async_http.with_retries(get, self.retries)
+
+
+def _discard(task: asyncio.Future) -> None:
+    """
+    Cancel task which result isn't needed. Error of already finished task
+    is retrieved, so it's not reported as never retrieved.
+
+    Params:
+        task: Task to discard
+    """
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import json
+import logging
+import threading
+
+from . import Validator
+from hotness.databases import Database
+from hotness.domain import Package
+
+_logger = logging.getLogger(__name__)
+
+
+class CachedValidator(Validator):
+    """
+    Wrapper caching the output of another validator in database.
+
+    It inherits the Validator abstract class and implements the validate method.
+
+    The output is stored as JSON under the key created from `key_prefix` and package name,
+    so it should only be used for validators which output depends only on package name.
+    Expiration and eviction of the cached output is handled by the database.
+    Any error of the database is logged and the wrapped validator is called instead.
+
+    Attributes:
+        validator: Validator to cache the output of
+        database: Database to store the output in
+        key_prefix: Prefix of the keys in database
+        hits: Number of validations answered from cache
+        misses: Number of validations passed to wrapped validator
+    """
+
+    def __init__(
+        self, validator: Validator, database: Database, key_prefix: str
+    ) -> None:
+        """
+        Class constructor.
+        """
+        super(CachedValidator, self).__init__()
+        self.validator = validator
+        self.database = database
+        self.key_prefix = key_prefix
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def validate(self, package: Package) -> dict:
+        """
+        Implementation of `Validator.validate` method. It returns the cached output
+        for the package if available, otherwise it calls the wrapped validator
+        and caches its output.
+
+        Params:
+            package: Package to validate
+
+        Returns:
+            Output of the wrapped validator.
+        """
+        key = "{}:{}".format(self.key_prefix, package.name)
+
+        value = ""
+        try:
+            value = self.database.retrieve(key)["value"]
+        except Exception:
+            _logger.exception("Couldn't retrieve cached validation for %r" % key)
+
+        if value:
+            with self._lock:
+                self.hits += 1
+            _logger.debug("Using cached validation for %r" % key)
+            return json.loads(value)
+
+        with self._lock:
+            self.misses += 1
+
+        output = self.validator.validate(package)
+
+        try:
+            self.database.insert(key, json.dumps(output))
+        except Exception:
+            _logger.exception("Couldn't cache validation for %r" % key)
+
+        return output
+
+    def stats(self) -> dict:
+        """
+        Return the cache statistics.
+
+        Returns:
+            Dictionary containing number of cache hits and misses.
+            Example:
+            {
+                "hits": 10,
+                "misses": 2
+            }
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
@@ -15,14 +15,20 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import concurrent.futures
+import json
 import logging
 import re
-from typing import Optional, Tuple, Union
+import threading
+from typing import Dict, Optional, Tuple, Union
 
 from . import Validator
+from .mdapi_mirror import MDApiMirror
+from hotness.databases import Cache
 from hotness.domain import Package
 from hotness.exceptions import HTTPException
 from hotness.common import RPM
+from hotness.common.metrics import EXTERNAL_CALL_DURATION
 
 from requests import Session
 
@@ -38,10 +44,17 @@ class MDApi(Validator):
     The mdapi will be used to check for the last available package version available in
     Fedora and compare if this is newer than the provided package.
 
+    Concurrent requests for the same package share one HTTP request to mdapi and
+    the retrieved metadata could be cached for a short time. When local mirror
+    of the metadata is provided, mdapi is only asked for packages missing in it.
+
     Attributes:
         url: URL of the mdapi server
         requests_session: Session object which will be used for HTTP request
         timeout: Timeouts to HTTP request in seconds (connect timeout, read timeout)
+        cache_expiration: Time in seconds to cache the retrieved metadata, 0 to disable
+        mirror: Local mirror of the metadata, None to always ask mdapi
+        cache: Cache holding the retrieved metadata
         __rc_release_regex: Regex for parsing release field obtained from mdapi
         __dist_tag_regex: Regex for matching dist tag in version
     """
@@ -55,6 +68,8 @@ class MDApi(Validator):
         url: str,
         requests_session: Session,
         timeout: Optional[Union[float, Tuple[float, float], Tuple[float, None]]],
+        cache_expiration: int = 0,
+        mirror: Optional[MDApiMirror] = None,
     ) -> None:
         """
         Class constructor.
@@ -63,6 +78,11 @@ class MDApi(Validator):
         self.url = url
         self.requests_session = requests_session
         self.timeout = timeout
+        self.cache_expiration = cache_expiration
+        self.mirror = mirror
+        self.cache = Cache(expiration_time=cache_expiration, max_size=1024)
+        self._in_flight: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
 
     def validate(self, package: Package) -> dict:
         """
@@ -84,30 +104,34 @@ class MDApi(Validator):
         Raises:
             HTTPException: Is raised when HTTP status code of response isn't 200.
         """
+        return self.compare_metadata(package, self._get_metadata(package.name))
+
+    @classmethod
+    def compare_metadata(cls, package: Package, metadata: dict) -> dict:
+        """
+        Compare package version with version in metadata retrieved from mdapi.
+
+        Params:
+            package: Package to compare
+            metadata: Metadata of the source package retrieved from mdapi
+
+        Returns:
+            Dictionary containing output of validation, see `validate`.
+        """
         output = {}
-        mdapi_url = "{0}/koji/srcpkg/{1}".format(self.url, package.name)
-        _logger.debug("Getting pkg info from %r" % mdapi_url)
 
-        response = self.requests_session.get(mdapi_url, timeout=self.timeout)
-        # If error is encountered raise exception
-        if response.status_code != 200:
-            raise HTTPException(
-                response.status_code,
-                "Error encountered on request {}".format(mdapi_url),
-            )
         # Remove dist tag from package before comparing with mdapi version
-        upstream_version = self._remove_dist_tag(package.version)
+        upstream_version = cls._remove_dist_tag(package.version)
 
-        js = response.json()
-        output["version"] = js["version"]
-        output["release"] = js["release"]
+        output["version"] = metadata["version"]
+        output["release"] = metadata["release"]
 
         _logger.info(
             "Comparing upstream %s against repo %s-%s"
             % (package.version, output["version"], output["release"])
         )
 
-        rc_tuple = self._get_rc(output["release"])
+        rc_tuple = cls._get_rc(output["release"])
 
         mdapi_version = "{}{}{}".format(output["version"], rc_tuple[0], rc_tuple[1])
 
@@ -128,7 +152,90 @@ class MDApi(Validator):
 
         return output
 
-    def _get_rc(self, release: str) -> tuple:
+    def _get_metadata(self, name: str) -> dict:
+        """
+        Retrieve metadata for source package from mdapi.
+
+        Metadata are returned from local mirror or cache if available. If there
+        is already a request for the same package in progress, wait for it and
+        use its result instead of doing a new request.
+
+        Params:
+            name: Name of the source package
+
+        Returns:
+            Metadata returned by mdapi.
+
+        Raises:
+            HTTPException: Is raised when HTTP status code of response isn't 200.
+        """
+        if self.mirror is not None:
+            metadata = self.mirror.srcpkg(name)
+            if metadata is not None:
+                _logger.debug("Using mirrored pkg info for %r" % name)
+                return metadata
+
+        with self._lock:
+            cached = self.cache.retrieve(name)["value"]
+            if cached:
+                _logger.debug("Using cached pkg info for %r" % name)
+                return json.loads(cached)
+
+            future = self._in_flight.get(name)
+            if future is None:
+                future = concurrent.futures.Future()
+                self._in_flight[name] = future
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            _logger.debug("Waiting for pkg info request for %r in progress" % name)
+            return future.result()
+
+        try:
+            js = self._request_metadata(name)
+            if self.cache_expiration:
+                self.cache.insert(name, json.dumps(js))
+            future.set_result(js)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[name]
+
+        return js
+
+    @EXTERNAL_CALL_DURATION.labels(system="mdapi", operation="srcpkg").time()
+    def _request_metadata(self, name: str) -> dict:
+        """
+        Request metadata for source package from mdapi.
+
+        Params:
+            name: Name of the source package
+
+        Returns:
+            Metadata returned by mdapi.
+
+        Raises:
+            HTTPException: Is raised when HTTP status code of response isn't 200.
+        """
+        mdapi_url = "{0}/koji/srcpkg/{1}".format(self.url, name)
+        _logger.debug("Getting pkg info from %r" % mdapi_url)
+
+        response = self.requests_session.get(mdapi_url, timeout=self.timeout)
+        # If error is encountered raise exception
+        if response.status_code != 200:
+            raise HTTPException(
+                response.status_code,
+                "Error encountered on request {}".format(mdapi_url),
+            )
+
+        return response.json()
+
+    @classmethod
+    def _get_rc(cls, release: str) -> tuple:
         """
         Get the release candidate value of a package's release
 
@@ -138,14 +245,15 @@ class MDApi(Validator):
         Returns:
             Tuple containing string part of release and numeric part of release.
         """
-        match = self.__rc_release_regex.match(release)
+        match = cls.__rc_release_regex.match(release)
 
         if match:
             return (match.group(1), match.group(2))
         else:
             return ("", "")
 
-    def _remove_dist_tag(self, version: str) -> str:
+    @classmethod
+    def _remove_dist_tag(cls, version: str) -> str:
         """
         Remove dist tag from version when available.
 
@@ -157,7 +265,7 @@ class MDApi(Validator):
           returns the original version.
         """
         result = version
-        if self.__dist_tag_regex.match(version):
+        if cls.__dist_tag_regex.match(version):
             version_array = version.split("-")[:-1]
             result = "-".join(version_array)
 
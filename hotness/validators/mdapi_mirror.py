@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import bz2
+import contextlib
+import glob
+import gzip
+import hashlib
+import io
+import logging
+import lzma
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
+from typing import IO, Optional, Tuple, Union
+
+from requests import Session
+
+from hotness.common import RPM
+from hotness.exceptions import HTTPException
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+# Namespace of the repomd.xml elements
+REPOMD_NAMESPACE = {"repo": "http://linux.duke.edu/metadata/repo"}
+
+# Size of chunks used when downloading the metadata
+CHUNK_SIZE = 1024 * 1024
+
+# Size of the database mapped to memory, the primary database is much smaller
+MMAP_SIZE = 1024 * 1024 * 1024
+
+
+class MDApiMirror:
+    """
+    Local mirror of the repository metadata mdapi is serving the data from.
+
+    The `primary_db` SQLite database of source repository is downloaded to
+    `cache_dir` and the version and release of the source packages are read
+    from it, memory-mapped, instead of asking mdapi.
+
+    The repository metadata are first checked in background thread started
+    by `start`, lookups return None until the database is ready, and then
+    again every `refresh_interval` seconds. The database is only downloaded when its checksum
+    in `repomd.xml` changed, the database with the same checksum left
+    in `cache_dir` from previous run is reused. The old database is used
+    until the new one is ready. Any error while refreshing is logged and
+    the old database is kept.
+
+    Attributes:
+        repo_url: URL of the source repository, which contains `repodata` directory
+        cache_dir: Directory where the database is stored
+        requests_session: Session object which will be used for HTTP request
+        timeout: Timeouts to HTTP request in seconds (connect timeout, read timeout)
+        refresh_interval: Time in seconds after which the metadata are checked
+          again, 0 means they are only checked by `start` or `refresh`
+        checksum: Checksum of the database in use, empty if there is none
+        hits: Number of packages found in database
+        misses: Number of packages not found in database
+    """
+
+    def __init__(
+        self,
+        repo_url: str,
+        cache_dir: str,
+        requests_session: Session,
+        timeout: Optional[Union[float, Tuple[float, float], Tuple[float, None]]],
+        refresh_interval: float = 3600,
+    ) -> None:
+        """
+        Class constructor.
+        """
+        self.repo_url = repo_url.rstrip("/")
+        self.cache_dir = cache_dir
+        self.requests_session = requests_session
+        self.timeout = timeout
+        self.refresh_interval = refresh_interval
+        self.checksum = ""
+        self.hits = 0
+        self.misses = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._refreshed = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        if zstandard is None:
+            _logger.error(
+                "zstandard isn't installed, mdapi mirror can't read zstd "
+                "compressed metadata used by current Fedora repositories, "
+                "install the-new-hotness[zstandard]"
+            )
+
+    def start(self) -> None:
+        """
+        Start the first refresh in background thread, unless a refresh
+        is already running.
+        """
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        self._start_refresh_thread()
+
+    def srcpkg(self, name: str) -> Optional[dict]:
+        """
+        Retrieve metadata for source package, the same fields as mdapi returns
+        for `koji/srcpkg`.
+
+        Params:
+            name: Name of the source package
+
+        Returns:
+            Dictionary containing epoch, version and release of the package or None
+            if the package isn't in database or there is no database.
+            Example:
+            {
+                "epoch": "0",
+                "version": "1.0",
+                "release": "1.fc40"
+            }
+        """
+        self._refresh_if_needed()
+
+        with self._lock:
+            if self._connection is None:
+                return None
+            rows = self._connection.execute(
+                "SELECT epoch, version, release FROM packages "
+                "WHERE name = ? AND arch = 'src'",
+                (name,),
+            ).fetchall()
+            if rows:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if not rows:
+            return None
+
+        epoch, version, release = max(
+            rows, key=lambda row: (RPM.version_key(row[1]), RPM.version_key(row[2]))
+        )
+        return {"epoch": epoch, "version": version, "release": release}
+
+    def refresh(self) -> bool:
+        """
+        Check the repository metadata and switch to the new database
+        if it changed.
+
+        Returns:
+            True if the database in use is up to date, False otherwise.
+        """
+        try:
+            location, checksum_type, checksum = self._read_repomd()
+            if checksum != self.checksum:
+                self._switch(self._download(location, checksum_type, checksum))
+                self.checksum = checksum
+        except Exception:
+            _logger.exception("Couldn't refresh mdapi mirror from %r" % self.repo_url)
+            return False
+        finally:
+            with self._lock:
+                # Try again after the refresh interval, not with every lookup
+                self._refreshed = time.monotonic()
+
+        return True
+
+    def stats(self) -> dict:
+        """
+        Return the mirror statistics.
+
+        Returns:
+            Dictionary containing checksum of the database and number of hits
+            and misses.
+            Example:
+            {
+                "checksum": "5f6c...",
+                "hits": 10,
+                "misses": 2
+            }
+        """
+        with self._lock:
+            return {"checksum": self.checksum, "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        """
+        Close the database.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _refresh_if_needed(self) -> None:
+        """
+        Start refresh in background thread if the refresh interval elapsed
+        and it isn't already running.
+        """
+        if not self.refresh_interval:
+            return
+        with self._lock:
+            if self._refreshing or (
+                time.monotonic() - self._refreshed < self.refresh_interval
+            ):
+                return
+            self._refreshing = True
+
+        self._start_refresh_thread()
+
+    def _start_refresh_thread(self) -> None:
+        """
+        Run refresh in background thread, `_refreshing` must be already set.
+        """
+
+        def refresh() -> None:
+            try:
+                self.refresh()
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(
+            target=refresh, name="hotness-mdapi-mirror", daemon=True
+        ).start()
+
+    def _read_repomd(self) -> Tuple[str, str, str]:
+        """
+        Find the primary database in repository metadata.
+
+        Returns:
+            Tuple containing location of the compressed database, checksum type
+            and checksum of the compressed database.
+
+        Raises:
+            HTTPException: Is raised when HTTP status code of response isn't 200.
+            ValueError: Is raised when there is no primary database in metadata.
+        """
+        url = "{}/repodata/repomd.xml".format(self.repo_url)
+        response = self.requests_session.get(url, timeout=self.timeout)
+        if response.status_code != 200:
+            raise HTTPException(
+                response.status_code, "Error encountered on request {}".format(url)
+            )
+
+        root = ET.fromstring(response.content)
+        data = root.find("repo:data[@type='primary_db']", REPOMD_NAMESPACE)
+        if data is None:
+            raise ValueError("No primary_db in {}".format(url))
+        location = data.find("repo:location", REPOMD_NAMESPACE)
+        checksum = data.find("repo:checksum", REPOMD_NAMESPACE)
+        if location is None or checksum is None:
+            raise ValueError("Incomplete primary_db entry in {}".format(url))
+
+        return (
+            location.attrib["href"],
+            checksum.attrib.get("type", "sha256"),
+            (checksum.text or "").strip(),
+        )
+
+    def _download(self, location: str, checksum_type: str, checksum: str) -> str:
+        """
+        Download and decompress the primary database, unless it was already
+        downloaded.
+
+        Params:
+            location: Location of the compressed database relative to repository
+            checksum_type: Type of the checksum, like "sha256"
+            checksum: Checksum of the compressed database
+
+        Returns:
+            Path to the database.
+
+        Raises:
+            HTTPException: Is raised when HTTP status code of response isn't 200.
+            ValueError: Is raised when the checksum doesn't match.
+        """
+        path = os.path.join(self.cache_dir, "primary-{}.sqlite".format(checksum))
+        if os.path.exists(path):
+            _logger.info("Using already downloaded mdapi mirror %r" % path)
+            return path
+
+        url = "{}/{}".format(self.repo_url, location)
+        _logger.info("Downloading mdapi mirror from %r" % url)
+        h = hashlib.new(checksum_type)
+        with tempfile.TemporaryFile(dir=self.cache_dir) as compressed:
+            with contextlib.closing(
+                self.requests_session.get(url, timeout=self.timeout, stream=True)
+            ) as response:
+                if response.status_code != 200:
+                    raise HTTPException(
+                        response.status_code,
+                        "Error encountered on request {}".format(url),
+                    )
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    h.update(chunk)
+                    compressed.write(chunk)
+
+            if h.hexdigest() != checksum:
+                raise ValueError("Checksum of {} doesn't match".format(url))
+
+            compressed.seek(0)
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_dir, prefix=".primary-", delete=False
+            ) as database:
+                try:
+                    with _decompress(location, compressed) as f:
+                        shutil.copyfileobj(f, database, CHUNK_SIZE)
+                except BaseException:
+                    os.remove(database.name)
+                    raise
+        os.replace(database.name, path)
+
+        return path
+
+    def _switch(self, path: str) -> None:
+        """
+        Start using the database and remove the old ones.
+
+        Params:
+            path: Path to the database
+        """
+        connection = sqlite3.connect(
+            "file:{}?mode=ro".format(path), uri=True, check_same_thread=False
+        )
+        try:
+            connection.execute("PRAGMA mmap_size = {}".format(MMAP_SIZE))
+            # Fail early if this isn't the primary database
+            connection.execute("SELECT name, version, release FROM packages LIMIT 1")
+        except BaseException:
+            connection.close()
+            raise
+
+        with self._lock:
+            old_connection, self._connection = self._connection, connection
+        if old_connection is not None:
+            old_connection.close()
+
+        for old_path in glob.glob(os.path.join(self.cache_dir, "primary-*.sqlite")):
+            if old_path != path:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(old_path)
+        _logger.info("Using mdapi mirror %r" % path)
+
+
+def _decompress(
+    location: str, fileobj: IO[bytes]
+) -> Union[io.BufferedIOBase, IO[bytes]]:
+    """
+    Open decompressed stream based on the extension of the file.
+
+    Params:
+        location: Location of the file
+        fileobj: Compressed file
+
+    Returns:
+        Decompressed stream.
+
+    Raises:
+        ValueError: Is raised when the compression isn't supported.
+    """
+    if location.endswith(".gz"):
+        return gzip.GzipFile(fileobj=fileobj)
+    if location.endswith(".bz2"):
+        return bz2.BZ2File(fileobj)
+    if location.endswith(".xz"):
+        return lzma.LZMAFile(fileobj)
+    if location.endswith(".zst"):
+        if zstandard is None:
+            raise ValueError("zstandard is required for {}".format(location))
+        return zstandard.ZstdDecompressor().stream_reader(fileobj)
+    if location.endswith(".sqlite"):
+        return fileobj
+    raise ValueError("Unsupported compression of {}".format(location))
@@ -15,15 +15,17 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import concurrent.futures
 import logging
 import tomllib as toml
-from typing import Optional, Tuple, Union
+from typing import Callable, List, Optional, Tuple, Union
 
 from . import Validator
+from hotness.common.metrics import EXTERNAL_CALL_DURATION
 from hotness.domain import Package
 from hotness.exceptions import HTTPException
 
-from requests import Session
+from requests import Response, Session
 
 # Accepted monitoring statuses
 MONITORING_STATUSES = [
@@ -59,6 +61,10 @@ class Pagure(Validator):
         url: URL of the pagure dist-git server
         requests_session: Session object which will be used for HTTP request
         timeout: Timeouts to HTTP request in seconds (connect timeout, read timeout)
+        parallel_requests: Do the retirement check and both monitoring settings
+          lookups in parallel instead of one after another
+        max_workers: Maximum number of parallel requests when `parallel_requests`
+          is enabled, three are needed for every validated package
     """
 
     def __init__(
@@ -68,6 +74,8 @@ class Pagure(Validator):
         timeout: Optional[Union[float, Tuple[float, float], Tuple[float, None]]],
         branch: str,
         package_type: str,
+        parallel_requests: bool = False,
+        max_workers: int = 3,
     ) -> None:
         """
         Class constructor.
@@ -77,7 +85,15 @@ class Pagure(Validator):
         self.timeout = timeout
         self.branch = branch
         self.package_type = package_type
+        self.parallel_requests = parallel_requests
+        self.max_workers = max_workers
+        self._executor = None
+        if parallel_requests:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="hotness-pagure"
+            )
 
+    @EXTERNAL_CALL_DURATION.labels(system="pagure", operation="validate").time()
     def validate(self, package: Package) -> dict:
         """
         Implementation of `Validator.validate` method. It calls the Pagure dist-git, checks if the
@@ -115,6 +131,16 @@ class Pagure(Validator):
         dead_package_url = "{0}/rpms/{1}/blob/{2}/f/dead.package".format(
             self.url, package.name, self.branch
         )
+        # Monitoring config file in repository is checked first
+        monitoring_config_url = "{0}/rpms/{1}/raw/{2}/f/monitoring.toml".format(
+            self.url, package.name, self.branch
+        )
+        # Old monitoring setting is used if the configuration file is not available
+        dist_git_url = "{0}/_dg/anitya/rpms/{1}".format(self.url, package.name)
+        get = self._prepare_requests(
+            [dead_package_url, monitoring_config_url, dist_git_url]
+        )
+
         params = (
             ("name", self.branch),
             ("global_component", package.name),
@@ -127,7 +153,7 @@ class Pagure(Validator):
                 dead_package_url, package, params
             )
         )
-        response = self.requests_session.get(dead_package_url, timeout=self.timeout)
+        response = get(dead_package_url)
 
         if response.status_code not in [200, 404]:
             raise HTTPException(
@@ -140,36 +166,24 @@ class Pagure(Validator):
 
         # Only check monitoring if the package is not retired
         if not output["retired"]:
-            # Check for monitoring config file in repository first
-            monitoring_config_url = "{0}/rpms/{1}/raw/{2}/f/monitoring.toml".format(
-                self.url, package.name, self.branch
-            )
             _logger.debug(
                 "Checking {} to see if {} is using monitoring config".format(
                     monitoring_config_url, package
                 )
             )
-            response = self.requests_session.get(
-                monitoring_config_url, timeout=self.timeout
-            )
+            response = get(monitoring_config_url)
 
             if response.status_code == 200:
-                config = toml.loads(response.text)
-                output["monitoring"] = config.get("monitoring", True)
-                output["bugzilla"] = config.get("bugzilla", True)
-                output["all_versions"] = config.get("all_versions", False)
-                output["stable_only"] = config.get("stable_only", False)
-                output["scratch_build"] = config.get("scratch_build", False)
+                output.update(self.parse_monitoring_config(response.text))
 
             # If the configuration file is not available check the old monitoring setting
             else:
-                dist_git_url = "{0}/_dg/anitya/rpms/{1}".format(self.url, package.name)
                 _logger.debug(
                     "Checking {} to see if {} is monitored.".format(
                         dist_git_url, package.name
                     )
                 )
-                response = self.requests_session.get(dist_git_url, timeout=self.timeout)
+                response = get(dist_git_url)
 
                 if not response.status_code == 200:
                     raise HTTPException(
@@ -178,41 +192,92 @@ class Pagure(Validator):
                     )
                 data = response.json()
                 monitoring_value = data.get("monitoring", "no-monitoring")
+                output.update(self.parse_monitoring_value(monitoring_value))
 
-                # Fill the output based on the monitoring value
-                # Invalid =
-                #   monitoring: False; scrach_build: False; all_versions: False; stable_only: False
-                # monitoring =
-                #   monitoring: True; scrach_build: False; all_versions: False; stable_only: False
-                # monitoring-with-scratch =
-                #   monitoring: True; scrach_build: True; all_versions: False; stable_only: False
-                # monitoring-all =
-                #   monitoring: True; scrach_build: False; all_versions: True; stable_only: False
-                # monitoring-all-scratch =
-                #   monitoring: True; scrach_build: True; all_versions: True; stable_only: False
-                # monitoring-stable =
-                #   monitoring: True; scrach_build: False; all_versions: True; stable_only: True
-                # monitoring-stable-scratch =
-                #   monitoring: True; scrach_build: True; all_versions: True; stable_only: True
-                # no-monitoring =
-                #   monitoring: False; scrach_build: False; all_versions: False; stable_only: False
-                if monitoring_value not in MONITORING_STATUSES:
-                    _logger.info(
-                        "Unknown status '{}' recovered from {}".format(
-                            dist_git_url, monitoring_value
-                        )
-                    )
+        return output
 
-                if monitoring_value.startswith("monitoring"):
-                    output["monitoring"] = True
+    def _prepare_requests(self, urls: List[str]) -> Callable[[str], Response]:
+        """
+        Prepare GET requests which could be needed by validation.
+
+        When `parallel_requests` is enabled all the requests are started at once
+        and the returned function waits for the response. Responses which aren't
+        needed are ignored, including their errors. Otherwise the request
+        is done when the returned function is called.
 
-                if monitoring_value.startswith("monitoring-all"):
-                    output["all_versions"] = True
+        Params:
+            urls: URLs which could be requested
 
-                if monitoring_value.startswith("monitoring-stable"):
-                    output["stable_only"] = True
+        Returns:
+            Function returning response for URL.
+        """
+        if self._executor is None:
+            return lambda url: self.requests_session.get(url, timeout=self.timeout)
 
-                if monitoring_value in MONITORING_STATUSES_SCRATCH_BUILD:
-                    output["scratch_build"] = True
+        futures = {
+            url: self._executor.submit(
+                self.requests_session.get, url, timeout=self.timeout
+            )
+            for url in urls
+        }
+        return lambda url: futures[url].result()
 
-        return output
+    @staticmethod
+    def parse_monitoring_config(text: str) -> dict:
+        """
+        Parse monitoring settings from monitoring.toml file in package repository.
+
+        Params:
+            text: Content of the monitoring.toml file
+
+        Returns:
+            Dictionary with monitoring, bugzilla, all_versions, stable_only
+            and scratch_build settings.
+        """
+        config = toml.loads(text)
+        return {
+            "monitoring": config.get("monitoring", True),
+            "bugzilla": config.get("bugzilla", True),
+            "all_versions": config.get("all_versions", False),
+            "stable_only": config.get("stable_only", False),
+            "scratch_build": config.get("scratch_build", False),
+        }
+
+    @staticmethod
+    def parse_monitoring_value(monitoring_value: str) -> dict:
+        """
+        Parse monitoring settings from the monitoring value set in dist-git.
+
+        Params:
+            monitoring_value: Monitoring value, one of `MONITORING_STATUSES`
+
+        Returns:
+            Dictionary with monitoring, all_versions, stable_only
+            and scratch_build settings.
+        """
+        # Fill the output based on the monitoring value
+        # Invalid =
+        #   monitoring: False; scrach_build: False; all_versions: False; stable_only: False
+        # monitoring =
+        #   monitoring: True; scrach_build: False; all_versions: False; stable_only: False
+        # monitoring-with-scratch =
+        #   monitoring: True; scrach_build: True; all_versions: False; stable_only: False
+        # monitoring-all =
+        #   monitoring: True; scrach_build: False; all_versions: True; stable_only: False
+        # monitoring-all-scratch =
+        #   monitoring: True; scrach_build: True; all_versions: True; stable_only: False
+        # monitoring-stable =
+        #   monitoring: True; scrach_build: False; all_versions: True; stable_only: True
+        # monitoring-stable-scratch =
+        #   monitoring: True; scrach_build: True; all_versions: True; stable_only: True
+        # no-monitoring =
+        #   monitoring: False; scrach_build: False; all_versions: False; stable_only: False
+        if monitoring_value not in MONITORING_STATUSES:
+            _logger.info("Unknown monitoring status '{}'".format(monitoring_value))
+
+        return {
+            "monitoring": monitoring_value.startswith("monitoring"),
+            "all_versions": monitoring_value.startswith("monitoring-all"),
+            "stable_only": monitoring_value.startswith("monitoring-stable"),
+            "scratch_build": monitoring_value in MONITORING_STATUSES_SCRATCH_BUILD,
+        }
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import json
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+
+from requests import Session
+
+from . import Validator
+from hotness.domain import Package
+from hotness.exceptions import HTTPException
+
+_logger = logging.getLogger(__name__)
+
+# Keys of the validation output stored in the index, every key is one bit
+OUTPUT_KEYS = (
+    "monitoring",
+    "bugzilla",
+    "all_versions",
+    "stable_only",
+    "scratch_build",
+    "retired",
+)
+
+# Values used for keys missing in the snapshot entry, same as `Pagure` output
+DEFAULT_OUTPUT = {
+    "monitoring": False,
+    "bugzilla": True,
+    "all_versions": False,
+    "stable_only": False,
+    "scratch_build": False,
+    "retired": False,
+}
+
+
+class SnapshotValidator(Validator):
+    """
+    Wrapper answering validations from bulk snapshot of the validator output
+    for all packages, instead of asking the wrapped validator per package.
+
+    It inherits the Validator abstract class and implements the validate method.
+
+    The snapshot is JSON document loaded from URL or local path, it could be
+    generated by `devel/dist_git_snapshot.py`:
+
+        {
+            "generated": 1700000000,  # Unix time when the snapshot was created
+            "packages": {
+                "foo": {"monitoring": true, "scratch_build": true},
+                "bar": {"retired": true, "updated": 1699990000}
+            }
+        }
+
+    Keys missing in the package entry have the same values as in `Pagure` output.
+    The optional "updated" key is Unix time when the settings of the package
+    were read, the time when the snapshot was created is used when it's missing.
+    The snapshot is kept as dictionary of package names, bit flags and update
+    times, which keeps it small even for all packages in the distribution.
+
+    The wrapped validator is called for packages missing in the snapshot and for
+    packages which settings are older than `max_age`. The snapshot is loaded
+    again in background thread every `refresh_interval` seconds, the old one is
+    used until the new one is loaded. Any error while loading the snapshot
+    is logged and the previous snapshot is kept.
+
+    Attributes:
+        validator: Validator called when the package can't be answered from snapshot
+        source: URL or path of the snapshot
+        requests_session: Session object which will be used for HTTP request
+        timeout: Timeouts to HTTP request in seconds (connect timeout, read timeout)
+        refresh_interval: Time in seconds after which the snapshot is loaded again,
+          0 means it's only loaded by calling `load`
+        max_age: Maximum age of the package settings in seconds, 0 means unlimited
+        hits: Number of validations answered from snapshot
+        misses: Number of validations passed to wrapped validator
+    """
+
+    def __init__(
+        self,
+        validator: Validator,
+        source: str,
+        requests_session: Session,
+        timeout: Optional[Union[float, Tuple[float, float], Tuple[float, None]]],
+        refresh_interval: float = 3600,
+        max_age: float = 0,
+    ) -> None:
+        """
+        Class constructor.
+        """
+        super(SnapshotValidator, self).__init__()
+        self.validator = validator
+        self.source = source
+        self.requests_session = requests_session
+        self.timeout = timeout
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._index: Dict[str, Tuple[int, float]] = {}
+        self._generated = 0.0
+        self._loaded = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def validate(self, package: Package) -> dict:
+        """
+        Implementation of `Validator.validate` method. It returns the output
+        from snapshot if the package is in it and the snapshot isn't stale,
+        otherwise it calls the wrapped validator.
+
+        Params:
+            package: Package to validate
+
+        Returns:
+            Output of the wrapped validator.
+        """
+        self._refresh_if_needed()
+
+        flags = self._lookup(package.name)
+        if flags is None:
+            with self._lock:
+                self.misses += 1
+            return self.validator.validate(package)
+
+        with self._lock:
+            self.hits += 1
+        _logger.debug("Using dist-git snapshot for %r" % package.name)
+        return {key: bool(flags & (1 << bit)) for bit, key in enumerate(OUTPUT_KEYS)}
+
+    def load(self) -> bool:
+        """
+        Load the snapshot from source and replace the current one.
+
+        Returns:
+            True if the snapshot was loaded, False otherwise.
+        """
+        start = time.monotonic()
+        try:
+            snapshot = self._read()
+            generated = float(snapshot.get("generated", time.time()))
+            index = {
+                name: (self._encode(entry), float(entry.get("updated", generated)))
+                for name, entry in snapshot["packages"].items()
+            }
+        except Exception:
+            _logger.exception("Couldn't load dist-git snapshot from %r" % self.source)
+            with self._lock:
+                # Try again after the refresh interval, not with every message
+                self._loaded = time.monotonic()
+            return False
+
+        with self._lock:
+            self._index = index
+            self._generated = generated
+            self._loaded = time.monotonic()
+        _logger.info(
+            "Loaded dist-git snapshot with %d packages in %.1f s"
+            % (len(index), time.monotonic() - start)
+        )
+        return True
+
+    def stats(self) -> dict:
+        """
+        Return the snapshot statistics.
+
+        Returns:
+            Dictionary containing number of packages in snapshot, its age in seconds
+            and number of hits and misses.
+            Example:
+            {
+                "packages": 23000,
+                "age": 120.5,
+                "hits": 10,
+                "misses": 2
+            }
+        """
+        with self._lock:
+            return {
+                "packages": len(self._index),
+                "age": time.time() - self._generated if self._index else 0.0,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _lookup(self, name: str) -> Optional[int]:
+        """
+        Find the package in snapshot.
+
+        Params:
+            name: Name of the package
+
+        Returns:
+            Bit flags of the validation output or None if the package isn't
+            in snapshot or its settings are stale.
+        """
+        with self._lock:
+            entry = self._index.get(name)
+        if entry is None:
+            return None
+
+        flags, updated = entry
+        if self.max_age and time.time() - updated > self.max_age:
+            return None
+        return flags
+
+    def _refresh_if_needed(self) -> None:
+        """
+        Start loading the snapshot in background thread if the refresh interval
+        elapsed and it isn't already being loaded.
+        """
+        if not self.refresh_interval:
+            return
+        with self._lock:
+            if self._refreshing or (
+                time.monotonic() - self._loaded < self.refresh_interval
+            ):
+                return
+            self._refreshing = True
+
+        def refresh() -> None:
+            try:
+                self.load()
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(
+            target=refresh, name="hotness-dist-git-snapshot", daemon=True
+        ).start()
+
+    def _read(self) -> dict:
+        """
+        Read the snapshot from URL or local path.
+
+        Returns:
+            Parsed snapshot.
+
+        Raises:
+            HTTPException: Is raised when HTTP status code of response isn't 200.
+        """
+        if not self.source.startswith(("http://", "https://")):
+            with open(self.source) as f:
+                return json.load(f)
+
+        response = self.requests_session.get(self.source, timeout=self.timeout)
+        if response.status_code != 200:
+            raise HTTPException(
+                response.status_code,
+                "Error encountered on request {}".format(self.source),
+            )
+        return response.json()
+
+    @staticmethod
+    def _encode(entry: dict) -> int:
+        """
+        Encode the snapshot entry to bit flags.
+
+        Params:
+            entry: Validation output of the package, missing keys have default value
+
+        Returns:
+            Bit flags, bit for every key in `OUTPUT_KEYS`.
+        """
+        flags = 0
+        for bit, key in enumerate(OUTPUT_KEYS):
+            if entry.get(key, DEFAULT_OUTPUT[key]):
+                flags |= 1 << bit
+        return flags
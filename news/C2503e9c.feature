@@ -0,0 +1 @@
+Process package mappings of Anitya message in parallel, configured by ``mapping_workers``
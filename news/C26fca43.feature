@@ -0,0 +1 @@
+Expose Prometheus metrics, configured by ``metrics``, requires the ``metrics`` extra
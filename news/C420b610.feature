@@ -0,0 +1 @@
+Reuse authenticated Koji sessions, configured by ``koji.session_pool_size``
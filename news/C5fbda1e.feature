@@ -0,0 +1 @@
+Cache downloaded package sources, configured by ``koji.source_cache_dir``
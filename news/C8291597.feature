@@ -0,0 +1 @@
+Request dist-git retirement and monitoring settings in parallel, configured by ``dist_git_parallel_requests``
@@ -0,0 +1 @@
+Share concurrent mdapi requests for the same package and optionally cache them, configured by ``mdapi_cache_expiration``
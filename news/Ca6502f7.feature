@@ -0,0 +1 @@
+Drop build task messages of untracked tasks by local Bloom filter, configured by ``task_filter``
@@ -0,0 +1 @@
+Clone package repositories from local dist-git mirrors, configured by ``koji.mirror_dir``
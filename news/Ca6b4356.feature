@@ -0,0 +1 @@
+Find existing Bugzilla bugs with one cached query, configured by ``bugzilla.query_cache_expiration``
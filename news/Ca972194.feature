@@ -0,0 +1 @@
+Start scratch builds from memory or Redis queue in build workers, configured by ``build_queue``
@@ -0,0 +1 @@
+Share pool of Redis connections, configured by ``redis.pool_size``
@@ -0,0 +1 @@
+Add asyncio consumer ``AsyncHotnessConsumer``, requires the ``async`` extra
@@ -0,0 +1 @@
+Read dist-git monitoring settings and retirement status from snapshot generated by ``devel/dist_git_snapshot.py``, configured by ``dist_git_snapshot``
@@ -0,0 +1 @@
+Send Bugzilla comments in batches, configured by ``bugzilla.update_delay``
@@ -0,0 +1 @@
+Add OpenTelemetry tracing spans for messages and use cases, configured by ``tracing``, requires the ``tracing`` extra
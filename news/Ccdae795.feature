@@ -0,0 +1 @@
+Cache monitoring settings and retirement status retrieved from dist-git, configured by ``validator_cache``
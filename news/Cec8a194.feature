@@ -0,0 +1 @@
+Read package versions from local mirror of repository metadata, configured by ``mdapi_mirror``, requires the ``zstandard`` extra
@@ -0,0 +1 @@
+Drop duplicate Anitya messages, configured by ``deduplication``
@@ -0,0 +1 @@
+Upload SRPM to Koji in resumable chunks, configured by ``koji.upload_chunk_size``
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+Fixtures for benchmarks of hot paths.
+
+Every benchmark is measured by `bench` fixture. Results could be saved
+as baseline and later runs compared against it:
+
+    pytest tests/benchmarks --hotness-bench-save tests/benchmarks/baseline.json
+    pytest tests/benchmarks --hotness-bench-compare tests/benchmarks/baseline.json
+"""
+
+import json
+import platform
+import timeit
+from typing import Callable, Dict
+
+import pytest
+
+from hotness import __version__
+
+# Results of all benchmarks in the session
+RESULTS: Dict[str, dict] = {}
+
+
+class Bench:
+    """
+    Measure the duration of function call.
+
+    Attributes:
+        name: Name of the benchmark
+        baseline: Baseline results, empty if not compared
+        tolerance: Allowed slowdown against baseline
+    """
+
+    def __init__(self, name: str, baseline: dict, tolerance: float) -> None:
+        """
+        Class constructor.
+        """
+        self.name = name
+        self.baseline = baseline
+        self.tolerance = tolerance
+
+    def __call__(self, func: Callable, number: int = 100, repeat: int = 5):
+        """
+        Call function repeatedly and record the duration of one call.
+        The best of repeats is used, it's the least affected by other processes.
+
+        Params:
+            func: Function without arguments to measure
+            number: Number of calls in one repeat
+            repeat: Number of repeats
+
+        Returns:
+            Value returned by the function.
+        """
+        timings = [
+            t / number for t in timeit.repeat(func, number=number, repeat=repeat)
+        ]
+        best = min(timings)
+        RESULTS[self.name] = {
+            "best": best,
+            "mean": sum(timings) / len(timings),
+            "number": number,
+            "repeat": repeat,
+        }
+
+        if self.name in self.baseline:
+            limit = self.baseline[self.name]["best"] * (1 + self.tolerance)
+            if best > limit:
+                pytest.fail(
+                    "Benchmark {} regressed: {:.3g} s per call, baseline {:.3g} s".format(
+                        self.name, best, self.baseline[self.name]["best"]
+                    )
+                )
+
+        return func()
+
+
+@pytest.fixture(scope="session")
+def baseline(request) -> dict:
+    """
+    Load baseline results if comparison was requested.
+    """
+    path = request.config.getoption("--hotness-bench-compare")
+    if not path:
+        return {}
+    with open(path) as f:
+        return json.load(f)["benchmarks"]
+
+
+@pytest.fixture
+def bench(request, baseline) -> Bench:
+    """
+    Provide `Bench` named after the benchmark.
+    """
+    name = request.node.name
+    if name.startswith("test_"):
+        name = name[len("test_") :]
+    return Bench(name, baseline, request.config.getoption("--hotness-bench-tolerance"))
+
+
+def pytest_sessionfinish(session):
+    """
+    Save the results of benchmarks if requested.
+    """
+    path = session.config.getoption("--hotness-bench-save")
+    if not path or not RESULTS:
+        return
+
+    data = {
+        "machine_info": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "hotness": __version__,
+        "benchmarks": dict(sorted(RESULTS.items())),
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
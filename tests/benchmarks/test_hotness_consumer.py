@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import pytest
+from unittest import mock
+
+from hotness.hotness_consumer import HotnessConsumer
+from tests.test_hotness_consumer import create_message
+
+pytestmark = pytest.mark.hotness_bench
+
+
+class TestHotnessConsumerBenchmark:
+    """
+    Benchmarks of `hotness.hotness_consumer.HotnessConsumer`.
+    """
+
+    def setup_method(self):
+        """
+        Create hotness consumer with mocked backends, which accept every update.
+        """
+        with mock.patch("hotness.hotness_consumer.Koji") as mock_koji_new, mock.patch(
+            "hotness.hotness_consumer.Redis"
+        ) as mock_redis_new, mock.patch(
+            "hotness.hotness_consumer.bz_notifier"
+        ) as mock_bz_notifier_new, mock.patch(
+            "hotness.hotness_consumer.FedoraMessaging"
+        ), mock.patch(
+            "hotness.hotness_consumer.bz_patcher"
+        ), mock.patch(
+            "hotness.hotness_consumer.MDApi"
+        ) as mock_mdapi_new, mock.patch(
+            "hotness.hotness_consumer.Pagure"
+        ) as mock_pagure_new:
+            mock_pagure_new.return_value.validate.return_value = {
+                "monitoring": True,
+                "bugzilla": True,
+                "all_versions": True,
+                "stable_only": False,
+                "scratch_build": True,
+                "retired": False,
+            }
+            mock_mdapi_new.return_value.validate.return_value = {
+                "newer": True,
+                "version": "0.1.0",
+                "release": "1.fc40",
+            }
+            mock_bz_notifier_new.return_value.notify.return_value = {"bz_id": 100}
+            mock_koji_new.return_value.build.return_value = {
+                "build_id": 1000,
+                "patch": "",
+                "patch_filename": "",
+                "message": "",
+            }
+            mock_redis_new.return_value.retrieve.return_value = {"value": "100"}
+
+            self.consumer = HotnessConsumer()
+
+    def test_consumer_anitya_update(self, bench):
+        """
+        Benchmark handling of Anitya update message from validation to scratch build.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+
+        bench(lambda: self.consumer(message), number=100)
+
+        self.consumer.builder_koji.build.assert_called()
+
+    def test_consumer_buildsys_completed(self, bench):
+        """
+        Benchmark handling of completed scratch build message.
+        """
+        message = create_message("buildsys.task.state.change", "build_completed")
+
+        bench(lambda: self.consumer(message), number=100)
+
+        self.consumer.notifier_bugzilla.notify.assert_called()
+
+    def test_consumer_buildsys_filtered(self, bench):
+        """
+        Benchmark dropping of build message not in done state.
+        """
+        message = create_message("buildsys.task.state.change", "build")
+
+        bench(lambda: self.consumer(message), number=1000)
+
+    def test_list_to_series(self, bench):
+        """
+        Benchmark converting list of build targets to series.
+        """
+        items = ["f{}-candidate".format(i % 50) for i in range(1000)]
+
+        series = bench(lambda: self.consumer._list_to_series(items), number=1000)
+
+        assert series.endswith("and 48 others")
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import os
+
+import pytest
+from unittest import mock
+
+from hotness.builders import Koji
+
+pytestmark = pytest.mark.hotness_bench
+
+
+class TestKojiBenchmark:
+    """
+    Benchmarks of `hotness.builders.Koji`.
+    """
+
+    def setup_method(self):
+        """
+        Create builder instance for benchmarks.
+        """
+        kerberos_args = {
+            "krb_principal": "",
+            "krb_keytab": "",
+            "krb_ccache": "",
+            "krb_proxyuser": "",
+            "krb_sessionopts": {},
+        }
+
+        self.builder = Koji(
+            "https://example.com/koji",
+            "https://example.com/kojihub",
+            kerberos_args,
+            "https://src.example.com/",
+            ("Emperor of Mankind", "emperor@ter.ra"),
+            {},
+            30,
+            "rawhide",
+            source_cache=mock.Mock(),
+        )
+
+    def test_koji_compare_sources(self, bench, tmpdir):
+        """
+        Benchmark comparing checksums of large source files.
+        """
+        old_sources = []
+        new_sources = []
+        for i in range(4):
+            for sources, prefix in ((old_sources, "old"), (new_sources, "new")):
+                path = os.path.join(tmpdir, "{}-{}.tar.gz".format(prefix, i))
+                with open(path, "wb") as f:
+                    # Every pair of files except the last one differs
+                    seed = b"%d" % i if i == 3 else prefix.encode() + b"%d" % i
+                    f.write(seed * (4 * 1024 * 1024 // len(seed)))
+                sources.append(path)
+
+        message = bench(
+            lambda: self.builder._compare_sources(old_sources, new_sources),
+            number=1,
+            repeat=3,
+        )
+
+        assert "old-3.tar.gz" in message
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import pytest
+from unittest import mock
+
+from hotness.domain import Package
+from hotness.validators import Pagure
+
+pytestmark = pytest.mark.hotness_bench
+
+MONITORING_TOML = """
+monitoring = true
+bugzilla = true
+all_versions = true
+stable_only = false
+scratch_build = true
+"""
+
+
+class TestPagureBenchmark:
+    """
+    Benchmarks of `hotness.validators.Pagure`.
+    """
+
+    def test_pagure_validate(self, bench):
+        """
+        Benchmark validation with monitoring settings in TOML file.
+        """
+        responses = {
+            "dead.package": mock.Mock(status_code=404),
+            "monitoring.toml": mock.Mock(status_code=200, text=MONITORING_TOML),
+        }
+        requests_session = mock.Mock()
+        requests_session.get.side_effect = lambda url, timeout: responses[
+            url.rsplit("/", 1)[-1]
+        ]
+        validator = Pagure(
+            "https://src.example.com", requests_session, (5, 20), "rawhide", "rpm"
+        )
+        package = Package(name="pg-semver", version="0.17.0", distro="Fedora")
+
+        output = bench(lambda: validator.validate(package), number=200)
+
+        assert output["scratch_build"] is True
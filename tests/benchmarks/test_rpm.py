@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import random
+
+import pytest
+
+from hotness.common import RPM
+
+pytestmark = pytest.mark.hotness_bench
+
+
+def version_corpus(count: int = 500) -> list:
+    """
+    Generate realistic upstream versions with release candidates,
+    pre-releases and date based versions.
+    """
+    rng = random.Random(42)
+    versions = []
+    for _ in range(count):
+        major, minor, patch = rng.randint(0, 5), rng.randint(0, 30), rng.randint(0, 99)
+        kind = rng.randint(0, 5)
+        if kind == 0:
+            version = "{}.{}.{}rc{}".format(major, minor, patch, rng.randint(1, 5))
+        elif kind == 1:
+            version = "{}.{}.{}-beta{}".format(major, minor, patch, rng.randint(1, 5))
+        elif kind == 2:
+            version = "{}{:02d}{:02d}".format(
+                rng.randint(2015, 2025), minor % 12, patch
+            )
+        elif kind == 3:
+            version = "{}.{}.{}.post{}".format(major, minor, patch, rng.randint(1, 5))
+        else:
+            version = "{}.{}.{}".format(major, minor, patch)
+        versions.append(version)
+    return versions
+
+
+class TestRPMBenchmark:
+    """
+    Benchmarks of `hotness.common.RPM`.
+    """
+
+    def setup_method(self):
+        """
+        Prepare pairs of versions to compare.
+        """
+        versions = version_corpus()
+        self.pairs = list(zip(versions, reversed(versions)))
+
+    def test_rpm_compare_cold(self, bench):
+        """
+        Benchmark comparing versions which weren't parsed yet.
+        """
+
+        def compare():
+            RPM.clear_cache()
+            return [RPM.compare(v1, v2) for v1, v2 in self.pairs]
+
+        bench(compare, number=50)
+
+    def test_rpm_compare_warm(self, bench):
+        """
+        Benchmark comparing versions which are already parsed.
+        """
+
+        def compare():
+            return [RPM.compare(v1, v2) for v1, v2 in self.pairs]
+
+        bench(compare, number=50)
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import fcntl
+import os
+import pytest
+from subprocess import CalledProcessError
+from unittest import mock
+
+from hotness.builders import GitMirror
+
+
+def create_mirror(cache_dir: str, name: str, size: int, mtime: int) -> str:
+    """
+    Create fake mirror with file of given size and modification time.
+    """
+    path = os.path.join(cache_dir, name + ".git")
+    os.makedirs(path)
+    with open(os.path.join(path, "pack"), "wb") as f:
+        f.write(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestGitMirrorInit:
+    """
+    Test class for `hotness.builders.GitMirror.__init__` method.
+    """
+
+    def test_init(self, tmpdir):
+        """
+        Assert that GitMirror object is initialized correctly.
+        """
+        cache_dir = os.path.join(tmpdir, "mirrors")
+
+        git_mirror = GitMirror(cache_dir, max_size=100)
+
+        assert git_mirror.cache_dir == cache_dir
+        assert git_mirror.max_size == 100
+        assert os.path.isdir(cache_dir)
+
+
+class TestGitMirrorClone:
+    """
+    Test class for `hotness.builders.GitMirror.clone` method.
+    """
+
+    @mock.patch("hotness.builders.git_mirror.sp.check_output")
+    def test_clone_new_mirror(self, mock_check_output, tmpdir):
+        """
+        Assert that mirror is created when it doesn't exist yet.
+        """
+        git_mirror = GitMirror(str(tmpdir))
+        mirror = os.path.join(tmpdir, "test.git")
+        url = "https://src.example.com/test.git"
+
+        def check_output(cmd, **kwargs):
+            if cmd[:3] == ["git", "clone", "--mirror"]:
+                os.makedirs(mirror)
+            return b""
+
+        mock_check_output.side_effect = check_output
+
+        git_mirror.clone("test", url, "/tmp/target")
+
+        mock_check_output.assert_has_calls(
+            [
+                mock.call(["git", "clone", "--mirror", url, mirror], stderr=mock.ANY),
+                mock.call(["git", "clone", mirror, "/tmp/target"], stderr=mock.ANY),
+                mock.call(
+                    ["git", "remote", "set-url", "origin", url],
+                    cwd="/tmp/target",
+                    stderr=mock.ANY,
+                ),
+            ]
+        )
+        assert mock_check_output.call_count == 3
+
+    @mock.patch("hotness.builders.git_mirror.sp.check_output")
+    def test_clone_existing_mirror(self, mock_check_output, tmpdir):
+        """
+        Assert that existing mirror is updated and its modification time is bumped.
+        """
+        git_mirror = GitMirror(str(tmpdir))
+        mirror = create_mirror(str(tmpdir), "test", 1, 1000)
+        url = "https://src.example.com/test.git"
+
+        git_mirror.clone("test", url, "/tmp/target")
+
+        mock_check_output.assert_has_calls(
+            [
+                mock.call(
+                    ["git", "fetch", "--prune", url, "+refs/*:refs/*"],
+                    cwd=mirror,
+                    stderr=mock.ANY,
+                ),
+                mock.call(["git", "clone", mirror, "/tmp/target"], stderr=mock.ANY),
+                mock.call(
+                    ["git", "remote", "set-url", "origin", url],
+                    cwd="/tmp/target",
+                    stderr=mock.ANY,
+                ),
+            ]
+        )
+        assert mock_check_output.call_count == 3
+        assert os.stat(mirror).st_mtime > 1000
+
+    @mock.patch("hotness.builders.git_mirror.sp.check_output")
+    def test_clone_new_mirror_error(self, mock_check_output, tmpdir):
+        """
+        Assert that partial mirror is removed when the mirror clone fails.
+        """
+        git_mirror = GitMirror(str(tmpdir))
+        mirror = os.path.join(tmpdir, "test.git")
+
+        def check_output(cmd, **kwargs):
+            os.makedirs(mirror)
+            raise CalledProcessError(128, cmd)
+
+        mock_check_output.side_effect = check_output
+
+        with pytest.raises(CalledProcessError):
+            git_mirror.clone("test", "https://src.example.com/test.git", "/tmp/target")
+
+        assert not os.path.exists(mirror)
+
+    @mock.patch("hotness.builders.git_mirror.sp.check_output")
+    def test_clone_evict(self, mock_check_output, tmpdir):
+        """
+        Assert that old mirrors are evicted after clone, but not the used one.
+        """
+        git_mirror = GitMirror(str(tmpdir), max_size=15)
+        old_mirror = create_mirror(str(tmpdir), "old", 10, 1000)
+        mirror = create_mirror(str(tmpdir), "test", 10, 500)
+
+        git_mirror.clone("test", "https://src.example.com/test.git", "/tmp/target")
+
+        assert not os.path.exists(old_mirror)
+        assert os.path.exists(mirror)
+
+
+class TestGitMirrorEvict:
+    """
+    Test class for `hotness.builders.GitMirror.evict` method.
+    """
+
+    def test_evict(self, tmpdir):
+        """
+        Assert that least recently used mirrors are evicted until the size
+        is below the limit.
+        """
+        git_mirror = GitMirror(str(tmpdir), max_size=25)
+        oldest = create_mirror(str(tmpdir), "oldest", 10, 1000)
+        old = create_mirror(str(tmpdir), "old", 10, 2000)
+        new = create_mirror(str(tmpdir), "new", 10, 3000)
+
+        removed = git_mirror.evict()
+
+        assert removed == [oldest]
+        assert not os.path.exists(oldest)
+        assert os.path.exists(old)
+        assert os.path.exists(new)
+
+    def test_evict_unlimited(self, tmpdir):
+        """
+        Assert that nothing is evicted when the size isn't limited.
+        """
+        git_mirror = GitMirror(str(tmpdir))
+        mirror = create_mirror(str(tmpdir), "test", 10, 1000)
+
+        assert git_mirror.evict() == []
+        assert os.path.exists(mirror)
+
+    def test_evict_locked(self, tmpdir):
+        """
+        Assert that mirror which is locked is not evicted.
+        """
+        git_mirror = GitMirror(str(tmpdir), max_size=15)
+        locked = create_mirror(str(tmpdir), "locked", 10, 1000)
+        old = create_mirror(str(tmpdir), "old", 10, 2000)
+
+        with open(locked + ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            removed = git_mirror.evict()
+
+        assert removed == [old]
+        assert os.path.exists(locked)
+        assert not os.path.exists(old)
+
+    def test_evict_ignore_other_files(self, tmpdir):
+        """
+        Assert that files which aren't mirrors are not evicted.
+        """
+        git_mirror = GitMirror(str(tmpdir), max_size=1)
+        other = os.path.join(tmpdir, "other")
+        os.makedirs(other)
+        with open(os.path.join(tmpdir, "test.git.lock"), "w") as f:
+            f.write("x" * 10)
+
+        assert git_mirror.evict() == []
+        assert os.path.exists(other)
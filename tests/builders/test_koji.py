@@ -15,12 +15,15 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import hashlib
 import os
 import pytest
+import zlib
 from subprocess import CalledProcessError
 from unittest import mock
 
-from koji import GenericError
+from koji import AuthExpired, GenericError
+from prometheus_client import REGISTRY
 
 from hotness.domain import Package
 from hotness.exceptions import BuilderException
@@ -77,6 +80,10 @@ class TestKojiInit:
         assert builder.opts == opts
         assert builder.priority == priority
         assert builder.target_tag == target_tag
+        assert builder.git_mirror is None
+        assert builder.source_cache is None
+        assert builder.session_pool.size == 1
+        assert builder.session_pool.factory == builder._session_maker
 
 
 class TestKojiBuild:
@@ -248,6 +255,78 @@ class TestKojiBuild:
             ]
         )
 
+    @mock.patch("hotness.builders.koji.sp.check_output")
+    @mock.patch("hotness.builders.koji.koji")
+    @mock.patch("hotness.builders.koji.TemporaryDirectory")
+    def test_build_git_mirror(
+        self, mock_temp_dir, mock_koji, mock_check_output, tmpdir
+    ):
+        """
+        Assert that package repository is cloned from mirror when available.
+        """
+        # Mock patch file
+        filename = "patch"
+        file = os.path.join(tmpdir, filename)
+        with open(file, "w") as f:
+            f.write("This is a patch")
+        mock_session = mock.Mock()
+        mock_session.build.return_value = 1000
+        mock_session.gssapi_login.return_value = True
+        mock_koji.ClientSession.return_value = mock_session
+        mock_temp_dir.return_value.__enter__.return_value = tmpdir
+
+        mock_check_output.side_effect = [
+            "rpmdev-bumpspec",
+            b"git status",
+            "git config",
+            "git config",
+            "git commit",
+            filename.encode(),
+            b"",
+            b"",
+            b"Wrote: foobar.srpm",
+        ]
+
+        self.builder.git_mirror = mock.Mock()
+
+        # Prepare package
+        package = Package(name="test", version="1.0", distro="Fedora")
+        opts = {"bz_id": 100}
+
+        output = self.builder.build(package, opts)
+
+        assert output["build_id"] == 1000
+
+        self.builder.git_mirror.clone.assert_called_once_with(
+            "test", self.builder.git_url, tmpdir
+        )
+        assert (
+            mock.call(["git", "clone", self.builder.git_url, tmpdir], stderr=mock.ANY)
+            not in mock_check_output.mock_calls
+        )
+
+    @mock.patch("hotness.builders.koji.koji")
+    @mock.patch("hotness.builders.koji.TemporaryDirectory")
+    def test_build_git_mirror_error(self, mock_temp_dir, mock_koji, tmpdir):
+        """
+        Assert that BuilderException is raised when clone from mirror fails.
+        """
+        mock_temp_dir.return_value.__enter__.return_value = tmpdir
+
+        self.builder.git_mirror = mock.Mock()
+        self.builder.git_mirror.clone.side_effect = CalledProcessError(
+            128, ["git", "fetch"], output=b"fatal: unable to access"
+        )
+
+        # Prepare package
+        package = Package(name="test", version="1.0", distro="Fedora")
+        opts = {"bz_id": 100}
+
+        with pytest.raises(BuilderException) as exc:
+            self.builder.build(package, opts)
+
+        assert exc.value.std_out == "fatal: unable to access"
+
     @mock.patch("hotness.builders.koji.sp.check_output")
     @mock.patch("hotness.builders.koji.koji")
     @mock.patch("hotness.builders.koji.TemporaryDirectory")
@@ -1198,3 +1277,505 @@ class TestKojiBuild:
                 ),
             ]
         )
+
+
+class TestKojiSourceCache:
+    """
+    Test class for source cache usage in `hotness.builders.Koji._dist_git_sources`
+    and `hotness.builders.Koji._spec_sources` methods.
+    """
+
+    def setup_method(self):
+        """
+        Create builder instance with source cache for tests.
+        """
+        kerberos_args = {
+            "krb_principal": "",
+            "krb_keytab": "",
+            "krb_ccache": "",
+            "krb_proxyuser": "",
+            "krb_sessionopts": {},
+        }
+
+        self.builder = Koji(
+            "https://example.com/koji",
+            "https://example.com/kojihub",
+            kerberos_args,
+            "https://src.example.com/",
+            ("Emperor of Mankind", "emperor@ter.ra"),
+            {},
+            30,
+            "rawhide",
+            source_cache=mock.Mock(),
+        )
+
+    def _write_sources_file(self, path, files):
+        """
+        Write dist-git sources file with dummy checksums.
+        """
+        with open(os.path.join(path, "sources"), "w") as f:
+            for name, checksum in files.items():
+                f.write("SHA512 ({}) = {}\n".format(name, checksum))
+
+    @mock.patch("hotness.builders.koji.sp.check_output")
+    def test_dist_git_sources_all_cached(self, mock_check_output, tmpdir):
+        """
+        Assert that fedpkg is not called when all sources are in cache.
+        """
+        self._write_sources_file(tmpdir, {"foo.tar.gz": "a" * 128, "bar": "b" * 128})
+        self.builder.source_cache.get.return_value = True
+
+        files = self.builder._dist_git_sources(tmpdir)
+
+        assert files == [
+            os.path.join(tmpdir, "foo.tar.gz"),
+            os.path.join(tmpdir, "bar"),
+        ]
+        self.builder.source_cache.get.assert_has_calls(
+            [
+                mock.call(os.path.join(tmpdir, "foo.tar.gz"), checksum="a" * 128),
+                mock.call(os.path.join(tmpdir, "bar"), checksum="b" * 128),
+            ]
+        )
+        mock_check_output.assert_not_called()
+
+    @mock.patch("hotness.builders.koji.sp.check_output")
+    def test_dist_git_sources_partially_cached(self, mock_check_output, tmpdir):
+        """
+        Assert that missing sources are downloaded and stored in cache.
+        """
+        self._write_sources_file(tmpdir, {"foo.tar.gz": "a" * 128, "bar": "b" * 128})
+        self.builder.source_cache.get.side_effect = [True, False]
+        mock_check_output.return_value = b"Downloading bar from https://example.com"
+
+        files = self.builder._dist_git_sources(tmpdir)
+
+        assert files == [
+            os.path.join(tmpdir, "foo.tar.gz"),
+            os.path.join(tmpdir, "bar"),
+        ]
+        mock_check_output.assert_called_once_with(
+            ["fedpkg", "--user", "hotness", "sources"], cwd=tmpdir
+        )
+        self.builder.source_cache.put.assert_called_once_with(
+            os.path.join(tmpdir, "bar"), checksum="b" * 128, url=""
+        )
+
+    @mock.patch("hotness.builders.koji.sp.check_output")
+    def test_dist_git_sources_no_sources_file(self, mock_check_output, tmpdir):
+        """
+        Assert that sources are downloaded when there is no sources file.
+        """
+        mock_check_output.return_value = b"Downloading bar from https://example.com"
+
+        files = self.builder._dist_git_sources(tmpdir)
+
+        assert files == [os.path.join(tmpdir, "bar")]
+        self.builder.source_cache.get.assert_not_called()
+        self.builder.source_cache.put.assert_called_once_with(
+            os.path.join(tmpdir, "bar"), checksum="", url=""
+        )
+
+    @mock.patch("hotness.builders.koji.sp.check_output")
+    def test_dist_git_sources_cache_error(self, mock_check_output, tmpdir):
+        """
+        Assert that error when storing source in cache doesn't fail the build.
+        """
+        mock_check_output.return_value = b"Downloading bar from https://example.com"
+        self.builder.source_cache.put.side_effect = OSError("No space left on device")
+
+        files = self.builder._dist_git_sources(tmpdir)
+
+        assert files == [os.path.join(tmpdir, "bar")]
+
+    @mock.patch("hotness.builders.koji.sp.check_output")
+    def test_spec_sources_cached(self, mock_check_output, tmpdir):
+        """
+        Assert that sources are retrieved from cache by URL and the downloaded
+        ones are stored in cache.
+        """
+        specfile = os.path.join(tmpdir, "test.spec")
+        mock_check_output.side_effect = [
+            (
+                b"Source0: https://example.com/foo-1.0.tar.gz\n"
+                b"Source1: https://example.com/archive/v1.0.tar.gz#/bar-1.0.tar.gz\n"
+                b"Source2: test.service\n"
+                b"Patch0: test.patch\n"
+            ),
+            b"Downloaded: bar-1.0.tar.gz\n",
+        ]
+        self.builder.source_cache.get.side_effect = [True, False]
+        with open(os.path.join(tmpdir, "bar-1.0.tar.gz"), "w") as f:
+            f.write("Adeptus Astartes")
+        checksums = {}
+
+        files = self.builder._spec_sources(specfile, tmpdir, checksums)
+
+        foo = os.path.realpath(os.path.join(tmpdir, "foo-1.0.tar.gz"))
+        bar = os.path.realpath(os.path.join(tmpdir, "bar-1.0.tar.gz"))
+        assert files == [foo, bar]
+        assert checksums == {bar: hashlib.sha512(b"Adeptus Astartes").hexdigest()}
+        mock_check_output.assert_has_calls(
+            [
+                mock.call(["spectool", "-l", specfile], cwd=tmpdir, stderr=mock.ANY),
+                mock.call(["spectool", "-g", specfile], cwd=tmpdir),
+            ]
+        )
+        self.builder.source_cache.get.assert_has_calls(
+            [
+                mock.call(foo, url="https://example.com/foo-1.0.tar.gz"),
+                mock.call(
+                    bar, url="https://example.com/archive/v1.0.tar.gz#/bar-1.0.tar.gz"
+                ),
+            ]
+        )
+        self.builder.source_cache.put.assert_called_once_with(
+            bar,
+            checksum=checksums[bar],
+            url="https://example.com/archive/v1.0.tar.gz#/bar-1.0.tar.gz",
+        )
+
+    @mock.patch("hotness.builders.koji.sp.check_output")
+    def test_spec_sources_list_error(self, mock_check_output, tmpdir):
+        """
+        Assert that sources are downloaded when listing them fails.
+        """
+        specfile = os.path.join(tmpdir, "test.spec")
+        mock_check_output.side_effect = [
+            CalledProcessError(1, ["spectool", "-l", specfile]),
+            b"Downloaded: foo-1.0.tar.gz\n",
+        ]
+
+        files = self.builder._spec_sources(specfile, tmpdir)
+
+        assert files == [os.path.realpath(os.path.join(tmpdir, "foo-1.0.tar.gz"))]
+        self.builder.source_cache.get.assert_not_called()
+        self.builder.source_cache.put.assert_not_called()
+
+
+class TestKojiChecksums:
+    """
+    Test class for `hotness.builders.Koji._checksum_files` method and reuse
+    of checksums in `hotness.builders.Koji._compare_sources`.
+    """
+
+    def setup_method(self):
+        """
+        Create builder instance for tests.
+        """
+        kerberos_args = {
+            "krb_principal": "",
+            "krb_keytab": "",
+            "krb_ccache": "",
+            "krb_proxyuser": "",
+            "krb_sessionopts": {},
+        }
+
+        self.builder = Koji(
+            "https://example.com/koji",
+            "https://example.com/kojihub",
+            kerberos_args,
+            "https://src.example.com/",
+            ("Emperor of Mankind", "emperor@ter.ra"),
+            {},
+            30,
+            "rawhide",
+        )
+
+    def test_checksum_files(self, tmpdir):
+        """
+        Assert that checksums of all files are computed.
+        """
+        paths = []
+        for name in ("foo", "bar", "baz"):
+            path = os.path.join(tmpdir, name)
+            with open(path, "w") as f:
+                f.write(name)
+            paths.append(path)
+
+        checksums = self.builder._checksum_files(paths)
+
+        assert checksums == {
+            path: hashlib.sha512(os.path.basename(path).encode()).hexdigest()
+            for path in paths
+        }
+
+    @mock.patch("hotness.builders.koji.sha512sum")
+    def test_checksum_files_known(self, mock_sha512sum):
+        """
+        Assert that files with known checksums and duplicate paths are not
+        hashed again.
+        """
+        mock_sha512sum.return_value = "b" * 128
+        checksums = {"/tmp/foo": "a" * 128}
+
+        result = self.builder._checksum_files(
+            ["/tmp/foo", "/tmp/bar", "/tmp/bar"], checksums
+        )
+
+        assert result is checksums
+        assert result == {"/tmp/foo": "a" * 128, "/tmp/bar": "b" * 128}
+        mock_sha512sum.assert_called_once_with("/tmp/bar")
+
+    @mock.patch("hotness.builders.koji.sha512sum")
+    def test_compare_sources_known_checksums(self, mock_sha512sum):
+        """
+        Assert that known checksums are used for comparing sources.
+        """
+        checksums = {"/tmp/old": "a" * 128, "/tmp/new": "a" * 128}
+
+        message = self.builder._compare_sources(["/tmp/old"], ["/tmp/new"], checksums)
+
+        assert "Old: ['old'] -> New: ['new'] ({})".format("a" * 128) in message
+        mock_sha512sum.assert_not_called()
+
+    @mock.patch("hotness.builders.koji.sp.check_output")
+    def test_dist_git_sources_checksums(self, mock_check_output, tmpdir):
+        """
+        Assert that checksums from the sources file are stored.
+        """
+        with open(os.path.join(tmpdir, "sources"), "w") as f:
+            f.write("SHA512 (foo.tar.gz) = {}\n".format("a" * 128))
+            f.write("d41d8cd98f00b204e9800998ecf8427e  old-format.tar.gz\n")
+        mock_check_output.return_value = b"Downloading foo.tar.gz from https://x"
+        checksums = {}
+
+        files = self.builder._dist_git_sources(tmpdir, checksums)
+
+        assert files == [os.path.join(tmpdir, "foo.tar.gz")]
+        assert checksums == {os.path.join(tmpdir, "foo.tar.gz"): "a" * 128}
+
+
+class TestKojiChunkedUpload:
+    """
+    Test class for `hotness.builders.Koji._chunked_upload` method.
+    """
+
+    def setup_method(self):
+        """
+        Create builder instance with chunked upload for tests.
+        """
+        kerberos_args = {
+            "krb_principal": "",
+            "krb_keytab": "",
+            "krb_ccache": "",
+            "krb_proxyuser": "",
+            "krb_sessionopts": {},
+        }
+
+        self.builder = Koji(
+            "https://example.com/koji",
+            "https://example.com/kojihub",
+            kerberos_args,
+            "https://src.example.com/",
+            ("Emperor of Mankind", "emperor@ter.ra"),
+            {},
+            30,
+            "rawhide",
+            upload_chunk_size=4,
+            upload_retries=3,
+        )
+        self.session = mock.Mock()
+        self.session.rawUpload.side_effect = self._raw_upload
+        self.session.checkUpload.side_effect = self._check_upload
+        self.uploaded = b""
+
+    def _raw_upload(self, chunk, offset, path, name, overwrite=False):
+        """
+        Fake Koji rawUpload writing the chunk at offset.
+        """
+        self.uploaded = self.uploaded[:offset] + chunk
+        return {"size": len(chunk), "hexdigest": "%08x" % zlib.adler32(chunk)}
+
+    def _check_upload(self, path, name, verify=None):
+        """
+        Fake Koji checkUpload returning size and checksum of uploaded file.
+        """
+        return {
+            "size": str(len(self.uploaded)),
+            "hexdigest": "%08x" % zlib.adler32(self.uploaded),
+        }
+
+    def _create_srpm(self, tmpdir, content):
+        """
+        Create fake SRPM file.
+        """
+        source = os.path.join(tmpdir, "foobar.srpm")
+        with open(source, "wb") as f:
+            f.write(content)
+        return source
+
+    @mock.patch("hotness.builders.koji.time.sleep")
+    def test_chunked_upload(self, mock_sleep, tmpdir):
+        """
+        Assert that file is uploaded in chunks and verified.
+        """
+        source = self._create_srpm(tmpdir, b"Adeptus Mechanicus")
+
+        self.builder._chunked_upload(self.session, source, "cli-build/test")
+
+        assert self.uploaded == b"Adeptus Mechanicus"
+        assert [call.args[1] for call in self.session.rawUpload.call_args_list] == [
+            0,
+            4,
+            8,
+            12,
+            16,
+        ]
+        self.session.rawUpload.assert_any_call(
+            b"Adep", 0, "cli-build/test", "foobar.srpm", overwrite=True
+        )
+        self.session.checkUpload.assert_called_once_with(
+            "cli-build/test", "foobar.srpm", verify="adler32"
+        )
+        mock_sleep.assert_not_called()
+
+    @mock.patch("hotness.builders.koji.time.sleep")
+    def test_chunked_upload_empty_file(self, mock_sleep, tmpdir):
+        """
+        Assert that empty file is uploaded.
+        """
+        source = self._create_srpm(tmpdir, b"")
+
+        self.builder._chunked_upload(self.session, source, "cli-build/test")
+
+        self.session.rawUpload.assert_called_once_with(
+            b"", 0, "cli-build/test", "foobar.srpm", overwrite=True
+        )
+        self.session.checkUpload.assert_called_once()
+
+    @mock.patch("hotness.builders.koji.time.sleep")
+    def test_chunked_upload_resume(self, mock_sleep, tmpdir):
+        """
+        Assert that only the failed chunk is uploaded again after backoff.
+        """
+        source = self._create_srpm(tmpdir, b"Adeptus Astartes")
+        results = [
+            None,
+            GenericError("Connection reset"),
+            {"size": 1, "hexdigest": "00000000"},
+            None,
+            None,
+            None,
+        ]
+
+        def raw_upload(chunk, offset, path, name, overwrite=False):
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            output = self._raw_upload(chunk, offset, path, name, overwrite)
+            return result or output
+
+        self.session.rawUpload.side_effect = raw_upload
+
+        self.builder._chunked_upload(self.session, source, "cli-build/test")
+
+        assert self.uploaded == b"Adeptus Astartes"
+        assert [call.args[1] for call in self.session.rawUpload.call_args_list] == [
+            0,
+            4,
+            4,
+            4,
+            8,
+            12,
+        ]
+        mock_sleep.assert_has_calls([mock.call(1), mock.call(2)])
+
+    @mock.patch("hotness.builders.koji.time.sleep")
+    def test_chunked_upload_retries_exhausted(self, mock_sleep, tmpdir):
+        """
+        Assert that BuilderException is raised when chunk can't be uploaded.
+        """
+        source = self._create_srpm(tmpdir, b"Adeptus Mechanicus")
+        self.session.rawUpload.side_effect = GenericError("Connection reset")
+
+        with pytest.raises(BuilderException) as exc:
+            self.builder._chunked_upload(self.session, source, "cli-build/test")
+
+        assert exc.value.message == "Couldn't upload source {} to koji.".format(source)
+        assert self.session.rawUpload.call_count == 4
+        mock_sleep.assert_has_calls([mock.call(1), mock.call(2), mock.call(4)])
+        self.session.checkUpload.assert_not_called()
+
+    @mock.patch("hotness.builders.koji.time.sleep")
+    def test_chunked_upload_auth_error(self, mock_sleep, tmpdir):
+        """
+        Assert that authentication error is not retried.
+        """
+        source = self._create_srpm(tmpdir, b"Adeptus Mechanicus")
+        self.session.rawUpload.side_effect = AuthExpired("Session expired")
+
+        with pytest.raises(AuthExpired):
+            self.builder._chunked_upload(self.session, source, "cli-build/test")
+
+        self.session.rawUpload.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "check_result",
+        [None, {"size": "1", "hexdigest": "00000000"}],
+    )
+    def test_chunked_upload_verification_failed(self, tmpdir, check_result):
+        """
+        Assert that BuilderException is raised when uploaded file doesn't match.
+        """
+        source = self._create_srpm(tmpdir, b"Adeptus Mechanicus")
+        self.session.checkUpload.side_effect = None
+        self.session.checkUpload.return_value = check_result
+
+        with pytest.raises(BuilderException) as exc:
+            self.builder._chunked_upload(self.session, source, "cli-build/test")
+
+        assert exc.value.message == (
+            "Uploaded source {} doesn't match the local file.".format(source)
+        )
+
+    def test_scratch_build_chunked_upload(self, tmpdir):
+        """
+        Assert that scratch build uses chunked upload when enabled.
+        """
+        source = self._create_srpm(tmpdir, b"Adeptus Mechanicus")
+        self.session.build.return_value = 1000
+
+        task_id = self.builder._scratch_build(self.session, "test", source)
+
+        assert task_id == 1000
+        assert self.uploaded == b"Adeptus Mechanicus"
+        self.session.uploadWrapper.assert_not_called()
+        remote = self.session.build.call_args.args[0]
+        assert remote.endswith("/foobar.srpm")
+
+    def test_scratch_build_upload_throughput(self, tmpdir):
+        """
+        Assert that throughput of upload reported by Koji is observed.
+        """
+        source = self._create_srpm(tmpdir, b"Adeptus Mechanicus")
+        self.builder.upload_chunk_size = 0
+        self.session.build.return_value = 1000
+
+        def upload_wrapper(source, serverdir, callback):
+            callback(0, 1024, 0, 0, 0)
+            callback(1024, 1024, 1024, 2.0, 2.0)
+
+        self.session.uploadWrapper.side_effect = upload_wrapper
+        name = "hotness_koji_upload_throughput_bytes_per_second"
+        count = REGISTRY.get_sample_value(name + "_count") or 0
+        total = REGISTRY.get_sample_value(name + "_sum") or 0
+
+        self.builder._scratch_build(self.session, "test", source)
+
+        assert REGISTRY.get_sample_value(name + "_count") == count + 1
+        assert REGISTRY.get_sample_value(name + "_sum") == total + 512
+
+    def test_scratch_build_chunked_upload_throughput(self, tmpdir):
+        """
+        Assert that throughput of chunked upload is observed.
+        """
+        source = self._create_srpm(tmpdir, b"Adeptus Mechanicus")
+        self.session.build.return_value = 1000
+        name = "hotness_koji_upload_throughput_bytes_per_second_count"
+        count = REGISTRY.get_sample_value(name) or 0
+
+        self.builder._scratch_build(self.session, "test", source)
+
+        assert REGISTRY.get_sample_value(name) == count + 1
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import threading
+
+import pytest
+from unittest import mock
+
+from koji import AuthExpired, GenericError
+
+from hotness.builders import KojiSessionPool
+
+
+class TestKojiSessionPoolInit:
+    """
+    Test class for `hotness.builders.KojiSessionPool.__init__` method.
+    """
+
+    def test_init(self):
+        """
+        Assert that KojiSessionPool object is initialized correctly.
+        """
+        factory = mock.Mock()
+
+        pool = KojiSessionPool(factory, size=2, check_interval=30)
+
+        assert pool.factory == factory
+        assert pool.size == 2
+        assert pool.check_interval == 30
+        factory.assert_not_called()
+
+
+class TestKojiSessionPoolSession:
+    """
+    Test class for `hotness.builders.KojiSessionPool.session` method.
+    """
+
+    def test_session_reused(self):
+        """
+        Assert that session is created only once and reused.
+        """
+        factory = mock.Mock()
+        pool = KojiSessionPool(factory)
+
+        with pool.session() as session:
+            assert session == factory.return_value
+
+        with pool.session() as session:
+            assert session == factory.return_value
+
+        factory.assert_called_once_with()
+        session.getLoggedInUser.assert_not_called()
+
+    def test_session_authentication_failed(self):
+        """
+        Assert that None is returned when authentication fails and nothing
+        is put back to pool.
+        """
+        factory = mock.Mock(return_value=None)
+        pool = KojiSessionPool(factory)
+
+        with pool.session() as session:
+            assert session is None
+
+        with pool.session() as session:
+            assert session is None
+
+        assert factory.call_count == 2
+
+    @mock.patch("hotness.builders.koji_session_pool.time")
+    def test_session_idle_valid(self, mock_time):
+        """
+        Assert that session idle for longer than check interval is checked
+        and reused when still logged in.
+        """
+        mock_time.monotonic.side_effect = [0, 100, 100]
+        factory = mock.Mock()
+        factory.return_value.getLoggedInUser.return_value = {"name": "hotness"}
+        pool = KojiSessionPool(factory, check_interval=60)
+
+        with pool.session():
+            pass
+
+        with pool.session() as session:
+            assert session == factory.return_value
+
+        factory.assert_called_once_with()
+        session.getLoggedInUser.assert_called_once_with()
+
+    @pytest.mark.parametrize(
+        "logged_in_user",
+        [None, AuthExpired("Session expired")],
+    )
+    @mock.patch("hotness.builders.koji_session_pool.time")
+    def test_session_idle_expired(self, mock_time, logged_in_user):
+        """
+        Assert that expired session is replaced by a new one.
+        """
+        mock_time.monotonic.side_effect = [0, 100, 100]
+        expired_session = mock.Mock()
+        expired_session.getLoggedInUser.side_effect = [logged_in_user]
+        new_session = mock.Mock()
+        factory = mock.Mock(side_effect=[expired_session, new_session])
+        pool = KojiSessionPool(factory, check_interval=60)
+
+        with pool.session():
+            pass
+
+        with pool.session() as session:
+            assert session == new_session
+
+        assert factory.call_count == 2
+
+    def test_session_auth_error(self):
+        """
+        Assert that session is dropped after authentication error.
+        """
+        first_session = mock.Mock()
+        second_session = mock.Mock()
+        factory = mock.Mock(side_effect=[first_session, second_session])
+        pool = KojiSessionPool(factory)
+
+        with pytest.raises(AuthExpired):
+            with pool.session():
+                raise AuthExpired("Session expired")
+
+        with pool.session() as session:
+            assert session == second_session
+
+    def test_session_other_error(self):
+        """
+        Assert that session is reused after error not related to authentication.
+        """
+        factory = mock.Mock()
+        pool = KojiSessionPool(factory)
+
+        with pytest.raises(GenericError):
+            with pool.session():
+                raise GenericError("Upload failed")
+
+        with pool.session() as session:
+            assert session == factory.return_value
+
+        factory.assert_called_once_with()
+
+    def test_session_concurrent(self):
+        """
+        Assert that concurrent users get different sessions and the number
+        of sessions is limited by pool size.
+        """
+        sessions = [mock.Mock(), mock.Mock()]
+        factory = mock.Mock(side_effect=sessions)
+        pool = KojiSessionPool(factory, size=2)
+
+        used = []
+        barrier = threading.Barrier(2, timeout=5)
+
+        def build():
+            with pool.session() as session:
+                used.append(session)
+                barrier.wait()
+
+        threads = [threading.Thread(target=build) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert sorted(used, key=id) == sorted(sessions, key=id)
+
+        # Third user waits until a session is free
+        release = threading.Event()
+        held = threading.Barrier(3, timeout=5)
+
+        def hold():
+            with pool.session():
+                held.wait()
+                release.wait(5)
+
+        holders = [threading.Thread(target=hold) for _ in range(2)]
+        for holder in holders:
+            holder.start()
+        held.wait()
+
+        acquired = threading.Event()
+
+        def wait_for_session():
+            with pool.session():
+                acquired.set()
+
+        waiter = threading.Thread(target=wait_for_session)
+        waiter.start()
+        assert not acquired.wait(0.1)
+
+        release.set()
+        waiter.join(5)
+        for holder in holders:
+            holder.join(5)
+
+        assert acquired.is_set()
+        assert factory.call_count == 2
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import hashlib
+import os
+from unittest import mock
+
+from hotness.builders import SourceCache
+from hotness.builders.source_cache import sha512sum
+
+
+def create_file(path: str, content: bytes) -> str:
+    """
+    Create file with given content and return its SHA512 checksum.
+    """
+    with open(path, "wb") as f:
+        f.write(content)
+    return hashlib.sha512(content).hexdigest()
+
+
+class TestSourceCacheInit:
+    """
+    Test class for `hotness.builders.SourceCache.__init__` method.
+    """
+
+    def test_init(self, tmpdir):
+        """
+        Assert that SourceCache object is initialized correctly.
+        """
+        cache_dir = os.path.join(tmpdir, "sources")
+
+        source_cache = SourceCache(cache_dir, max_size=100)
+
+        assert source_cache.cache_dir == cache_dir
+        assert source_cache.max_size == 100
+        assert source_cache.hits == 0
+        assert source_cache.misses == 0
+        assert os.path.isdir(os.path.join(cache_dir, "objects"))
+        assert os.path.isdir(os.path.join(cache_dir, "urls"))
+
+
+class TestSourceCacheGetPut:
+    """
+    Test class for `hotness.builders.SourceCache.get` and
+    `hotness.builders.SourceCache.put` methods.
+    """
+
+    def test_put_get_checksum(self, tmpdir):
+        """
+        Assert that file stored in cache is retrieved by checksum.
+        """
+        source_cache = SourceCache(os.path.join(tmpdir, "cache"))
+        source = os.path.join(tmpdir, "source.tar.gz")
+        checksum = create_file(source, b"Adeptus Mechanicus")
+
+        assert source_cache.put(source) == checksum
+
+        target = os.path.join(tmpdir, "target.tar.gz")
+        assert source_cache.get(target, checksum=checksum) is True
+
+        with open(target, "rb") as f:
+            assert f.read() == b"Adeptus Mechanicus"
+        assert source_cache.stats() == {"hits": 1, "misses": 0, "hit_rate": 1.0}
+
+    def test_put_get_url(self, tmpdir):
+        """
+        Assert that file stored in cache is retrieved by URL.
+        """
+        source_cache = SourceCache(os.path.join(tmpdir, "cache"))
+        source = os.path.join(tmpdir, "source.tar.gz")
+        create_file(source, b"Adeptus Mechanicus")
+        url = "https://example.com/source.tar.gz"
+
+        source_cache.put(source, url=url)
+
+        target = os.path.join(tmpdir, "target.tar.gz")
+        assert source_cache.get(target, url=url) is True
+
+        with open(target, "rb") as f:
+            assert f.read() == b"Adeptus Mechanicus"
+
+    def test_put_invalid_checksum(self, tmpdir):
+        """
+        Assert that checksum is computed when the provided one is not valid.
+        """
+        source_cache = SourceCache(os.path.join(tmpdir, "cache"))
+        source = os.path.join(tmpdir, "source.tar.gz")
+        checksum = create_file(source, b"Adeptus Mechanicus")
+
+        assert source_cache.put(source, checksum="../../etc/passwd") == checksum
+
+    def test_get_miss(self, tmpdir):
+        """
+        Assert that missing file is reported as cache miss.
+        """
+        source_cache = SourceCache(os.path.join(tmpdir, "cache"))
+        target = os.path.join(tmpdir, "target.tar.gz")
+
+        assert source_cache.get(target, checksum="a" * 128) is False
+        assert source_cache.get(target, url="https://example.com/foo") is False
+        assert source_cache.get(target, checksum="not a checksum") is False
+
+        assert not os.path.exists(target)
+        assert source_cache.stats() == {"hits": 0, "misses": 3, "hit_rate": 0.0}
+
+    def test_get_overwrites_target(self, tmpdir):
+        """
+        Assert that existing target file is replaced by cached file.
+        """
+        source_cache = SourceCache(os.path.join(tmpdir, "cache"))
+        source = os.path.join(tmpdir, "source.tar.gz")
+        checksum = create_file(source, b"Adeptus Mechanicus")
+        source_cache.put(source)
+
+        target = os.path.join(tmpdir, "target.tar.gz")
+        create_file(target, b"Heresy")
+
+        assert source_cache.get(target, checksum=checksum) is True
+
+        with open(target, "rb") as f:
+            assert f.read() == b"Adeptus Mechanicus"
+
+    @mock.patch("hotness.builders.source_cache.os.link")
+    def test_get_copy(self, mock_link, tmpdir):
+        """
+        Assert that file is copied when it can't be hardlinked.
+        """
+        mock_link.side_effect = OSError("Invalid cross-device link")
+        source_cache = SourceCache(os.path.join(tmpdir, "cache"))
+        source = os.path.join(tmpdir, "source.tar.gz")
+        checksum = create_file(source, b"Adeptus Mechanicus")
+        source_cache.put(source)
+
+        target = os.path.join(tmpdir, "target.tar.gz")
+        assert source_cache.get(target, checksum=checksum) is True
+
+        with open(target, "rb") as f:
+            assert f.read() == b"Adeptus Mechanicus"
+
+
+class TestSourceCacheEvict:
+    """
+    Test class for `hotness.builders.SourceCache.evict` method.
+    """
+
+    def test_evict(self, tmpdir):
+        """
+        Assert that least recently used files are evicted until the size
+        is below the limit.
+        """
+        source_cache = SourceCache(os.path.join(tmpdir, "cache"))
+        paths = []
+        for mtime, content in ((1000, b"a" * 10), (3000, b"b" * 10), (2000, b"c" * 10)):
+            source = os.path.join(tmpdir, "source")
+            checksum = create_file(source, content)
+            source_cache.put(source)
+            os.remove(source)
+            path = os.path.join(tmpdir, "cache", "objects", checksum)
+            os.utime(path, (mtime, mtime))
+            paths.append(path)
+
+        source_cache.max_size = 25
+        removed = source_cache.evict()
+
+        assert removed == [paths[0]]
+        assert os.path.exists(paths[1])
+        assert os.path.exists(paths[2])
+
+    def test_evict_on_put(self, tmpdir):
+        """
+        Assert that old files are evicted when the new file is stored,
+        but not the new file.
+        """
+        source_cache = SourceCache(os.path.join(tmpdir, "cache"), max_size=15)
+        old = os.path.join(tmpdir, "old")
+        old_checksum = create_file(old, b"a" * 10)
+        source_cache.put(old)
+        old_path = os.path.join(tmpdir, "cache", "objects", old_checksum)
+        os.utime(old_path, (1000, 1000))
+
+        new = os.path.join(tmpdir, "new")
+        new_checksum = create_file(new, b"b" * 10)
+        os.utime(new, (500, 500))
+        source_cache.put(new)
+
+        assert not os.path.exists(old_path)
+        assert os.path.exists(os.path.join(tmpdir, "cache", "objects", new_checksum))
+
+    def test_evict_unlimited(self, tmpdir):
+        """
+        Assert that nothing is evicted when the size isn't limited.
+        """
+        source_cache = SourceCache(os.path.join(tmpdir, "cache"))
+        source = os.path.join(tmpdir, "source")
+        create_file(source, b"a" * 10)
+        source_cache.put(source)
+
+        assert source_cache.evict() == []
+
+
+class TestSha512sum:
+    """
+    Test class for `hotness.builders.source_cache.sha512sum` function.
+    """
+
+    @mock.patch("hotness.builders.source_cache.CHUNK_SIZE", 3)
+    def test_sha512sum(self, tmpdir):
+        """
+        Assert that checksum is computed correctly from multiple chunks.
+        """
+        source = os.path.join(tmpdir, "source")
+        checksum = create_file(source, b"The Emperor protects")
+
+        assert sha512sum(source) == checksum
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import pytest
+
+from hotness.common import BloomFilter
+
+
+class TestBloomFilterInit:
+    """
+    Test class for `hotness.common.BloomFilter.__init__` method.
+    """
+
+    def test_init(self):
+        """
+        Assert that size of the filter is computed from capacity and error rate.
+        """
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+
+        assert bloom_filter.capacity == 1000
+        assert bloom_filter.error_rate == 0.01
+        assert bloom_filter.num_bits == 9586
+        assert bloom_filter.num_hashes == 7
+        assert bloom_filter.size == 1199
+        assert len(bloom_filter) == 0
+
+    @pytest.mark.parametrize(
+        "capacity, error_rate",
+        [(0, 0.01), (100, 0), (100, 1)],
+    )
+    def test_init_invalid(self, capacity, error_rate):
+        """
+        Assert that invalid parameters are rejected.
+        """
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=capacity, error_rate=error_rate)
+
+
+class TestBloomFilterContains:
+    """
+    Test class for `hotness.common.BloomFilter.add` and
+    `hotness.common.BloomFilter.__contains__` methods.
+    """
+
+    def test_contains(self):
+        """
+        Assert that every added item is found.
+        """
+        bloom_filter = BloomFilter(capacity=1000)
+
+        for task_id in range(1000):
+            bloom_filter.add(str(task_id))
+
+        assert all(str(task_id) in bloom_filter for task_id in range(1000))
+        assert len(bloom_filter) == 1000
+
+    def test_false_positive_rate(self):
+        """
+        Assert that false positive rate is close to the expected error rate.
+        """
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+        for task_id in range(1000):
+            bloom_filter.add(str(task_id))
+
+        false_positives = sum(
+            str(task_id) in bloom_filter for task_id in range(1000, 11000)
+        )
+
+        assert false_positives < 200
+
+    def test_contains_not_string(self):
+        """
+        Assert that item which is not string is never found.
+        """
+        bloom_filter = BloomFilter(capacity=10)
+        bloom_filter.add("1000")
+
+        assert 1000 not in bloom_filter
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+from unittest import mock
+
+from hotness.common import Deduplicator
+from hotness.databases import Cache
+
+
+class TestDeduplicatorInit:
+    """
+    Test class for `hotness.common.Deduplicator.__init__` method.
+    """
+
+    def test_init(self):
+        """
+        Assert that Deduplicator object is initialized correctly.
+        """
+        database = mock.Mock()
+
+        deduplicator = Deduplicator(window=60, max_size=100, database=database)
+
+        assert deduplicator.window == 60
+        assert deduplicator.max_size == 100
+        assert deduplicator.database == database
+        assert deduplicator.stats() == {
+            "hits": {"memory": 0, "database": 0},
+            "misses": 0,
+        }
+
+
+class TestDeduplicatorClaim:
+    """
+    Test class for `hotness.common.Deduplicator.claim` and
+    `hotness.common.Deduplicator.release` methods.
+    """
+
+    def test_claim_memory(self):
+        """
+        Assert that claimed key is found in memory.
+        """
+        deduplicator = Deduplicator(window=60)
+
+        assert deduplicator.claim("key") is None
+        assert deduplicator.claim("key") == "memory"
+        assert deduplicator.claim("other") is None
+
+        assert deduplicator.stats() == {
+            "hits": {"memory": 1, "database": 0},
+            "misses": 2,
+        }
+
+    def test_release(self):
+        """
+        Assert that released key could be claimed again.
+        """
+        database = Cache(expiration_time=60)
+        deduplicator = Deduplicator(window=60, database=database)
+        deduplicator.claim("key")
+
+        deduplicator.release("key")
+
+        assert database.retrieve("key")["value"] == ""
+        assert deduplicator.claim("key") is None
+
+    @mock.patch("hotness.databases.cache.time")
+    def test_claim_expired(self, mock_time):
+        """
+        Assert that key is forgotten after the window.
+        """
+        mock_time.monotonic.return_value = 0
+        deduplicator = Deduplicator(window=60)
+        deduplicator.claim("key")
+
+        mock_time.monotonic.return_value = 30
+        assert deduplicator.claim("key") == "memory"
+        mock_time.monotonic.return_value = 61
+        assert deduplicator.claim("key") is None
+
+    def test_claim_lru(self):
+        """
+        Assert that least recently used key is evicted from memory.
+        """
+        deduplicator = Deduplicator(window=60, max_size=2)
+        deduplicator.claim("first")
+        deduplicator.claim("second")
+        deduplicator.claim("third")
+
+        assert deduplicator.claim("third") == "memory"
+        assert deduplicator.claim("first") is None
+
+    def test_claim_database(self):
+        """
+        Assert that key claimed by other instance is found in shared database.
+        """
+        database = Cache(expiration_time=60)
+        other = Deduplicator(window=60, database=database)
+        deduplicator = Deduplicator(window=60, database=database)
+
+        other.claim("key")
+
+        assert deduplicator.claim("key") == "database"
+        assert deduplicator.stats()["hits"] == {"memory": 0, "database": 1}
+        assert database.retrieve("key")["value"] == "1"
+
+        # The other instance failed to process the message
+        other.release("key")
+
+        assert deduplicator.claim("key") is None
+
+    def test_claim_database_failure(self):
+        """
+        Assert that key is treated as not claimed when database fails.
+        """
+        database = mock.Mock()
+        database.claim.side_effect = Exception("Database is gone!")
+        database.delete.side_effect = Exception("Database is gone!")
+        deduplicator = Deduplicator(window=60, database=database)
+
+        assert deduplicator.claim("key") is None
+        assert deduplicator.claim("key") == "memory"
+        deduplicator.release("key")
+        assert deduplicator.claim("key") is None
+
+        database.claim.assert_called_with("key", "1")
+        database.delete.assert_called_once_with("key")
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import urllib.request
+
+from prometheus_client import REGISTRY
+from unittest import mock
+
+from hotness.common import metrics
+from hotness.common.metrics import StatsCollector, register_stats, start_http_server
+
+
+class TestStatsCollector:
+    """
+    Test class for `hotness.common.metrics.StatsCollector` class.
+    """
+
+    def test_collect(self):
+        """
+        Assert that numeric statistics are exported as gauges.
+        """
+        collector = StatsCollector()
+        collector.register(
+            "cache",
+            lambda: {
+                "hits": 3,
+                "hit_rate": 0.75,
+                "checksum": "abc",
+                "enabled": True,
+                "by_source": {"memory": 1},
+            },
+        )
+
+        gauges = {gauge.name: gauge.samples[0].value for gauge in collector.collect()}
+
+        assert gauges == {"hotness_cache_hit_rate": 0.75, "hotness_cache_hits": 3}
+
+    def test_collect_replaced(self):
+        """
+        Assert that statistics registered again under the same name replace
+        the previous ones.
+        """
+        collector = StatsCollector()
+        collector.register("cache", lambda: {"hits": 1})
+        collector.register("cache", lambda: {"hits": 2})
+
+        gauges = list(collector.collect())
+
+        assert len(gauges) == 1
+        assert gauges[0].samples[0].value == 2
+
+    def test_collect_error(self, caplog):
+        """
+        Assert that component whose statistics fail is skipped.
+        """
+        collector = StatsCollector()
+        collector.register("broken", mock.Mock(side_effect=Exception("Heresy")))
+        collector.register("cache", lambda: {"hits": 1})
+
+        gauges = [gauge.name for gauge in collector.collect()]
+
+        assert gauges == ["hotness_cache_hits"]
+        assert "Couldn't read broken statistics" in caplog.text
+
+    @mock.patch.dict(metrics.STATS._sources)
+    def test_register_stats(self):
+        """
+        Assert that registered statistics are exposed by default registry.
+        """
+        register_stats("test_component", lambda: {"queue_depth": 4})
+
+        assert REGISTRY.get_sample_value("hotness_test_component_queue_depth") == 4
+
+
+class TestStartHttpServer:
+    """
+    Test class for `hotness.common.metrics.start_http_server` function.
+    """
+
+    @mock.patch.dict(metrics.STATS._sources)
+    def test_start_http_server(self):
+        """
+        Assert that metrics are served over HTTP.
+        """
+        register_stats("test_http", lambda: {"hits": 7})
+
+        server = start_http_server(port=0, host="127.0.0.1")
+        try:
+            url = "http://127.0.0.1:{}/metrics".format(server.server_address[1])
+            with urllib.request.urlopen(url, timeout=5) as response:  # nosec
+                content = response.read().decode()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert "hotness_test_http_hits 7.0" in content
+        assert "# TYPE hotness_messages_total counter" in content
+
+    @mock.patch("hotness.common.metrics.prometheus_client", None)
+    def test_start_http_server_not_installed(self, caplog):
+        """
+        Assert that nothing is served when prometheus-client is not installed.
+        """
+        assert start_http_server(port=0) is None
+        assert "prometheus-client is not installed" in caplog.text
+
+
+class TestNoopMetric:
+    """
+    Test class for `hotness.common.metrics._NoopMetric` class.
+    """
+
+    def test_noop(self):
+        """
+        Assert that no-op metric has the interface of Prometheus metrics.
+        """
+        metric = metrics._NoopMetric()
+
+        metric.labels(system="koji").inc()
+        metric.observe(1.0)
+        with metric.labels(system="koji").time():
+            pass
+
+        @metric.time()
+        def decorated():
+            return 1
+
+        assert decorated() == 1
@@ -15,7 +15,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+from unittest import mock
+
 from hotness.common import RPM
+from hotness.common.rpm import VERSION_KEY_CACHE_SIZE
 
 import pytest
 
@@ -53,3 +56,104 @@ class TestRPMCompare:
         Assert that compare works correctly for rpm.
         """
         assert RPM.compare(v1, v2) == result
+
+
+class TestRPMVersionKey:
+    """
+    Test class for `hotness.common.RPM.version_key` method.
+    """
+
+    @pytest.mark.parametrize(
+        "versions",
+        [
+            ["1.0.a", "1.0", "1.1"],
+            ["2.0.rc1", "2.0.pre1", "2.0.beta1", "2.0.alpha1"],
+            ["2.0.0.rc1", "2.0.0.rc", "2.0.0", "1.9"],
+            ["3.0.0rc1", "3.0.0", "3.0.0rc2", "3.0.0RC3"],
+        ],
+    )
+    def test_version_key_consistent_with_compare(self, versions):
+        """
+        Assert that comparing keys gives the same result as compare for every pair.
+        """
+        for v1 in versions:
+            for v2 in versions:
+                key1 = RPM.version_key(v1)
+                key2 = RPM.version_key(v2)
+                assert (key1 > key2) - (key1 < key2) == RPM.compare(v1, v2)
+
+    def test_version_key_cached(self):
+        """
+        Assert that version is parsed only once.
+        """
+        RPM.clear_cache()
+
+        RPM.version_key("1.2.3")
+        RPM.version_key("1.2.3")
+
+        stats = RPM.cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @mock.patch("hotness.common.rpm.RPM._split_rc", wraps=RPM._split_rc)
+    def test_compare_uses_cache(self, mock_split_rc):
+        """
+        Assert that versions compared repeatedly are parsed only once.
+        """
+        RPM.clear_cache()
+
+        for _ in range(10):
+            RPM.compare("1.0.rc1", "1.0")
+
+        assert mock_split_rc.call_count == 2
+
+    def test_version_key_cached_many(self):
+        """
+        Assert that many versions parsed once are returned from cache afterwards.
+        """
+        versions = ["1.{}.{}rc{}".format(i, i * 7, i % 3) for i in range(100)]
+        RPM.clear_cache()
+
+        for version in versions:
+            RPM.version_key(version)
+        for version in versions:
+            RPM.version_key(version)
+
+        info = RPM.version_key.cache_info()
+        assert info.misses == 100
+        assert info.hits == 100
+        assert info.currsize == 100
+
+
+class TestRPMCacheStats:
+    """
+    Test class for `hotness.common.RPM.cache_stats` method.
+    """
+
+    def test_cache_stats(self):
+        """
+        Assert that cache statistics are reported correctly.
+        """
+        RPM.clear_cache()
+
+        RPM.compare("1.0", "2.0")
+        RPM.compare("1.0", "3.0")
+
+        assert RPM.cache_stats() == {
+            "hits": 1,
+            "misses": 3,
+            "hit_rate": 0.25,
+            "size": 3,
+            "max_size": VERSION_KEY_CACHE_SIZE,
+        }
+
+    def test_cache_stats_empty(self):
+        """
+        Assert that hit rate is zero when the cache wasn't used.
+        """
+        RPM.clear_cache()
+
+        stats = RPM.cache_stats()
+
+        assert stats["hit_rate"] == 0.0
+        assert stats["size"] == 0
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import asyncio
+import concurrent.futures
+import contextvars
+
+from unittest import mock
+
+from hotness.common import tracing
+from hotness.domain import Package
+from hotness.requests import PackageRequest
+from hotness.use_cases import AsyncPackageCheckUseCase, PackageCheckUseCase
+
+
+class TestTracing:
+    """
+    Test class for `hotness.common.tracing` module.
+    """
+
+    def setup_method(self):
+        """
+        Prepare OpenTelemetry tracer mock.
+        """
+        self.mock_otel_trace = mock.Mock()
+        self.tracer = self.mock_otel_trace.get_tracer.return_value
+        self.current_span = mock.Mock()
+        self.tracer.start_as_current_span.return_value = mock.MagicMock(
+            __enter__=mock.Mock(return_value=self.current_span)
+        )
+
+    def teardown_method(self):
+        """
+        Disable tracing after every test.
+        """
+        tracing.disable()
+
+    def test_span_disabled(self):
+        """
+        Assert that span is no-op when tracing is disabled.
+        """
+        with mock.patch("hotness.common.tracing.otel_trace", self.mock_otel_trace):
+            with tracing.span("message", {"key": "value"}) as current:
+                current.set_attribute("key", "value")
+
+        assert not tracing.is_enabled()
+        self.tracer.start_as_current_span.assert_not_called()
+
+    def test_enable_not_installed(self):
+        """
+        Assert that tracing stays disabled when OpenTelemetry is not installed.
+        """
+        with mock.patch("hotness.common.tracing.otel_trace", None):
+            assert tracing.enable() is False
+
+        assert not tracing.is_enabled()
+
+    def test_span_enabled(self):
+        """
+        Assert that span is created by OpenTelemetry tracer when enabled.
+        """
+        with mock.patch("hotness.common.tracing.otel_trace", self.mock_otel_trace):
+            assert tracing.enable() is True
+
+        with tracing.span("message", {"key": "value"}) as current:
+            assert current == self.current_span
+
+        self.mock_otel_trace.get_tracer.assert_called_once_with("hotness")
+        self.tracer.start_as_current_span.assert_called_once_with(
+            "message", attributes={"key": "value"}
+        )
+
+    def test_use_case_span(self):
+        """
+        Assert that use case span is tagged with package, component
+        and response type.
+        """
+        with mock.patch("hotness.common.tracing.otel_trace", self.mock_otel_trace):
+            tracing.enable()
+        validator = mock.Mock()
+        validator.validate.return_value = {}
+        package = Package(name="test", version="1.0", distro="Fedora")
+
+        response = PackageCheckUseCase(validator).validate(PackageRequest(package))
+
+        assert response
+        self.tracer.start_as_current_span.assert_called_once_with(
+            "PackageCheckUseCase.validate",
+            attributes={
+                "hotness.use_case": "PackageCheckUseCase",
+                "hotness.validator": "Mock",
+                "hotness.package": "test",
+            },
+        )
+        self.current_span.set_attribute.assert_called_once_with(
+            "hotness.response.type", "Success"
+        )
+
+    def test_use_case_span_async(self):
+        """
+        Assert that use case span of coroutine is open until the coroutine
+        is finished.
+        """
+        with mock.patch("hotness.common.tracing.otel_trace", self.mock_otel_trace):
+            tracing.enable()
+        span_context = self.tracer.start_as_current_span.return_value
+
+        async def validate(package):
+            span_context.__exit__.assert_not_called()
+            return {}
+
+        validator = mock.Mock()
+        validator.validate = validate
+        package = Package(name="test", version="1.0", distro="Fedora")
+
+        response = asyncio.run(
+            AsyncPackageCheckUseCase(validator).validate(PackageRequest(package))
+        )
+
+        assert response
+        self.tracer.start_as_current_span.assert_called_once_with(
+            "AsyncPackageCheckUseCase.validate",
+            attributes={
+                "hotness.use_case": "AsyncPackageCheckUseCase",
+                "hotness.validator": "Mock",
+                "hotness.package": "test",
+            },
+        )
+        self.current_span.set_attribute.assert_called_once_with(
+            "hotness.response.type", "Success"
+        )
+        span_context.__exit__.assert_called_once()
+
+    def test_propagate(self):
+        """
+        Assert that context of caller is available in worker threads.
+        """
+        variable = contextvars.ContextVar("variable", default="")
+        variable.set("parent")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(tracing.propagate(variable.get)) for _ in range(4)
+            ]
+            unwrapped = executor.submit(variable.get)
+
+        assert [future.result() for future in futures] == ["parent"] * 4
+        assert unwrapped.result() == ""
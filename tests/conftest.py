@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+"""
+Options shared by all tests. Benchmarks in `tests/benchmarks` are marked
+by `hotness_bench` marker and skipped unless requested by the options.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """
+    Add command line options for benchmarks.
+    """
+    group = parser.getgroup("hotness-bench", "the-new-hotness benchmarks")
+    group.addoption(
+        "--hotness-bench",
+        action="store_true",
+        default=False,
+        help="Run benchmarks, they are skipped by default",
+    )
+    group.addoption(
+        "--hotness-bench-save",
+        metavar="PATH",
+        default="",
+        help="Run benchmarks and save results as JSON to the file",
+    )
+    group.addoption(
+        "--hotness-bench-compare",
+        metavar="PATH",
+        default="",
+        help="Run benchmarks and fail those slower than baseline results in the JSON file",
+    )
+    group.addoption(
+        "--hotness-bench-tolerance",
+        type=float,
+        default=1.0,
+        help="Allowed slowdown against baseline, 1.0 means twice as slow (default: 1.0)",
+    )
+
+
+def pytest_configure(config):
+    """
+    Register the marker of benchmarks.
+    """
+    config.addinivalue_line(
+        "markers", "hotness_bench: benchmark of hot path, skipped by default"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip benchmarks unless they were requested.
+    """
+    if (
+        config.getoption("--hotness-bench")
+        or config.getoption("--hotness-bench-save")
+        or config.getoption("--hotness-bench-compare")
+    ):
+        return
+
+    skip = pytest.mark.skip(reason="benchmarks run only with --hotness-bench")
+    for item in items:
+        if "hotness_bench" in item.keywords:
+            item.add_marker(skip)
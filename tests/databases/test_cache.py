@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+from unittest import mock
+
 from hotness.databases import Cache
 
 
@@ -30,6 +32,18 @@ class TestCacheInit:
         database = Cache()
 
         assert database.cache == {}
+        assert database.expiration_time == 0
+        assert database.max_size == 0
+
+    def test_init_limits(self):
+        """
+        Assert that database object is correctly initialized with limits.
+        """
+        database = Cache(expiration_time=60, max_size=10)
+
+        assert database.cache == {}
+        assert database.expiration_time == 60
+        assert database.max_size == 10
 
 
 class TestCacheInsert:
@@ -70,6 +84,32 @@ class TestCacheInsert:
         assert output == {"key": key, "value": value, "old_value": old_value}
         assert self.database.cache == {key: value}
 
+    def test_insert_max_size(self):
+        """
+        Assert that insert evicts least recently used key when the cache is full.
+        """
+        self.database.max_size = 2
+
+        self.database.insert("first", "1")
+        self.database.insert("second", "2")
+        # Use the first key, so the second one is least recently used
+        self.database.retrieve("first")
+        self.database.insert("third", "3")
+
+        assert self.database.cache == {"first": "1", "third": "3"}
+
+    @mock.patch("hotness.databases.cache.time")
+    def test_insert_expiration(self, mock_time):
+        """
+        Assert that insert sets expiration for key.
+        """
+        mock_time.monotonic.return_value = 100
+        self.database.expiration_time = 60
+
+        self.database.insert("key", "value")
+
+        assert self.database.expirations == {"key": 160}
+
 
 class TestCacheRetrieve:
     """
@@ -104,3 +144,75 @@ class TestCacheRetrieve:
         output = self.database.retrieve(key)
 
         assert output == {"key": key, "value": ""}
+
+    @mock.patch("hotness.databases.cache.time")
+    def test_retrieve_key_is_expired(self, mock_time):
+        """
+        Assert that retrieve returns empty value and removes the key, if key is expired.
+        """
+        self.database.expiration_time = 60
+        mock_time.monotonic.return_value = 100
+        self.database.insert("key", "value")
+
+        mock_time.monotonic.return_value = 159
+        assert self.database.retrieve("key") == {"key": "key", "value": "value"}
+
+        mock_time.monotonic.return_value = 160
+        assert self.database.retrieve("key") == {"key": "key", "value": ""}
+        assert self.database.cache == {}
+        assert self.database.expirations == {}
+
+
+class TestCacheClaim:
+    """
+    Test class for `hotness.databases.Cache.claim` and
+    `hotness.databases.Cache.delete` methods.
+    """
+
+    def test_claim(self):
+        """
+        Assert that only the first claim of the key succeeds.
+        """
+        database = Cache()
+
+        assert database.claim("key", "value")
+        assert not database.claim("key", "other")
+        assert database.retrieve("key")["value"] == "value"
+
+    @mock.patch("hotness.databases.cache.time")
+    def test_claim_key_is_expired(self, mock_time):
+        """
+        Assert that expired key could be claimed again.
+        """
+        database = Cache(expiration_time=60)
+        mock_time.monotonic.return_value = 100
+        assert database.claim("key", "value")
+
+        mock_time.monotonic.return_value = 160
+        assert database.claim("key", "value")
+        assert database.expirations == {"key": 220}
+
+    def test_claim_max_size(self):
+        """
+        Assert that claim evicts the least recently used key.
+        """
+        database = Cache(max_size=1)
+
+        database.claim("key", "value")
+        database.claim("key2", "value2")
+
+        assert database.cache == {"key2": "value2"}
+
+    def test_delete(self):
+        """
+        Assert that deleted key could be claimed again.
+        """
+        database = Cache(expiration_time=60)
+        database.claim("key", "value")
+
+        database.delete("key")
+        database.delete("missing")
+
+        assert database.cache == {}
+        assert database.expirations == {}
+        assert database.claim("key", "value")
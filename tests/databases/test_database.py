@@ -16,6 +16,7 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 import pytest
+from unittest import mock
 
 from hotness.databases import Database
 
@@ -51,3 +52,48 @@ class TestDatabaseRetrieve:
 
         with pytest.raises(NotImplementedError):
             database.retrieve(key)
+
+
+class TestDatabaseClaim:
+    """
+    Test class for `hotness.databases.Database.claim` method.
+    """
+
+    def test_claim(self):
+        """
+        Assert that claim inserts the key when it's missing.
+        """
+        database = Database()
+        database.retrieve = mock.Mock(return_value={"key": "key", "value": ""})
+        database.insert = mock.Mock()
+
+        assert database.claim("key", "value")
+
+        database.insert.assert_called_once_with("key", "value")
+
+    def test_claim_key_already_exists(self):
+        """
+        Assert that claim doesn't insert the key when it's already in database.
+        """
+        database = Database()
+        database.retrieve = mock.Mock(return_value={"key": "key", "value": "value"})
+        database.insert = mock.Mock()
+
+        assert not database.claim("key", "value")
+
+        database.insert.assert_not_called()
+
+
+class TestDatabaseDelete:
+    """
+    Test class for `hotness.databases.Database.delete` method.
+    """
+
+    def test_delete(self):
+        """
+        Assert that delete in abstract class raise NotImplementedError.
+        """
+        database = Database()
+
+        with pytest.raises(NotImplementedError):
+            database.delete("key")
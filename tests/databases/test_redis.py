@@ -47,11 +47,38 @@ class TestRedisInit:
         )
 
         # Asserts
-        mock_redis.Redis.assert_called_with(host=hostname, port=port, password=password)
+        mock_redis.BlockingConnectionPool.assert_called_with(
+            host=hostname, port=port, password=password, max_connections=10
+        )
+        mock_redis.Redis.assert_called_with(
+            connection_pool=mock_redis.BlockingConnectionPool.return_value
+        )
 
         assert database.redis == redis_mock_instance
+        assert (
+            database.connection_pool == mock_redis.BlockingConnectionPool.return_value
+        )
         assert database.expiration_time == expiration_time
 
+    @mock.patch("hotness.databases.redis.redis")
+    def test_init_connection_pool(self, mock_redis):
+        """
+        Assert that provided connection pool is used instead of creating a new one.
+        """
+        connection_pool = mock.Mock()
+
+        database = Redis(
+            hostname="hostname",
+            port=1234,
+            password="password",
+            expiration_time=60,
+            connection_pool=connection_pool,
+        )
+
+        mock_redis.BlockingConnectionPool.assert_not_called()
+        mock_redis.Redis.assert_called_with(connection_pool=connection_pool)
+        assert database.connection_pool == connection_pool
+
 
 class TestRedisInsert:
     """
@@ -159,3 +186,78 @@ class TestRedisRetrieve:
         # Asserts
         assert output == {"key": key, "value": ""}
         self.database.redis.get.assert_called_with(key)
+
+
+class TestRedisClaim:
+    """
+    Test class for `hotness.databases.Redis.claim` and
+    `hotness.databases.Redis.delete` methods.
+    """
+
+    def setup_method(self):
+        """
+        Create database instance for tests.
+        """
+        with mock.patch("hotness.databases.redis.redis") as mock_redis:
+            redis_mock_instance = mock.Mock()
+            mock_redis.Redis.return_value = redis_mock_instance
+
+            self.database = Redis(
+                hostname="", port=1234, password="", expiration_time=86400
+            )
+
+    def test_claim(self):
+        """
+        Assert that claim sets the key only if it doesn't exist.
+        """
+        self.database.redis.set.return_value = True
+
+        assert self.database.claim("key", "value")
+        self.database.redis.set.assert_called_with("key", "value", ex=86400, nx=True)
+
+    def test_claim_key_already_exists(self):
+        """
+        Assert that claim returns False when the key exists.
+        """
+        self.database.redis.set.return_value = None
+
+        assert not self.database.claim("key", "value")
+
+    def test_delete(self):
+        """
+        Assert that delete removes the key.
+        """
+        self.database.delete("key")
+
+        self.database.redis.delete.assert_called_with("key")
+
+
+class TestRedisScanKeys:
+    """
+    Test class for `hotness.databases.Redis.scan_keys` method.
+    """
+
+    def setup_method(self):
+        """
+        Create database instance for tests.
+        """
+        with mock.patch("hotness.databases.redis.redis") as mock_redis:
+            redis_mock_instance = mock.Mock()
+            mock_redis.Redis.return_value = redis_mock_instance
+
+            self.database = Redis(
+                hostname="", port=1234, password="", expiration_time=86400
+            )
+
+    def test_scan_keys(self):
+        """
+        Assert that matching keys are returned decoded.
+        """
+        self.database.redis.scan_iter.return_value = iter([b"1000", b"1001"])
+
+        output = list(self.database.scan_keys("[0-9]*"))
+
+        assert output == ["1000", "1001"]
+        self.database.redis.scan_iter.assert_called_once_with(
+            match="[0-9]*", count=1000
+        )
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import json
+import os
+import subprocess  # nosec
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestBenchmark:
+    """
+    Smoke test of `devel/benchmark.py` script.
+    """
+
+    def test_benchmark(self):
+        """
+        Assert that the benchmark replays the recorded messages through consumer.
+        """
+        env = dict(os.environ, PYTHONPATH=ROOT_DIR)
+
+        result = subprocess.run(  # nosec
+            [
+                sys.executable,
+                os.path.join(ROOT_DIR, "devel", "benchmark.py"),
+                "--messages",
+                "20",
+                "--json",
+            ],
+            cwd=ROOT_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+        assert result.returncode == 0, result.stderr
+        results = json.loads(result.stdout)
+        assert results["messages"] == 20
+        assert results["throughput"] > 0
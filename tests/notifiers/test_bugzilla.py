@@ -15,8 +15,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import threading
+
 import pytest
 from unittest import mock
+from prometheus_client import REGISTRY
 
 from hotness.domain import Package
 from hotness.exceptions import NotifierException
@@ -77,6 +80,8 @@ class TestBugzillaInit:
             "version": version,
             "status": status,
         }
+        assert notifier.cache_expiration == 0
+        assert notifier.update_delay == 0
 
     def test_init_no_authentication(self):
         """
@@ -143,6 +148,24 @@ class TestBugzillaNotify:
 
         assert self.notifier.bugzilla == bugzilla_session
 
+        self.expected_query = {
+            "component": "test",
+            "bug_status": [
+                "ASSIGNED",
+                "CLOSED",
+                "FAILS_QA",
+                "MODIFIED",
+                "NEW",
+                "ON_DEV",
+                "ON_QA",
+                "POST",
+                "RELEASE_PENDING",
+                "VERIFIED",
+            ],
+            "include_fields": ["id", "summary", "status"],
+        }
+        self.expected_query.update(self.notifier.base_query)
+
     def test_notify_follow_up(self):
         """
         Assert that notify will follow up on existing bug when bug id is provided.
@@ -190,21 +213,14 @@ class TestBugzillaNotify:
         mock_bug = mock.Mock()
         mock_bug.bug_id = 100
         mock_bug.weburl = "Bug URL"
+        mock_bug.summary = "Test-1.0 is available"
+        mock_bug.status = "CLOSED"
         self.notifier.bugzilla.query.return_value = [mock_bug]
 
         output = self.notifier.notify(package, message, opts)
 
-        # It looks like assert_called_with convert parameter to None when doing update on dict
-        # Let's use assert_has_calls instead
-        self.notifier.bugzilla.query.assert_has_calls == [
-            {
-                "component": "test",
-                "bug_status": self.notifier.bug_status_open
-                + self.notifier.bug_status_closed,
-                "short_desc": opts["bz_short_desc"],
-                "short_desc_type": "substring",
-            }.update(self.notifier.base_query)
-        ]
+        self.notifier.bugzilla.query.assert_called_once_with(self.expected_query)
+        self.notifier.bugzilla._proxy.Bug.update.assert_not_called()
 
         expected_output = {"bz_id": 100}
 
@@ -225,28 +241,20 @@ class TestBugzillaNotify:
         opts = {"bz_short_desc": "test-1.0 is available"}
 
         # Mock bugzilla query output
+        closed_bug = mock.Mock()
+        closed_bug.bug_id = 99
+        closed_bug.summary = "test-0.8 is available"
+        closed_bug.status = "CLOSED"
         mock_bug = mock.Mock()
         mock_bug.bug_id = 100
         mock_bug.weburl = "Bug URL"
-        self.notifier.bugzilla.query.side_effect = [[], [mock_bug]]
+        mock_bug.summary = "test-0.9 is available"
+        mock_bug.status = "NEW"
+        self.notifier.bugzilla.query.return_value = [closed_bug, mock_bug]
 
         output = self.notifier.notify(package, message, opts)
 
-        self.notifier.bugzilla.query.assert_has_calls == [
-            {
-                "component": "test",
-                "bug_status": self.notifier.bug_status_open
-                + self.notifier.bug_status_closed,
-                "short_desc": opts["bz_short_desc"],
-                "short_desc_type": "substring",
-            }.update(self.notifier.base_query),
-            {
-                "component": "test",
-                "bug_status": self.notifier.bug_status_early
-                + [self.notifier.new_bug["status"]],
-                "creator": self.notifier.reporter,
-            }.update(self.notifier.base_query),
-        ]
+        self.notifier.bugzilla.query.assert_called_once_with(self.expected_query)
 
         self.notifier.bugzilla._proxy.Bug.update.assert_called_with(
             {
@@ -287,21 +295,7 @@ class TestBugzillaNotify:
 
         output = self.notifier.notify(package, message, opts)
 
-        self.notifier.bugzilla.query.assert_has_calls == [
-            {
-                "component": "test",
-                "bug_status": self.notifier.bug_status_open
-                + self.notifier.bug_status_closed,
-                "short_desc": opts["bz_short_desc"],
-                "short_desc_type": "substring",
-            }.update(self.notifier.base_query),
-            {
-                "component": "test",
-                "bug_status": self.notifier.bug_status_early
-                + [self.notifier.new_bug["status"]],
-                "creator": self.notifier.reporter,
-            }.update(self.notifier.base_query),
-        ]
+        self.notifier.bugzilla.query.assert_called_once_with(self.expected_query)
 
         # It looks like assert_called_with convert parameter to None when doing update on dict
         # Let's use assert_has_calls instead
@@ -337,3 +331,409 @@ class TestBugzillaNotify:
             "Additional parameters are missing! "
             "Please provide either `bz_id` or `bz_short_desc`."
         )
+
+
+class TestBugzillaComponentBugs:
+    """
+    Test class for `hotness.notifiers.Bugzilla._component_bugs` method and its cache.
+    """
+
+    def setup_method(self):
+        """
+        Create notifier instance with cache for tests.
+        """
+        with mock.patch("hotness.notifiers.bugzilla.bugzilla") as mock_bugzilla:
+            mock_bugzilla.Bugzilla.return_value = mock.Mock()
+
+            self.notifier = Bugzilla(
+                "https://example.com/",
+                "Fabius Bile",
+                "Fabius@Bile.w40k",
+                "some API key",
+                "Fedora",
+                "Tzeentch, Chaos",
+                "1.0",
+                "NEW",
+                cache_expiration=60,
+            )
+
+        self.package = Package(name="test", version="1.0", distro="Fedora")
+
+    def _mock_bug(self, bug_id, summary, status):
+        """
+        Create mock bug.
+        """
+        bug = mock.Mock()
+        bug.bug_id = bug_id
+        bug.summary = summary
+        bug.status = status
+        return bug
+
+    def test_component_bugs_cached(self):
+        """
+        Assert that bugs for component are queried only once.
+        """
+        bug = self._mock_bug(100, "test-1.0 is available", "NEW")
+        self.notifier.bugzilla.query.return_value = [bug]
+
+        opts = {"bz_short_desc": "test-1.0 is available"}
+        first = self.notifier.notify(self.package, "message", opts)
+        second = self.notifier.notify(self.package, "message", opts)
+
+        assert first == second == {"bz_id": 100}
+        self.notifier.bugzilla.query.assert_called_once()
+
+    @mock.patch("hotness.notifiers.bugzilla.time")
+    def test_component_bugs_expired(self, mock_time):
+        """
+        Assert that bugs for component are queried again after expiration.
+        """
+        mock_time.monotonic.side_effect = [0, 30, 61, 61]
+        self.notifier.bugzilla.query.return_value = []
+
+        self.notifier._component_bugs(self.package)
+        self.notifier._component_bugs(self.package)
+        self.notifier._component_bugs(self.package)
+
+        assert self.notifier.bugzilla.query.call_count == 2
+
+    def test_component_bugs_cache_disabled(self):
+        """
+        Assert that bugs for component are queried every time when cache is disabled.
+        """
+        self.notifier.cache_expiration = 0
+        self.notifier.bugzilla.query.return_value = []
+
+        self.notifier._component_bugs(self.package)
+        self.notifier._component_bugs(self.package)
+
+        assert self.notifier.bugzilla.query.call_count == 2
+
+    def test_component_bugs_invalidated_on_create(self):
+        """
+        Assert that cached bugs are dropped when new bug is created.
+        """
+        new_bug = self._mock_bug(100, "test-1.0 is available", "NEW")
+        self.notifier.bugzilla.query.side_effect = [[], [new_bug]]
+        self.notifier.bugzilla.createbug.return_value = new_bug
+
+        opts = {"bz_short_desc": "test-1.0 is available"}
+        self.notifier.notify(self.package, "message", opts)
+        output = self.notifier.notify(self.package, "message", opts)
+
+        assert output == {"bz_id": 100}
+        self.notifier.bugzilla.createbug.assert_called_once()
+        assert self.notifier.bugzilla.query.call_count == 2
+
+    @pytest.mark.parametrize(
+        "opts",
+        [{"bz_id": 100}, {"bz_short_desc": "test-1.0 is available"}],
+    )
+    def test_component_bugs_invalidated_on_update(self, opts):
+        """
+        Assert that cached bugs are dropped when bug is updated.
+        """
+        old_bug = self._mock_bug(100, "test-0.9 is available", "NEW")
+        self.notifier.bugzilla.query.return_value = [old_bug]
+        self.notifier._component_bugs(self.package)
+
+        self.notifier.notify(self.package, "message", opts)
+
+        self.notifier.bugzilla._proxy.Bug.update.assert_called_once()
+        assert self.notifier._bugs_cache == {}
+
+    def test_exact_bug_case_insensitive(self):
+        """
+        Assert that exact bug is matched case insensitive as substring.
+        """
+        bug = self._mock_bug(100, "Test-1.0 is available", "CLOSED")
+
+        assert self.notifier._exact_bug([bug], "test-1.0 is") == bug
+        assert self.notifier._exact_bug([bug], "test-1.1 is") is None
+
+    def test_inexact_bug_early_state(self):
+        """
+        Assert that only bug in early state is matched as inexact bug.
+        """
+        closed_bug = self._mock_bug(98, "test-0.8 is available", "CLOSED")
+        modified_bug = self._mock_bug(99, "test-0.9 is available", "MODIFIED")
+        assigned_bug = self._mock_bug(100, "test-0.9 is available", "ASSIGNED")
+
+        assert self.notifier._inexact_bug([closed_bug, modified_bug]) is None
+        assert (
+            self.notifier._inexact_bug([closed_bug, modified_bug, assigned_bug])
+            == assigned_bug
+        )
+
+
+class TestBugzillaUpdateQueue:
+    """
+    Test class for queued updates of bugs in `hotness.notifiers.Bugzilla`.
+    """
+
+    def setup_method(self):
+        """
+        Create notifier instance with update delay for tests.
+        """
+        with mock.patch("hotness.notifiers.bugzilla.bugzilla") as mock_bugzilla:
+            mock_bugzilla.Bugzilla.return_value = mock.Mock()
+
+            self.notifier = Bugzilla(
+                "https://example.com/",
+                "Fabius Bile",
+                "Fabius@Bile.w40k",
+                "some API key",
+                "Fedora",
+                "Tzeentch, Chaos",
+                "1.0",
+                "NEW",
+                update_delay=60,
+            )
+
+    @mock.patch("hotness.notifiers.bugzilla.threading.Thread", mock.Mock())
+    def test_update_bug_queued(self):
+        """
+        Assert that update is not sent before flush.
+        """
+        self.notifier._update_bug(100, "Build failed")
+
+        self.notifier.bugzilla._proxy.Bug.update.assert_not_called()
+        assert self.notifier.stats()["queue_depth"] == 1
+
+    @mock.patch("hotness.notifiers.bugzilla.threading.Thread", mock.Mock())
+    def test_flush_coalesce(self):
+        """
+        Assert that comments for the same bug are joined and bugs with the same
+        update are updated by one call.
+        """
+        self.notifier._update_bug(100, "Scratch build started")
+        self.notifier._update_bug(100, "Scratch build failed")
+        self.notifier._update_bug(101, "Scratch build failed")
+        self.notifier._update_bug(102, "Scratch build failed")
+        self.notifier._update_bug(103, "New version", summary="test-1.0 is available")
+
+        self.notifier.flush()
+
+        self.notifier.bugzilla._proxy.Bug.update.assert_has_calls(
+            [
+                mock.call(
+                    {
+                        "comment": {
+                            "body": "Scratch build started\n\nScratch build failed",
+                            "is_private": False,
+                        },
+                        "ids": [100],
+                    }
+                ),
+                mock.call(
+                    {
+                        "comment": {
+                            "body": "Scratch build failed",
+                            "is_private": False,
+                        },
+                        "ids": [101, 102],
+                    }
+                ),
+                mock.call(
+                    {
+                        "comment": {"body": "New version", "is_private": False},
+                        "ids": [103],
+                        "summary": "test-1.0 is available",
+                    }
+                ),
+            ]
+        )
+        assert self.notifier.bugzilla._proxy.Bug.update.call_count == 3
+
+        stats = self.notifier.stats()
+        assert stats["queue_depth"] == 0
+        assert stats["flushes"] == 1
+
+    @mock.patch("hotness.notifiers.bugzilla.threading.Thread", mock.Mock())
+    def test_flush_error(self):
+        """
+        Assert that failed update doesn't stop other updates from being sent.
+        """
+        self.notifier.bugzilla._proxy.Bug.update.side_effect = [
+            Exception("Bugzilla is down"),
+            None,
+        ]
+        self.notifier._update_bug(100, "First")
+        self.notifier._update_bug(101, "Second")
+
+        self.notifier.flush()
+
+        assert self.notifier.bugzilla._proxy.Bug.update.call_count == 2
+        assert self.notifier.stats()["queue_depth"] == 0
+        assert self.notifier.stats()["update_failures"] == 1
+
+    @mock.patch("hotness.notifiers.bugzilla.threading.Thread", mock.Mock())
+    def test_flush_error_reported(self):
+        """
+        Assert that failed update is counted and reported to callback.
+        """
+        package = Package(name="test", version="1.0", distro="Fedora")
+        callback = mock.Mock()
+        self.notifier.update_failure_callback = callback
+        self.notifier.bugzilla._proxy.Bug.update.side_effect = Exception(
+            "Bugzilla is down"
+        )
+        failures = (
+            REGISTRY.get_sample_value("hotness_bugzilla_update_failures_total") or 0
+        )
+        opts = {"bz_id": 100, "trigger": {"msg": {}, "topic": "topic"}}
+        self.notifier.notify(package, "First", opts)
+        self.notifier._update_bug(101, "Second")
+
+        self.notifier.flush()
+
+        callback.assert_called_once_with(package, opts)
+        assert self.notifier.stats()["update_failures"] == 2
+        assert (
+            REGISTRY.get_sample_value("hotness_bugzilla_update_failures_total") or 0
+        ) == failures + 2
+
+    @mock.patch("hotness.notifiers.bugzilla.threading.Thread", mock.Mock())
+    def test_flush_sent_reported(self):
+        """
+        Assert that only sent updates are reported to callback, with id of the bug.
+        """
+        package = Package(name="test", version="1.0", distro="Fedora")
+        sent_callback = mock.Mock()
+        failure_callback = mock.Mock()
+        self.notifier.update_sent_callback = sent_callback
+        self.notifier.update_failure_callback = failure_callback
+        self.notifier.bugzilla._proxy.Bug.update.side_effect = [
+            None,
+            Exception("Bugzilla is down"),
+        ]
+        trigger = {"msg": {}, "topic": "topic"}
+        first = self.notifier.notify(
+            package, "First", {"bz_id": 100, "trigger": trigger}
+        )
+        self.notifier.bugzilla.query.return_value = [
+            mock.Mock(bug_id=101, summary="test-0.9 is available", status="NEW")
+        ]
+        second = self.notifier.notify(
+            package, "Second", {"bz_short_desc": "test-1.0 is available"}
+        )
+
+        sent_callback.assert_not_called()
+        self.notifier.flush()
+
+        assert first == {"bz_id": 100, "queued": True}
+        assert second == {"bz_id": 101, "queued": True}
+        sent_callback.assert_called_once_with(
+            package, {"bz_id": 100, "trigger": trigger}
+        )
+        failure_callback.assert_called_once_with(
+            package, {"bz_id": 101, "bz_short_desc": "test-1.0 is available"}
+        )
+
+    @mock.patch("hotness.notifiers.bugzilla.threading.Thread", mock.Mock())
+    def test_flush_sent_callback_exception(self):
+        """
+        Assert that exception raised by sent callback doesn't stop the flush.
+        """
+        package = Package(name="test", version="1.0", distro="Fedora")
+        self.notifier.update_sent_callback = mock.Mock(
+            side_effect=Exception("Broker is down")
+        )
+        self.notifier.notify(package, "First", {"bz_id": 100})
+        self.notifier.notify(package, "Second", {"bz_id": 101})
+
+        self.notifier.flush()
+
+        assert self.notifier.update_sent_callback.call_count == 2
+        assert self.notifier.stats()["flushes"] == 1
+
+    @mock.patch("hotness.notifiers.bugzilla.threading.Thread", mock.Mock())
+    def test_flush_error_callback_exception(self):
+        """
+        Assert that exception raised by callback doesn't stop the flush.
+        """
+        package = Package(name="test", version="1.0", distro="Fedora")
+        self.notifier.update_failure_callback = mock.Mock(
+            side_effect=Exception("Broker is down")
+        )
+        self.notifier.bugzilla._proxy.Bug.update.side_effect = [
+            Exception("Bugzilla is down"),
+            None,
+        ]
+        self.notifier.notify(package, "First", {"bz_id": 100})
+        self.notifier._update_bug(101, "Second")
+
+        self.notifier.flush()
+
+        assert self.notifier.bugzilla._proxy.Bug.update.call_count == 2
+        assert self.notifier.stats()["flushes"] == 1
+
+    @mock.patch("hotness.notifiers.bugzilla.threading.Thread", mock.Mock())
+    def test_notify_twice_in_delay_window(self):
+        """
+        Assert that the second message for the same version inside the delay window
+        finds the bug by the queued summary and doesn't queue another comment.
+        """
+        package = Package(name="test", version="1.0", distro="Fedora")
+        old_bug = mock.Mock(bug_id=100, summary="test-0.9 is available", status="NEW")
+        self.notifier.cache_expiration = 60
+        self.notifier.bugzilla.query.return_value = [old_bug]
+        opts = {"bz_short_desc": "test-1.0 is available"}
+
+        first = self.notifier.notify(package, "New version", opts)
+        second = self.notifier.notify(package, "New version", opts)
+
+        assert first == {"bz_id": 100, "queued": True}
+        # Exact bug is found, nothing is queued
+        assert second == {"bz_id": 100}
+        assert self.notifier._pending_updates[100]["comments"] == ["New version"]
+        # Cached bugs are used until the update is sent
+        self.notifier.bugzilla.query.assert_called_once()
+
+        self.notifier.flush()
+
+        self.notifier.bugzilla._proxy.Bug.update.assert_called_once_with(
+            {
+                "comment": {"body": "New version", "is_private": False},
+                "ids": [100],
+                "summary": "test-1.0 is available",
+            }
+        )
+        assert self.notifier._bugs_cache == {}
+
+    def test_pending_summaries_sending(self):
+        """
+        Assert that summaries of updates being sent are used.
+        """
+        self.notifier._sending_updates = {
+            100: {"comments": ["New version"], "summary": "test-1.0 is available"}
+        }
+        self.notifier._pending_updates = {
+            101: {"comments": ["Build failed"], "summary": ""}
+        }
+
+        assert self.notifier._pending_summaries() == {100: "test-1.0 is available"}
+
+    def test_flush_empty(self):
+        """
+        Assert that nothing is sent when there are no pending updates.
+        """
+        self.notifier.flush()
+
+        self.notifier.bugzilla._proxy.Bug.update.assert_not_called()
+        assert self.notifier.stats()["flushes"] == 0
+
+    def test_flush_periodically(self):
+        """
+        Assert that pending updates are flushed by background thread after delay.
+        """
+        self.notifier.update_delay = 0.01
+        flushed = threading.Event()
+        self.notifier.bugzilla._proxy.Bug.update.side_effect = (
+            lambda update: flushed.set()
+        )
+
+        self.notifier._update_bug(100, "Build failed")
+
+        assert flushed.wait(5)
+        assert self.notifier._flusher.daemon
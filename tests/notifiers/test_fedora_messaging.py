@@ -21,6 +21,7 @@ from unittest import mock
 from fedora_messaging.testing import mock_sends
 from fedora_messaging.exceptions import PublishException, ConnectionException
 from hotness_schema.messages import UpdateDrop
+from prometheus_client import REGISTRY
 
 from hotness.domain import Package
 from hotness.exceptions import NotifierException
@@ -73,6 +74,29 @@ class TestFedoraMessagingNotify:
 
             assert list(output.keys()) == ["msg_id"]
 
+    def test_notify_update_drop_metrics(self):
+        """
+        Assert that dropped update is counted by reason.
+        """
+        package = Package(name="test", version="1.0", distro="Fedora")
+        body = {"trigger": {"msg": {}, "topic": "topic"}, "reason": "Heresy"}
+        drops = (
+            REGISTRY.get_sample_value(
+                "hotness_update_drops_total", {"reason": "Heresy"}
+            )
+            or 0
+        )
+
+        with mock_sends(UpdateDrop):
+            self.notifier.notify(package, "update.drop", {"body": body})
+
+        assert (
+            REGISTRY.get_sample_value(
+                "hotness_update_drops_total", {"reason": "Heresy"}
+            )
+            or 0
+        ) == drops + 1
+
     def test_notify_missing_opts(self):
         """
         Assert that NotifierException is raised when opts are missing.
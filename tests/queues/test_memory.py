@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+from hotness.queues import Memory
+
+
+class TestMemoryInit:
+    """
+    Test class for `hotness.queues.Memory.__init__` method.
+    """
+
+    def test_init(self):
+        """
+        Assert that queue object is correctly initialized.
+        """
+        queue = Memory()
+
+        assert queue.size() == 0
+
+
+class TestMemoryPut:
+    """
+    Test class for `hotness.queues.Memory.put` method.
+    """
+
+    def test_put(self):
+        """
+        Assert that put adds value to queue.
+        """
+        queue = Memory()
+
+        queue.put({"key": "value"})
+
+        assert queue.size() == 1
+
+
+class TestMemoryGet:
+    """
+    Test class for `hotness.queues.Memory.get` method.
+    """
+
+    def test_get(self):
+        """
+        Assert that get returns values in order they were added.
+        """
+        queue = Memory()
+        queue.put({"key": "first"})
+        queue.put({"key": "second"})
+
+        assert queue.get(timeout=0) == {"key": "first"}
+        assert queue.get(timeout=0) == {"key": "second"}
+        assert queue.size() == 0
+
+    def test_get_empty(self):
+        """
+        Assert that get returns None when the queue is empty.
+        """
+        queue = Memory()
+
+        assert queue.get(timeout=0) is None
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import pytest
+
+from hotness.queues import Queue
+
+
+class TestQueuePut:
+    """
+    Test class for `hotness.queues.Queue.put` method.
+    """
+
+    def test_put(self):
+        """
+        Assert that put in abstract class raise NotImplementedError.
+        """
+        queue = Queue()
+
+        with pytest.raises(NotImplementedError):
+            queue.put({})
+
+
+class TestQueueGet:
+    """
+    Test class for `hotness.queues.Queue.get` method.
+    """
+
+    def test_get(self):
+        """
+        Assert that get in abstract class raise NotImplementedError.
+        """
+        queue = Queue()
+
+        with pytest.raises(NotImplementedError):
+            queue.get(timeout=1)
+
+
+class TestQueueSize:
+    """
+    Test class for `hotness.queues.Queue.size` method.
+    """
+
+    def test_size(self):
+        """
+        Assert that size in abstract class raise NotImplementedError.
+        """
+        queue = Queue()
+
+        with pytest.raises(NotImplementedError):
+            queue.size()
+
+
+class TestQueueAck:
+    """
+    Test class for `hotness.queues.Queue.ack` method.
+    """
+
+    def test_ack(self):
+        """
+        Assert that ack in abstract class does nothing.
+        """
+        queue = Queue()
+
+        assert queue.ack({}) is None
+
+
+class TestQueueHeartbeat:
+    """
+    Test class for `hotness.queues.Queue.heartbeat` method.
+    """
+
+    def test_heartbeat(self):
+        """
+        Assert that heartbeat in abstract class does nothing.
+        """
+        queue = Queue()
+
+        assert queue.heartbeat() is None
+
+
+class TestQueueRequeue:
+    """
+    Test class for `hotness.queues.Queue.requeue` method.
+    """
+
+    def test_requeue(self):
+        """
+        Assert that requeue in abstract class returns no value to queue.
+        """
+        queue = Queue()
+
+        assert queue.requeue() == 0
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import mock
+
+from hotness.queues import Redis
+
+
+class TestRedisInit:
+    """
+    Test class for `hotness.queues.Redis.__init__` method.
+    """
+
+    @mock.patch("hotness.queues.redis.uuid")
+    @mock.patch("hotness.queues.redis.redis")
+    def test_init(self, mock_redis, mock_uuid):
+        """
+        Assert that queue object is correctly initialized.
+        """
+        redis_mock_instance = mock.Mock()
+        mock_redis.Redis.return_value = redis_mock_instance
+        mock_uuid.uuid4.return_value.hex = "instance"
+
+        queue = Redis(hostname="hostname", port=1234, password="password", name="q")
+
+        mock_redis.BlockingConnectionPool.assert_called_with(
+            host="hostname", port=1234, password="password"
+        )
+        mock_redis.Redis.assert_called_with(
+            connection_pool=mock_redis.BlockingConnectionPool.return_value
+        )
+        assert queue.redis == redis_mock_instance
+        assert queue.connection_pool == mock_redis.BlockingConnectionPool.return_value
+        assert queue.name == "q"
+        assert queue.lease_time == 30
+        assert queue.instance_id == "instance"
+        assert queue.instances == "q:instances"
+        assert queue.processing == "q:processing:instance"
+        assert queue.lease == "q:lease:instance"
+        assert queue.persistent
+
+    @mock.patch("hotness.queues.redis.redis")
+    def test_init_connection_pool(self, mock_redis):
+        """
+        Assert that provided connection pool is shared.
+        """
+        connection_pool = mock.Mock()
+
+        queue = Redis(
+            hostname="hostname",
+            port=1234,
+            password="password",
+            name="q",
+            lease_time=60,
+            connection_pool=connection_pool,
+        )
+
+        mock_redis.BlockingConnectionPool.assert_not_called()
+        mock_redis.Redis.assert_called_with(connection_pool=connection_pool)
+        assert queue.connection_pool == connection_pool
+        assert queue.lease_time == 60
+
+    @mock.patch("hotness.queues.redis.redis")
+    def test_init_unique_instance(self, mock_redis):
+        """
+        Assert that every queue object has its own processing list.
+        """
+        queue = Redis(hostname="", port=1234, password="", name="q")
+        other_queue = Redis(hostname="", port=1234, password="", name="q")
+
+        assert queue.instance_id != other_queue.instance_id
+        assert queue.processing != other_queue.processing
+
+
+class TestRedisQueue:
+    """
+    Test class for `hotness.queues.Redis` put, get, ack, heartbeat, requeue
+    and size methods.
+    """
+
+    def setup_method(self):
+        """
+        Create queue instance for tests.
+        """
+        with mock.patch("hotness.queues.redis.redis") as mock_redis:
+            mock_redis.Redis.return_value = mock.Mock()
+
+            self.queue = Redis(hostname="", port=1234, password="", name="q")
+        self.queue.instance_id = "own"
+        self.queue.processing = "q:processing:own"
+        self.queue.lease = "q:lease:own"
+
+    def test_put(self):
+        """
+        Assert that put pushes serialized value to Redis list.
+        """
+        self.queue.put({"key": "value"})
+
+        self.queue.redis.lpush.assert_called_with("q", '{"key": "value"}')
+
+    def test_get(self):
+        """
+        Assert that get moves value to processing list of the instance
+        and deserializes it.
+        """
+        self.queue.redis.blmove.return_value = b'{"key": "value"}'
+
+        assert self.queue.get(timeout=5) == {"key": "value"}
+        self.queue.redis.blmove.assert_called_with(
+            "q", "q:processing:own", 5, src="RIGHT", dest="LEFT"
+        )
+
+    def test_get_empty(self):
+        """
+        Assert that get returns None when the queue is empty.
+        """
+        self.queue.redis.blmove.return_value = None
+
+        assert self.queue.get(timeout=5) is None
+
+    def test_ack(self):
+        """
+        Assert that ack removes value from processing list of the instance.
+        """
+        self.queue.ack({"key": "value"})
+
+        self.queue.redis.lrem.assert_called_with(
+            "q:processing:own", 1, '{"key": "value"}'
+        )
+
+    def test_heartbeat(self):
+        """
+        Assert that heartbeat renews the lease and registers the instance.
+        """
+        pipeline = self.queue.redis.pipeline.return_value
+
+        self.queue.heartbeat()
+
+        pipeline.set.assert_called_with("q:lease:own", 1, ex=30)
+        pipeline.sadd.assert_called_with("q:instances", "own")
+        pipeline.execute.assert_called_once_with()
+
+    def test_requeue(self):
+        """
+        Assert that requeue moves values only from processing lists of instances
+        whose lease expired.
+        """
+        self.queue.redis.smembers.return_value = {b"own", b"alive", b"dead"}
+        self.queue.redis.exists.side_effect = lambda key: key == "q:lease:alive"
+        self.queue.redis.lmove.side_effect = [b"{}", b"{}", None]
+
+        assert self.queue.requeue() == 2
+        self.queue.redis.pipeline.return_value.execute.assert_called_once_with()
+        self.queue.redis.lmove.assert_called_with(
+            "q:processing:dead", "q", src="LEFT", dest="RIGHT"
+        )
+        assert self.queue.redis.lmove.call_count == 3
+        self.queue.redis.srem.assert_called_once_with("q:instances", "dead")
+
+    def test_requeue_nothing(self):
+        """
+        Assert that requeue doesn't touch values of running instances.
+        """
+        self.queue.redis.smembers.return_value = {b"own", b"alive"}
+        self.queue.redis.exists.return_value = True
+
+        assert self.queue.requeue() == 0
+        self.queue.redis.lmove.assert_not_called()
+        self.queue.redis.srem.assert_not_called()
+
+    def test_size(self):
+        """
+        Assert that size returns length of Redis list.
+        """
+        self.queue.redis.llen.return_value = 3
+
+        assert self.queue.size() == 3
+        self.queue.redis.llen.assert_called_with("q")
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import threading
+from unittest import mock
+
+from hotness.queues import Memory, WorkerPool
+
+
+class TestWorkerPoolInit:
+    """
+    Test class for `hotness.queues.WorkerPool.__init__` method.
+    """
+
+    def test_init(self):
+        """
+        Assert that worker pool is correctly initialized.
+        """
+        queue = mock.Mock()
+        handler = mock.Mock()
+
+        pool = WorkerPool(queue=queue, handler=handler, workers=2)
+
+        assert pool.queue == queue
+        assert pool.handler == handler
+        assert pool.workers == 2
+        assert pool.poll_interval == 1.0
+        assert pool.threads == []
+
+
+class TestWorkerPoolStartStop:
+    """
+    Test class for `hotness.queues.WorkerPool.start` and `stop` methods.
+    """
+
+    def test_start_stop(self):
+        """
+        Assert that workers process every value in queue and stop.
+        """
+        queue = Memory()
+        processed = []
+        done = threading.Event()
+
+        def handler(value):
+            processed.append(value["id"])
+            if len(processed) == 3:
+                done.set()
+
+        pool = WorkerPool(queue=queue, handler=handler, workers=2, poll_interval=0.01)
+        pool.start()
+        for index in range(3):
+            queue.put({"id": index})
+
+        assert done.wait(5)
+        pool.stop(timeout=5)
+
+        assert sorted(processed) == [0, 1, 2]
+        assert pool.threads == []
+
+    def test_stop_drains_queue(self):
+        """
+        Assert that values left in queue that is not persistent are processed
+        before workers stop.
+        """
+        queue = Memory()
+        processed = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def handler(value):
+            started.set()
+            release.wait(5)
+            processed.append(value["id"])
+
+        pool = WorkerPool(queue=queue, handler=handler, workers=1, poll_interval=0.01)
+        pool.start()
+        for index in range(3):
+            queue.put({"id": index})
+
+        assert started.wait(5)
+        pool._stop_event.set()
+        release.set()
+        pool.stop(timeout=5)
+
+        assert processed == [0, 1, 2]
+        assert queue.size() == 0
+
+    def test_stop_persistent_queue(self):
+        """
+        Assert that values left in persistent queue are kept there.
+        """
+        queue = mock.Mock()
+        queue.persistent = True
+        queue.requeue.return_value = 0
+        queue.get.return_value = None
+        handler = mock.Mock()
+
+        pool = WorkerPool(queue=queue, handler=handler, workers=1, poll_interval=0.01)
+        pool.start()
+        pool.stop(timeout=5)
+
+        handler.assert_not_called()
+        for call in queue.get.call_args_list:
+            assert call == mock.call(timeout=0.01)
+
+    def test_start_requeue(self):
+        """
+        Assert that unfinished values are returned to queue on start
+        and every processed value is acknowledged.
+        """
+        queue = mock.Mock()
+        queue.persistent = True
+        queue.requeue.return_value = 1
+        done = threading.Event()
+        values = [{"id": 0}]
+
+        def get(timeout):
+            if values:
+                return values.pop()
+            done.set()
+            return None
+
+        queue.get.side_effect = get
+        handler = mock.Mock(side_effect=Exception("This is heresy!"))
+
+        pool = WorkerPool(queue=queue, handler=handler, workers=1, poll_interval=0.01)
+        pool.start()
+
+        assert done.wait(5)
+        pool.stop(timeout=5)
+
+        queue.requeue.assert_called_once_with()
+        handler.assert_called_once_with({"id": 0})
+        queue.ack.assert_called_once_with({"id": 0})
+
+    def test_start_requeue_exception(self):
+        """
+        Assert that workers start when unfinished values can't be returned to queue.
+        """
+        queue = Memory()
+        queue.requeue = mock.Mock(side_effect=Exception("Queue is gone!"))
+        handler = mock.Mock()
+
+        pool = WorkerPool(queue=queue, handler=handler, workers=1, poll_interval=0.01)
+        pool.start()
+
+        assert len(pool.threads) == 1
+        pool.stop(timeout=5)
+
+    def test_heartbeat(self):
+        """
+        Assert that heartbeat of queue is sent while workers are running.
+        """
+        queue = mock.Mock()
+        queue.persistent = True
+        queue.requeue.return_value = 0
+        queue.get.return_value = None
+        done = threading.Event()
+        queue.heartbeat.side_effect = lambda: done.set()
+        handler = mock.Mock()
+
+        pool = WorkerPool(
+            queue=queue,
+            handler=handler,
+            workers=1,
+            poll_interval=0.01,
+            heartbeat_interval=0.01,
+        )
+        pool.start()
+
+        assert done.wait(5)
+        pool.stop(timeout=5)
+
+        assert pool._heartbeat_thread is None
+
+    def test_heartbeat_exception(self):
+        """
+        Assert that heartbeat continues when it fails.
+        """
+        queue = mock.Mock()
+        queue.persistent = True
+        queue.requeue.return_value = 0
+        queue.get.return_value = None
+        done = threading.Event()
+        calls = []
+
+        def heartbeat():
+            calls.append(1)
+            if len(calls) > 1:
+                done.set()
+            raise Exception("Queue is gone!")
+
+        queue.heartbeat.side_effect = heartbeat
+        handler = mock.Mock()
+
+        pool = WorkerPool(
+            queue=queue,
+            handler=handler,
+            workers=1,
+            poll_interval=0.01,
+            heartbeat_interval=0.01,
+        )
+        pool.start()
+
+        assert done.wait(5)
+        pool.stop(timeout=5)
+
+        assert len(calls) > 1
+
+    def test_handler_exception(self):
+        """
+        Assert that worker continues when handler raises exception.
+        """
+        queue = Memory()
+        processed = []
+        done = threading.Event()
+
+        def handler(value):
+            if value["id"] == 0:
+                raise Exception("This is heresy!")
+            processed.append(value["id"])
+            done.set()
+
+        pool = WorkerPool(queue=queue, handler=handler, workers=1, poll_interval=0.01)
+        pool.start()
+        queue.put({"id": 0})
+        queue.put({"id": 1})
+
+        assert done.wait(5)
+        pool.stop(timeout=5)
+
+        assert processed == [1]
+
+    def test_queue_exception(self):
+        """
+        Assert that worker continues when queue raises exception.
+        """
+        queue = mock.Mock()
+        done = threading.Event()
+
+        def get(timeout):
+            if not done.is_set():
+                done.set()
+                raise Exception("Queue is gone!")
+            return None
+
+        queue.get.side_effect = get
+        handler = mock.Mock()
+
+        pool = WorkerPool(queue=queue, handler=handler, workers=1, poll_interval=0.01)
+        pool.start()
+
+        assert done.wait(5)
+        pool.stop(timeout=5)
+
+        handler.assert_not_called()
@@ -197,6 +197,27 @@ class TestResponseFailurePatcherError:
         }
 
 
+class TestResponseFailureQueueError:
+    """
+    Test class for `hotness.responses.response.ResponseFailure.queue_error` method.
+    """
+
+    def test_queue_error(self):
+        """
+        Assert that queue error response is created correctly.
+        """
+        response = ResponseFailure.queue_error(
+            message=Exception("This is queue heresy!")
+        )
+
+        assert response.type == ResponseFailure.QUEUE_ERROR
+        assert response.value == {
+            "type": ResponseFailure.QUEUE_ERROR,
+            "message": "Exception: This is queue heresy!",
+            "use_case_value": None,
+        }
+
+
 class TestResponseFailureInvalidRequestError:
     """
     Test class for `hotness.responses.ResponseFailure.invalid_request_error` method.
@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2026 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions
+# of the GNU General Public License v.2, or (at your option) any later
+# version.  This program is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY expressed or implied, including the
+# implied warranties of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.  You
+# should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# Any Red Hat trademarks that are incorporated in the source
+# code or documentation are not subject to the GNU General Public
+import asyncio
+import threading
+
+import pytest
+from unittest import mock
+
+from fedora_messaging import exceptions as fm_exceptions
+
+from hotness.async_hotness_consumer import AsyncHotnessConsumer
+from hotness.common import Deduplicator
+from hotness.config import config
+from hotness.domain import Package
+from hotness.validators import AsyncMDApi, AsyncPagure
+from tests.test_hotness_consumer import create_message
+
+
+class TestAsyncHotnessConsumer:
+    """
+    Test class for `hotness.async_hotness_consumer.AsyncHotnessConsumer`.
+    """
+
+    def setup_method(self):
+        """
+        Create asyncio hotness consumer for tests.
+        It is accessible as `self.consumer`.
+        """
+        with mock.patch("hotness.hotness_consumer.Koji"), mock.patch(
+            "hotness.hotness_consumer.Redis"
+        ), mock.patch("hotness.hotness_consumer.bz_notifier"), mock.patch(
+            "hotness.hotness_consumer.FedoraMessaging"
+        ), mock.patch(
+            "hotness.hotness_consumer.bz_patcher"
+        ), mock.patch(
+            "hotness.async_hotness_consumer.async_http.create_session"
+        ) as mock_create_session:
+            self.session = mock.Mock()
+            self.session.close = mock.AsyncMock()
+            mock_create_session.return_value = self.session
+
+            self.consumer = AsyncHotnessConsumer()
+
+        self.create_session = mock_create_session
+        self.consumer.validator_pagure = mock.Mock()
+        self.consumer.validator_pagure.validate = mock.AsyncMock(
+            return_value={
+                "bugzilla": True,
+                "monitoring": True,
+                "all_versions": False,
+                "stable_only": False,
+                "scratch_build": False,
+                "retired": False,
+            }
+        )
+        self.consumer.validator_mdapi = mock.Mock()
+        self.consumer.validator_mdapi.validate = mock.AsyncMock(
+            return_value={"newer": True, "version": "0.16.0", "release": 1}
+        )
+        self.consumer.notifier_bugzilla.notify.return_value = {"bz_id": 100}
+
+    def teardown_method(self):
+        """
+        Stop the event loop of the consumer.
+        """
+        self.consumer.stop()
+
+    def test_init(self):
+        """
+        Assert that the event loop is running and asyncio validators share
+        one HTTP session.
+        """
+        with mock.patch("hotness.hotness_consumer.Koji"), mock.patch(
+            "hotness.hotness_consumer.Redis"
+        ), mock.patch("hotness.hotness_consumer.bz_notifier"), mock.patch(
+            "hotness.hotness_consumer.FedoraMessaging"
+        ), mock.patch(
+            "hotness.hotness_consumer.bz_patcher"
+        ), mock.patch(
+            "hotness.hotness_consumer.MDApi"
+        ) as mock_mdapi, mock.patch(
+            "hotness.hotness_consumer.Pagure"
+        ) as mock_pagure, mock.patch(
+            "hotness.async_hotness_consumer.async_http.create_session"
+        ) as mock_create_session:
+            mock_create_session.return_value.close = mock.AsyncMock()
+            consumer = AsyncHotnessConsumer()
+
+        try:
+            # Blocking validators are not created at all
+            mock_mdapi.assert_not_called()
+            mock_pagure.assert_not_called()
+            assert consumer.loop.is_running()
+            assert consumer.http_session == mock_create_session.return_value
+            mock_create_session.assert_called_once_with(
+                connect_timeout=config["connect_timeout"],
+                read_timeout=config["read_timeout"],
+                pool_size=config["async_consumer"]["pool_size"],
+            )
+            assert isinstance(consumer.validator_pagure, AsyncPagure)
+            assert isinstance(consumer.validator_mdapi, AsyncMDApi)
+            assert consumer.validator_pagure.session == consumer.http_session
+            assert consumer.validator_mdapi.session == consumer.http_session
+            assert consumer.validator_pagure.retries == config["requests_retries"]
+            assert consumer.validator_mdapi.retries == config["requests_retries"]
+        finally:
+            consumer.stop()
+
+    def test_init_mapping_workers(self):
+        """
+        Assert that worker pool for package mappings is not created,
+        when more mapping workers are configured.
+        """
+        with mock.patch("hotness.hotness_consumer.Koji"), mock.patch(
+            "hotness.hotness_consumer.Redis"
+        ), mock.patch("hotness.hotness_consumer.bz_notifier"), mock.patch(
+            "hotness.hotness_consumer.FedoraMessaging"
+        ), mock.patch(
+            "hotness.hotness_consumer.bz_patcher"
+        ), mock.patch(
+            "hotness.hotness_consumer.concurrent.futures.ThreadPoolExecutor"
+        ) as mock_executor, mock.patch(
+            "hotness.async_hotness_consumer.async_http.create_session"
+        ) as mock_create_session, mock.patch.dict(
+            config, {"mapping_workers": 4}
+        ):
+            mock_create_session.return_value.close = mock.AsyncMock()
+            consumer = AsyncHotnessConsumer()
+
+        try:
+            assert consumer.mapping_workers == 4
+            assert consumer.mapping_executor is None
+            for call in mock_executor.call_args_list:
+                assert call.kwargs.get("thread_name_prefix") != "hotness-mapping"
+        finally:
+            consumer.stop()
+
+    @pytest.mark.parametrize("section", ["validator_cache", "dist_git_snapshot"])
+    def test_init_unsupported(self, section):
+        """
+        Assert that consumer refuses to start with options asyncio validators
+        don't support.
+        """
+        with mock.patch("hotness.hotness_consumer.Koji"), mock.patch(
+            "hotness.hotness_consumer.Redis"
+        ), mock.patch("hotness.hotness_consumer.bz_notifier"), mock.patch(
+            "hotness.hotness_consumer.FedoraMessaging"
+        ), mock.patch(
+            "hotness.hotness_consumer.bz_patcher"
+        ), mock.patch(
+            "hotness.async_hotness_consumer.async_http.create_session"
+        ) as mock_create_session, mock.patch.dict(
+            config[section], {"enabled": True}
+        ):
+            with pytest.raises(ValueError, match=section):
+                AsyncHotnessConsumer()
+
+        mock_create_session.assert_not_called()
+
+    def test_stop(self):
+        """
+        Assert that HTTP session is closed and the event loop is stopped.
+        """
+        self.consumer.stop()
+
+        self.session.close.assert_awaited_once_with()
+        assert not self.consumer.loop.is_running()
+
+        # Second call does nothing
+        self.consumer.stop()
+        self.session.close.assert_awaited_once_with()
+
+    def test_call_anitya_update(self):
+        """
+        Assert that Anitya message is validated by asyncio validators and
+        bug is filed.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+
+        self.consumer(message)
+
+        package = Package(name="flatpak", version="1.0.4", distro="Fedora")
+        self.consumer.validator_pagure.validate.assert_awaited_once_with(package)
+        self.consumer.validator_mdapi.validate.assert_awaited_once_with(package)
+        self.consumer.notifier_fedora_messaging.notify.assert_called_with(
+            package,
+            "update.bug.file",
+            {
+                "body": {
+                    "trigger": {"msg": message.body, "topic": message.topic},
+                    "bug": {"bug_id": 100},
+                    "package": package.name,
+                }
+            },
+        )
+
+    def test_call_anitya_update_not_newer(self):
+        """
+        Assert that update is dropped when the version isn't newer.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        self.consumer.validator_mdapi.validate.return_value = {
+            "newer": False,
+            "version": "1.0.4",
+            "release": 1,
+        }
+
+        self.consumer(message)
+
+        package = Package(name="flatpak", version="1.0.4", distro="Fedora")
+        self.consumer.notifier_bugzilla.notify.assert_not_called()
+        self.consumer.notifier_fedora_messaging.notify.assert_called_with(
+            package,
+            "update.drop",
+            {
+                "body": {
+                    "trigger": {"msg": message.body, "topic": message.topic},
+                    "reason": "not newer",
+                }
+            },
+        )
+
+    def test_call_anitya_update_concurrent_mappings(self):
+        """
+        Assert that validations of different packages are running concurrently.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        message.body["message"]["packages"].append(
+            {"distro": "Fedora", "package_name": "flatpak-builder"}
+        )
+        output = self.consumer.validator_pagure.validate.return_value
+        # Both validations must be in progress to pass the barrier
+        barrier = asyncio.Barrier(2)
+
+        async def validate(package):
+            await asyncio.wait_for(barrier.wait(), 5)
+            return output
+
+        self.consumer.validator_pagure.validate.side_effect = validate
+
+        self.consumer(message)
+
+        assert self.consumer.validator_mdapi.validate.await_count == 2
+        assert self.consumer.notifier_bugzilla.notify.call_count == 2
+
+    def test_call_anitya_update_first_mapping_dropped(self):
+        """
+        Assert that processing stops on the first dropped mapping, the same way
+        as in the synchronous consumer.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        message.body["message"]["packages"].append(
+            {"distro": "Fedora", "package_name": "flatpak-builder"}
+        )
+        output = dict(self.consumer.validator_pagure.validate.return_value)
+
+        async def validate(package):
+            if package.name == "flatpak":
+                return dict(output, monitoring=False)
+            return output
+
+        self.consumer.validator_pagure.validate.side_effect = validate
+
+        self.consumer(message)
+
+        package = Package(name="flatpak", version="1.0.4", distro="Fedora")
+        assert self.consumer.notifier_fedora_messaging.notify.call_args_list == [
+            mock.call(
+                package,
+                "update.drop",
+                {
+                    "body": {
+                        "trigger": {"msg": message.body, "topic": message.topic},
+                        "reason": "monitoring settings",
+                    }
+                },
+            )
+        ]
+        self.consumer.notifier_bugzilla.notify.assert_not_called()
+
+    def test_call_anitya_update_network_error(self):
+        """
+        Assert that transient network error raises Nack.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        self.consumer.validator_pagure.validate.side_effect = asyncio.TimeoutError()
+
+        with pytest.raises(fm_exceptions.Nack):
+            self.consumer(message)
+
+    def test_call_anitya_update_validator_exception(self):
+        """
+        Assert that update is dropped when validator fails.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        self.consumer.validator_pagure.validate.side_effect = Exception("Heresy!")
+
+        self.consumer(message)
+
+        self.consumer.validator_mdapi.validate.assert_not_awaited()
+        assert (
+            self.consumer.notifier_fedora_messaging.notify.call_args[0][2]["body"][
+                "reason"
+            ]
+            == "dist-git"
+        )
+
+    def test_call_anitya_update_duplicate(self):
+        """
+        Assert that already processed update message is dropped before validation.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        self.consumer.deduplicator = Deduplicator(window=60)
+
+        self.consumer(message)
+        self.consumer(message)
+
+        self.consumer.validator_pagure.validate.assert_awaited_once()
+        assert self.consumer.dropped_messages == {"duplicate": 1}
+
+    def test_call_anitya_update_duplicate_error_drop(self):
+        """
+        Assert that update message dropped because of failure of external system
+        isn't remembered as processed.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        self.consumer.deduplicator = Deduplicator(window=60)
+        self.consumer.validator_pagure.validate.return_value = {}
+
+        self.consumer(message)
+        self.consumer(message)
+
+        assert self.consumer.validator_pagure.validate.await_count == 2
+        assert self.consumer.dropped_messages == {}
+
+    def test_call_buildsys(self):
+        """
+        Assert that buildsys message is handled outside of the event loop thread.
+        """
+        message = create_message("buildsys.task.state.change", "build_completed")
+        threads = []
+
+        def handle(msg):
+            threads.append(threading.current_thread())
+
+        with mock.patch.object(
+            self.consumer, "_handle_buildsys_scratch", side_effect=handle
+        ) as mock_handle:
+            self.consumer(message)
+
+        mock_handle.assert_called_once_with(message)
+        assert threads[0] is not self.consumer._loop_thread
+
+    def test_call_filtered(self):
+        """
+        Assert that filtered message isn't handled.
+        """
+        message = create_message("buildsys.task.state.change", "build")
+
+        self.consumer(message)
+
+        assert self.consumer.dropped_messages["build_not_done"] == 1
+        self.consumer.database_redis.retrieve.assert_not_called()
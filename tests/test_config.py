@@ -29,18 +29,66 @@ full_config = {
     "consumer_config": {
         "dist_git_url": "https://src.stg.fedoraproject.org",
         "mdapi_url": "https://apps.fedoraproject.org/mdapi_test",
+        "mdapi_cache_expiration": 0,
+        "dist_git_parallel_requests": True,
         "repoid": "",
         "distro": "",
         "hotness_issue_tracker": "https://github.com/fedora-infra/the-new-hotness/issues",
         "connect_timeout": 30,
         "read_timeout": 30,
         "requests_retries": 1,
+        "mapping_workers": 4,
         "redis": {
             "hostname": "localhost",
             "port": 6379,
             "password": "",
             "expiration": 86400,
+            "pool_size": 20,
         },
+        "mdapi_mirror": {
+            "enabled": True,
+            "repo_url": "https://example.com/rawhide/source",
+            "cache_dir": "/tmp/hotness/mdapi",
+            "refresh_interval": 600,
+        },
+        "validator_cache": {
+            "enabled": True,
+            "backend": "redis",
+            "expiration": 60,
+            "max_size": 100,
+        },
+        "dist_git_snapshot": {
+            "enabled": True,
+            "source": "https://example.com/dist-git.json",
+            "refresh_interval": 600,
+            "max_age": 3600,
+        },
+        "build_queue": {
+            "enabled": True,
+            "backend": "redis",
+            "name": "hotness:test_queue",
+            "workers": 4,
+            "lease_time": 60,
+        },
+        "task_filter": {
+            "enabled": True,
+            "capacity": 1000,
+            "error_rate": 0.001,
+            "refresh_interval": 60,
+        },
+        "deduplication": {
+            "enabled": True,
+            "window": 600,
+            "max_size": 100,
+            "backend": "redis",
+        },
+        "metrics": {
+            "enabled": True,
+            "host": "127.0.0.1",
+            "port": 9000,
+        },
+        "tracing": {"enabled": True},
+        "async_consumer": {"pool_size": 50},
         "bugzilla": {
             "enabled": False,
             "url": "https://partner-bugzilla.redhat.com_test",
@@ -49,6 +97,8 @@ full_config = {
             "version": "",
             "keywords": "",
             "bug_status": "",
+            "query_cache_expiration": 0,
+            "update_delay": 5,
             "explanation_url": "https://fedoraproject.org/wiki/upstream_release_monitoring_test",
             "reporter": "",
             "reporter_email": "",
@@ -69,6 +119,13 @@ full_config = {
             "opts": {"scratch": False},
             "priority": 60,
             "target_tag": "",
+            "mirror_dir": "/var/cache/hotness",
+            "mirror_max_size": 0,
+            "source_cache_dir": "/var/cache/hotness-sources",
+            "source_cache_max_size": 0,
+            "session_pool_size": 4,
+            "upload_chunk_size": 1048576,
+            "upload_retries": 5,
         },
     }
 }
@@ -17,6 +17,7 @@
 # code or documentation are not subject to the GNU General Public
 # License and may only be used or replicated with the express permission
 # of Red Hat, Inc.
+import concurrent.futures
 import json
 import os
 import pytest
@@ -24,7 +25,10 @@ import traceback
 from unittest import mock
 
 from fedora_messaging.message import Message
+from prometheus_client import REGISTRY
 
+from hotness.config import config
+from hotness.common import Deduplicator
 from hotness.hotness_consumer import HotnessConsumer
 from hotness.domain import Package
 from hotness.exceptions import BuilderException, DownloadException
@@ -54,6 +58,13 @@ def create_message(topic: str, name: str) -> Message:
     return message
 
 
+def metric_value(name: str, **labels: str) -> float:
+    """
+    Return current value of metric sample, 0 if it wasn't recorded yet.
+    """
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
 class TestHotnessConsumerInit:
     """
     Test class for `hotness.hotness_consumer.HotnessConsumer.__init__`.
@@ -138,6 +149,12 @@ To change the monitoring settings for the project, please visit:
         assert consumer.patcher_bugzilla == mock_bugzilla_patcher
         assert consumer.validator_mdapi == mock_mdapi
         assert consumer.validator_pagure == mock_pagure
+        assert consumer.mapping_workers == 1
+        assert consumer.mapping_executor is None
+        assert consumer.build_queue is None
+        assert consumer.build_workers is None
+        assert consumer.mdapi_mirror is None
+        assert consumer.deduplicator is None
 
         mock_koji_new.assert_called_with(
             server_url="https://koji.fedoraproject.org/kojihub",
@@ -157,10 +174,19 @@ To change the monitoring settings for the project, please visit:
             opts=dict(scratch=True),
             priority=30,
             target_tag="rawhide",
+            git_mirror=None,
+            source_cache=None,
+            session_pool_size=2,
+            upload_chunk_size=0,
+            upload_retries=3,
         )
 
         mock_redis_new.assert_called_with(
-            hostname="localhost", port=6379, password="", expiration_time=86400
+            hostname="localhost",
+            port=6379,
+            password="",
+            expiration_time=86400,
+            pool_size=10,
         )
 
         mock_bz_notifier_new.assert_called_with(
@@ -172,6 +198,10 @@ To change the monitoring settings for the project, please visit:
             keywords="FutureFeature, Triaged",
             version="rawhide",
             status="NEW",
+            cache_expiration=60,
+            update_delay=0,
+            update_failure_callback=consumer._handle_bugzilla_update_failure,
+            update_sent_callback=consumer._handle_bugzilla_update_sent,
         )
 
         mock_fm_new.assert_called_with(prefix="hotness")
@@ -185,6 +215,8 @@ To change the monitoring settings for the project, please visit:
             url="https://apps.fedoraproject.org/mdapi",
             requests_session=mock.ANY,
             timeout=(15, 15),
+            cache_expiration=0,
+            mirror=None,
         )
 
         mock_pagure_new.assert_called_with(
@@ -193,6 +225,420 @@ To change the monitoring settings for the project, please visit:
             timeout=(15, 15),
             branch="rawhide",
             package_type="rpm",
+            parallel_requests=False,
+            max_workers=3,
+        )
+
+    @pytest.mark.parametrize(
+        "backend",
+        ["memory", "redis"],
+    )
+    @mock.patch("hotness.hotness_consumer.atexit")
+    @mock.patch("hotness.hotness_consumer.WorkerPool")
+    @mock.patch("hotness.hotness_consumer.redis_queue")
+    @mock.patch("hotness.hotness_consumer.memory_queue")
+    @mock.patch("hotness.hotness_consumer.Koji", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Redis", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_notifier", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.FedoraMessaging", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_patcher", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.MDApi", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Pagure", mock.Mock())
+    def test_init_build_queue(
+        self,
+        mock_memory_queue_new,
+        mock_redis_queue_new,
+        mock_worker_pool_new,
+        mock_atexit,
+        backend,
+    ):
+        """
+        Assert that build queue and build workers are initialized when enabled.
+        """
+        build_queue_config = {
+            "enabled": True,
+            "backend": backend,
+            "name": "hotness:build_queue",
+            "workers": 3,
+            "lease_time": 30,
+        }
+        with mock.patch.dict(
+            "hotness.hotness_consumer.config", {"build_queue": build_queue_config}
+        ):
+            consumer = HotnessConsumer()
+
+        if backend == "redis":
+            mock_redis_queue_new.assert_called_with(
+                hostname="localhost",
+                port=6379,
+                password="",
+                name="hotness:build_queue",
+                lease_time=30,
+                connection_pool=consumer.database_redis.connection_pool,
+            )
+            assert consumer.build_queue == mock_redis_queue_new.return_value
+        else:
+            mock_memory_queue_new.assert_called_with()
+            assert consumer.build_queue == mock_memory_queue_new.return_value
+
+        mock_worker_pool_new.assert_called_with(
+            queue=consumer.build_queue,
+            handler=consumer._handle_queued_scratch_build,
+            workers=3,
+        )
+        assert consumer.build_workers == mock_worker_pool_new.return_value
+        consumer.build_workers.start.assert_called_once()
+        mock_atexit.register.assert_called_with(consumer.build_workers.stop)
+
+    @mock.patch("hotness.hotness_consumer.tracing")
+    @mock.patch("hotness.hotness_consumer.Koji", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Redis", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_notifier", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.FedoraMessaging", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_patcher", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.MDApi", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Pagure", mock.Mock())
+    def test_init_tracing(self, mock_tracing):
+        """
+        Assert that tracing is enabled when configured.
+        """
+        with mock.patch.dict(
+            "hotness.hotness_consumer.config", {"tracing": {"enabled": True}}
+        ):
+            HotnessConsumer()
+
+        mock_tracing.enable.assert_called_once_with()
+
+    @mock.patch("hotness.hotness_consumer.atexit")
+    @mock.patch("hotness.hotness_consumer.start_http_server")
+    @mock.patch("hotness.hotness_consumer.Koji", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Redis", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_notifier", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.FedoraMessaging", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_patcher", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.MDApi", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Pagure", mock.Mock())
+    def test_init_metrics(self, mock_start_http_server, mock_atexit):
+        """
+        Assert that metrics server is started when enabled.
+        """
+        with mock.patch.dict(
+            "hotness.hotness_consumer.config",
+            {"metrics": {"enabled": True, "host": "127.0.0.1", "port": 9000}},
+        ):
+            consumer = HotnessConsumer()
+
+        mock_start_http_server.assert_called_with(port=9000, host="127.0.0.1")
+        assert consumer.metrics_server == mock_start_http_server.return_value
+        mock_atexit.register.assert_called_with(consumer.metrics_server.shutdown)
+
+    @mock.patch("hotness.hotness_consumer.atexit")
+    @mock.patch("hotness.hotness_consumer.start_http_server")
+    @mock.patch("hotness.hotness_consumer.Koji", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Redis", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_notifier", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.FedoraMessaging", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_patcher", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.MDApi", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Pagure", mock.Mock())
+    def test_init_metrics_not_installed(self, mock_start_http_server, mock_atexit):
+        """
+        Assert that consumer starts when metrics can't be exposed.
+        """
+        mock_start_http_server.return_value = None
+        with mock.patch.dict(
+            "hotness.hotness_consumer.config",
+            {"metrics": {"enabled": True, "host": "127.0.0.1", "port": 9000}},
+        ):
+            consumer = HotnessConsumer()
+
+        assert consumer.metrics_server is None
+        mock_atexit.register.assert_not_called()
+
+    @mock.patch("hotness.hotness_consumer.atexit")
+    @mock.patch("hotness.hotness_consumer.bz_notifier")
+    @mock.patch("hotness.hotness_consumer.Koji", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Redis", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.FedoraMessaging", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_patcher", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.MDApi", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Pagure", mock.Mock())
+    def test_init_bugzilla_update_delay(self, mock_bz_notifier_new, mock_atexit):
+        """
+        Assert that queued bug updates are flushed on exit when update delay is set.
+        """
+        with mock.patch.dict(
+            "hotness.hotness_consumer.config",
+            {"bugzilla": dict(config["bugzilla"], update_delay=5)},
+        ):
+            consumer = HotnessConsumer()
+
+        assert mock_bz_notifier_new.call_args.kwargs["update_delay"] == 5
+        mock_atexit.register.assert_called_with(consumer.notifier_bugzilla.flush)
+
+    @pytest.mark.parametrize(
+        "backend",
+        ["memory", "redis"],
+    )
+    @mock.patch("hotness.hotness_consumer.register_stats")
+    @mock.patch("hotness.hotness_consumer.CachedValidator")
+    @mock.patch("hotness.hotness_consumer.Cache")
+    @mock.patch("hotness.hotness_consumer.Redis")
+    @mock.patch("hotness.hotness_consumer.Pagure")
+    @mock.patch("hotness.hotness_consumer.Koji", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_notifier", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.FedoraMessaging", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_patcher", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.MDApi", mock.Mock())
+    def test_init_validator_cache(
+        self,
+        mock_pagure_new,
+        mock_redis_new,
+        mock_cache_new,
+        mock_cached_validator_new,
+        mock_register_stats,
+        backend,
+    ):
+        """
+        Assert that Pagure validator is wrapped by cache when enabled
+        and the cache statistics are exported.
+        """
+        validator_cache_config = {
+            "enabled": True,
+            "backend": backend,
+            "expiration": 60,
+            "max_size": 100,
+        }
+        with mock.patch.dict(
+            "hotness.hotness_consumer.config",
+            {"validator_cache": validator_cache_config},
+        ):
+            consumer = HotnessConsumer()
+
+        if backend == "redis":
+            mock_redis_new.assert_called_with(
+                hostname="localhost",
+                port=6379,
+                password="",
+                expiration_time=60,
+                connection_pool=mock_redis_new.return_value.connection_pool,
+            )
+            database = mock_redis_new.return_value
+        else:
+            mock_cache_new.assert_called_with(expiration_time=60, max_size=100)
+            database = mock_cache_new.return_value
+
+        mock_cached_validator_new.assert_called_with(
+            validator=mock_pagure_new.return_value,
+            database=database,
+            key_prefix="pagure:rawhide",
+        )
+        assert consumer.validator_pagure == mock_cached_validator_new.return_value
+        mock_register_stats.assert_any_call(
+            "validator_cache", mock_cached_validator_new.return_value.stats
+        )
+        mock_register_stats.assert_any_call(
+            "bugzilla", consumer.notifier_bugzilla.stats
+        )
+
+    @pytest.mark.parametrize(
+        "backend",
+        ["memory", "redis"],
+    )
+    @mock.patch("hotness.hotness_consumer.Deduplicator")
+    @mock.patch("hotness.hotness_consumer.Redis")
+    @mock.patch("hotness.hotness_consumer.Pagure", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Koji", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_notifier", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.FedoraMessaging", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_patcher", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.MDApi", mock.Mock())
+    def test_init_deduplication(self, mock_redis_new, mock_deduplicator_new, backend):
+        """
+        Assert that deduplicator is created when enabled.
+        """
+        deduplication_config = {
+            "enabled": True,
+            "window": 600,
+            "max_size": 100,
+            "backend": backend,
+        }
+        with mock.patch.dict(
+            "hotness.hotness_consumer.config",
+            {"deduplication": deduplication_config},
+        ):
+            consumer = HotnessConsumer()
+
+        database = None
+        if backend == "redis":
+            mock_redis_new.assert_called_with(
+                hostname="localhost",
+                port=6379,
+                password="",
+                expiration_time=600,
+                connection_pool=mock_redis_new.return_value.connection_pool,
+            )
+            database = mock_redis_new.return_value
+
+        mock_deduplicator_new.assert_called_with(
+            window=600, max_size=100, database=database
+        )
+        assert consumer.deduplicator == mock_deduplicator_new.return_value
+
+    @mock.patch.object(HotnessConsumer, "_start_task_filter_refresh_thread")
+    @mock.patch("hotness.hotness_consumer.Pagure", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Koji", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Redis", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_notifier", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.FedoraMessaging", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_patcher", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.MDApi", mock.Mock())
+    def test_init_task_filter(self, mock_start_refresh):
+        """
+        Assert that task filter is loaded in background when enabled.
+        """
+        with mock.patch.dict(
+            "hotness.hotness_consumer.config",
+            {"task_filter": dict(config["task_filter"], enabled=True)},
+        ):
+            consumer = HotnessConsumer()
+
+        mock_start_refresh.assert_called_once_with()
+        assert consumer._task_filter_refreshing
+        assert consumer.task_filter is None
+
+    @mock.patch("hotness.hotness_consumer.atexit")
+    @mock.patch("hotness.hotness_consumer.MDApiMirror")
+    @mock.patch("hotness.hotness_consumer.MDApi")
+    @mock.patch("hotness.hotness_consumer.Pagure", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Koji", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Redis", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_notifier", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.FedoraMessaging", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_patcher", mock.Mock())
+    def test_init_mdapi_mirror(self, mock_mdapi_new, mock_mirror_new, mock_atexit):
+        """
+        Assert that MDApi validator gets local mirror when enabled
+        and the mirror is refreshed in background.
+        """
+        mirror_config = {
+            "enabled": True,
+            "repo_url": "https://example.com/rawhide/source",
+            "cache_dir": "/var/cache/hotness/mdapi",
+            "refresh_interval": 600,
+        }
+        with mock.patch.dict(
+            "hotness.hotness_consumer.config", {"mdapi_mirror": mirror_config}
+        ):
+            consumer = HotnessConsumer()
+
+        mock_mirror_new.assert_called_with(
+            repo_url="https://example.com/rawhide/source",
+            cache_dir="/var/cache/hotness/mdapi",
+            requests_session=mock.ANY,
+            timeout=(15, 15),
+            refresh_interval=600,
+        )
+        mirror = mock_mirror_new.return_value
+        mirror.start.assert_called_once_with()
+        mirror.refresh.assert_not_called()
+        mock_atexit.register.assert_any_call(mirror.close)
+        assert mock_mdapi_new.call_args.kwargs["mirror"] == mirror
+        assert consumer.mdapi_mirror == mirror
+
+    @mock.patch("hotness.hotness_consumer.SnapshotValidator")
+    @mock.patch("hotness.hotness_consumer.Pagure")
+    @mock.patch("hotness.hotness_consumer.Koji", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Redis", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_notifier", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.FedoraMessaging", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_patcher", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.MDApi", mock.Mock())
+    def test_init_dist_git_snapshot(self, mock_pagure_new, mock_snapshot_new):
+        """
+        Assert that Pagure validator is wrapped by snapshot when enabled
+        and the snapshot is loaded.
+        """
+        snapshot_config = {
+            "enabled": True,
+            "source": "/var/lib/hotness/dist-git.json",
+            "refresh_interval": 600,
+            "max_age": 3600,
+        }
+        with mock.patch.dict(
+            "hotness.hotness_consumer.config",
+            {"dist_git_snapshot": snapshot_config},
+        ):
+            consumer = HotnessConsumer()
+
+        mock_snapshot_new.assert_called_with(
+            validator=mock_pagure_new.return_value,
+            source="/var/lib/hotness/dist-git.json",
+            requests_session=mock.ANY,
+            timeout=(15, 15),
+            refresh_interval=600,
+            max_age=3600,
+        )
+        mock_snapshot_new.return_value.load.assert_called_once_with()
+        assert consumer.validator_pagure == mock_snapshot_new.return_value
+
+    @mock.patch("hotness.hotness_consumer.GitMirror")
+    @mock.patch("hotness.hotness_consumer.Koji")
+    @mock.patch("hotness.hotness_consumer.Redis", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_notifier", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.FedoraMessaging", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_patcher", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.MDApi", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Pagure", mock.Mock())
+    def test_init_git_mirror(self, mock_koji_new, mock_git_mirror_new):
+        """
+        Assert that Koji builder gets the dist-git mirror when enabled.
+        """
+        koji_config = dict(config["koji"])
+        koji_config["mirror_dir"] = "/var/cache/hotness"
+        koji_config["mirror_max_size"] = 100
+        with mock.patch.dict("hotness.hotness_consumer.config", {"koji": koji_config}):
+            HotnessConsumer()
+
+        mock_git_mirror_new.assert_called_with(
+            cache_dir="/var/cache/hotness", max_size=100 * 1024 * 1024
+        )
+        assert (
+            mock_koji_new.call_args.kwargs["git_mirror"]
+            == mock_git_mirror_new.return_value
+        )
+
+    @mock.patch("hotness.hotness_consumer.register_stats")
+    @mock.patch("hotness.hotness_consumer.SourceCache")
+    @mock.patch("hotness.hotness_consumer.Koji")
+    @mock.patch("hotness.hotness_consumer.Redis", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_notifier", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.FedoraMessaging", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.bz_patcher", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.MDApi", mock.Mock())
+    @mock.patch("hotness.hotness_consumer.Pagure", mock.Mock())
+    def test_init_source_cache(
+        self, mock_koji_new, mock_source_cache_new, mock_register_stats
+    ):
+        """
+        Assert that Koji builder gets the source cache when enabled
+        and the cache statistics are exported.
+        """
+        koji_config = dict(config["koji"])
+        koji_config["source_cache_dir"] = "/var/cache/hotness-sources"
+        koji_config["source_cache_max_size"] = 100
+        with mock.patch.dict("hotness.hotness_consumer.config", {"koji": koji_config}):
+            HotnessConsumer()
+
+        mock_source_cache_new.assert_called_with(
+            cache_dir="/var/cache/hotness-sources", max_size=100 * 1024 * 1024
+        )
+        assert (
+            mock_koji_new.call_args.kwargs["source_cache"]
+            == mock_source_cache_new.return_value
+        )
+        mock_register_stats.assert_any_call(
+            "source_cache", mock_source_cache_new.return_value.stats
         )
 
 
@@ -1345,6 +1791,120 @@ class TestHotnessConsumerCall:
             package, "update.drop", exp_opts
         )
 
+    @mock.patch.dict(
+        "hotness.hotness_consumer.config",
+        {"bugzilla": dict(config["bugzilla"], update_delay=5)},
+    )
+    def test_call_anitya_update_bugzilla_queued(self):
+        """
+        Assert that queued comment is published to `update.bug.file` only
+        after it's sent and the scratch build is started.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        self.consumer.validator_pagure.validate.return_value = {
+            "bugzilla": True,
+            "monitoring": True,
+            "all_versions": False,
+            "stable_only": False,
+            "scratch_build": True,
+            "retired": False,
+        }
+        self.consumer.validator_mdapi.validate.return_value = {
+            "newer": True,
+            "version": "0.16.0",
+            "release": 1,
+        }
+        self.consumer.notifier_bugzilla.notify.return_value = {
+            "bz_id": 100,
+            "queued": True,
+        }
+        self.consumer.builder_koji.build.return_value = {
+            "build_id": 1000,
+            "patch": "Let's patch this heresy!",
+            "patch_filename": "patch_heresy.0001",
+            "message": "",
+        }
+
+        self.consumer.__call__(message)
+
+        package = Package(name="flatpak", version="1.0.4", distro="Fedora")
+        trigger = {"msg": message.body, "topic": message.topic}
+
+        assert self.consumer.notifier_bugzilla.notify.call_args_list[0][0][2] == {
+            "bz_short_desc": "flatpak-1.0.4 is available",
+            "trigger": trigger,
+        }
+        self.consumer.builder_koji.build.assert_called_with(package, {"bz_id": 100})
+        for call in self.consumer.notifier_fedora_messaging.notify.call_args_list:
+            assert call[0][1] != "update.bug.file"
+
+    def test_handle_bugzilla_update_sent(self):
+        """
+        Assert that sent queued update of bug is published as filled bug.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        package = Package(name="flatpak", version="1.0.4", distro="Fedora")
+        trigger = {"msg": message.body, "topic": message.topic}
+
+        self.consumer._handle_bugzilla_update_sent(
+            package,
+            {
+                "bz_id": 100,
+                "bz_short_desc": "flatpak-1.0.4 is available",
+                "trigger": trigger,
+            },
+        )
+
+        self.consumer.notifier_fedora_messaging.notify.assert_called_once_with(
+            package,
+            "update.bug.file",
+            {
+                "body": {
+                    "trigger": trigger,
+                    "bug": {"bug_id": 100},
+                    "package": "flatpak",
+                }
+            },
+        )
+
+    def test_handle_bugzilla_update_sent_no_trigger(self):
+        """
+        Assert that sent queued update not related to new version isn't published.
+        """
+        package = Package(name="flatpak", version="1.0.4", distro="Fedora")
+
+        self.consumer._handle_bugzilla_update_sent(package, {"bz_id": 100})
+
+        self.consumer.notifier_fedora_messaging.notify.assert_not_called()
+
+    def test_handle_bugzilla_update_failure(self):
+        """
+        Assert that failed queued update of bug is published as dropped update.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        package = Package(name="flatpak", version="1.0.4", distro="Fedora")
+        trigger = {"msg": message.body, "topic": message.topic}
+
+        self.consumer._handle_bugzilla_update_failure(
+            package, {"bz_short_desc": "flatpak-1.0.4 is available", "trigger": trigger}
+        )
+
+        self.consumer.notifier_fedora_messaging.notify.assert_called_once_with(
+            package,
+            "update.drop",
+            {"body": {"trigger": trigger, "reason": "bugzilla"}},
+        )
+
+    def test_handle_bugzilla_update_failure_no_trigger(self):
+        """
+        Assert that failed queued update not related to new version isn't published.
+        """
+        package = Package(name="flatpak", version="1.0.4", distro="Fedora")
+
+        self.consumer._handle_bugzilla_update_failure(package, {"bz_id": 100})
+
+        self.consumer.notifier_fedora_messaging.notify.assert_not_called()
+
     def test_call_anitya_update_bugzilla_exception(self):
         """
         Assert that update message is handled correctly, when bugzilla raises exception.
@@ -1439,6 +1999,346 @@ class TestHotnessConsumerCall:
             package, "update.bug.file", exp_opts
         )
 
+    def test_call_anitya_update_concurrent_mappings(self):
+        """
+        Assert that every mapping is processed when mappings are processed
+        concurrently.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        message.body["message"]["packages"].append(
+            {"distro": "Fedora", "package_name": "flatpak-builder"}
+        )
+        self.consumer.mapping_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2
+        )
+        self.consumer.validator_pagure.validate.return_value = {
+            "bugzilla": True,
+            "monitoring": True,
+            "all_versions": False,
+            "stable_only": False,
+            "scratch_build": False,
+            "retired": False,
+        }
+        self.consumer.validator_mdapi.validate.return_value = {
+            "newer": True,
+            "version": "0.16.0",
+            "release": 1,
+        }
+        self.consumer.notifier_bugzilla.notify.return_value = {"bz_id": 100}
+
+        self.consumer.__call__(message)
+
+        packages = [
+            Package(name="flatpak", version="1.0.4", distro="Fedora"),
+            Package(name="flatpak-builder", version="1.0.4", distro="Fedora"),
+        ]
+        for package in packages:
+            self.consumer.validator_pagure.validate.assert_any_call(package)
+
+            exp_opts = {
+                "body": {
+                    "trigger": {"msg": message.body, "topic": message.topic},
+                    "bug": {"bug_id": 100},
+                    "package": package.name,
+                }
+            }
+            self.consumer.notifier_fedora_messaging.notify.assert_any_call(
+                package, "update.bug.file", exp_opts
+            )
+
+        assert self.consumer.validator_pagure.validate.call_count == 2
+
+    def test_call_anitya_update_concurrent_mappings_network_error(self):
+        """
+        Assert that transient network error in worker raises Nack when mappings
+        are processed concurrently.
+        """
+        import requests
+        from fedora_messaging import exceptions as fm_exceptions
+
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        message.body["message"]["packages"].append(
+            {"distro": "Fedora", "package_name": "flatpak-builder"}
+        )
+        self.consumer.mapping_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2
+        )
+        self.consumer.validator_pagure.validate.side_effect = (
+            requests.exceptions.ConnectionError("Network unreachable")
+        )
+
+        with pytest.raises(fm_exceptions.Nack):
+            self.consumer.__call__(message)
+
+        # Nothing is processed, so the retried message doesn't repeat anything
+        self.consumer.notifier_bugzilla.notify.assert_not_called()
+        self.consumer.notifier_fedora_messaging.notify.assert_not_called()
+
+    @pytest.mark.parametrize("mapping_workers", [1, 2])
+    def test_call_anitya_update_first_mapping_dropped(self, mapping_workers):
+        """
+        Assert that processing stops on the first dropped mapping and the same
+        messages are published regardless of the number of mapping workers.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        message.body["message"]["packages"].append(
+            {"distro": "Fedora", "package_name": "flatpak-builder"}
+        )
+        if mapping_workers > 1:
+            self.consumer.mapping_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=mapping_workers
+            )
+        outputs = {
+            "flatpak": {
+                "bugzilla": True,
+                "monitoring": False,
+                "all_versions": False,
+                "stable_only": False,
+                "scratch_build": False,
+                "retired": False,
+            },
+            "flatpak-builder": {
+                "bugzilla": True,
+                "monitoring": True,
+                "all_versions": False,
+                "stable_only": False,
+                "scratch_build": False,
+                "retired": False,
+            },
+        }
+        self.consumer.validator_pagure.validate.side_effect = lambda package: outputs[
+            package.name
+        ]
+        self.consumer.validator_mdapi.validate.return_value = {
+            "newer": True,
+            "version": "0.16.0",
+            "release": 1,
+        }
+        self.consumer.notifier_bugzilla.notify.return_value = {"bz_id": 100}
+
+        self.consumer.__call__(message)
+
+        package = Package(name="flatpak", version="1.0.4", distro="Fedora")
+        exp_opts = {
+            "body": {
+                "trigger": {"msg": message.body, "topic": message.topic},
+                "reason": "monitoring settings",
+            }
+        }
+        assert self.consumer.notifier_fedora_messaging.notify.call_args_list == [
+            mock.call(package, "update.drop", exp_opts)
+        ]
+        self.consumer.notifier_bugzilla.notify.assert_not_called()
+
+    def test_call_anitya_update_duplicate(self):
+        """
+        Assert that the same update message is dropped before validation when
+        it was already processed.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        self.consumer.deduplicator = Deduplicator(window=60)
+        self.consumer.validator_pagure.validate.return_value = {
+            "bugzilla": True,
+            "monitoring": False,
+            "all_versions": False,
+            "stable_only": False,
+            "scratch_build": False,
+            "retired": False,
+        }
+
+        self.consumer.__call__(message)
+        self.consumer.__call__(message)
+
+        self.consumer.validator_pagure.validate.assert_called_once()
+        assert self.consumer.dropped_messages == {"duplicate": 1}
+        assert self.consumer.deduplicator.stats() == {
+            "hits": {"memory": 1, "database": 0},
+            "misses": 1,
+        }
+
+        # New version of the project isn't a duplicate
+        message.body["message"]["versions"].insert(0, "1.0.5")
+        self.consumer.__call__(message)
+
+        assert self.consumer.validator_pagure.validate.call_count == 2
+
+    def test_call_anitya_update_duplicate_retried(self):
+        """
+        Assert that message which should be retried isn't remembered
+        as processed.
+        """
+        import requests
+        from fedora_messaging import exceptions as fm_exceptions
+
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        self.consumer.deduplicator = Deduplicator(window=60)
+        self.consumer.validator_pagure.validate.side_effect = (
+            requests.exceptions.ConnectionError("Network unreachable")
+        )
+
+        with pytest.raises(fm_exceptions.Nack):
+            self.consumer.__call__(message)
+        with pytest.raises(fm_exceptions.Nack):
+            self.consumer.__call__(message)
+
+        assert self.consumer.validator_pagure.validate.call_count == 2
+        assert self.consumer.dropped_messages == {}
+
+    def test_call_anitya_update_duplicate_error_drop(self):
+        """
+        Assert that message dropped because of failure of external system isn't
+        remembered as processed, but message dropped by validation is.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        self.consumer.deduplicator = Deduplicator(window=60)
+        self.consumer.validator_pagure.validate.side_effect = Exception()
+
+        self.consumer.__call__(message)
+        self.consumer.__call__(message)
+
+        assert self.consumer.validator_pagure.validate.call_count == 2
+        assert self.consumer.dropped_messages == {}
+        assert (
+            self.consumer.notifier_fedora_messaging.notify.call_args[0][2]["body"][
+                "reason"
+            ]
+            == "dist-git"
+        )
+
+        self.consumer.validator_pagure.validate.side_effect = None
+        self.consumer.validator_pagure.validate.return_value = {
+            "bugzilla": True,
+            "monitoring": False,
+            "all_versions": False,
+            "stable_only": False,
+            "scratch_build": False,
+            "retired": False,
+        }
+
+        self.consumer.__call__(message)
+        self.consumer.__call__(message)
+
+        assert self.consumer.validator_pagure.validate.call_count == 3
+        assert self.consumer.dropped_messages == {"duplicate": 1}
+
+    def test_call_anitya_update_duplicate_permanent_error(self):
+        """
+        Assert that message which failed with permanent error isn't remembered
+        as processed.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        self.consumer.deduplicator = Deduplicator(window=60)
+        self.consumer.validator_pagure.validate.side_effect = Exception("Bug!")
+
+        self.consumer.__call__(message)
+        self.consumer.__call__(message)
+
+        assert self.consumer.validator_pagure.validate.call_count == 2
+        assert self.consumer.dropped_messages == {}
+
+    def test_call_anitya_update_scratch_build_queued(self):
+        """
+        Assert that scratch build is queued instead of started when build queue
+        is enabled.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        self.consumer.build_queue = mock.Mock()
+        self.consumer.validator_pagure.validate.return_value = {
+            "bugzilla": True,
+            "monitoring": True,
+            "all_versions": False,
+            "stable_only": False,
+            "scratch_build": True,
+            "retired": False,
+        }
+        self.consumer.validator_mdapi.validate.return_value = {
+            "newer": True,
+            "version": "0.16.0",
+            "release": 1,
+        }
+        self.consumer.notifier_bugzilla.notify.return_value = {"bz_id": 100}
+
+        self.consumer.__call__(message)
+
+        self.consumer.build_queue.put.assert_called_with(
+            {
+                "package": {
+                    "name": "flatpak",
+                    "version": "1.0.4",
+                    "distro": "Fedora",
+                },
+                "opts": {"bz_id": 100},
+            }
+        )
+        self.consumer.builder_koji.build.assert_not_called()
+        self.consumer.database_redis.insert.assert_not_called()
+        self.consumer.patcher_bugzilla.submit_patch.assert_not_called()
+
+    def test_call_anitya_update_scratch_build_queue_failure(self):
+        """
+        Assert that scratch build is started directly when it can't be queued.
+        """
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        self.consumer.build_queue = mock.Mock()
+        self.consumer.build_queue.put.side_effect = Exception("Queue is gone!")
+        self.consumer.validator_pagure.validate.return_value = {
+            "bugzilla": True,
+            "monitoring": True,
+            "all_versions": False,
+            "stable_only": False,
+            "scratch_build": True,
+            "retired": False,
+        }
+        self.consumer.validator_mdapi.validate.return_value = {
+            "newer": True,
+            "version": "0.16.0",
+            "release": 1,
+        }
+        self.consumer.notifier_bugzilla.notify.return_value = {"bz_id": 100}
+        self.consumer.builder_koji.build.return_value = {
+            "build_id": 1000,
+            "patch": "Let's patch this heresy!",
+            "patch_filename": "patch_heresy.0001",
+            "message": "",
+        }
+
+        self.consumer.__call__(message)
+
+        package = Package(name="flatpak", version="1.0.4", distro="Fedora")
+        self.consumer.builder_koji.build.assert_called_with(package, {"bz_id": 100})
+        self.consumer.database_redis.insert.assert_called_with("1000", "100")
+
+    def test_handle_queued_scratch_build(self):
+        """
+        Assert that queued scratch build is started and reported by build worker.
+        """
+        self.consumer.builder_koji.build.return_value = {
+            "build_id": 1000,
+            "patch": "Let's patch this heresy!",
+            "patch_filename": "patch_heresy.0001",
+            "message": "",
+        }
+
+        self.consumer._handle_queued_scratch_build(
+            {
+                "package": {
+                    "name": "flatpak",
+                    "version": "1.0.4",
+                    "distro": "Fedora",
+                },
+                "opts": {"bz_id": 100},
+            }
+        )
+
+        package = Package(name="flatpak", version="1.0.4", distro="Fedora")
+        self.consumer.builder_koji.build.assert_called_with(package, {"bz_id": 100})
+        self.consumer.database_redis.insert.assert_called_with("1000", "100")
+        self.consumer.patcher_bugzilla.submit_patch.assert_called_with(
+            package,
+            "Let's patch this heresy!",
+            {"bz_id": 100, "patch_filename": "patch_heresy.0001"},
+        )
+
     #
     #  buildsys.task.state.change topic
     #
@@ -1628,26 +2528,30 @@ class TestHotnessConsumerCall:
 
     def test_call_buildsys_task_build_not_in_done_state(self):
         """
-        Assert that message is handled correctly when the build is not in done state.
+        Assert that message is dropped without asking database when the build
+        is not in done state.
         """
         message = create_message("buildsys.task.state.change", "build")
-
-        self.consumer.database_redis.retrieve.return_value = {
-            "key": "90100954",
-            "value": "100",
-        }
+        dropped = metric_value(
+            "hotness_dropped_messages_total", filter="build_not_done"
+        )
 
         self.consumer.__call__(message)
 
-        self.consumer.database_redis.retrieve.assert_called_with("90100954")
+        self.consumer.database_redis.retrieve.assert_not_called()
 
         self.consumer.notifier_bugzilla.notify.assert_not_called()
+        assert self.consumer.dropped_messages == {"build_not_done": 1}
+        assert (
+            metric_value("hotness_dropped_messages_total", filter="build_not_done")
+            == dropped + 1
+        )
 
     def test_call_buildsys_task_build_database_retrieve_failure(self):
         """
         Assert that message is handled correctly when we can't retrieve value from database.
         """
-        message = create_message("buildsys.task.state.change", "build")
+        message = create_message("buildsys.task.state.change", "build_completed")
 
         self.consumer.database_redis.retrieve.side_effect = Exception(
             "This is tech heresy!"
@@ -1663,7 +2567,7 @@ class TestHotnessConsumerCall:
         """
         Assert that message is handled correctly when the build is not in database.
         """
-        message = create_message("buildsys.task.state.change", "build")
+        message = create_message("buildsys.task.state.change", "build_completed")
 
         self.consumer.database_redis.retrieve.return_value = {
             "key": "90100954",
@@ -1686,6 +2590,7 @@ class TestHotnessConsumerCall:
 
         # Assert that nothing is called
         self.consumer.database_redis.retrieve.assert_not_called()
+        assert self.consumer.dropped_messages == {"secondary_instance": 1}
 
     def test_call_buildsys_task_non_build(self):
         """
@@ -1697,6 +2602,178 @@ class TestHotnessConsumerCall:
 
         # Assert that nothing is called
         self.consumer.database_redis.retrieve.assert_not_called()
+        assert self.consumer.dropped_messages == {"non_build_method": 1}
+
+    @mock.patch.dict(
+        "hotness.hotness_consumer.config",
+        {"task_filter": dict(config["task_filter"], enabled=True, refresh_interval=0)},
+    )
+    def test_call_buildsys_task_filter_unknown(self):
+        """
+        Assert that message for task not in task filter is dropped without
+        asking the database.
+        """
+        message = create_message("buildsys.task.state.change", "build_completed")
+        self.consumer.database_redis.scan_keys.return_value = ["1000"]
+        self.consumer._refresh_task_filter()
+
+        self.consumer.__call__(message)
+
+        self.consumer.database_redis.scan_keys.assert_called_once_with("[0-9]*")
+        self.consumer.database_redis.retrieve.assert_not_called()
+        self.consumer.notifier_bugzilla.notify.assert_not_called()
+
+    @mock.patch.dict(
+        "hotness.hotness_consumer.config",
+        {"task_filter": dict(config["task_filter"], enabled=True, refresh_interval=0)},
+    )
+    def test_call_buildsys_task_filter_known(self):
+        """
+        Assert that message for task in task filter is handled.
+        """
+        message = create_message("buildsys.task.state.change", "build_completed")
+        self.consumer.database_redis.scan_keys.return_value = ["90100954"]
+        self.consumer._refresh_task_filter()
+        self.consumer.database_redis.retrieve.return_value = {
+            "key": "90100954",
+            "value": "100",
+        }
+
+        self.consumer.__call__(message)
+
+        self.consumer.database_redis.retrieve.assert_called_with("90100954")
+        self.consumer.notifier_bugzilla.notify.assert_called_once()
+
+    @mock.patch.dict(
+        "hotness.hotness_consumer.config",
+        {"task_filter": dict(config["task_filter"], enabled=True, refresh_interval=0)},
+    )
+    def test_call_buildsys_task_filter_load_failure(self):
+        """
+        Assert that task filter is disabled when it can't be loaded from database.
+        """
+        message = create_message("buildsys.task.state.change", "build_completed")
+        self.consumer.database_redis.scan_keys.side_effect = Exception(
+            "This is tech heresy!"
+        )
+        self.consumer._refresh_task_filter()
+
+        self.consumer.__call__(message)
+
+        assert self.consumer.task_filter is None
+        self.consumer.database_redis.retrieve.assert_called_with("90100954")
+
+    @mock.patch("hotness.hotness_consumer.threading.Thread")
+    @mock.patch("hotness.hotness_consumer.time")
+    @mock.patch.dict(
+        "hotness.hotness_consumer.config",
+        {"task_filter": dict(config["task_filter"], enabled=True)},
+    )
+    def test_call_buildsys_task_filter_refresh(self, mock_time, mock_thread):
+        """
+        Assert that task filter is loaded again in background after refresh
+        interval and the current filter is used until it's loaded.
+        """
+        mock_time.monotonic.side_effect = [0, 3600, 3600, 3600]
+        message = create_message("buildsys.task.state.change", "build_completed")
+        self.consumer.database_redis.scan_keys.side_effect = [[], ["90100954"]]
+        self.consumer._refresh_task_filter()
+
+        self.consumer.__call__(message)
+
+        # Message is filtered by the current filter, database is not scanned
+        assert self.consumer.database_redis.scan_keys.call_count == 1
+        self.consumer.database_redis.retrieve.assert_not_called()
+        assert self.consumer._task_filter_refreshing
+        mock_thread.assert_called_once_with(
+            target=mock.ANY, name="hotness-task-filter", daemon=True
+        )
+        mock_thread.return_value.start.assert_called_once_with()
+
+        # Run the background refresh
+        mock_thread.call_args.kwargs["target"]()
+
+        assert self.consumer.database_redis.scan_keys.call_count == 2
+        assert "90100954" in self.consumer.task_filter
+        assert not self.consumer._task_filter_refreshing
+
+        self.consumer.__call__(message)
+
+        self.consumer.database_redis.retrieve.assert_called_with("90100954")
+
+    @mock.patch("hotness.hotness_consumer.threading.Thread")
+    @mock.patch("hotness.hotness_consumer.time")
+    @mock.patch.dict(
+        "hotness.hotness_consumer.config",
+        {"task_filter": dict(config["task_filter"], enabled=True)},
+    )
+    def test_call_buildsys_task_filter_refresh_running(self, mock_time, mock_thread):
+        """
+        Assert that task filter is not loaded again while it's loading.
+        """
+        mock_time.monotonic.return_value = 3600
+        message = create_message("buildsys.task.state.change", "build_completed")
+        self.consumer._task_filter_refreshing = True
+
+        self.consumer.__call__(message)
+
+        mock_thread.assert_not_called()
+
+    @mock.patch("hotness.hotness_consumer.threading.Thread")
+    def test_refresh_task_filter_thread_tracked(self, mock_thread):
+        """
+        Assert that tasks tracked while the task filter is loading are added
+        to the loaded filter.
+        """
+        self.consumer.database_redis.scan_keys.return_value = ["1000"]
+        self.consumer._task_filter_refreshing = True
+        self.consumer._start_task_filter_refresh_thread()
+
+        self.consumer._track_task("2000")
+        mock_thread.call_args.kwargs["target"]()
+
+        assert "1000" in self.consumer.task_filter
+        assert "2000" in self.consumer.task_filter
+        assert self.consumer._task_filter_pending is None
+        assert not self.consumer._task_filter_refreshing
+
+    @mock.patch("hotness.hotness_consumer.threading.Thread")
+    def test_refresh_task_filter_thread_failure(self, mock_thread):
+        """
+        Assert that task filter can be loaded again after failed load.
+        """
+        self.consumer.database_redis.scan_keys.side_effect = Exception(
+            "This is tech heresy!"
+        )
+        self.consumer._task_filter_refreshing = True
+        self.consumer._start_task_filter_refresh_thread()
+
+        mock_thread.call_args.kwargs["target"]()
+
+        assert self.consumer.task_filter is None
+        assert not self.consumer._task_filter_refreshing
+
+    @mock.patch.dict(
+        "hotness.hotness_consumer.config",
+        {"task_filter": dict(config["task_filter"], enabled=True)},
+    )
+    def test_handle_scratch_build_task_filter(self):
+        """
+        Assert that started scratch build is added to task filter.
+        """
+        self.consumer.database_redis.scan_keys.return_value = []
+        self.consumer._refresh_task_filter()
+        self.consumer.builder_koji.build.return_value = {
+            "build_id": 1000,
+            "patch": "Let's patch this heresy!",
+            "patch_filename": "patch_heresy.0001",
+            "message": "",
+        }
+        package = Package(name="flatpak", version="1.0.4", distro="Fedora")
+
+        self.consumer._handle_scratch_build(package, 100)
+
+        assert "1000" in self.consumer.task_filter
 
     def test_call_transient_network_error_raises_nack(self):
         """
@@ -1718,6 +2795,78 @@ class TestHotnessConsumerCall:
         package = Package(name="flatpak", version="1.0.4", distro="Fedora")
         self.consumer.validator_pagure.validate.assert_called_with(package)
 
+    @pytest.mark.parametrize(
+        "fixture, result",
+        [("build_completed", "handled"), ("build", "filtered")],
+    )
+    def test_call_metrics(self, fixture, result):
+        """
+        Assert that received messages are counted by result and their duration
+        is observed.
+        """
+        message = create_message("buildsys.task.state.change", fixture)
+        self.consumer.database_redis.retrieve.return_value = {
+            "key": "90100954",
+            "value": "",
+        }
+        count = metric_value(
+            "hotness_messages_total", topic=message.topic, result=result
+        )
+        duration_count = metric_value(
+            "hotness_message_duration_seconds_count", topic=message.topic
+        )
+
+        self.consumer.__call__(message)
+
+        assert (
+            metric_value("hotness_messages_total", topic=message.topic, result=result)
+            == count + 1
+        )
+        assert (
+            metric_value("hotness_message_duration_seconds_count", topic=message.topic)
+            == duration_count + 1
+        )
+
+    def test_call_metrics_error(self):
+        """
+        Assert that message dropped because of error is counted.
+        """
+        message = create_message("buildsys.task.state.change", "build_completed")
+        del message.body["info"]
+        count = metric_value(
+            "hotness_messages_total", topic=message.topic, result="error"
+        )
+
+        self.consumer.__call__(message)
+
+        assert (
+            metric_value("hotness_messages_total", topic=message.topic, result="error")
+            == count + 1
+        )
+
+    def test_call_metrics_nack(self):
+        """
+        Assert that message which will be retried is counted.
+        """
+        import requests
+        from fedora_messaging import exceptions as fm_exceptions
+
+        message = create_message("anitya.project.version.update.v2", "fedora_mapping")
+        self.consumer.validator_pagure.validate.side_effect = (
+            requests.exceptions.Timeout("Request timed out")
+        )
+        count = metric_value(
+            "hotness_messages_total", topic=message.topic, result="nack"
+        )
+
+        with pytest.raises(fm_exceptions.Nack):
+            self.consumer.__call__(message)
+
+        assert (
+            metric_value("hotness_messages_total", topic=message.topic, result="nack")
+            == count + 1
+        )
+
     def test_call_transient_timeout_error_raises_nack(self):
         """
         Assert that timeout errors raise Nack to retry the message.
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import asyncio
+
+import pytest
+from unittest import mock
+
+from hotness.use_cases.async_package_check_use_case import AsyncPackageCheckUseCase
+from hotness import responses
+
+
+class TestAsyncPackageCheckUseCaseInit:
+    """
+    Test class for `hotness.use_cases.AsyncPackageCheckUseCase.__init__` method
+    """
+
+    def test_init(self):
+        """
+        Assert that the object is correctly created.
+        """
+        validator = mock.Mock()
+
+        use_case = AsyncPackageCheckUseCase(validator=validator)
+
+        assert use_case.validator == validator
+
+
+class TestAsyncPackageCheckUseCaseValidate:
+    """
+    Test class for `hotness.use_cases.AsyncPackageCheckUseCase.validate` method
+    """
+
+    def test_validate(self):
+        """
+        Assert that the validation is awaited and successful response is returned.
+        """
+        validator = mock.Mock()
+        validator.validate = mock.AsyncMock(return_value={"validation_output": True})
+
+        package = mock.Mock()
+        request = mock.Mock()
+        request.package = package
+
+        use_case = AsyncPackageCheckUseCase(validator=validator)
+
+        result = asyncio.run(use_case.validate(request))
+
+        validator.validate.assert_awaited_with(package)
+        assert type(result) is responses.ResponseSuccess
+        assert result.value == {"validation_output": True}
+
+    def test_validate_invalid_request(self):
+        """
+        Assert that the validate fails when request validation fails.
+        """
+        validator = mock.Mock()
+        validator.validate = mock.AsyncMock()
+
+        request = mock.MagicMock()
+        request.__bool__.return_value = False
+        request.errors = []
+
+        use_case = AsyncPackageCheckUseCase(validator=validator)
+
+        result = asyncio.run(use_case.validate(request))
+
+        validator.validate.assert_not_awaited()
+        assert type(result) is responses.ResponseFailure
+        assert result.value["type"] == responses.ResponseFailure.INVALID_REQUEST_ERROR
+
+    def test_validate_failure(self):
+        """
+        Assert that failure response is returned when validator raises exception.
+        """
+        validator = mock.Mock()
+        validator.validate = mock.AsyncMock(side_effect=Exception("This is heresy!"))
+
+        request = mock.Mock()
+
+        use_case = AsyncPackageCheckUseCase(validator=validator)
+
+        result = asyncio.run(use_case.validate(request))
+
+        assert type(result) is responses.ResponseFailure
+        assert result.value == {
+            "type": responses.ResponseFailure.VALIDATOR_ERROR,
+            "message": "Exception: This is heresy!",
+            "use_case_value": None,
+        }
+
+    def test_validate_timeout(self):
+        """
+        Assert that timeout is raised, so the message could be retried.
+        """
+        validator = mock.Mock()
+        validator.validate = mock.AsyncMock(side_effect=asyncio.TimeoutError())
+
+        use_case = AsyncPackageCheckUseCase(validator=validator)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(use_case.validate(mock.Mock()))
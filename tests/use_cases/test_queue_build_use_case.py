@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+from unittest import mock
+
+from hotness.use_cases import QueueBuildUseCase
+from hotness import responses
+
+
+class TestQueueBuildUseCaseInit:
+    """
+    Test class for `hotness.use_cases.QueueBuildUseCase.__init__` method
+    """
+
+    def test_init(self):
+        """
+        Assert that the object is correctly created.
+        """
+        queue = mock.Mock()
+
+        use_case = QueueBuildUseCase(queue=queue)
+
+        assert use_case.queue == queue
+
+
+class TestQueueBuildUseCaseQueueBuild:
+    """
+    Test class for `hotness.use_cases.QueueBuildUseCase.queue_build` method
+    """
+
+    def test_queue_build(self):
+        """
+        Assert that the put is called correctly and successful response
+        is returned when no error is encountered.
+        """
+        queue = mock.Mock()
+
+        request = mock.MagicMock()
+        request.package.to_dict.return_value = {"name": "test"}
+        request.opts = {"bz_id": 100}
+        request.__bool__.return_value = True
+
+        use_case = QueueBuildUseCase(queue=queue)
+
+        result = use_case.queue_build(request)
+
+        exp_value = {"package": {"name": "test"}, "opts": {"bz_id": 100}}
+        queue.put.assert_called_with(exp_value)
+        assert type(result) is responses.ResponseSuccess
+        assert bool(result) is True
+        assert result.value == exp_value
+
+    def test_queue_build_invalid_request(self):
+        """
+        Assert that the queue_build fails when request validation fails.
+        """
+        errors = [
+            {
+                "parameter": "param",
+                "error": "This is not the parameter you are looking for.",
+            }
+        ]
+        queue = mock.Mock()
+
+        request = mock.MagicMock()
+        request.__bool__.return_value = False
+        request.errors = errors
+
+        use_case = QueueBuildUseCase(queue=queue)
+
+        result = use_case.queue_build(request)
+
+        queue.put.assert_not_called()
+        assert type(result) is responses.ResponseFailure
+        assert bool(result) is False
+        assert result.value == {
+            "type": responses.ResponseFailure.INVALID_REQUEST_ERROR,
+            "message": str(errors),
+            "use_case_value": None,
+        }
+
+    def test_queue_build_failure(self):
+        """
+        Assert that the put is called correctly and failure response
+        is returned when queue raises exception.
+        """
+        queue = mock.Mock()
+        queue.put.side_effect = Exception("This is heresy!")
+
+        request = mock.MagicMock()
+        request.package.to_dict.return_value = {"name": "test"}
+        request.opts = {"bz_id": 100}
+        request.__bool__.return_value = True
+
+        use_case = QueueBuildUseCase(queue=queue)
+
+        result = use_case.queue_build(request)
+
+        assert type(result) is responses.ResponseFailure
+        assert bool(result) is False
+        assert result.value == {
+            "type": responses.ResponseFailure.QUEUE_ERROR,
+            "message": "Exception: This is heresy!",
+            "use_case_value": None,
+        }
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import asyncio
+from unittest import mock
+
+import pytest
+
+from hotness.validators import async_http
+
+
+class TestBackoffTime:
+    """
+    Test class for `hotness.validators.async_http.backoff_time` function.
+    """
+
+    @pytest.mark.parametrize(
+        "attempt, expected", [(1, 0), (2, 2), (3, 4), (4, 5), (10, 5)]
+    )
+    def test_backoff_time(self, attempt, expected):
+        """
+        Assert that backoff grows exponentially up to the maximum.
+        """
+        assert async_http.backoff_time(attempt) == expected
+
+
+class TestWithRetries:
+    """
+    Test class for `hotness.validators.async_http.with_retries` function.
+    """
+
+    @mock.patch("hotness.validators.async_http.asyncio.sleep")
+    def test_with_retries(self, mock_sleep):
+        """
+        Assert that request is retried on transient error.
+        """
+        request = mock.AsyncMock(side_effect=[asyncio.TimeoutError(), "response"])
+
+        assert asyncio.run(async_http.with_retries(request, 3)) == "response"
+        assert request.await_count == 2
+        mock_sleep.assert_called_once_with(0)
+
+    @mock.patch("hotness.validators.async_http.asyncio.sleep")
+    def test_with_retries_exhausted(self, mock_sleep):
+        """
+        Assert that the last transient error is raised when all retries failed.
+        """
+        request = mock.AsyncMock(side_effect=asyncio.TimeoutError())
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(async_http.with_retries(request, 3))
+
+        assert request.await_count == 4
+        assert mock_sleep.call_args_list == [
+            mock.call(0),
+            mock.call(2),
+            mock.call(4),
+        ]
+
+    @mock.patch("hotness.validators.async_http.asyncio.sleep")
+    def test_with_retries_disabled(self, mock_sleep):
+        """
+        Assert that request is not retried when retries are disabled.
+        """
+        request = mock.AsyncMock(side_effect=asyncio.TimeoutError())
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(async_http.with_retries(request, 0))
+
+        assert request.await_count == 1
+        mock_sleep.assert_not_called()
+
+    @mock.patch("hotness.validators.async_http.asyncio.sleep")
+    def test_with_retries_other_error(self, mock_sleep):
+        """
+        Assert that request is not retried on error which is not transient.
+        """
+        request = mock.AsyncMock(side_effect=ValueError("This is heresy!"))
+
+        with pytest.raises(ValueError):
+            asyncio.run(async_http.with_retries(request, 3))
+
+        assert request.await_count == 1
+        mock_sleep.assert_not_called()
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import asyncio
+from unittest import mock
+
+import pytest
+
+from hotness.domain import Package
+from hotness.validators import AsyncMDApi
+from hotness.exceptions import HTTPException
+
+from .test_async_pagure import FakeResponse, FakeSession
+
+
+class TestAsyncMDApiInit:
+    """
+    Test class for `hotness.validators.AsyncMDApi.__init__` method.
+    """
+
+    def test_init(self):
+        """
+        Assert that AsyncMDApi object is initialized correctly.
+        """
+        session = FakeSession({})
+
+        validator = AsyncMDApi("http://testing.url", session, cache_expiration=30)
+
+        assert validator.url == "http://testing.url"
+        assert validator.session == session
+        assert validator.cache_expiration == 30
+        assert validator.mirror is None
+        assert validator.retries == 0
+
+
+class TestAsyncMDApiValidate:
+    """
+    Test class for `hotness.validators.AsyncMDApi.validate` method.
+    """
+
+    def test_validate(self):
+        """
+        Assert that newer version is recognized.
+        """
+        session = FakeSession(
+            {"srcpkg/test": FakeResponse(200, data={"version": "1.0", "release": "1"})}
+        )
+        validator = AsyncMDApi("http://testing.url", session)
+        package = Package(name="test", version="1.1", distro="Fedora")
+
+        output = asyncio.run(validator.validate(package))
+
+        assert output == {"newer": True, "version": "1.0", "release": "1"}
+        assert session.urls == ["http://testing.url/koji/srcpkg/test"]
+
+    def test_validate_rc_in_release(self):
+        """
+        Assert that release candidate in release is taken into account.
+        """
+        session = FakeSession(
+            {
+                "srcpkg/test": FakeResponse(
+                    200, data={"version": "1.0", "release": "0.1.rc1.fc40"}
+                )
+            }
+        )
+        validator = AsyncMDApi("http://testing.url", session)
+        package = Package(name="test", version="1.0", distro="Fedora")
+
+        output = asyncio.run(validator.validate(package))
+
+        assert output["newer"] is True
+
+    def test_validate_response_not_ok(self):
+        """
+        Assert that HTTPException is raised when mdapi returns error.
+        """
+        session = FakeSession({"srcpkg/test": FakeResponse(404)})
+        validator = AsyncMDApi("http://testing.url", session)
+        package = Package(name="test", version="1.0", distro="Fedora")
+
+        with pytest.raises(HTTPException):
+            asyncio.run(validator.validate(package))
+
+    @mock.patch("hotness.validators.async_http.asyncio.sleep")
+    def test_validate_retry(self, mock_sleep):
+        """
+        Assert that request failed on transient error is retried.
+        """
+        session = FakeSession(
+            {
+                "srcpkg/test": [
+                    asyncio.TimeoutError(),
+                    asyncio.TimeoutError(),
+                    FakeResponse(200, data={"version": "0.9", "release": "1.fc40"}),
+                ]
+            }
+        )
+        validator = AsyncMDApi("http://testing.url", session, retries=3)
+        package = Package(name="test", version="1.0", distro="Fedora")
+
+        output = asyncio.run(validator.validate(package))
+
+        assert output["newer"] is True
+        assert len(session.urls) == 3
+        assert mock_sleep.call_args_list == [mock.call(0), mock.call(2)]
+
+    def test_validate_response_not_ok_no_retry(self):
+        """
+        Assert that request isn't retried when mdapi returns error.
+        """
+        session = FakeSession({"srcpkg/test": FakeResponse(500)})
+        validator = AsyncMDApi("http://testing.url", session, retries=3)
+        package = Package(name="test", version="1.0", distro="Fedora")
+
+        with pytest.raises(HTTPException):
+            asyncio.run(validator.validate(package))
+
+        assert len(session.urls) == 1
+
+    def test_validate_mirror(self):
+        """
+        Assert that metadata are read from mirror without asking mdapi.
+        """
+        session = FakeSession({})
+        mirror = mock.Mock()
+        mirror.srcpkg.return_value = {"epoch": "0", "version": "1.0", "release": "1"}
+        validator = AsyncMDApi("http://testing.url", session, mirror=mirror)
+        package = Package(name="test", version="1.1", distro="Fedora")
+
+        output = asyncio.run(validator.validate(package))
+
+        assert output == {"newer": True, "version": "1.0", "release": "1"}
+        assert session.urls == []
+
+    def test_validate_mirror_missing(self):
+        """
+        Assert that mdapi is asked for package missing in mirror.
+        """
+        session = FakeSession(
+            {"srcpkg/test": FakeResponse(200, data={"version": "1.0", "release": "1"})}
+        )
+        mirror = mock.Mock()
+        mirror.srcpkg.return_value = None
+        validator = AsyncMDApi("http://testing.url", session, mirror=mirror)
+        package = Package(name="test", version="1.1", distro="Fedora")
+
+        asyncio.run(validator.validate(package))
+
+        assert session.urls == ["http://testing.url/koji/srcpkg/test"]
+
+    def test_validate_cache(self):
+        """
+        Assert that the metadata are cached.
+        """
+        session = FakeSession(
+            {"srcpkg/test": FakeResponse(200, data={"version": "1.0", "release": "1"})}
+        )
+        validator = AsyncMDApi("http://testing.url", session, cache_expiration=30)
+        package = Package(name="test", version="1.1", distro="Fedora")
+
+        asyncio.run(validator.validate(package))
+        asyncio.run(validator.validate(package))
+
+        assert len(session.urls) == 1
+
+    def test_validate_concurrent_packages(self):
+        """
+        Assert that concurrent validations of the same package share one request
+        and the outputs are in the same order as packages.
+        """
+        session = FakeSession(
+            {
+                "srcpkg/test": FakeResponse(
+                    200, data={"version": "1.0", "release": "1"}
+                ),
+                "srcpkg/other": FakeResponse(
+                    200, data={"version": "2.0", "release": "1"}
+                ),
+            }
+        )
+        validator = AsyncMDApi("http://testing.url", session)
+        packages = [
+            Package(name="test", version="1.1", distro="Fedora"),
+            Package(name="other", version="1.0", distro="Fedora"),
+            Package(name="test", version="0.9", distro="Fedora"),
+        ]
+
+        async def validate_all():
+            return await asyncio.gather(*(validator.validate(p) for p in packages))
+
+        outputs = asyncio.run(validate_all())
+
+        assert [output["newer"] for output in outputs] == [True, False, False]
+        assert sorted(session.urls) == [
+            "http://testing.url/koji/srcpkg/other",
+            "http://testing.url/koji/srcpkg/test",
+        ]
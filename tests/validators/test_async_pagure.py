@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+from hotness.domain import Package
+from hotness.validators import AsyncPagure, async_http
+from hotness.exceptions import HTTPException
+
+
+class FakeResponse:
+    """
+    Response of `FakeSession` behaving like `aiohttp.ClientResponse`.
+    """
+
+    def __init__(self, status: int, text: str = "", data: dict = None) -> None:
+        self.status = status
+        self._text = text
+        self._data = data
+
+    async def text(self) -> str:
+        if self._data is not None:
+            return json.dumps(self._data)
+        return self._text
+
+    async def json(self, content_type: str = "application/json") -> dict:
+        return self._data
+
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+
+class FakeSession:
+    """
+    Session behaving like `aiohttp.ClientSession` returning prepared responses.
+    Response is chosen by the suffix of requested URL, list of responses
+    is returned one by one.
+    """
+
+    def __init__(self, responses: dict) -> None:
+        self.responses = responses
+        self.urls = []
+
+    def get(self, url: str) -> FakeResponse:
+        self.urls.append(url)
+        for suffix, response in self.responses.items():
+            if url.endswith(suffix):
+                if isinstance(response, list):
+                    response = response.pop(0)
+                if isinstance(response, BaseException):
+                    raise response
+                return response
+        raise AssertionError("Unexpected request {}".format(url))
+
+
+class TestAsyncPagureInit:
+    """
+    Test class for `hotness.validators.AsyncPagure.__init__` method.
+    """
+
+    def test_init(self):
+        """
+        Assert that AsyncPagure object is initialized correctly.
+        """
+        session = FakeSession({})
+
+        validator = AsyncPagure("http://testing.url", session, "rawhide", "rpm")
+
+        assert validator.url == "http://testing.url"
+        assert validator.session == session
+        assert validator.branch == "rawhide"
+        assert validator.package_type == "rpm"
+        assert validator.parallel_requests is False
+        assert validator.retries == 0
+
+
+class TestAsyncPagureValidate:
+    """
+    Test class for `hotness.validators.AsyncPagure.validate` method.
+    """
+
+    def setup_method(self):
+        """
+        Prepare package for tests.
+        """
+        self.package = Package(name="test", version="1.0", distro="Fedora")
+
+    def validate(
+        self, responses: dict, parallel_requests: bool = False, retries: int = 0
+    ) -> dict:
+        """
+        Validate the package with session returning the responses.
+        """
+        self.session = FakeSession(responses)
+        validator = AsyncPagure(
+            "http://testing.url",
+            self.session,
+            "rawhide",
+            "rpm",
+            parallel_requests=parallel_requests,
+            retries=retries,
+        )
+        return asyncio.run(validator.validate(self.package))
+
+    def test_validate_monitoring_config(self):
+        """
+        Assert that monitoring settings are read from monitoring.toml file.
+        """
+        output = self.validate(
+            {
+                "dead.package": FakeResponse(404),
+                "monitoring.toml": FakeResponse(
+                    200, text="stable_only = true\nscratch_build = true\n"
+                ),
+            }
+        )
+
+        assert output == {
+            "monitoring": True,
+            "bugzilla": True,
+            "all_versions": False,
+            "stable_only": True,
+            "scratch_build": True,
+            "retired": False,
+        }
+        assert self.session.urls == [
+            "http://testing.url/rpms/test/blob/rawhide/f/dead.package",
+            "http://testing.url/rpms/test/raw/rawhide/f/monitoring.toml",
+        ]
+
+    def test_validate_monitoring_value(self):
+        """
+        Assert that monitoring value is read from dist-git, when there is
+        no monitoring.toml file.
+        """
+        output = self.validate(
+            {
+                "dead.package": FakeResponse(404),
+                "monitoring.toml": FakeResponse(404),
+                "_dg/anitya/rpms/test": FakeResponse(
+                    200, data={"monitoring": "monitoring-all-scratch"}
+                ),
+            }
+        )
+
+        assert output == {
+            "monitoring": True,
+            "bugzilla": True,
+            "all_versions": True,
+            "stable_only": False,
+            "scratch_build": True,
+            "retired": False,
+        }
+
+    def test_validate_retired(self):
+        """
+        Assert that monitoring isn't checked for retired package.
+        """
+        output = self.validate({"dead.package": FakeResponse(200)})
+
+        assert output["retired"] is True
+        assert output["monitoring"] is False
+        assert len(self.session.urls) == 1
+
+    def test_validate_response_retired_not_ok(self):
+        """
+        Assert that HTTPException is raised when retirement check fails.
+        """
+        with pytest.raises(HTTPException):
+            self.validate({"dead.package": FakeResponse(500)})
+
+    def test_validate_response_monitoring_not_ok(self):
+        """
+        Assert that HTTPException is raised when monitoring value can't be retrieved.
+        """
+        with pytest.raises(HTTPException):
+            self.validate(
+                {
+                    "dead.package": FakeResponse(404),
+                    "monitoring.toml": FakeResponse(404),
+                    "_dg/anitya/rpms/test": FakeResponse(503),
+                }
+            )
+
+    def test_validate_parallel_requests(self):
+        """
+        Assert that all the requests are started at once when parallel requests
+        are enabled and monitoring config still takes precedence.
+        """
+        output = self.validate(
+            {
+                "dead.package": FakeResponse(404),
+                "monitoring.toml": FakeResponse(200, text="all_versions = true\n"),
+                "_dg/anitya/rpms/test": FakeResponse(
+                    200, data={"monitoring": "no-monitoring"}
+                ),
+            },
+            parallel_requests=True,
+        )
+
+        assert output["monitoring"] is True
+        assert output["all_versions"] is True
+        assert sorted(self.session.urls) == [
+            "http://testing.url/_dg/anitya/rpms/test",
+            "http://testing.url/rpms/test/blob/rawhide/f/dead.package",
+            "http://testing.url/rpms/test/raw/rawhide/f/monitoring.toml",
+        ]
+
+    def test_validate_parallel_requests_unused_error(self):
+        """
+        Assert that error of request which isn't needed is ignored when parallel
+        requests are enabled.
+        """
+        output = self.validate(
+            {
+                "dead.package": FakeResponse(200),
+                "monitoring.toml": FakeResponse(404),
+                "_dg/anitya/rpms/test": ConnectionError("Connection reset"),
+            },
+            parallel_requests=True,
+        )
+
+        assert output["retired"] is True
+        assert output["monitoring"] is False
+
+    def test_validate_parallel_requests_retired_not_ok(self):
+        """
+        Assert that HTTPException is raised when retirement check fails with
+        parallel requests enabled.
+        """
+        with pytest.raises(HTTPException):
+            self.validate(
+                {
+                    "dead.package": FakeResponse(500),
+                    "monitoring.toml": FakeResponse(404),
+                    "_dg/anitya/rpms/test": FakeResponse(200, data={}),
+                },
+                parallel_requests=True,
+            )
+
+    @mock.patch("hotness.validators.async_http.asyncio.sleep")
+    def test_validate_retry(self, mock_sleep):
+        """
+        Assert that request failed on transient error is retried.
+        """
+        output = self.validate(
+            {
+                "dead.package": [asyncio.TimeoutError(), FakeResponse(404)],
+                "monitoring.toml": FakeResponse(404),
+                "_dg/anitya/rpms/test": FakeResponse(
+                    200, data={"monitoring": "monitoring"}
+                ),
+            },
+            retries=3,
+        )
+
+        assert output["monitoring"] is True
+        assert len(self.session.urls) == 4
+        mock_sleep.assert_called_once_with(0)
+
+    @mock.patch("hotness.validators.async_http.asyncio.sleep")
+    def test_validate_retry_exhausted(self, mock_sleep):
+        """
+        Assert that transient error is raised when all retries failed.
+        """
+        with pytest.raises(asyncio.TimeoutError):
+            self.validate(
+                {"dead.package": asyncio.TimeoutError()},
+                retries=2,
+            )
+
+        assert len(self.session.urls) == 3
+        assert mock_sleep.call_args_list == [mock.call(0), mock.call(2)]
+
+
+class TestAsyncPagureServer:
+    """
+    Test class for `hotness.validators.AsyncPagure` talking to real HTTP server
+    through session created by `hotness.validators.async_http`.
+    """
+
+    def test_validate(self):
+        """
+        Assert that every dist-git request is done by the shared session
+        and responses are read correctly.
+        """
+        pytest.importorskip("aiohttp")
+        from aiohttp import test_utils, web
+
+        requested = []
+
+        async def dead_package(request):
+            requested.append(request.path)
+            return web.Response(status=404)
+
+        async def monitoring_config(request):
+            requested.append(request.path)
+            return web.Response(status=404)
+
+        async def monitoring_value(request):
+            requested.append(request.path)
+            return web.json_response({"monitoring": "monitoring-with-scratch"})
+
+        async def validate(parallel_requests):
+            app = web.Application()
+            app.router.add_get("/rpms/test/blob/rawhide/f/dead.package", dead_package)
+            app.router.add_get(
+                "/rpms/test/raw/rawhide/f/monitoring.toml", monitoring_config
+            )
+            app.router.add_get("/_dg/anitya/rpms/test", monitoring_value)
+
+            async with test_utils.TestServer(app) as server:
+                session = async_http.create_session(
+                    connect_timeout=5, read_timeout=5, pool_size=3
+                )
+                async with session:
+                    validator = AsyncPagure(
+                        str(server.make_url("")).rstrip("/"),
+                        session,
+                        "rawhide",
+                        "rpm",
+                        parallel_requests=parallel_requests,
+                    )
+                    return await validator.validate(
+                        Package(name="test", version="1.0", distro="Fedora")
+                    )
+
+        expected = {
+            "monitoring": True,
+            "bugzilla": True,
+            "all_versions": False,
+            "stable_only": False,
+            "scratch_build": True,
+            "retired": False,
+        }
+        assert asyncio.run(validate(False)) == expected
+        assert asyncio.run(validate(True)) == expected
+        assert sorted(requested) == sorted(
+            [
+                "/rpms/test/blob/rawhide/f/dead.package",
+                "/rpms/test/raw/rawhide/f/monitoring.toml",
+                "/_dg/anitya/rpms/test",
+            ]
+            * 2
+        )
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+from unittest import mock
+
+import pytest
+
+from hotness.databases import Cache
+from hotness.domain import Package
+from hotness.validators import CachedValidator
+
+
+class TestCachedValidatorInit:
+    """
+    Test class for `hotness.validators.CachedValidator.__init__` method.
+    """
+
+    def test_init(self):
+        """
+        Assert that cached validator is initialized successfully.
+        """
+        validator = mock.Mock()
+        database = mock.Mock()
+
+        cached_validator = CachedValidator(validator, database, "pagure:rawhide")
+
+        assert cached_validator.validator == validator
+        assert cached_validator.database == database
+        assert cached_validator.key_prefix == "pagure:rawhide"
+        assert cached_validator.stats() == {"hits": 0, "misses": 0}
+
+
+class TestCachedValidatorValidate:
+    """
+    Test class for `hotness.validators.CachedValidator.validate` method.
+    """
+
+    def setup_method(self):
+        """
+        Create cached validator for tests.
+        """
+        self.validator = mock.Mock()
+        self.validator.validate.return_value = {"monitoring": True, "retired": False}
+        self.database = Cache()
+        self.cached_validator = CachedValidator(
+            self.validator, self.database, "pagure:rawhide"
+        )
+        self.package = Package(name="test", version="1.0", distro="Fedora")
+
+    def test_validate(self):
+        """
+        Assert that output of validator is cached and reused.
+        """
+        result = self.cached_validator.validate(self.package)
+        result_cached = self.cached_validator.validate(self.package)
+
+        assert result == {"monitoring": True, "retired": False}
+        assert result_cached == result
+        self.validator.validate.assert_called_once_with(self.package)
+        assert self.database.cache == {
+            "pagure:rawhide:test": '{"monitoring": true, "retired": false}'
+        }
+        assert self.cached_validator.stats() == {"hits": 1, "misses": 1}
+
+    def test_validate_different_packages(self):
+        """
+        Assert that output is cached per package.
+        """
+        package = Package(name="other", version="1.0", distro="Fedora")
+
+        self.cached_validator.validate(self.package)
+        self.cached_validator.validate(package)
+
+        assert self.validator.validate.call_count == 2
+        assert self.cached_validator.stats() == {"hits": 0, "misses": 2}
+
+    def test_validate_exception(self):
+        """
+        Assert that exception from validator is raised and nothing is cached.
+        """
+        self.validator.validate.side_effect = Exception("This is heresy!")
+
+        with pytest.raises(Exception, match="This is heresy!"):
+            self.cached_validator.validate(self.package)
+
+        assert self.database.cache == {}
+
+    def test_validate_database_failure(self):
+        """
+        Assert that validator is called when database fails.
+        """
+        database = mock.Mock()
+        database.retrieve.side_effect = Exception("Database is gone!")
+        database.insert.side_effect = Exception("Database is gone!")
+        cached_validator = CachedValidator(self.validator, database, "pagure:rawhide")
+
+        result = cached_validator.validate(self.package)
+
+        assert result == {"monitoring": True, "retired": False}
+        self.validator.validate.assert_called_once_with(self.package)
+        assert cached_validator.stats() == {"hits": 0, "misses": 1}
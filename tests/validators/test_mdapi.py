@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import threading
+
 import pytest
 from unittest import mock
 
@@ -41,6 +43,8 @@ class TestMDAPIInit:
         assert validator.url == url
         assert validator.requests_session == requests_session
         assert validator.timeout == timeout
+        assert validator.cache_expiration == 0
+        assert validator.mirror is None
 
 
 class TestMDAPIValidate:
@@ -231,3 +235,245 @@ class TestMDAPIValidate:
         requests_session.get.assert_called_with(
             url + "/koji/srcpkg/test", timeout=timeout
         )
+
+    def test_validate_cache(self):
+        """
+        Assert that metadata are retrieved only once when cache is enabled.
+        """
+        url = "http://testing.url"
+        timeout = (5, 20)
+
+        # Mock requests_session
+        requests_session = mock.Mock()
+
+        response = mock.Mock()
+        response.status_code = 200
+        response.json.return_value = {"version": "1.0", "release": "1.fc34"}
+        requests_session.get.return_value = response
+
+        # Prepare package
+        package = Package(name="test", version="1.1", distro="Fedora")
+
+        validator = MDApi(url, requests_session, timeout, cache_expiration=30)
+
+        first = validator.validate(package)
+        second = validator.validate(package)
+
+        requests_session.get.assert_called_once_with(
+            url + "/koji/srcpkg/test", timeout=timeout
+        )
+
+        assert first == second
+        assert first["newer"] is True
+
+    def test_validate_cache_disabled(self):
+        """
+        Assert that metadata are retrieved every time when cache is disabled.
+        """
+        url = "http://testing.url"
+        timeout = (5, 20)
+
+        # Mock requests_session
+        requests_session = mock.Mock()
+
+        response = mock.Mock()
+        response.status_code = 200
+        response.json.return_value = {"version": "1.0", "release": "1.fc34"}
+        requests_session.get.return_value = response
+
+        # Prepare package
+        package = Package(name="test", version="1.1", distro="Fedora")
+
+        validator = MDApi(url, requests_session, timeout)
+
+        validator.validate(package)
+        validator.validate(package)
+
+        assert requests_session.get.call_count == 2
+
+    def test_validate_mirror(self):
+        """
+        Assert that metadata are read from mirror without asking mdapi.
+        """
+        requests_session = mock.Mock()
+        mirror = mock.Mock()
+        mirror.srcpkg.return_value = {
+            "epoch": "0",
+            "version": "1.0",
+            "release": "1.fc34",
+        }
+        package = Package(name="test", version="1.1", distro="Fedora")
+
+        validator = MDApi("http://testing.url", requests_session, None, mirror=mirror)
+
+        result = validator.validate(package)
+
+        assert result == {"newer": True, "version": "1.0", "release": "1.fc34"}
+        mirror.srcpkg.assert_called_once_with("test")
+        requests_session.get.assert_not_called()
+
+    def test_validate_mirror_missing(self):
+        """
+        Assert that mdapi is asked for package missing in mirror.
+        """
+        requests_session = mock.Mock()
+        response = mock.Mock()
+        response.status_code = 200
+        response.json.return_value = {"version": "1.2", "release": "1.fc34"}
+        requests_session.get.return_value = response
+        mirror = mock.Mock()
+        mirror.srcpkg.return_value = None
+        package = Package(name="test", version="1.1", distro="Fedora")
+
+        validator = MDApi("http://testing.url", requests_session, None, mirror=mirror)
+
+        result = validator.validate(package)
+
+        assert result["newer"] is False
+        requests_session.get.assert_called_once_with(
+            "http://testing.url/koji/srcpkg/test", timeout=None
+        )
+
+    def test_validate_response_not_ok_not_cached(self):
+        """
+        Assert that failed response isn't cached.
+        """
+        url = "http://testing.url"
+        timeout = (5, 20)
+
+        # Mock requests_session
+        requests_session = mock.Mock()
+
+        response = mock.Mock()
+        response.status_code = 500
+        requests_session.get.return_value = response
+
+        # Prepare package
+        package = Package(name="test", version="1.0", distro="Fedora")
+
+        validator = MDApi(url, requests_session, timeout, cache_expiration=30)
+
+        with pytest.raises(HTTPException):
+            validator.validate(package)
+
+        with pytest.raises(HTTPException):
+            validator.validate(package)
+
+        assert requests_session.get.call_count == 2
+
+    def test_validate_coalesce_requests(self):
+        """
+        Assert that concurrent validations of the same package share one request.
+        """
+        url = "http://testing.url"
+        timeout = (5, 20)
+
+        request_started = threading.Event()
+        release_request = threading.Event()
+
+        response = mock.Mock()
+        response.status_code = 200
+        response.json.return_value = {"version": "1.0", "release": "1.fc34"}
+
+        def get(*args, **kwargs):
+            request_started.set()
+            release_request.wait(5)
+            return response
+
+        # Mock requests_session
+        requests_session = mock.Mock()
+        requests_session.get.side_effect = get
+
+        # Prepare package
+        package = Package(name="test", version="1.1", distro="Fedora")
+
+        validator = MDApi(url, requests_session, timeout)
+
+        results = []
+
+        def validate():
+            results.append(validator.validate(package))
+
+        owner = threading.Thread(target=validate)
+        owner.start()
+        request_started.wait(5)
+
+        waiting = threading.Event()
+        with mock.patch("hotness.validators.mdapi._logger") as mock_logger:
+            mock_logger.debug.side_effect = lambda *args: waiting.set()
+            waiter = threading.Thread(target=validate)
+            waiter.start()
+            # Wait until the second validation is waiting for the request
+            # in progress
+            waiting.wait(5)
+            release_request.set()
+
+        owner.join(5)
+        waiter.join(5)
+
+        requests_session.get.assert_called_once_with(
+            url + "/koji/srcpkg/test", timeout=timeout
+        )
+
+        assert len(results) == 2
+        assert results[0] == results[1]
+        assert validator._in_flight == {}
+
+    def test_validate_coalesce_requests_exception(self):
+        """
+        Assert that exception raised by shared request is raised in every
+        waiting validation.
+        """
+        url = "http://testing.url"
+        timeout = (5, 20)
+
+        request_started = threading.Event()
+        release_request = threading.Event()
+
+        response = mock.Mock()
+        response.status_code = 500
+
+        def get(*args, **kwargs):
+            request_started.set()
+            release_request.wait(5)
+            return response
+
+        # Mock requests_session
+        requests_session = mock.Mock()
+        requests_session.get.side_effect = get
+
+        # Prepare package
+        package = Package(name="test", version="1.1", distro="Fedora")
+
+        validator = MDApi(url, requests_session, timeout)
+
+        errors = []
+
+        def validate():
+            try:
+                validator.validate(package)
+            except HTTPException as ex:
+                errors.append(ex)
+
+        owner = threading.Thread(target=validate)
+        owner.start()
+        request_started.wait(5)
+
+        waiting = threading.Event()
+        with mock.patch("hotness.validators.mdapi._logger") as mock_logger:
+            mock_logger.debug.side_effect = lambda *args: waiting.set()
+            waiter = threading.Thread(target=validate)
+            waiter.start()
+            # Wait until the second validation is waiting for the request
+            # in progress
+            waiting.wait(5)
+            release_request.set()
+
+        owner.join(5)
+        waiter.join(5)
+
+        requests_session.get.assert_called_once()
+
+        assert len(errors) == 2
+        assert errors[0].error_code == 500
+        assert errors[1].error_code == 500
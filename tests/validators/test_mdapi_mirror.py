@@ -0,0 +1,442 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import gzip
+import hashlib
+import lzma
+import os
+import sqlite3
+import time
+from unittest import mock
+
+import pytest
+import zstandard
+
+from hotness.exceptions import HTTPException
+from hotness.validators import MDApiMirror
+
+REPOMD = """<?xml version="1.0" encoding="UTF-8"?>
+<repomd xmlns="http://linux.duke.edu/metadata/repo">
+  <revision>1700000000</revision>
+  <data type="primary">
+    <checksum type="sha256">aaaa</checksum>
+    <location href="repodata/aaaa-primary.xml.gz"/>
+  </data>
+  <data type="primary_db">
+    <checksum type="sha256">{checksum}</checksum>
+    <location href="{location}"/>
+  </data>
+</repomd>
+"""
+
+
+def create_primary_db(path: str, packages: list) -> bytes:
+    """
+    Create primary database with packages and return its content.
+    """
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE packages (pkgKey INTEGER PRIMARY KEY, name TEXT, arch TEXT, "
+        "epoch TEXT, version TEXT, release TEXT)"
+    )
+    connection.executemany(
+        "INSERT INTO packages (name, arch, epoch, version, release) "
+        "VALUES (?, ?, ?, ?, ?)",
+        packages,
+    )
+    connection.commit()
+    connection.close()
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class FakeRepository:
+    """
+    Session returning repository metadata with primary database.
+    """
+
+    def __init__(self, tmpdir, packages: list, compression: str = "xz") -> None:
+        self.get = mock.Mock(side_effect=self._get)
+        self.publish(tmpdir, packages, compression)
+
+    def publish(self, tmpdir, packages: list, compression: str = "xz") -> None:
+        """
+        Publish new primary database with packages.
+        """
+        content = create_primary_db(
+            os.path.join(tmpdir, "primary-{}.sqlite".format(len(packages))), packages
+        )
+        compress = {
+            "xz": lzma.compress,
+            "gz": gzip.compress,
+            "zst": zstandard.compress,
+            "sqlite": bytes,
+        }
+        self.content = compress[compression](content)
+        self.checksum = hashlib.sha256(self.content).hexdigest()
+        self.location = "repodata/{}-primary.sqlite.{}".format(
+            self.checksum, compression
+        ).replace(".sqlite.sqlite", ".sqlite")
+
+    def _get(self, url, timeout=None, stream=False):
+        response = mock.Mock()
+        response.status_code = 200
+        if url.endswith("repomd.xml"):
+            response.content = REPOMD.format(
+                checksum=self.checksum, location=self.location
+            ).encode()
+        elif url.endswith(self.location):
+            response.iter_content.return_value = [
+                self.content[:10],
+                self.content[10:],
+            ]
+        else:
+            response.status_code = 404
+        return response
+
+
+PACKAGES = [
+    ("foo", "src", "0", "1.0", "1.fc40"),
+    ("foo", "x86_64", "0", "9.9", "1.fc40"),
+    ("bar", "src", "1", "2.0", "1.fc40"),
+    ("bar", "src", "1", "2.0", "2.fc40"),
+]
+
+
+class TestMDApiMirrorInit:
+    """
+    Test class for `hotness.validators.MDApiMirror.__init__` method.
+    """
+
+    def test_init(self, tmpdir):
+        """
+        Assert that MDApiMirror object is initialized correctly.
+        """
+        cache_dir = os.path.join(tmpdir, "mdapi")
+        requests_session = mock.Mock()
+
+        mirror = MDApiMirror(
+            "https://example.com/source/",
+            cache_dir,
+            requests_session,
+            (5, 20),
+            refresh_interval=600,
+        )
+
+        assert mirror.repo_url == "https://example.com/source"
+        assert mirror.cache_dir == cache_dir
+        assert mirror.requests_session == requests_session
+        assert mirror.timeout == (5, 20)
+        assert mirror.refresh_interval == 600
+        assert mirror.stats() == {"checksum": "", "hits": 0, "misses": 0}
+        assert os.path.isdir(cache_dir)
+        requests_session.get.assert_not_called()
+
+    @mock.patch("hotness.validators.mdapi_mirror.zstandard", None)
+    def test_init_no_zstandard(self, tmpdir, caplog):
+        """
+        Assert that missing zstandard is reported.
+        """
+        MDApiMirror("https://example.com/source", str(tmpdir), mock.Mock(), None)
+
+        assert "zstandard isn't installed" in caplog.text
+        assert caplog.records[-1].levelname == "ERROR"
+
+
+class TestMDApiMirrorStart:
+    """
+    Test class for `hotness.validators.MDApiMirror.start` method.
+    """
+
+    @mock.patch("hotness.validators.mdapi_mirror.threading.Thread")
+    def test_start(self, mock_thread, tmpdir):
+        """
+        Assert that first refresh runs in background thread and lookups
+        don't wait for it.
+        """
+        repository = FakeRepository(tmpdir, PACKAGES)
+        mirror = MDApiMirror(
+            "https://example.com/source", str(tmpdir), repository, None
+        )
+
+        mirror.start()
+        mirror.start()
+
+        mock_thread.assert_called_once_with(
+            target=mock.ANY, name="hotness-mdapi-mirror", daemon=True
+        )
+        mock_thread.return_value.start.assert_called_once_with()
+        repository.get.assert_not_called()
+        assert mirror.srcpkg("foo") is None
+
+        # Run the refresh
+        mock_thread.call_args.kwargs["target"]()
+
+        assert mirror._refreshing is False
+        assert mirror.srcpkg("foo") == {
+            "epoch": "0",
+            "version": "1.0",
+            "release": "1.fc40",
+        }
+
+
+class TestMDApiMirrorRefresh:
+    """
+    Test class for `hotness.validators.MDApiMirror.refresh` method.
+    """
+
+    @pytest.mark.parametrize("compression", ["xz", "gz", "zst", "sqlite"])
+    def test_refresh(self, tmpdir, compression):
+        """
+        Assert that primary database is downloaded and used.
+        """
+        repository = FakeRepository(tmpdir, PACKAGES, compression)
+        cache_dir = os.path.join(tmpdir, "mdapi")
+        mirror = MDApiMirror(
+            "https://example.com/source", cache_dir, repository, (5, 20)
+        )
+
+        assert mirror.refresh() is True
+
+        assert mirror.checksum == repository.checksum
+        assert os.listdir(cache_dir) == ["primary-{}.sqlite".format(mirror.checksum)]
+        repository.get.assert_has_calls(
+            [
+                mock.call(
+                    "https://example.com/source/repodata/repomd.xml", timeout=(5, 20)
+                ),
+                mock.call(
+                    "https://example.com/source/" + repository.location,
+                    timeout=(5, 20),
+                    stream=True,
+                ),
+            ]
+        )
+        assert mirror.srcpkg("foo") == {
+            "epoch": "0",
+            "version": "1.0",
+            "release": "1.fc40",
+        }
+
+    def test_refresh_unchanged(self, tmpdir):
+        """
+        Assert that database isn't downloaded again when it didn't change.
+        """
+        repository = FakeRepository(tmpdir, PACKAGES)
+        mirror = MDApiMirror(
+            "https://example.com/source",
+            os.path.join(tmpdir, "mdapi"),
+            repository,
+            None,
+        )
+        mirror.refresh()
+
+        assert mirror.refresh() is True
+
+        assert repository.get.call_count == 3
+
+    def test_refresh_reuse_downloaded(self, tmpdir):
+        """
+        Assert that database downloaded by previous run is reused.
+        """
+        repository = FakeRepository(tmpdir, PACKAGES)
+        cache_dir = os.path.join(tmpdir, "mdapi")
+        MDApiMirror("https://example.com/source", cache_dir, repository, None).refresh()
+
+        mirror = MDApiMirror("https://example.com/source", cache_dir, repository, None)
+
+        assert mirror.refresh() is True
+
+        assert repository.get.call_count == 3
+        assert mirror.srcpkg("foo") is not None
+
+    def test_refresh_changed(self, tmpdir):
+        """
+        Assert that new database replaces the old one.
+        """
+        repository = FakeRepository(tmpdir, PACKAGES)
+        cache_dir = os.path.join(tmpdir, "mdapi")
+        mirror = MDApiMirror("https://example.com/source", cache_dir, repository, None)
+        mirror.refresh()
+
+        repository.publish(tmpdir, [("foo", "src", "0", "1.1", "1.fc40")])
+
+        assert mirror.refresh() is True
+
+        assert mirror.srcpkg("foo")["version"] == "1.1"
+        assert mirror.srcpkg("bar") is None
+        assert os.listdir(cache_dir) == ["primary-{}.sqlite".format(mirror.checksum)]
+
+    def test_refresh_checksum_mismatch(self, tmpdir):
+        """
+        Assert that database with wrong checksum isn't used.
+        """
+        repository = FakeRepository(tmpdir, PACKAGES)
+        repository.content += b"heresy"
+        cache_dir = os.path.join(tmpdir, "mdapi")
+        mirror = MDApiMirror("https://example.com/source", cache_dir, repository, None)
+
+        assert mirror.refresh() is False
+
+        assert mirror.checksum == ""
+        assert mirror.srcpkg("foo") is None
+        assert os.listdir(cache_dir) == []
+
+    @pytest.mark.parametrize(
+        "repomd",
+        [
+            None,
+            '<repomd xmlns="http://linux.duke.edu/metadata/repo"></repomd>',
+            "This is not XML",
+        ],
+    )
+    def test_refresh_invalid_repomd(self, tmpdir, repomd):
+        """
+        Assert that the old database is kept when metadata can't be read.
+        """
+        repository = FakeRepository(tmpdir, PACKAGES)
+        mirror = MDApiMirror(
+            "https://example.com/source",
+            os.path.join(tmpdir, "mdapi"),
+            repository,
+            None,
+        )
+        mirror.refresh()
+
+        response = mock.Mock()
+        response.status_code = 503 if repomd is None else 200
+        response.content = (repomd or "").encode()
+        repository.get.side_effect = None
+        repository.get.return_value = response
+
+        assert mirror.refresh() is False
+
+        assert mirror.srcpkg("foo") is not None
+
+    def test_read_repomd_http_error(self, tmpdir):
+        """
+        Assert that HTTPException is raised when metadata can't be downloaded.
+        """
+        requests_session = mock.Mock()
+        requests_session.get.return_value.status_code = 404
+        mirror = MDApiMirror(
+            "https://example.com/source", str(tmpdir), requests_session, None
+        )
+
+        with pytest.raises(HTTPException) as ex:
+            mirror._read_repomd()
+
+        assert ex.value.error_code == 404
+
+    def test_download_unsupported_compression(self, tmpdir):
+        """
+        Assert that unsupported compression is reported.
+        """
+        repository = FakeRepository(tmpdir, PACKAGES)
+        repository.location = repository.location.replace(".xz", ".lz4")
+        mirror = MDApiMirror(
+            "https://example.com/source", str(tmpdir), repository, None
+        )
+
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            mirror._download(repository.location, "sha256", repository.checksum)
+
+
+class TestMDApiMirrorSrcpkg:
+    """
+    Test class for `hotness.validators.MDApiMirror.srcpkg` method.
+    """
+
+    def create_mirror(self, tmpdir, refresh_interval=0):
+        """
+        Create mirror with downloaded database.
+        """
+        repository = FakeRepository(tmpdir, PACKAGES)
+        mirror = MDApiMirror(
+            "https://example.com/source",
+            os.path.join(tmpdir, "mdapi"),
+            repository,
+            None,
+            refresh_interval=refresh_interval,
+        )
+        mirror.refresh()
+        return mirror
+
+    def test_srcpkg_newest(self, tmpdir):
+        """
+        Assert that the newest source package is returned.
+        """
+        mirror = self.create_mirror(tmpdir)
+
+        assert mirror.srcpkg("bar") == {
+            "epoch": "1",
+            "version": "2.0",
+            "release": "2.fc40",
+        }
+        assert mirror.stats()["hits"] == 1
+
+    def test_srcpkg_missing(self, tmpdir):
+        """
+        Assert that None is returned for missing package.
+        """
+        mirror = self.create_mirror(tmpdir)
+
+        assert mirror.srcpkg("baz") is None
+        assert mirror.stats()["misses"] == 1
+
+    def test_srcpkg_no_database(self, tmpdir):
+        """
+        Assert that None is returned when there is no database.
+        """
+        mirror = MDApiMirror(
+            "https://example.com/source", str(tmpdir), mock.Mock(), None, 0
+        )
+
+        assert mirror.srcpkg("foo") is None
+
+    def test_srcpkg_closed(self, tmpdir):
+        """
+        Assert that None is returned after the database is closed.
+        """
+        mirror = self.create_mirror(tmpdir)
+
+        mirror.close()
+
+        assert mirror.srcpkg("foo") is None
+
+    @mock.patch("hotness.validators.mdapi_mirror.threading.Thread")
+    def test_srcpkg_refresh(self, mock_thread, tmpdir):
+        """
+        Assert that metadata are checked again in background after refresh
+        interval and only one refresh runs at a time.
+        """
+        mirror = self.create_mirror(tmpdir, refresh_interval=60)
+        mirror._refreshed = time.monotonic() - 120
+
+        mirror.srcpkg("foo")
+        mirror.srcpkg("foo")
+
+        mock_thread.assert_called_once_with(
+            target=mock.ANY, name="hotness-mdapi-mirror", daemon=True
+        )
+        mock_thread.return_value.start.assert_called_once_with()
+
+        # Run the refresh
+        mock_thread.call_args.kwargs["target"]()
+
+        assert mirror.requests_session.get.call_count == 3
+        assert mirror._refreshing is False
@@ -45,6 +45,26 @@ class TestPagureInit:
         assert validator.timeout == timeout
         assert validator.branch == branch
         assert validator.package_type == package_type
+        assert validator.parallel_requests is False
+        assert validator.max_workers == 3
+
+    def test_init_parallel_requests(self):
+        """
+        Assert that Pagure class is initialized with parallel requests.
+        """
+        validator = Pagure(
+            "http://testing.url",
+            mock.Mock(),
+            (5, 20),
+            "rawhide",
+            "rpm",
+            parallel_requests=True,
+            max_workers=6,
+        )
+
+        assert validator.parallel_requests is True
+        assert validator.max_workers == 6
+        assert validator._executor._max_workers == 6
 
 
 class TestPagureValidate:
@@ -398,3 +418,126 @@ class TestPagureValidate:
         assert result["stable_only"] is monitoring_config.get("stable_only", False)
         assert result["scratch_build"] is monitoring_config.get("scratch_build", False)
         assert result["retired"] is False
+
+
+class TestPagureValidateParallel:
+    """
+    Test class for `hotness.validators.Pagure.validate` method with parallel
+    requests enabled.
+    """
+
+    def setup_method(self):
+        """
+        Setup phase before test.
+        """
+        self.responses = {}
+        requests_session = mock.Mock()
+        requests_session.get.side_effect = lambda url, timeout: self.responses[url]
+
+        self.validator = Pagure(
+            "http://testing.url",
+            requests_session,
+            (5, 20),
+            "rawhide",
+            "rpm",
+            parallel_requests=True,
+        )
+        self.dead_package_url = (
+            "http://testing.url/rpms/test/blob/rawhide/f/dead.package"
+        )
+        self.monitoring_config_url = (
+            "http://testing.url/rpms/test/raw/rawhide/f/monitoring.toml"
+        )
+        self.dist_git_url = "http://testing.url/_dg/anitya/rpms/test"
+
+    def add_response(self, url, status_code, text="", data=None):
+        """
+        Add response for URL to mocked session.
+        """
+        response = mock.Mock()
+        response.status_code = status_code
+        response.text = text
+        response.json.return_value = data
+        self.responses[url] = response
+
+    def test_validate_all_requests(self):
+        """
+        Assert that all the requests are done and monitoring config takes
+        precedence over the old monitoring setting.
+        """
+        self.add_response(self.dead_package_url, 404)
+        self.add_response(
+            self.monitoring_config_url,
+            200,
+            text="monitoring = true\nscratch_build = true\n",
+        )
+        self.add_response(self.dist_git_url, 200, data={"monitoring": "no-monitoring"})
+        package = Package(name="test", version="1.0", distro="Fedora")
+
+        result = self.validator.validate(package)
+
+        assert result == {
+            "monitoring": True,
+            "bugzilla": True,
+            "all_versions": False,
+            "stable_only": False,
+            "scratch_build": True,
+            "retired": False,
+        }
+        self.validator.requests_session.get.assert_has_calls(
+            [
+                mock.call(self.dead_package_url, timeout=(5, 20)),
+                mock.call(self.monitoring_config_url, timeout=(5, 20)),
+                mock.call(self.dist_git_url, timeout=(5, 20)),
+            ],
+            any_order=True,
+        )
+
+    def test_validate_monitoring_setting(self):
+        """
+        Assert that old monitoring setting is used when monitoring config
+        is not available.
+        """
+        self.add_response(self.dead_package_url, 404)
+        self.add_response(self.monitoring_config_url, 404)
+        self.add_response(
+            self.dist_git_url, 200, data={"monitoring": "monitoring-with-scratch"}
+        )
+        package = Package(name="test", version="1.0", distro="Fedora")
+
+        result = self.validator.validate(package)
+
+        assert result["monitoring"] is True
+        assert result["scratch_build"] is True
+        assert result["retired"] is False
+
+    def test_validate_unused_request_error(self):
+        """
+        Assert that error of request which isn't needed is ignored.
+        """
+        self.add_response(self.dead_package_url, 200)
+        self.add_response(self.monitoring_config_url, 404)
+        package = Package(name="test", version="1.0", distro="Fedora")
+
+        result = self.validator.validate(package)
+
+        assert result["retired"] is True
+        assert result["monitoring"] is False
+
+    def test_validate_response_retired_not_ok(self):
+        """
+        Assert that validation raises HTTPException when response code is 500
+        for the retirement call.
+        """
+        self.add_response(self.dead_package_url, 500)
+        self.add_response(self.monitoring_config_url, 200, text="monitoring = true")
+        self.add_response(self.dist_git_url, 200, data={"monitoring": "monitoring"})
+        package = Package(name="test", version="1.0", distro="Fedora")
+
+        with pytest.raises(HTTPException) as ex:
+            self.validator.validate(package)
+
+        assert ex.value.error_code == 500
+        assert ex.value.message == (
+            "Error encountered on request {}".format(self.dead_package_url)
+        )
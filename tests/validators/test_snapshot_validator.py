@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
+import json
+import os
+import time
+from unittest import mock
+
+import pytest
+
+from hotness.domain import Package
+from hotness.exceptions import HTTPException
+from hotness.validators import SnapshotValidator
+
+SNAPSHOT = {
+    "generated": 1700000000,
+    "packages": {
+        "monitored": {"monitoring": True, "scratch_build": True},
+        "retired": {"retired": True},
+    },
+}
+
+
+class TestSnapshotValidatorInit:
+    """
+    Test class for `hotness.validators.SnapshotValidator.__init__` method.
+    """
+
+    def test_init(self):
+        """
+        Assert that snapshot validator is initialized successfully.
+        """
+        validator = mock.Mock()
+        requests_session = mock.Mock()
+
+        snapshot_validator = SnapshotValidator(
+            validator,
+            "https://example.com/dist-git.json",
+            requests_session,
+            (5, 20),
+            refresh_interval=600,
+            max_age=3600,
+        )
+
+        assert snapshot_validator.validator == validator
+        assert snapshot_validator.source == "https://example.com/dist-git.json"
+        assert snapshot_validator.requests_session == requests_session
+        assert snapshot_validator.timeout == (5, 20)
+        assert snapshot_validator.refresh_interval == 600
+        assert snapshot_validator.max_age == 3600
+        assert snapshot_validator.stats() == {
+            "packages": 0,
+            "age": 0.0,
+            "hits": 0,
+            "misses": 0,
+        }
+        requests_session.get.assert_not_called()
+
+
+class TestSnapshotValidatorLoad:
+    """
+    Test class for `hotness.validators.SnapshotValidator.load` method.
+    """
+
+    def test_load_path(self, tmpdir):
+        """
+        Assert that snapshot is loaded from local path.
+        """
+        path = os.path.join(tmpdir, "dist-git.json")
+        with open(path, "w") as f:
+            json.dump(SNAPSHOT, f)
+        snapshot_validator = SnapshotValidator(mock.Mock(), path, mock.Mock(), None)
+
+        assert snapshot_validator.load() is True
+
+        assert snapshot_validator.stats()["packages"] == 2
+        snapshot_validator.requests_session.get.assert_not_called()
+
+    def test_load_url(self):
+        """
+        Assert that snapshot is loaded from URL.
+        """
+        requests_session = mock.Mock()
+        requests_session.get.return_value.status_code = 200
+        requests_session.get.return_value.json.return_value = SNAPSHOT
+        snapshot_validator = SnapshotValidator(
+            mock.Mock(), "https://example.com/dist-git.json", requests_session, (5, 20)
+        )
+
+        assert snapshot_validator.load() is True
+
+        requests_session.get.assert_called_once_with(
+            "https://example.com/dist-git.json", timeout=(5, 20)
+        )
+        assert snapshot_validator.stats()["packages"] == 2
+
+    @pytest.mark.parametrize(
+        "status_code, data",
+        [(503, SNAPSHOT), (200, {"generated": 1700000000})],
+    )
+    def test_load_failure(self, status_code, data):
+        """
+        Assert that previous snapshot is kept when loading fails.
+        """
+        requests_session = mock.Mock()
+        requests_session.get.return_value.status_code = 200
+        requests_session.get.return_value.json.return_value = SNAPSHOT
+        snapshot_validator = SnapshotValidator(
+            mock.Mock(), "https://example.com/dist-git.json", requests_session, None
+        )
+        snapshot_validator.load()
+
+        requests_session.get.return_value.status_code = status_code
+        requests_session.get.return_value.json.return_value = data
+
+        assert snapshot_validator.load() is False
+        assert snapshot_validator.stats()["packages"] == 2
+
+    def test_read_http_error(self):
+        """
+        Assert that HTTPException is raised when snapshot can't be downloaded.
+        """
+        requests_session = mock.Mock()
+        requests_session.get.return_value.status_code = 404
+        snapshot_validator = SnapshotValidator(
+            mock.Mock(), "https://example.com/dist-git.json", requests_session, None
+        )
+
+        with pytest.raises(HTTPException) as ex:
+            snapshot_validator._read()
+
+        assert ex.value.error_code == 404
+
+
+class TestSnapshotValidatorValidate:
+    """
+    Test class for `hotness.validators.SnapshotValidator.validate` method.
+    """
+
+    def setup_method(self):
+        """
+        Create snapshot validator with loaded snapshot for tests.
+        """
+        self.validator = mock.Mock()
+        self.validator.validate.return_value = {"monitoring": False, "retired": False}
+        requests_session = mock.Mock()
+        requests_session.get.return_value.status_code = 200
+        requests_session.get.return_value.json.return_value = SNAPSHOT
+        self.snapshot_validator = SnapshotValidator(
+            self.validator,
+            "https://example.com/dist-git.json",
+            requests_session,
+            None,
+            refresh_interval=0,
+        )
+        self.snapshot_validator.load()
+
+    def test_validate(self):
+        """
+        Assert that output is answered from snapshot, missing keys have
+        default values.
+        """
+        package = Package(name="monitored", version="1.0", distro="Fedora")
+
+        result = self.snapshot_validator.validate(package)
+
+        assert result == {
+            "monitoring": True,
+            "bugzilla": True,
+            "all_versions": False,
+            "stable_only": False,
+            "scratch_build": True,
+            "retired": False,
+        }
+        self.validator.validate.assert_not_called()
+        assert self.snapshot_validator.stats()["hits"] == 1
+
+    def test_validate_retired(self):
+        """
+        Assert that retired package is answered from snapshot.
+        """
+        package = Package(name="retired", version="1.0", distro="Fedora")
+
+        result = self.snapshot_validator.validate(package)
+
+        assert result["retired"] is True
+        assert result["monitoring"] is False
+
+    def test_validate_missing(self):
+        """
+        Assert that wrapped validator is called for package missing in snapshot.
+        """
+        package = Package(name="missing", version="1.0", distro="Fedora")
+
+        result = self.snapshot_validator.validate(package)
+
+        assert result == {"monitoring": False, "retired": False}
+        self.validator.validate.assert_called_once_with(package)
+        assert self.snapshot_validator.stats()["misses"] == 1
+
+    def test_validate_stale(self):
+        """
+        Assert that wrapped validator is called when package settings without
+        update time are older than the snapshot limit.
+        """
+        self.snapshot_validator.max_age = time.time() - 1700000000 - 60
+        package = Package(name="monitored", version="1.0", distro="Fedora")
+
+        result = self.snapshot_validator.validate(package)
+
+        assert result == {"monitoring": False, "retired": False}
+        self.validator.validate.assert_called_once_with(package)
+
+    def test_validate_stale_per_package(self):
+        """
+        Assert that staleness is judged by the update time of every package.
+        """
+        snapshot = {
+            "generated": 1700000000,
+            "packages": {
+                "monitored": {"monitoring": True},
+                "fresh": {"monitoring": True, "updated": time.time()},
+            },
+        }
+        self.snapshot_validator.requests_session.get.return_value.json.return_value = (
+            snapshot
+        )
+        self.snapshot_validator.load()
+        self.snapshot_validator.max_age = 3600
+
+        fresh = Package(name="fresh", version="1.0", distro="Fedora")
+        stale = Package(name="monitored", version="1.0", distro="Fedora")
+
+        assert self.snapshot_validator.validate(fresh)["monitoring"] is True
+        self.validator.validate.assert_not_called()
+        assert self.snapshot_validator.validate(stale) == {
+            "monitoring": False,
+            "retired": False,
+        }
+        self.validator.validate.assert_called_once_with(stale)
+
+    @mock.patch("hotness.validators.snapshot_validator.threading.Thread")
+    def test_validate_refresh(self, mock_thread):
+        """
+        Assert that snapshot is loaded again in background after refresh interval
+        and only one refresh runs at a time.
+        """
+        self.snapshot_validator.refresh_interval = 60
+        self.snapshot_validator._loaded = time.monotonic() - 120
+        package = Package(name="monitored", version="1.0", distro="Fedora")
+
+        self.snapshot_validator.validate(package)
+        self.snapshot_validator.validate(package)
+
+        mock_thread.assert_called_once_with(
+            target=mock.ANY, name="hotness-dist-git-snapshot", daemon=True
+        )
+        mock_thread.return_value.start.assert_called_once_with()
+
+        # Run the refresh
+        mock_thread.call_args.kwargs["target"]()
+
+        assert self.snapshot_validator.requests_session.get.call_count == 2
+        assert self.snapshot_validator._refreshing is False
+
+    @mock.patch("hotness.validators.snapshot_validator.threading.Thread")
+    def test_validate_refresh_not_needed(self, mock_thread):
+        """
+        Assert that snapshot isn't loaded again before refresh interval elapsed.
+        """
+        self.snapshot_validator.refresh_interval = 60
+        package = Package(name="monitored", version="1.0", distro="Fedora")
+
+        self.snapshot_validator.validate(package)
+
+        mock_thread.assert_not_called()